@@ -30,7 +30,7 @@ for container_name in "${localhost_containers[@]}"; do
 	fi
 done
 
-if ! python test/security/test.py; then
+if ! python test/security/test.py "$@"; then
     echo "Security tests did not succeed."
     exit 1
 else
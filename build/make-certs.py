@@ -1,9 +1,22 @@
 #!/usr/bin/env python3
 
 import argparse
+import hashlib
+import json
 import os
 import shutil
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Existing client and node certificates expiring within this delay are generated again
+RENEWAL_DELAY = 30 * 24 * 3600
+
+# `cockroach cert` only generates RSA keys, of the provided size
+KEY_SIZES = {
+    "rsa2048": "2048",
+    "rsa4096": "4096",
+}
 
 
 class CockroachCluster(object):
@@ -58,6 +71,11 @@ class CockroachCluster(object):
     def prometheus_certs_dir(self):
         return os.path.join(self.directory, "prometheus_certs_dir")
 
+    @property
+    def state_file(self):
+        # Outside of the certs directories, which are uploaded as secrets
+        return os.path.join(self.directory, "make-certs.json")
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -93,12 +111,52 @@ def parse_args():
         default=False,
         help="True to generate new CA certs, false to use the existing one",
     )
+    parser.add_argument(
+        "--overwrite-certs",
+        action="store_true",
+        default=False,
+        help="True to generate new client and node certs, false to reuse the existing ones that are still valid",
+    )
+    parser.add_argument(
+        "--key-type",
+        metavar="KEY_TYPE",
+        default="rsa2048",
+        choices=list(KEY_SIZES),
+        help="type of the private keys generated for the CA, clients and nodes, one of rsa2048, rsa4096. Default to rsa2048",
+    )
     return parser.parse_args()
 
 
+def file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def is_valid_cert(path):
+    """True if the certificate at path exists and is not about to expire"""
+    if not os.path.exists(path):
+        return False
+    process = subprocess.run(
+        ["openssl", "x509", "-noout", "-checkend", str(RENEWAL_DELAY), "-in", path],
+        capture_output=True,
+    )
+    return process.returncode == 0
+
+
+def cockroach_cert(args):
+    process = subprocess.run(
+        ["cockroach", "cert"] + args, capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        raise RuntimeError(
+            "cockroach cert {} failed: {}".format(args[0], process.stderr.strip())
+        )
+
+
 def main():
     args = parse_args()
     cr = CockroachCluster(args.cluster_context, args.namespace, args.ca_cert_to_join)
+    key_size = KEY_SIZES[args.key_type]
 
     # Create the generated directories.
     if not os.path.exists("workspace"):
@@ -106,7 +164,23 @@ def main():
     if not os.path.exists(cr.directory):
         os.makedirs(cr.directory)
 
+    summary = []
+
     create_ca = not os.path.exists(cr.ca_certs_file) or args.overwrite_ca_cert
+    if not create_ca:
+        # Replacing the CA breaks the trust with the running cluster and the joined instances, so it is never automatic
+        if not os.path.exists(cr.ca_key_file):
+            sys.exit(
+                "The key of the CA certificate is missing from {}, client and node certificates can't be signed. "
+                "Use --overwrite-ca-cert to create a new CA.".format(cr.ca_key_dir)
+            )
+        if not is_valid_cert(cr.ca_certs_file):
+            print(
+                "Warning: the CA certificate in {} has expired or expires within {} days. "
+                "Use --overwrite-ca-cert to create a new CA.".format(
+                    cr.ca_certs_dir, RENEWAL_DELAY // (24 * 3600)
+                )
+            )
     if create_ca:
         # Create a new CA.
         # Delete and recreate the ca_certs_dir.
@@ -115,73 +189,41 @@ def main():
         os.mkdir(cr.ca_certs_dir)
         os.mkdir(cr.ca_key_dir)
 
-    # Build node and client certs.
-    # Delete and recreate the directories.
-    shutil.rmtree(cr.node_certs_dir, ignore_errors=True)
-    shutil.rmtree(cr.client_certs_dir, ignore_errors=True)
-    shutil.rmtree(cr.prometheus_certs_dir, ignore_errors=True)
-    os.mkdir(cr.client_certs_dir)
-    os.mkdir(cr.node_certs_dir)
-    os.mkdir(cr.prometheus_certs_dir)
-
-    if create_ca:
-        # Create the CA.
-        subprocess.check_call(
+        cockroach_cert(
             [
-                "cockroach",
-                "cert",
                 "create-ca",
                 "--certs-dir",
                 cr.ca_certs_dir,
                 "--ca-key",
                 cr.ca_key_file,
+                "--key-size",
+                key_size,
             ]
         )
+    summary.append(("CA", cr.ca_certs_dir, create_ca))
+
+    for directory in [cr.client_certs_dir, cr.node_certs_dir, cr.prometheus_certs_dir]:
+        if not os.path.exists(directory):
+            os.mkdir(directory)
 
-    # Copy out the CA cert for generation, we delete these copies later.
-    shutil.copy(cr.ca_certs_file, cr.client_certs_dir)
-    shutil.copy(cr.ca_certs_file, cr.node_certs_dir)
-    shutil.copy(cr.ca_certs_file, cr.prometheus_certs_dir)
+        # Copy out the CA cert for generation.
+        shutil.copy(cr.ca_certs_file, directory)
 
     # We slightly abuse the rotate certs feature:
     # https://www.cockroachlabs.com/docs/stable/rotate-certificates.html
     if cr.ca_cert_to_join:
-        with open(cr.ca_certs_file, "a") as new_certs_fh:
-            with open(cr.ca_cert_to_join) as join_ca_cert_fh:
-                new_certs_fh.write(join_ca_cert_fh.read())
+        with open(cr.ca_cert_to_join) as join_ca_cert_fh:
+            join_ca_cert = join_ca_cert_fh.read()
+        with open(cr.ca_certs_file) as ca_certs_fh:
+            joined = join_ca_cert in ca_certs_fh.read()
+        if not joined:
+            with open(cr.ca_certs_file, "a") as new_certs_fh:
+                new_certs_fh.write(join_ca_cert)
                 new_certs_fh.write("\n")
 
     if cr.ca_cert_to_join and create_ca:
         print("Created new CA certificate in {}".format(cr.ca_certs_dir))
 
-    subprocess.check_call(
-        [
-            "cockroach",
-            "cert",
-            "create-client",
-            "root",
-            "--certs-dir",
-            cr.client_certs_dir,
-            "--ca-key",
-            cr.ca_key_file,
-        ]
-    )
-
-    subprocess.check_call(
-        [
-            "cockroach",
-            "cert",
-            "create-client",
-            "grafana",
-            "--certs-dir",
-            cr.client_certs_dir,
-            "--ca-key",
-            cr.ca_key_file,
-        ]
-    )
-
-    print("Created new clients certificate in {}".format(cr.client_certs_dir))
-
     node_addresses = ["localhost"]
     node_addresses.extend(args.node_address)
     node_addresses.extend(
@@ -205,37 +247,85 @@ def main():
         ]
     )
 
-    subprocess.check_call(
-        [
-            "cockroach",
-            "cert",
-            "create-node",
-            "--certs-dir",
-            cr.node_certs_dir,
-            "--ca-key",
-            cr.ca_key_file,
-        ]
-        + node_addresses
-    )
-
-    print("Created new node certificate in {}".format(cr.node_certs_dir))
-
-    node_addresses = ["prometheus"]
-
-    subprocess.check_call(
-        [
-            "cockroach",
-            "cert",
-            "create-node",
-            "--certs-dir",
-            cr.prometheus_certs_dir,
-            "--ca-key",
-            cr.ca_key_file,
-        ]
-        + node_addresses
-    )
+    # Name, directory, file name without extension and command of each certificate
+    certs = [
+        ("root client", cr.client_certs_dir, "client.root", ["create-client", "root"]),
+        (
+            "grafana client",
+            cr.client_certs_dir,
+            "client.grafana",
+            ["create-client", "grafana"],
+        ),
+        ("node", cr.node_certs_dir, "node", ["create-node"] + node_addresses),
+        ("prometheus", cr.prometheus_certs_dir, "node", ["create-node", "prometheus"]),
+    ]
+
+    # A certificate is reused if it is still valid and was generated with the same CA key and parameters.
+    try:
+        with open(cr.state_file) as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        state = {}
+    ca_digest = file_digest(cr.ca_key_file)
+
+    to_create = []
+    for name, directory, filename, command in certs:
+        stamp = {"ca": ca_digest, "command": command, "key_size": key_size}
+        reuse = (
+            not args.overwrite_certs
+            and state.get(name) == stamp
+            and os.path.exists(os.path.join(directory, filename + ".key"))
+            and is_valid_cert(os.path.join(directory, filename + ".crt"))
+        )
+        if not reuse:
+            to_create.append((name, stamp, command, directory))
+        summary.append((name, directory, not reuse))
+
+    def create(command, directory):
+        cockroach_cert(
+            command
+            + [
+                "--certs-dir",
+                directory,
+                "--ca-key",
+                cr.ca_key_file,
+                "--key-size",
+                key_size,
+                "--overwrite",
+            ]
+        )
 
-    print("Created new prometheus certificate in {}".format(cr.prometheus_certs_dir))
+    # Certificates are independent, and generated by separate cockroach processes.
+    # The state of the certificates created successfully is saved even if another one failed.
+    failures = []
+    try:
+        if to_create:
+            with ThreadPoolExecutor(max_workers=len(to_create)) as executor:
+                futures = [
+                    executor.submit(create, command, directory)
+                    for _, _, command, directory in to_create
+                ]
+                for (name, stamp, _, _), future in zip(to_create, futures):
+                    try:
+                        future.result()
+                        state[name] = stamp
+                    except Exception as e:
+                        # The files of the certificate may have been partially overwritten
+                        state.pop(name, None)
+                        failures.append(e)
+    finally:
+        with open(cr.state_file, "w") as f:
+            json.dump(state, f, indent=2)
+
+    if failures:
+        raise RuntimeError("\n".join(str(e) for e in failures))
+
+    for name, directory, created in summary:
+        print(
+            "{} {} certificate in {}".format(
+                "Created new" if created else "Reused existing", name, directory
+            )
+        )
 
 
 if __name__ == "__main__":
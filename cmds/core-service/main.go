@@ -52,6 +52,8 @@ var (
 	locality          = flag.String("locality", "", "self-identification string of this DSS instance")
 	publicEndpoint    = flag.String("public_endpoint", "", "Public endpoint to access this DSS instance. Must be an absolute URI")
 
+	responseCompressionMinSize = flag.Int("response_compression_min_size", 0, "Minimum size in bytes of JSON responses to gzip-compress for clients accepting it; 0 disables response compression")
+
 	logFormat               = flag.String("log_format", logging.DefaultFormat, "The log format in {json, console}")
 	logLevel                = flag.String("log_level", logging.DefaultLevel.String(), "The log level")
 	dumpRequests            = flag.Bool("dump_requests", false, "Log full HTTP request and response (note: will dump sensitive information to logs; intended only for debugging and/or development)")
@@ -65,9 +67,10 @@ var (
 	jwksEndpoint            = flag.String("jwks_endpoint", "", "URL pointing to an endpoint serving JWKS")
 	jwksKeyIDs              = flag.String("jwks_key_ids", "", "IDs of a set of key in a JWKS, separated by commas")
 	legacyKeyRefreshTimeout = flag.Duration("key_refresh_timeout", 1*time.Minute, "DEPRECATED (replaced by jwks_refresh_interval) Cadence at which the keys used for JWT verification are refreshed")
-	jwksRefreshInterval     = flag.Duration("jwks_refresh_interval", 1*time.Minute, "Cadence at which the keys used for JWT verification are refreshed")
+	jwksRefreshInterval     = flag.Duration("jwks_refresh_interval", 1*time.Minute, "Cadence at which the keys used for JWT verification are refreshed, shifted by up to 10% at random")
 	jwksKeyTTL              = flag.Duration("jwks_key_ttl", 1*time.Hour, "Maximum duration during which keys that could not be refreshed are still used before shutting down the service")
 	jwtAudiences            = flag.String("accepted_jwt_audiences", "", "comma-separated acceptable JWT `aud` claims")
+	tokenCacheSize          = flag.Int("token_cache_size", 10000, "Maximum number of validated access tokens cached until they expire, so that their signature is not verified again; 0 disables the cache")
 )
 
 func createKeyResolver() (auth.KeyResolver, error) {
@@ -261,6 +264,35 @@ func registerSCDMetrics(store scds.Store) error {
 	return err
 }
 
+func registerAuthMetrics(authorizer *auth.Authorizer) error {
+
+	meter := otel.Meter("auth")
+
+	_, err := meter.Int64ObservableCounter(
+		"auth_token_cache_hits_total",
+		metric.WithDescription("Number of access tokens found in the cache of validated tokens"),
+		metric.WithInt64Callback(func(ctx context.Context, o metric.Int64Observer) error {
+			hits, _ := authorizer.TokenCacheStats()
+			o.Observe(hits)
+			return nil
+		}),
+	)
+	if err != nil {
+		return err
+	}
+	_, err = meter.Int64ObservableCounter(
+		"auth_token_cache_misses_total",
+		metric.WithDescription("Number of access tokens not found in the cache of validated tokens, and validated"),
+		metric.WithInt64Callback(func(ctx context.Context, o metric.Int64Observer) error {
+			_, misses := authorizer.TokenCacheStats()
+			o.Observe(misses)
+			return nil
+		}),
+	)
+
+	return err
+}
+
 // RunHTTPServer starts the DSS HTTP server.
 func RunHTTPServer(ctx context.Context, ctxCanceler func(), address, locality string) error {
 	logger := logging.WithValuesFromContext(ctx, logging.Logger).With(zap.String("address", address))
@@ -332,12 +364,19 @@ func RunHTTPServer(ctx context.Context, ctxCanceler func(), address, locality st
 			KeyRefreshInterval: *jwksRefreshInterval,
 			KeyTTL:             *jwksKeyTTL,
 			AcceptedAudiences:  strings.Split(*jwtAudiences, ","),
+			TokenCacheSize:     *tokenCacheSize,
 		},
 	)
 	if err != nil {
 		return stacktrace.Propagate(err, "Error creating RSA authorizer")
 	}
+	if *enableMetrics {
+		if err := registerAuthMetrics(authorizer); err != nil {
+			return stacktrace.Propagate(err, "Unable to setup metrics")
+		}
+	}
 
+	api.ResponseCompressionMinSize = *responseCompressionMinSize
 	auxV1Router := apiauxv1.MakeAPIRouter(auxV1Server, authorizer)
 	versioningV1Router := apiversioningv1.MakeAPIRouter(versioningV1Server, authorizer)
 	ridV1Router := apiridv1.MakeAPIRouter(ridV1Server, authorizer)
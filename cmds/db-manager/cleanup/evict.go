@@ -18,6 +18,8 @@ import (
 	"github.com/interuss/stacktrace"
 	"github.com/spf13/cobra"
 	"github.com/spf13/pflag"
+	"go.opentelemetry.io/otel/attribute"
+	"go.opentelemetry.io/otel/metric"
 )
 
 var (
@@ -26,16 +28,20 @@ var (
 		Short: "List and evict expired entities",
 		RunE:  evict,
 	}
-	flags         = pflag.NewFlagSet("evict", pflag.ExitOnError)
-	checkScdOirs  = flags.Bool("scd_oir", true, "set this flag to true to check for expired SCD operational intents")
-	checkScdSubs  = flags.Bool("scd_sub", true, "set this flag to true to check for expired SCD subscriptions")
-	checkRidISAs  = flags.Bool("rid_isa", true, "set this flag to true to check for expired RID ISAs")
-	checkRidSubs  = flags.Bool("rid_sub", true, "set this flag to true to check for expired RID subscriptions")
-	scdTtl        = flags.Duration("scd_ttl", time.Hour*24*112, "time-to-live duration used for determining SCD entries expiration, defaults to 2*56 days")
-	ridTtl        = flags.Duration("rid_ttl", time.Minute*30, "time-to-live duration used for determining RID entries expiration, defaults to 30 minutes")
-	deleteExpired = flags.Bool("delete", false, "set this flag to true to delete the expired entities")
-	locality      = flags.String("locality", "", "self-identification string of this DSS instance")
-	timeout       = flags.Duration("timeout", 5*time.Minute, "Timeout for the command")
+	flags          = pflag.NewFlagSet("evict", pflag.ExitOnError)
+	checkScdOirs   = flags.Bool("scd_oir", true, "set this flag to true to check for expired SCD operational intents")
+	checkScdSubs   = flags.Bool("scd_sub", true, "set this flag to true to check for expired SCD subscriptions")
+	checkRidISAs   = flags.Bool("rid_isa", true, "set this flag to true to check for expired RID ISAs")
+	checkRidSubs   = flags.Bool("rid_sub", true, "set this flag to true to check for expired RID subscriptions")
+	scdTtl         = flags.Duration("scd_ttl", time.Hour*24*112, "time-to-live duration used for determining SCD entries expiration, defaults to 2*56 days")
+	ridTtl         = flags.Duration("rid_ttl", time.Minute*30, "time-to-live duration used for determining RID entries expiration, defaults to 30 minutes")
+	deleteExpired  = flags.Bool("delete", false, "set this flag to true to delete the expired entities")
+	locality       = flags.String("locality", "", "self-identification string of this DSS instance")
+	timeout        = flags.Duration("timeout", 5*time.Minute, "Timeout for the command, 0 for no timeout")
+	batchSize      = flags.Int("batch_size", 1000, "maximum number of expired entities of each type deleted per transaction")
+	rate           = flags.Float64("rate", 0, "maximum number of expired entities deleted per second on average, 0 for no limit")
+	checkpointPath = flags.String("checkpoint", "", "file recording the progress of the deletion, from which an interrupted run resumes with the same thresholds")
+	metricsAddr    = flags.String("metrics_addr", "", "address and port on which to serve prometheus-compatible metrics about the deletion progress, disabled if empty")
 )
 
 func init() {
@@ -48,13 +54,47 @@ func evict(cmd *cobra.Command, _ []string) error {
 		scdThreshold = time.Now().Add(-*scdTtl)
 		ridThreshold = time.Now().Add(-*ridTtl)
 	)
+	if *batchSize <= 0 {
+		return fmt.Errorf("--batch_size must be positive, got %d", *batchSize)
+	}
+	if *rate < 0 {
+		return fmt.Errorf("--rate must not be negative, got %g", *rate)
+	}
 	log.Printf("WARNING: The usage of this tool may have an impact on performance when deleting entities. Read more in the README.")
 
-	ctx, cancel := context.WithTimeout(ctx, *timeout)
-	defer cancel()
+	if *timeout > 0 {
+		var cancel context.CancelFunc
+		ctx, cancel = context.WithTimeout(ctx, *timeout)
+		defer cancel()
+	}
 
 	logger := logging.WithValuesFromContext(ctx, logging.Logger)
 
+	p := &progress{pacer: pacer{rate: *rate}}
+	if *deleteExpired && *checkpointPath != "" {
+		cp, err := loadCheckpoint(*checkpointPath, scdThreshold, ridThreshold, *locality)
+		if err != nil {
+			return err
+		}
+		if len(cp.Evicted) > 0 {
+			log.Printf("resuming eviction from checkpoint %s: %v entities already evicted", *checkpointPath, cp.Evicted)
+		}
+		scdThreshold, ridThreshold = cp.ScdThreshold, cp.RidThreshold
+		p.checkpoint = cp
+	}
+	if *metricsAddr != "" {
+		shutdown, err := serveMetrics(*metricsAddr)
+		if err != nil {
+			return fmt.Errorf("serving metrics: %w", err)
+		}
+		defer func() { _ = shutdown(context.Background()) }()
+	}
+	metrics, err := newEvictMetrics()
+	if err != nil {
+		return fmt.Errorf("registering metrics: %w", err)
+	}
+	p.metrics = metrics
+
 	scdStore, err := scds.Init(ctx, logger, false)
 	if err != nil {
 		return err
@@ -66,108 +106,220 @@ func evict(cmd *cobra.Command, _ []string) error {
 	}
 
 	var (
-		expiredOpIntents []*scdmodels.OperationalIntent
-		scdExpiredSub    []*scdmodels.Subscription
-		expiredISAs      []*ridmodels.IdentificationServiceArea
-		ridExpiredSub    []*ridmodels.Subscription
+		count         int
+		scdStoreTyped = dssstore.Store[scdrepos.Repository](scdStore)
+		ridStoreTyped = dssstore.Store[ridrepos.Repository](ridStore)
 	)
-	scdAction := func(ctx context.Context, r scdrepos.Repository) (err error) {
-		if *checkScdOirs {
-			expiredOpIntents, err = r.ListExpiredOperationalIntents(ctx, scdThreshold)
-			if err != nil {
-				return fmt.Errorf("listing expired operational intents: %w", err)
-			}
-			if *deleteExpired {
-				for _, opIntent := range expiredOpIntents {
-					if err = r.DeleteOperationalIntent(ctx, opIntent.ID); err != nil {
-						return fmt.Errorf("deleting expired operational intents: %w", err)
-					}
-				}
-			}
+	if *checkScdOirs {
+		n, err := evictExpired(ctx, scdStoreTyped, p, expiredEntities[scdrepos.Repository, *scdmodels.OperationalIntent]{
+			kind: "scd_operational_intents",
+			count: func(ctx context.Context, r scdrepos.Repository) (int64, error) {
+				return r.CountExpiredOperationalIntents(ctx, scdThreshold)
+			},
+			list: func(ctx context.Context, r scdrepos.Repository, limit int) ([]*scdmodels.OperationalIntent, error) {
+				return r.ListExpiredOperationalIntents(ctx, scdThreshold, limit)
+			},
+			id:  func(opIntent *scdmodels.OperationalIntent) dssmodels.ID { return opIntent.ID },
+			del: scdrepos.Repository.DeleteOperationalIntents,
+			logEntity: func(opIntent *scdmodels.OperationalIntent) {
+				logExpiredEntity("operational intent", opIntent.ID, scdThreshold, *deleteExpired, opIntent.EndTime != nil)
+			},
+		})
+		if err != nil {
+			return fmt.Errorf("evicting expired operational intents: %w", err)
 		}
+		count += n
+	}
 
-		if *checkScdSubs {
-			scdExpiredSub, err = r.ListExpiredSubscriptions(ctx, scdThreshold)
-			if err != nil {
-				return fmt.Errorf("SCD listing expired subscriptions: %w", err)
-			}
-			if *deleteExpired {
-				for _, sub := range scdExpiredSub {
-					if err = r.DeleteSubscription(ctx, sub.ID); err != nil {
-						return fmt.Errorf("SCD deleting expired subscriptions: %w", err)
-					}
-				}
-			}
+	if *checkScdSubs {
+		n, err := evictExpired(ctx, scdStoreTyped, p, expiredEntities[scdrepos.Repository, *scdmodels.Subscription]{
+			kind: "scd_subscriptions",
+			count: func(ctx context.Context, r scdrepos.Repository) (int64, error) {
+				return r.CountExpiredSubscriptions(ctx, scdThreshold)
+			},
+			list: func(ctx context.Context, r scdrepos.Repository, limit int) ([]*scdmodels.Subscription, error) {
+				return r.ListExpiredSubscriptions(ctx, scdThreshold, limit)
+			},
+			id:  func(sub *scdmodels.Subscription) dssmodels.ID { return sub.ID },
+			del: scdrepos.Repository.DeleteSubscriptions,
+			logEntity: func(sub *scdmodels.Subscription) {
+				logExpiredEntity("SCD subscription", sub.ID, scdThreshold, *deleteExpired, sub.EndTime != nil)
+			},
+		})
+		if err != nil {
+			return fmt.Errorf("SCD evicting expired subscriptions: %w", err)
 		}
-		return nil
+		count += n
 	}
-	if _, err = scdStore.Transact(ctx, dssstore.NewFuncOperation(scdAction)); err != nil {
-		return fmt.Errorf("failed to execute SCD transaction: %w", err)
+
+	if *checkRidISAs {
+		n, err := evictExpired(ctx, ridStoreTyped, p, expiredEntities[ridrepos.Repository, *ridmodels.IdentificationServiceArea]{
+			kind: "rid_isas",
+			count: func(ctx context.Context, r ridrepos.Repository) (int64, error) {
+				return r.CountExpiredISAs(ctx, *locality, ridThreshold)
+			},
+			list: func(ctx context.Context, r ridrepos.Repository, limit int) ([]*ridmodels.IdentificationServiceArea, error) {
+				return r.ListExpiredISAs(ctx, *locality, ridThreshold, limit)
+			},
+			id:  func(isa *ridmodels.IdentificationServiceArea) dssmodels.ID { return isa.ID },
+			del: ridrepos.Repository.DeleteISAs,
+			logEntity: func(isa *ridmodels.IdentificationServiceArea) {
+				logExpiredEntity("ISA", isa.ID, ridThreshold, *deleteExpired, isa.EndTime != nil)
+			},
+		})
+		if err != nil {
+			return stacktrace.Propagate(err, "Failed to evict expired ISAs")
+		}
+		count += n
 	}
 
-	ridAction := func(ctx context.Context, r ridrepos.Repository) (err error) {
-		if *checkRidISAs {
+	if *checkRidSubs {
+		n, err := evictExpired(ctx, ridStoreTyped, p, expiredEntities[ridrepos.Repository, *ridmodels.Subscription]{
+			kind: "rid_subscriptions",
+			count: func(ctx context.Context, r ridrepos.Repository) (int64, error) {
+				return r.CountExpiredSubscriptions(ctx, *locality, ridThreshold)
+			},
+			list: func(ctx context.Context, r ridrepos.Repository, limit int) ([]*ridmodels.Subscription, error) {
+				return r.ListExpiredSubscriptions(ctx, *locality, ridThreshold, limit)
+			},
+			id:  func(sub *ridmodels.Subscription) dssmodels.ID { return sub.ID },
+			del: ridrepos.Repository.DeleteSubscriptions,
+			logEntity: func(sub *ridmodels.Subscription) {
+				logExpiredEntity("RID subscription", sub.ID, ridThreshold, *deleteExpired, sub.EndTime != nil)
+			},
+		})
+		if err != nil {
+			return stacktrace.Propagate(err, "Failed to evict RID expired Subscriptions")
+		}
+		count += n
+	}
 
-			expiredISAs, err = r.ListExpiredISAs(ctx, *locality, ridThreshold)
-			if err != nil {
-				return stacktrace.Propagate(err, "Failed to list expired ISAs")
-			}
+	if err := p.checkpoint.remove(); err != nil {
+		return err
+	}
 
-			if *deleteExpired {
-				for _, isa := range expiredISAs {
-					_, err := r.DeleteISA(ctx, isa)
-					if err != nil {
-						return stacktrace.Propagate(err, "Failed to delete ISAs")
-					}
-				}
-			}
+	if count == 0 {
+		log.Printf("no SCD entity older than %s and no RID entity older than %s found", scdThreshold.String(), ridThreshold.String())
+	} else if !*deleteExpired {
+		log.Printf("no entity was deleted, run the command again with the `--delete` flag to do so")
+	}
+	return nil
+}
 
+// progress holds the state shared by the evictions of the different entity types.
+type progress struct {
+	pacer      pacer
+	checkpoint *checkpoint // nil without --checkpoint
+	metrics    *evictMetrics
+}
+
+// expiredEntities describes how to evict the expired entities of one type from a repository R.
+type expiredEntities[R any, E any] struct {
+	// kind identifies the entity type in the checkpoint and the metrics.
+	kind      string
+	count     func(ctx context.Context, r R) (int64, error)
+	list      func(ctx context.Context, r R, limit int) ([]E, error)
+	id        func(E) dssmodels.ID
+	del       func(r R, ctx context.Context, ids []dssmodels.ID) (int64, error)
+	logEntity func(E)
+}
+
+// evictExpired lists the expired entities of one type and, if deleteExpired is set, deletes them.
+// When deleting, expired entities are handled by batches of at most batchSize entities, each listed and deleted in its
+// own transaction, until none is left. Batches are paced to honor --rate, and each of them is recorded in the
+// checkpoint and the metrics. Otherwise, a single page of at most dssmodels.MaxResultLimit entities is listed.
+// logEntity is called for each entity once the transaction handling it has succeeded. evictExpired returns the number
+// of entities listed.
+func evictExpired[R any, E any](ctx context.Context, store dssstore.Store[R], p *progress, entities expiredEntities[R, E]) (int, error) {
+	if !*deleteExpired {
+		var expired []E
+		_, err := store.Transact(ctx, dssstore.NewFuncOperation(func(ctx context.Context, r R) (err error) {
+			expired, err = entities.list(ctx, r, dssmodels.MaxResultLimit)
+			return err
+		}))
+		if err != nil {
+			return 0, stacktrace.Propagate(err, "Failed to list expired entities")
+		}
+		for _, e := range expired {
+			entities.logEntity(e)
 		}
+		return len(expired), nil
+	}
 
-		if *checkRidSubs {
+	if p.checkpoint.completed(entities.kind) {
+		log.Printf("skipping %s, already evicted according to the checkpoint", entities.kind)
+		return 0, nil
+	}
 
-			ridExpiredSub, err = r.ListExpiredSubscriptions(ctx, *locality, ridThreshold)
+	attrs := metric.WithAttributes(attribute.String("kind", entities.kind))
+	var remaining int64
+	_, err := store.Transact(ctx, dssstore.NewFuncOperation(func(ctx context.Context, r R) (err error) {
+		remaining, err = entities.count(ctx, r)
+		return err
+	}))
+	if err != nil {
+		return 0, stacktrace.Propagate(err, "Failed to count expired entities")
+	}
+	p.metrics.remaining.Record(ctx, remaining, attrs)
+
+	limit := p.pacer.limit(*batchSize)
+	var count int
+	for {
+		var batch []E
+		action := func(ctx context.Context, r R) (err error) {
+			batch, err = entities.list(ctx, r, limit)
 			if err != nil {
-				return stacktrace.Propagate(err,
-					"Failed to list RID expired Subscriptions")
+				return stacktrace.Propagate(err, "Failed to list expired entities")
 			}
-
-			if *deleteExpired {
-				for _, sub := range ridExpiredSub {
-					_, err := r.DeleteSubscription(ctx, sub)
-					if err != nil {
-						return stacktrace.Propagate(err,
-							"Failed to delete RID Subscription")
-					}
-				}
+			if len(batch) == 0 {
+				return nil
 			}
 
+			ids := make([]dssmodels.ID, len(batch))
+			for i, e := range batch {
+				ids[i] = entities.id(e)
+			}
+			deleted, err := entities.del(r, ctx, ids)
+			if err != nil {
+				return stacktrace.Propagate(err, "Failed to delete expired entities")
+			}
+			if deleted != int64(len(ids)) {
+				return stacktrace.NewError("Deleted %d out of %d expired entities", deleted, len(ids))
+			}
+			return nil
+		}
+		start := time.Now()
+		if _, err := store.Transact(ctx, dssstore.NewFuncOperation(action)); err != nil {
+			return count, err
 		}
+		duration := time.Since(start)
 
-		return nil
-	}
-	if _, err = ridStore.Transact(ctx, dssstore.NewFuncOperation(ridAction)); err != nil {
-		return fmt.Errorf("failed to execute RID transaction: %w", err)
-	}
+		for _, e := range batch {
+			entities.logEntity(e)
+		}
+		count += len(batch)
+		remaining = max(remaining-int64(len(batch)), 0)
+		done := len(batch) < limit
+		if done {
+			remaining = 0
+		}
+		p.metrics.batchDuration.Record(ctx, duration.Seconds(), attrs)
+		p.metrics.evicted.Add(ctx, int64(len(batch)), attrs)
+		p.metrics.remaining.Record(ctx, remaining, attrs)
+		if len(batch) > 0 {
+			log.Printf("evicted a batch of %d %s in %s, %d remaining", len(batch), entities.kind, duration, remaining)
+		}
+		if err := p.checkpoint.update(entities.kind, len(batch), done); err != nil {
+			return count, err
+		}
 
-	for _, opIntent := range expiredOpIntents {
-		logExpiredEntity("operational intent", opIntent.ID, scdThreshold, *deleteExpired, opIntent.EndTime != nil)
-	}
-	for _, sub := range scdExpiredSub {
-		logExpiredEntity("SCD subscription", sub.ID, scdThreshold, *deleteExpired, sub.EndTime != nil)
-	}
-	for _, isa := range expiredISAs {
-		logExpiredEntity("ISA", isa.ID, ridThreshold, *deleteExpired, isa.EndTime != nil)
-	}
-	for _, sub := range ridExpiredSub {
-		logExpiredEntity("RID subscription", sub.ID, ridThreshold, *deleteExpired, sub.EndTime != nil)
-	}
-	if len(expiredOpIntents) == 0 && len(scdExpiredSub) == 0 && len(expiredISAs) == 0 && len(ridExpiredSub) == 0 {
-		log.Printf("no SCD entity older than %s and no RID entity older than %s found", scdThreshold.String(), ridThreshold.String())
-	} else if !*deleteExpired {
-		log.Printf("no entity was deleted, run the command again with the `--delete` flag to do so")
+		if done {
+			return count, nil
+		}
+		if err := p.pacer.wait(ctx, start, len(batch)); err != nil {
+			return count, stacktrace.Propagate(err, "Interrupted while pacing evictions")
+		}
 	}
-	return nil
 }
 
 func logExpiredEntity(entity string, entityID dssmodels.ID, threshold time.Time, deleted, hasEndTime bool) {
@@ -0,0 +1,213 @@
+package cleanup
+
+import (
+	"context"
+	"encoding/json"
+	"errors"
+	"io/fs"
+	"log"
+	"net/http"
+	"os"
+	"path/filepath"
+	"slices"
+	"time"
+
+	"github.com/interuss/stacktrace"
+	"github.com/prometheus/client_golang/prometheus/promhttp"
+	"go.opentelemetry.io/otel"
+	"go.opentelemetry.io/otel/exporters/prometheus"
+	"go.opentelemetry.io/otel/metric"
+	sdkmetric "go.opentelemetry.io/otel/sdk/metric"
+)
+
+// checkpoint is the progress of an eviction persisted in the file provided with --checkpoint, so that an interrupted
+// eviction resumes with the same thresholds and skips the entity types already evicted.
+type checkpoint struct {
+	path string
+
+	ScdThreshold time.Time        `json:"scd_threshold"`
+	RidThreshold time.Time        `json:"rid_threshold"`
+	Locality     string           `json:"locality"`
+	Completed    []string         `json:"completed"`
+	Evicted      map[string]int64 `json:"evicted"`
+}
+
+// loadCheckpoint reads the checkpoint stored at path, or creates it with the provided thresholds if it does not
+// exist yet.
+func loadCheckpoint(path string, scdThreshold, ridThreshold time.Time, locality string) (*checkpoint, error) {
+	cp := &checkpoint{
+		path:         path,
+		ScdThreshold: scdThreshold,
+		RidThreshold: ridThreshold,
+		Locality:     locality,
+		Evicted:      map[string]int64{},
+	}
+
+	data, err := os.ReadFile(path)
+	if errors.Is(err, fs.ErrNotExist) {
+		return cp, cp.save()
+	}
+	if err != nil {
+		return nil, stacktrace.Propagate(err, "Failed to read checkpoint %s", path)
+	}
+	if err := json.Unmarshal(data, cp); err != nil {
+		return nil, stacktrace.Propagate(err, "Failed to parse checkpoint %s", path)
+	}
+	if cp.Locality != locality {
+		return nil, stacktrace.NewError("Checkpoint %s was recorded for locality `%s` instead of `%s`", path, cp.Locality, locality)
+	}
+	if cp.Evicted == nil {
+		cp.Evicted = map[string]int64{}
+	}
+	return cp, nil
+}
+
+// save atomically replaces the checkpoint file with the current progress.
+func (cp *checkpoint) save() error {
+	data, err := json.Marshal(cp)
+	if err != nil {
+		return stacktrace.Propagate(err, "Failed to serialize checkpoint")
+	}
+	tmp, err := os.CreateTemp(filepath.Dir(cp.path), filepath.Base(cp.path)+".*")
+	if err != nil {
+		return stacktrace.Propagate(err, "Failed to create checkpoint %s", cp.path)
+	}
+	defer func() { _ = os.Remove(tmp.Name()) }()
+	if _, err := tmp.Write(data); err != nil {
+		_ = tmp.Close()
+		return stacktrace.Propagate(err, "Failed to write checkpoint %s", cp.path)
+	}
+	if err := tmp.Close(); err != nil {
+		return stacktrace.Propagate(err, "Failed to write checkpoint %s", cp.path)
+	}
+	if err := os.Rename(tmp.Name(), cp.path); err != nil {
+		return stacktrace.Propagate(err, "Failed to replace checkpoint %s", cp.path)
+	}
+	return nil
+}
+
+// completed reports whether all expired entities of the provided kind were evicted. It is false for a nil checkpoint.
+func (cp *checkpoint) completed(kind string) bool {
+	return cp != nil && slices.Contains(cp.Completed, kind)
+}
+
+// update adds evicted to the number of entities of the provided kind evicted so far and, if done, records that none
+// is left. It is a no-op for a nil checkpoint.
+func (cp *checkpoint) update(kind string, evicted int, done bool) error {
+	if cp == nil {
+		return nil
+	}
+	cp.Evicted[kind] += int64(evicted)
+	if done {
+		cp.Completed = append(cp.Completed, kind)
+	}
+	return cp.save()
+}
+
+// remove deletes the checkpoint file once the eviction is over. It is a no-op for a nil checkpoint.
+func (cp *checkpoint) remove() error {
+	if cp == nil {
+		return nil
+	}
+	if err := os.Remove(cp.path); err != nil {
+		return stacktrace.Propagate(err, "Failed to remove checkpoint %s", cp.path)
+	}
+	return nil
+}
+
+// pacer spaces batches of deletions so that at most rate entities are deleted per second on average. A rate of 0
+// means unlimited.
+type pacer struct {
+	rate float64
+	next time.Time
+}
+
+// limit returns the size of the next batch: batchSize, lowered to the number of entities that may be deleted in one
+// second so that the budget is spread evenly instead of being consumed by bursts.
+func (p *pacer) limit(batchSize int) int {
+	if p.rate > 0 && p.rate < float64(batchSize) {
+		return max(1, int(p.rate))
+	}
+	return batchSize
+}
+
+// wait blocks until deleting n entities in a batch started at start fits in the budget, or until ctx is done.
+func (p *pacer) wait(ctx context.Context, start time.Time, n int) error {
+	if p.rate <= 0 {
+		return nil
+	}
+	if p.next.Before(start) {
+		p.next = start
+	}
+	p.next = p.next.Add(time.Duration(float64(n) / p.rate * float64(time.Second)))
+
+	timer := time.NewTimer(time.Until(p.next))
+	defer timer.Stop()
+	select {
+	case <-ctx.Done():
+		return ctx.Err()
+	case <-timer.C:
+		return nil
+	}
+}
+
+// evictMetrics are the instruments reporting the progress of the eviction. They are no-ops unless serveMetrics was
+// called before newEvictMetrics.
+type evictMetrics struct {
+	evicted       metric.Int64Counter
+	remaining     metric.Int64Gauge
+	batchDuration metric.Float64Histogram
+}
+
+func newEvictMetrics() (*evictMetrics, error) {
+	meter := otel.Meter("evict")
+
+	evicted, err := meter.Int64Counter(
+		"evict_evicted_entities",
+		metric.WithDescription("Number of expired entities deleted"),
+	)
+	if err != nil {
+		return nil, err
+	}
+	remaining, err := meter.Int64Gauge(
+		"evict_remaining_entities",
+		metric.WithDescription("Number of expired entities left to delete"),
+	)
+	if err != nil {
+		return nil, err
+	}
+	batchDuration, err := meter.Float64Histogram(
+		"evict_batch_duration",
+		metric.WithDescription("Duration of the transactions listing and deleting a batch of expired entities"),
+		metric.WithUnit("s"),
+	)
+	if err != nil {
+		return nil, err
+	}
+	return &evictMetrics{evicted: evicted, remaining: remaining, batchDuration: batchDuration}, nil
+}
+
+// serveMetrics exposes the metrics of the eviction on listeningAddress with a prometheus-compatible endpoint. The
+// returned function stops the endpoint.
+func serveMetrics(listeningAddress string) (func(context.Context) error, error) {
+	exporter, err := prometheus.New()
+	if err != nil {
+		return nil, err
+	}
+	provider := sdkmetric.NewMeterProvider(sdkmetric.WithReader(exporter))
+	otel.SetMeterProvider(provider)
+
+	mux := http.NewServeMux()
+	mux.Handle("/metrics", promhttp.Handler())
+	server := &http.Server{Addr: listeningAddress, Handler: mux}
+	go func() {
+		if err := server.ListenAndServe(); err != nil && !errors.Is(err, http.ErrServerClosed) {
+			log.Printf("error serving metrics: %v", err)
+		}
+	}()
+	log.Printf("serving metrics on %s", listeningAddress)
+
+	return func(ctx context.Context) error {
+		return errors.Join(server.Shutdown(ctx), provider.Shutdown(ctx))
+	}, nil
+}
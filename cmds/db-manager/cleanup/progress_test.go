@@ -0,0 +1,74 @@
+package cleanup
+
+import (
+	"context"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/require"
+)
+
+func TestCheckpointResume(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "evict.json")
+	scdThreshold := time.Date(2024, time.August, 14, 15, 48, 36, 0, time.UTC)
+	ridThreshold := scdThreshold.Add(time.Hour)
+
+	cp, err := loadCheckpoint(path, scdThreshold, ridThreshold, "locality")
+	require.NoError(t, err)
+	require.FileExists(t, path)
+	require.NoError(t, cp.update("scd_operational_intents", 10, false))
+	require.NoError(t, cp.update("scd_operational_intents", 3, true))
+	require.NoError(t, cp.update("scd_subscriptions", 5, false))
+
+	// A resumed run keeps the thresholds of the interrupted one.
+	resumed, err := loadCheckpoint(path, time.Now(), time.Now(), "locality")
+	require.NoError(t, err)
+	require.True(t, resumed.ScdThreshold.Equal(scdThreshold))
+	require.True(t, resumed.RidThreshold.Equal(ridThreshold))
+	require.True(t, resumed.completed("scd_operational_intents"))
+	require.False(t, resumed.completed("scd_subscriptions"))
+	require.Equal(t, map[string]int64{"scd_operational_intents": 13, "scd_subscriptions": 5}, resumed.Evicted)
+
+	_, err = loadCheckpoint(path, time.Now(), time.Now(), "other")
+	require.Error(t, err)
+
+	require.NoError(t, resumed.remove())
+	require.NoFileExists(t, path)
+	entries, err := os.ReadDir(filepath.Dir(path))
+	require.NoError(t, err)
+	require.Empty(t, entries)
+}
+
+func TestNilCheckpoint(t *testing.T) {
+	var cp *checkpoint
+	require.False(t, cp.completed("scd_operational_intents"))
+	require.NoError(t, cp.update("scd_operational_intents", 10, true))
+	require.NoError(t, cp.remove())
+}
+
+func TestPacer(t *testing.T) {
+	ctx := context.Background()
+
+	unlimited := pacer{}
+	require.Equal(t, 1000, unlimited.limit(1000))
+	require.NoError(t, unlimited.wait(ctx, time.Now(), 1000))
+
+	p := pacer{rate: 200}
+	require.Equal(t, 200, p.limit(1000))
+	require.Equal(t, 50, p.limit(50))
+	require.Equal(t, 1, (&pacer{rate: 0.5}).limit(1000))
+
+	// Deleting 40 entities at 200 per second takes 200ms, part of which was spent in the batch itself.
+	start := time.Now()
+	require.NoError(t, p.wait(ctx, start.Add(-50*time.Millisecond), 20))
+	require.NoError(t, p.wait(ctx, time.Now(), 20))
+	elapsed := time.Since(start)
+	require.GreaterOrEqual(t, elapsed, 140*time.Millisecond)
+	require.Less(t, elapsed, time.Second)
+
+	cancelled, cancel := context.WithCancel(ctx)
+	cancel()
+	require.ErrorIs(t, p.wait(cancelled, time.Now(), 1000), context.Canceled)
+}
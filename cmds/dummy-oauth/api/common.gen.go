@@ -2,12 +2,14 @@
 package api
 
 import (
+	"bytes"
+	"compress/gzip"
 	"encoding/json"
 	"fmt"
-	"io"
-	"log"
 	"net/http"
-	"regexp"
+	"strconv"
+	"strings"
+	"sync"
 )
 
 // --- Interface definitions ---
@@ -27,6 +29,42 @@ type RequiredScope string
 // All RequiredScope of all SecurityScheme must be presented simultaneously to use this option.
 type AuthorizationOption map[SecurityScheme][]RequiredScope
 
+// ScopeMask is a set of RequiredScope, in which each scope registered with RegisterScopes is represented by one bit.
+type ScopeMask uint64
+
+// Contains returns true if every scope of required is also in m.
+func (m ScopeMask) Contains(required ScopeMask) bool {
+	return m&required == required
+}
+
+// Bit of each scope registered by the API packages.  It is only written during package initialization, so it may be
+// read concurrently afterward.
+var scopeBits = map[RequiredScope]ScopeMask{}
+
+// RegisterScopes assigns a bit to each of the provided scopes not registered yet and returns the ScopeMask of each
+// provided scope.  Generated API packages register their scopes during their initialization, so it must not be called
+// once requests are being handled.  Scopes used by several APIs share the same bit.
+func RegisterScopes(scopes ...RequiredScope) []ScopeMask {
+	masks := make([]ScopeMask, len(scopes))
+	for i, scope := range scopes {
+		mask, ok := scopeBits[scope]
+		if !ok {
+			if len(scopeBits) == 64 {
+				panic(fmt.Sprintf("unable to register scope %s: a ScopeMask holds at most 64 scopes", scope))
+			}
+			mask = ScopeMask(1) << len(scopeBits)
+			scopeBits[scope] = mask
+		}
+		masks[i] = mask
+	}
+	return masks
+}
+
+// ScopeMaskOf returns the ScopeMask of the provided scope, or an empty ScopeMask if no API registered this scope.
+func ScopeMaskOf(scope RequiredScope) ScopeMask {
+	return scopeBits[scope]
+}
+
 type AuthorizationResult struct {
 	// ID of the client making the operation request
 	ClientID *string
@@ -39,33 +77,226 @@ type AuthorizationResult struct {
 }
 
 type Authorizer interface {
-	Authorize(w http.ResponseWriter, r *http.Request, authOptions []AuthorizationOption) AuthorizationResult
+	// authMasks holds the ScopeMask of each of authOptions, in the same order.
+	Authorize(w http.ResponseWriter, r *http.Request, authOptions []AuthorizationOption, authMasks []ScopeMask) AuthorizationResult
 }
 
 // --- Utilities ---
 
+// ResponseCompressionMinSize is the minimum size, in bytes, of a JSON response body to gzip-compress when the client's Accept-Encoding allows it.
+// Zero or a negative value disables response compression.
+var ResponseCompressionMinSize = 0
+
+// Buffers larger than this are not returned to the pool so that one very large response does not pin its memory.
+const maxPooledJSONBufferSize = 1 << 20
+
+var jsonBufferPool = sync.Pool{
+	New: func() interface{} {
+		b := make([]byte, 0, 4096)
+		return &b
+	},
+}
+
+var gzipWriterPool = sync.Pool{
+	New: func() interface{} {
+		zw, _ := gzip.NewWriterLevel(nil, gzip.BestSpeed)
+		return zw
+	},
+}
+
+func getJSONBuffer() *[]byte {
+	return jsonBufferPool.Get().(*[]byte)
+}
+
+func putJSONBuffer(p *[]byte, b []byte) {
+	if cap(b) > maxPooledJSONBufferSize {
+		return
+	}
+	*p = b[:0]
+	jsonBufferPool.Put(p)
+}
+
+// WriteJSON writes obj to w as JSON without negotiating a compressed response; see WriteJSONResponse.
 func WriteJSON(w http.ResponseWriter, code int, obj interface{}) {
-	w.Header().Set("Content-Type", "application/json; charset=utf-8")
+	WriteJSONResponse(w, nil, code, obj)
+}
+
+// WriteJSONResponse encodes obj into a pooled buffer and writes it to w with a Content-Length, compressing it when
+// ResponseCompressionMinSize is reached and r (which may be nil) accepts gzip.
+func WriteJSONResponse(w http.ResponseWriter, r *http.Request, code int, obj interface{}) {
+	p := getJSONBuffer()
+	buf := bytes.NewBuffer((*p)[:0])
+	if err := json.NewEncoder(buf).Encode(obj); err != nil {
+		buf.Reset()
+		buf.WriteString(fmt.Sprintf("{\"error_message\": \"Error encoding JSON: %s\"}", err.Error()))
+	}
+	b := buf.Bytes()
+	defer putJSONBuffer(p, b)
+	writeJSONBody(w, r, code, b)
+}
+
+// writeJSONBody writes the encoded JSON body b to w, gzip-compressed if appropriate for r.
+func writeJSONBody(w http.ResponseWriter, r *http.Request, code int, b []byte) {
+	header := w.Header()
+	header.Set("Content-Type", "application/json; charset=utf-8")
+	if ResponseCompressionMinSize > 0 {
+		header.Add("Vary", "Accept-Encoding")
+		if len(b) >= ResponseCompressionMinSize && r != nil && acceptsGzip(r.Header.Values("Accept-Encoding")) {
+			p := getJSONBuffer()
+			buf := bytes.NewBuffer((*p)[:0])
+			zw := gzipWriterPool.Get().(*gzip.Writer)
+			zw.Reset(buf)
+			_, err := zw.Write(b)
+			if err == nil {
+				err = zw.Close()
+			}
+			gzipWriterPool.Put(zw)
+			if err == nil {
+				b = buf.Bytes()
+				header.Set("Content-Encoding", "gzip")
+			}
+			defer putJSONBuffer(p, buf.Bytes())
+		}
+	}
+	header.Set("Content-Length", strconv.Itoa(len(b)))
 	w.WriteHeader(code)
-	if err := json.NewEncoder(w).Encode(obj); err != nil {
-		if _, err = io.WriteString(w, fmt.Sprintf("{\"error_message\": \"Error encoding JSON: %s\"}", err.Error())); err != nil {
-			log.Panicf("Unable to encode JSON for %d response: %v", code, err)
+	// An error here means the client connection is no longer usable, so there is nobody left to report it to.
+	_, _ = w.Write(b)
+}
+
+// acceptsGzip returns true if the Accept-Encoding header values allow a gzip-encoded response.
+func acceptsGzip(values []string) bool {
+	gzipQ, wildcardQ := -1.0, -1.0
+	for _, value := range values {
+		for _, coding := range strings.Split(value, ",") {
+			name, params, _ := strings.Cut(coding, ";")
+			q := 1.0
+			for _, param := range strings.Split(params, ";") {
+				k, v, ok := strings.Cut(strings.TrimSpace(param), "=")
+				if ok && strings.EqualFold(strings.TrimSpace(k), "q") {
+					if parsed, err := strconv.ParseFloat(strings.TrimSpace(v), 64); err == nil {
+						q = parsed
+					}
+				}
+			}
+			switch name = strings.TrimSpace(name); {
+			case strings.EqualFold(name, "gzip") || strings.EqualFold(name, "x-gzip"):
+				gzipQ = q
+			case name == "*":
+				wildcardQ = q
+			}
 		}
 	}
+	if gzipQ >= 0 {
+		return gzipQ > 0
+	}
+	return wildcardQ > 0
 }
 
 // --- API router definitions ---
 
-type Handler func(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request)
+// Handler handles a routed request; pathParams holds the values of the path parameters of the route, in the order they appear in the route's Path.
+type Handler func(pathParams []string, w http.ResponseWriter, r *http.Request)
 
 type Route struct {
 	Method  string
-	Pattern *regexp.Regexp
 	Handler Handler
 	Name    string
 	Path    string
 }
 
+// RouteTrie matches requests to Routes by walking a tree of path segments for the request method.
+// Static segments take precedence over path parameters, and path parameters are captured during the same walk.
+type RouteTrie struct {
+	roots     map[string]*routeNode
+	maxParams int
+}
+
+type routeNode struct {
+	static map[string]*routeNode
+	param  *routeNode
+	route  *Route
+}
+
+func NewRouteTrie(routes []*Route) *RouteTrie {
+	t := &RouteTrie{roots: map[string]*routeNode{}}
+	for _, route := range routes {
+		t.Add(route)
+	}
+	return t
+}
+
+// Add inserts the provided Route into the trie.  If a Route with the same Method and Path was already added, the earlier Route is kept.
+func (t *RouteTrie) Add(route *Route) {
+	node, ok := t.roots[route.Method]
+	if !ok {
+		node = &routeNode{}
+		t.roots[route.Method] = node
+	}
+	nParams := 0
+	for _, segment := range strings.Split(strings.TrimPrefix(route.Path, "/"), "/") {
+		if strings.HasPrefix(segment, "{") && strings.HasSuffix(segment, "}") {
+			if node.param == nil {
+				node.param = &routeNode{}
+			}
+			node = node.param
+			nParams++
+		} else {
+			if node.static == nil {
+				node.static = map[string]*routeNode{}
+			}
+			child, ok := node.static[segment]
+			if !ok {
+				child = &routeNode{}
+				node.static[segment] = child
+			}
+			node = child
+		}
+	}
+	if node.route == nil {
+		node.route = route
+	}
+	if nParams > t.maxParams {
+		t.maxParams = nParams
+	}
+}
+
+// Match returns the Route matching the provided method and path along with the values of its path parameters, or nil if no Route matches.
+func (t *RouteTrie) Match(method string, path string) (*Route, []string) {
+	node, ok := t.roots[method]
+	if !ok || !strings.HasPrefix(path, "/") {
+		return nil, nil
+	}
+	var params []string
+	if t.maxParams > 0 {
+		params = make([]string, 0, t.maxParams)
+	}
+	return node.match(path[1:], params)
+}
+
+func (n *routeNode) match(path string, params []string) (*Route, []string) {
+	segment, rest, more := strings.Cut(path, "/")
+	if child, ok := n.static[segment]; ok {
+		if route, matched := child.matchRest(rest, more, params); route != nil {
+			return route, matched
+		}
+	}
+	if n.param != nil {
+		return n.param.matchRest(rest, more, append(params, segment))
+	}
+	return nil, nil
+}
+
+func (n *routeNode) matchRest(rest string, more bool, params []string) (*Route, []string) {
+	if more {
+		return n.match(rest, params)
+	}
+	if n.route != nil {
+		return n.route, params
+	}
+	return nil, nil
+}
+
 type PartialRouter interface {
 	Handle(w http.ResponseWriter, r *http.Request) bool
 }
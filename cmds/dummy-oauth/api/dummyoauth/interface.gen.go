@@ -7,7 +7,8 @@ import (
 )
 
 var (
-	GetTokenSecurity = []api.AuthorizationOption{}
+	GetTokenSecurity      = []api.AuthorizationOption{}
+	GetTokenSecurityMasks = []api.ScopeMask{}
 )
 
 type GetTokenRequest struct {
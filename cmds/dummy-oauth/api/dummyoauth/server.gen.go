@@ -10,12 +10,12 @@ import (
 	semconv "go.opentelemetry.io/otel/semconv/v1.40.0"
 	"go.opentelemetry.io/otel/trace"
 	"net/http"
-	"regexp"
 	"strconv"
 )
 
 type APIRouter struct {
 	Routes         []*api.Route
+	Trie           *api.RouteTrie
 	Implementation Implementation
 	Authorizer     api.Authorizer
 }
@@ -24,32 +24,31 @@ var tracer = otel.Tracer("dummyoauth.api")
 
 // *dummyoauth.APIRouter (type defined above) implements the api.PartialRouter interface
 func (s *APIRouter) Handle(w http.ResponseWriter, r *http.Request) bool {
-	for _, route := range s.Routes {
-		if route.Method == r.Method && route.Pattern.MatchString(r.URL.Path) {
+	route, pathParams := s.Trie.Match(r.Method, r.URL.Path)
+	if route == nil {
+		return false
+	}
 
-			if labeler, ok := otelhttp.LabelerFromContext(r.Context()); ok {
-				labeler.Add(semconv.HTTPRoute(route.Path))
-			}
+	if labeler, ok := otelhttp.LabelerFromContext(r.Context()); ok {
+		labeler.Add(semconv.HTTPRoute(route.Path))
+	}
 
-			// We retrieve the current span from the otelhttp handler to set its name property.
-			span := trace.SpanFromContext(r.Context())
+	// We retrieve the current span from the otelhttp handler to set its name property.
+	span := trace.SpanFromContext(r.Context())
 
-			if span.IsRecording() { // If the span is not recording, the name cannot be changed. This also likely means the otelhttp handler is not present (tracing disabled).
-				span.SetName(fmt.Sprintf("%s %s", r.Method, route.Path))
-			}
+	if span.IsRecording() { // If the span is not recording, the name cannot be changed. This also likely means the otelhttp handler is not present (tracing disabled).
+		span.SetName(fmt.Sprintf("%s %s", r.Method, route.Path))
+	}
 
-			ctx, span := tracer.Start(r.Context(), route.Name)
-			defer span.End()
-			r = r.WithContext(ctx)
+	ctx, span := tracer.Start(r.Context(), route.Name)
+	defer span.End()
+	r = r.WithContext(ctx)
 
-			route.Handler(route.Pattern, w, r)
-			return true
-		}
-	}
-	return false
+	route.Handler(pathParams, w, r)
+	return true
 }
 
-func (s *APIRouter) GetToken(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetToken(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetTokenRequest
 	var response GetTokenResponseSet
 
@@ -85,25 +84,25 @@ func (s *APIRouter) GetToken(exp *regexp.Regexp, w http.ResponseWriter, r *http.
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
 func MakeAPIRouter(impl Implementation, auth api.Authorizer) APIRouter {
 	router := APIRouter{Implementation: impl, Authorizer: auth, Routes: make([]*api.Route, 1)}
 
-	pattern := regexp.MustCompile("^/token$")
-	router.Routes[0] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetToken, Name: "dummyoauth.GetToken", Path: "/token"}
+	router.Routes[0] = &api.Route{Method: http.MethodGet, Handler: router.GetToken, Name: "dummyoauth.GetToken", Path: "/token"}
 
+	router.Trie = api.NewRouteTrie(router.Routes)
 	return router
 }
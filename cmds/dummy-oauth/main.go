@@ -86,7 +86,7 @@ func (s *DummyOAuthImplementation) GetToken(ctx context.Context, req *dummyoauth
 
 type PermissiveAuthorizer struct{}
 
-func (*PermissiveAuthorizer) Authorize(w http.ResponseWriter, r *http.Request, authOptions []api.AuthorizationOption) api.AuthorizationResult {
+func (*PermissiveAuthorizer) Authorize(w http.ResponseWriter, r *http.Request, authOptions []api.AuthorizationOption, authMasks []api.ScopeMask) api.AuthorizationResult {
 	return api.AuthorizationResult{}
 }
 
@@ -1,90 +1,141 @@
+import base64
+import hashlib
+import json
 import subprocess
 import os
+import sys
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+FIELD_MANAGER = "dss-certs"
+CONTENT_HASH_ANNOTATION = "dss-certs.interuss.org/content-hash"
+
+JWT_PUBLIC_CERTS_DIR = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    "..",
+    "..",
+    "..",
+    "build",
+    "jwt-public-certs",
+)
+
+
+def kubectl(cluster, args, input=None):
+    return subprocess.run(
+        ["kubectl"] + args + ["--context", cluster.cluster_context],
+        input=input,
+        capture_output=True,
+        text=True,
+    )
+
+
+def build_secret(cluster, secret_name, folder):
+    """Render a secret holding each file of folder, like `kubectl create secret generic --from-file`"""
+    data = {}
+    for filename in sorted(os.listdir(folder)):
+        path = os.path.join(folder, filename)
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                data[filename] = base64.b64encode(f.read()).decode("ascii")
+
+    h = hashlib.sha256()
+    for key, value in data.items():
+        h.update(f"{key}={value}\n".encode("ascii"))
+
+    return {
+        "apiVersion": "v1",
+        "kind": "Secret",
+        "type": "Opaque",
+        "metadata": {
+            "name": secret_name,
+            "namespace": cluster.namespace,
+            "annotations": {CONTENT_HASH_ANNOTATION: h.hexdigest()},
+        },
+        "data": data,
+    }
+
+
+def get_applied_hashes(cluster):
+    """Returns the content hash of each secret of the namespace previously applied by this tool"""
+    process = kubectl(
+        cluster, ["get", "secrets", "--namespace", cluster.namespace, "-o", "json"]
+    )
+    if process.returncode != 0:
+        logger.debug(f"Unable to list secrets, assuming none exist: {process.stderr}")
+        return {}
+
+    return {
+        secret["metadata"]["name"]: secret["metadata"]
+        .get("annotations", {})
+        .get(CONTENT_HASH_ANNOTATION)
+        for secret in json.loads(process.stdout).get("items", [])
+    }
+
 
 def do_apply(cluster):
     logger.debug("Applying kubernetes configuration")
 
-    logger.debug(f"Creating namespace {cluster.namespace}")
-
-    try:
-        subprocess.check_call(
-            [
-                "kubectl",
-                "create",
-                "namespace",
-                cluster.namespace,
-                "--context",
-                cluster.cluster_context,
-            ],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-
-        logger.info(f"Created namespace {cluster.namespace}")
-
-    except subprocess.CalledProcessError:  # We do assume everything else works
-        logger.debug(f"Namespace {cluster.namespace} already exists")
-
-    for secret_name in [
-        "yb-master-yugabyte-tls-cert",
-        "yb-tserver-yugabyte-tls-cert",
-        "yugabyte-tls-client-cert",
-        "dss.public.certs",
-        "monitoring.grafana.certs",
-        "monitoring.prometheus.certs",
-    ]:
-        try:
-            subprocess.check_call(
-                [
-                    "kubectl",
-                    "delete",
-                    "secret",
-                    secret_name,
-                    "--namespace",
-                    cluster.namespace,
-                    "--context",
-                    cluster.cluster_context,
-                ],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-
-            logger.info(f"Deleted old secret '{secret_name}'")
-
-        except subprocess.CalledProcessError:  # We do assume everything else works
-            logger.debug(f"Secret '{secret_name}' not present on the cluster")
-
-    for secret_name, folder in [
-        ("yb-master-yugabyte-tls-cert", cluster.master_certs_dir),
-        ("yb-tserver-yugabyte-tls-cert", cluster.tserver_certs_dir),
-        ("monitoring.grafana.certs", cluster.client_certs_dir),
-        ("yugabyte-tls-client-cert", cluster.client_certs_dir),
-        ("monitoring.prometheus.certs", cluster.prometheus_certs_dir),
-        (
-            "dss.public.certs",
-            os.path.join("..", "..", "..", "build", "jwt-public-certs"),
-        ),
-    ]:
-        subprocess.check_call(
-            [
-                "kubectl",
-                "create",
-                "secret",
-                "generic",
-                secret_name,
-                "--namespace",
-                cluster.namespace,
-                "--context",
-                cluster.cluster_context,
-                "--from-file",
-                folder,
-            ],
-            stdout=subprocess.DEVNULL,
-        )
-
-        logger.info(f"Created secret '{secret_name}'")
+    secrets = [
+        build_secret(cluster, secret_name, folder)
+        for secret_name, folder in [
+            ("yb-master-yugabyte-tls-cert", cluster.master_certs_dir),
+            ("yb-tserver-yugabyte-tls-cert", cluster.tserver_certs_dir),
+            ("monitoring.grafana.certs", cluster.client_certs_dir),
+            ("yugabyte-tls-client-cert", cluster.client_certs_dir),
+            ("monitoring.prometheus.certs", cluster.prometheus_certs_dir),
+            ("dss.public.certs", JWT_PUBLIC_CERTS_DIR),
+        ]
+    ]
+
+    applied_hashes = get_applied_hashes(cluster)
+
+    changed = []
+    for secret in secrets:
+        name = secret["metadata"]["name"]
+        if (
+            applied_hashes.get(name)
+            == secret["metadata"]["annotations"][CONTENT_HASH_ANNOTATION]
+        ):
+            logger.info(f"Secret '{name}' is up to date")
+        else:
+            changed.append(secret)
+
+    if not changed:
+        logger.info("All secrets are up to date, nothing to apply")
+        return
+
+    # The namespace is applied along the secrets, in case it doesn't exist yet
+    manifest = {
+        "apiVersion": "v1",
+        "kind": "List",
+        "items": [
+            {
+                "apiVersion": "v1",
+                "kind": "Namespace",
+                "metadata": {"name": cluster.namespace},
+            }
+        ]
+        + changed,
+    }
+
+    process = kubectl(
+        cluster,
+        [
+            "apply",
+            "--server-side",
+            "--force-conflicts",
+            "--field-manager",
+            FIELD_MANAGER,
+            "-f",
+            "-",
+        ],
+        input=json.dumps(manifest),
+    )
+    if process.returncode != 0:
+        logger.error(f"Unable to apply secrets: {process.stderr}")
+        sys.exit(1)
+
+    for secret in changed:
+        logger.info(f"Applied secret '{secret['metadata']['name']}'")
@@ -1,23 +1,67 @@
 import base64
 import hashlib
+import json
 import logging
 import os
 import re
-import shutil
-import tempfile
 
-from utils import get_cert_display_name, get_cert_serial
+from utils import get_cert_metadata, write_file_atomically, write_if_changed
 
 logger = logging.getLogger(__name__)
 
+POOL_INDEX_FILE = "index.json"
+POOL_HASH_FILE = "ca.hash"
 
-def build_pool_hash(cluster):
-    CAs = []
-    for f in os.listdir(cluster.ca_pool_dir):
-        if f.endswith(".crt") and f != "ca.crt":
-            CAs.append(f.lower())
 
-    CAs = sorted(CAs)
+def pool_certificates(cluster):
+    """Returns the sorted file names of the CA certificates in the pool"""
+    return sorted(
+        f
+        for f in os.listdir(cluster.ca_pool_dir)
+        if f.endswith(".crt") and f != "ca.crt"
+    )
+
+
+def load_pool_index(cluster):
+    """Returns the metadata of each CA certificate in the pool, by file name.
+
+    Metadata is cached in the pool directory and only decoded again for certificates whose file changed since."""
+    index_file = os.path.join(cluster.ca_pool_dir, POOL_INDEX_FILE)
+
+    try:
+        with open(index_file, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = {}
+
+    index = {}
+    for filename in pool_certificates(cluster):
+        path = os.path.join(cluster.ca_pool_dir, filename)
+        stat = os.stat(path)
+        entry = cached.get(filename)
+        if (
+            entry
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            index[filename] = entry
+            continue
+
+        logger.debug(f"Indexing CA {filename}")
+        with open(path, "r") as f:
+            entry = get_cert_metadata(f.read())
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        index[filename] = entry
+
+    if index != cached:
+        write_file_atomically(index_file, json.dumps(index, indent=2, sort_keys=True))
+
+    return index
+
+
+def build_pool_hash(cluster):
+    CAs = sorted(f.lower() for f in pool_certificates(cluster))
 
     h = hashlib.sha256()
     h.update((",".join(CAs)).encode("utf-8"))
@@ -33,51 +77,73 @@ def add_cas(cluster, certificate):
 
     logger.debug("Getting new CA metadata")
 
-    with tempfile.NamedTemporaryFile(delete_on_close=False) as tf:
-        tf.write(certificate.encode("utf-8"))
-        tf.close()
+    metadata = get_cert_metadata(certificate)
+    name = metadata["name"]
+
+    target_file = os.path.join(folder, f"{metadata['serial']}.crt")
 
-        serial = get_cert_serial(tf.name)
-        name = get_cert_display_name(tf.name)
+    if os.path.exists(target_file):
+        logger.info(f"CA {name} already present in the pool")
+        return
 
-        filename = f"{serial}.crt"
+    logger.info(f"Adding CA {name} in the pool")
 
-        target_file = os.path.join(folder, filename)
+    with open(target_file, "w") as f:
+        f.write(certificate)
 
-        if os.path.exists(target_file):
-            logger.info(f"CA {name} already present in the pool")
-            return
 
-        logger.info(f"Adding CA {name} in the pool")
+def regenerate_ca_files(cluster):
+    """Regenerates the CA bundles from the CA pool if it changed since the last regeneration.
 
-        with open(target_file, "w") as f:
-            f.write(certificate)
+    Returns the list of files that were written, empty if all of them were already up to date."""
+    h = build_pool_hash(cluster)
+    hash_file = os.path.join(cluster.ca_pool_dir, POOL_HASH_FILE)
 
+    pool_bundles = [cluster.ca_pool_ca, cluster.client_ca] + [
+        getattr(cluster, f"{node_type}_ca")
+        for node_type in ["master", "tserver", "prometheus"]
+    ]
+
+    try:
+        with open(hash_file, "r") as f:
+            previous_hash = f.read()
+    except FileNotFoundError:
+        previous_hash = None
+
+    if previous_hash == h and all(
+        os.path.exists(f) for f in pool_bundles + [cluster.client_instance_ca]
+    ):
+        logger.info(f"CA files are up to date. Current pool hash: {h}")
+        return []
 
-def regenerate_ca_files(cluster):
     logger.debug("Regenerating CA files from all CA in the pool")
 
     CAs = []
-    for filename in os.listdir(cluster.ca_pool_dir):
-        if filename.endswith(".crt") and filename != "ca.crt":
-            with open(os.path.join(cluster.ca_pool_dir, filename), "r") as f:
-                CAs.append(f.read())
+    for filename in pool_certificates(cluster):
+        with open(os.path.join(cluster.ca_pool_dir, filename), "r") as f:
+            CAs.append(f.read())
+
+    bundle = "\n\n".join(sorted(CAs))
 
-    CAs = sorted(CAs)
+    with open(cluster.ca_cert_file, "r") as f:
+        instance_ca = f.read()
 
-    with open(cluster.ca_pool_ca, "w") as f:
-        f.write("\n\n".join(CAs))
+    changed = [f for f in pool_bundles if write_if_changed(f, bundle)]
+    if write_if_changed(cluster.client_instance_ca, instance_ca):
+        changed.append(cluster.client_instance_ca)
 
-    shutil.copy(cluster.ca_pool_ca, cluster.client_ca)
-    shutil.copy(cluster.ca_cert_file, cluster.client_instance_ca)
+    for f in changed:
+        logger.info(f"Updated {os.path.relpath(f, cluster.directory)}")
 
-    for node_type in ["master", "tserver", "prometheus"]:
-        shutil.copy(cluster.ca_pool_ca, getattr(cluster, f"{node_type}_ca"))
+    # Keep the index in sync with the pool, only newly added certificates are decoded
+    load_pool_index(cluster)
 
-    h = build_pool_hash(cluster)
+    write_file_atomically(hash_file, h)
 
     logger.info(f"Regenerated CA files from the CA pool. Current pool hash: {h}")
 
+    return changed
+
 
 def do_add_cas(cluster, certificates):
     pattern = re.compile(
@@ -94,35 +160,29 @@ def do_remove_cas(cluster, certificates_or_serial):
         r"-----BEGIN CERTIFICATE-----\s*.+?\s*-----END CERTIFICATE-----", re.DOTALL
     )
     for cert in pattern.findall(certificates_or_serial):
-        with tempfile.NamedTemporaryFile(delete_on_close=False) as tf:
-            tf.write(cert.encode("utf-8"))
-            tf.close()
-            serial = get_cert_serial(tf.name)
-            name = get_cert_display_name(tf.name)
-
-            filename = f"{serial}.crt"
-
-            target = os.path.join(cluster.ca_pool_dir, filename)
-
-            if os.path.isfile(target):
-                os.unlink(target)
-                logger.info(f"Removed certificate {name}")
-            else:
-                logger.info(f"Certificate {name} not present in pool")
-
-    for filename in sorted(os.listdir(cluster.ca_pool_dir)):
-        if filename.endswith(".crt") and filename != "ca.crt":
-            serial = get_cert_serial(os.path.join(cluster.ca_pool_dir, filename))
-            name = get_cert_display_name(os.path.join(cluster.ca_pool_dir, filename))
-
-            if (
-                certificates_or_serial == name
-                or certificates_or_serial == serial
-                or f"SN={certificates_or_serial}, " in name
-                or name.startswith(certificates_or_serial)
-            ):
-                os.unlink(os.path.join(cluster.ca_pool_dir, filename))
-                logger.info(f"Removed certificate {name}")
+        metadata = get_cert_metadata(cert)
+        name = metadata["name"]
+
+        target = os.path.join(cluster.ca_pool_dir, f"{metadata['serial']}.crt")
+
+        if os.path.isfile(target):
+            os.unlink(target)
+            logger.info(f"Removed certificate {name}")
+        else:
+            logger.info(f"Certificate {name} not present in pool")
+
+    for filename, metadata in load_pool_index(cluster).items():
+        serial = metadata["serial"]
+        name = metadata["name"]
+
+        if (
+            certificates_or_serial == name
+            or certificates_or_serial == serial
+            or f"SN={certificates_or_serial}, " in name
+            or name.startswith(certificates_or_serial)
+        ):
+            os.unlink(os.path.join(cluster.ca_pool_dir, filename))
+            logger.info(f"Removed certificate {name}")
 
     regenerate_ca_files(cluster)
 
@@ -142,6 +202,5 @@ def do_list_pool_ca(cluster):
 
     print(f"Current CA pool hash: {h}")
 
-    for filename in sorted(os.listdir(cluster.ca_pool_dir)):
-        if filename.endswith(".crt") and filename != "ca.crt":
-            print(get_cert_display_name(os.path.join(cluster.ca_pool_dir, filename)))
+    for metadata in load_pool_index(cluster).values():
+        print(metadata["name"])
@@ -1,6 +1,6 @@
 import os
 
-from utils import slugify
+from utils import slugify, DEFAULT_KEY_TYPE
 
 
 class Cluster(object):
@@ -14,6 +14,7 @@ class Cluster(object):
         organization,
         nodes_count,
         nodes_public_address,
+        key_type=DEFAULT_KEY_TYPE,
     ):
         self._name = name
         self.cluster_context = cluster_context
@@ -21,6 +22,7 @@ class Cluster(object):
         self.organization = organization
         self.nodes_count = nodes_count
         self.nodes_public_address = nodes_public_address
+        self.key_type = key_type
 
     @property
     def name(self):
@@ -9,6 +9,7 @@ from apply import do_apply
 from cluster import Cluster
 from init import do_init, do_generate_clients
 from nodes import do_generate_nodes
+from utils import KEY_TYPES, DEFAULT_KEY_TYPE
 from ca_pool import (
     do_get_pool_ca,
     do_get_ca,
@@ -60,6 +61,13 @@ def parse_args():
         default="",
         help="Public node address. Use <ID> to indicate id of the node (0, 1, ...), <TYPE> for the type (tserver, masters). Example: '<ID>.<TYPE>.db.interuss.example'",
     )
+    parser.add_argument(
+        "--key-type",
+        metavar="KEY_TYPE",
+        default=DEFAULT_KEY_TYPE,
+        choices=list(KEY_TYPES),
+        help=f"Type of the private keys generated for the CA, nodes and clients, one of {', '.join(KEY_TYPES)}. Default to {DEFAULT_KEY_TYPE}",
+    )
     parser.add_argument(
         "--ca-file",
         metavar="CA_FILE",
@@ -116,6 +124,7 @@ def main():
         args.organization,
         args.nodes_count,
         args.nodes_public_address,
+        args.key_type,
     )
 
     def read_input():
@@ -5,7 +5,7 @@ import sys
 
 from ca_pool import do_add_cas
 from nodes import do_generate_nodes
-from utils import get_cert_display_name
+from utils import get_cert_display_name, generate_private_key
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +13,9 @@ logger = logging.getLogger(__name__)
 def generate_ca_config(cluster):
     logger.debug("Creating CA configuration files")
 
+    # Ed25519 signatures embed their digest, and cannot be combined with another one
+    default_md = "default" if cluster.key_type == "ed25519" else "sha256"
+
     with open(cluster.ca_conf, "w") as f:
         f.write(
             f"""
@@ -24,7 +27,7 @@ default_days = 3650
 
 serial = {cluster.ca_key_dir}/serialogger.txt
 database = {cluster.ca_key_dir}/index.txt
-default_md = sha256
+default_md = {default_md}
 policy = my_policy
 
 [ my_policy ]
@@ -59,10 +62,7 @@ basicConstraints = critical,CA:true,pathlen:1
 
 def generate_ca_key(cluster):
     logger.debug("Generating CA private key")
-    subprocess.check_call(
-        ["openssl", "genrsa", "-out", cluster.ca_key_file, "4096"],
-        stdout=subprocess.DEVNULL,
-    )
+    generate_private_key(cluster.ca_key_file, cluster.key_type)
     logger.info("Generated CA private key")
 
 
@@ -146,9 +146,7 @@ commonName = {client}
 def generate_client_key(cluster, client):
     logger.debug(f"Generating client '{client}' private key")
 
-    subprocess.check_call(
-        ["openssl", "genrsa", "-out", cluster.get_client_key_file(client), "4096"]
-    )
+    generate_private_key(cluster.get_client_key_file(client), cluster.key_type)
 
     logger.info(f"Generated client '{client}' private key")
 
@@ -1,16 +1,16 @@
 import logging
+import os
 import subprocess
 import sys
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
-from utils import get_cert_display_name
+from utils import get_cert_display_name, generate_private_key
 
 logger = logging.getLogger(__name__)
 
 
 def generate_node_config(cluster, node_type, node_id):
-    logger.debug(f"Creating {node_type} #{node_id} configuration file")
-
     short_name = cluster.get_node_short_name(node_type, node_id)
     short_name_group = cluster.get_node_short_name_group(node_type, node_id)
     full_name = cluster.get_node_full_name(node_type, node_id)
@@ -48,35 +48,19 @@ DNS.7 = yb-{node_type}s.{cluster.namespace}.svc.cluster.local
             f.write(f"""DNS.8 = {public_address}
 """)
 
-    logger.info(f"Created {node_type} #{node_id} configuration file")
-
 
 def generate_node_key(cluster, node_type, node_id):
-    logger.debug(f"Generating {node_type} #{node_id} private key")
-
     file = cluster.get_node_key_file(node_type, node_id)
 
-    subprocess.check_call(
-        [
-            "openssl",
-            "genrsa",
-            "-out",
-            file,
-            "4096",
-        ]
-    )
+    generate_private_key(file, cluster.key_type)
 
     second_file = cluster.get_node_key_second_file(node_type, node_id)
 
     if second_file:
         shutil.copy(file, second_file)
 
-    logger.info(f"Generated {node_type} #{node_id} private key")
-
 
 def generate_node_csr(cluster, node_type, node_id):
-    logger.debug(f"Generating {node_type} #{node_id} certificate request")
-
     subprocess.check_call(
         [
             "openssl",
@@ -92,8 +76,6 @@ def generate_node_csr(cluster, node_type, node_id):
         stdout=subprocess.DEVNULL,
     )
 
-    logger.info(f"Generated {node_type} #{node_id} certificate request")
-
 
 def generate_node_cert(cluster, node_type, node_id):
     logger.debug(f"Generating {node_type} #{node_id} certificate")
@@ -140,19 +122,51 @@ def generate_node_cert(cluster, node_type, node_id):
     logger.info(f"Generated {node_type} #{node_id} certificate '{name}'")
 
 
-def generate_node(cluster, node_type, node_id):
-    if cluster.is_node_ready(node_type, node_id):
-        logger.debug(f"{node_type} #{node_id} certificates already generated")
-        return
-
+def prepare_node(cluster, node_type, node_id):
+    """Generate the configuration, private key and certificate request of a node.
+    Nodes are independent of each other, so this may run concurrently for several nodes."""
     generate_node_config(cluster, node_type, node_id)
     generate_node_key(cluster, node_type, node_id)
     generate_node_csr(cluster, node_type, node_id)
+
+
+def sign_node(cluster, node_type, node_id):
+    """Sign the certificate of a prepared node. This updates the CA database, so it must not run concurrently."""
     generate_node_cert(cluster, node_type, node_id)
 
     shutil.copy(cluster.ca_pool_ca, getattr(cluster, f"{node_type}_ca"))
 
 
+def generate_nodes(cluster, nodes):
+    pending = []
+    for node_type, node_id in nodes:
+        if cluster.is_node_ready(node_type, node_id):
+            logger.debug(f"{node_type} #{node_id} certificates already generated")
+        else:
+            pending.append((node_type, node_id))
+
+    if not pending:
+        return
+
+    # Keys generation dominates, but happens in openssl processes: threads are enough to run them in parallel.
+    # Logs of prepared nodes are emitted in order once the node and all the previous ones are ready.
+    workers = min(len(pending), os.cpu_count() or 1)
+    logger.debug(f"Preparing {len(pending)} nodes with {workers} workers")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(prepare_node, cluster, node_type, node_id)
+            for node_type, node_id in pending
+        ]
+        for (node_type, node_id), future in zip(pending, futures):
+            future.result()
+            logger.info(
+                f"Generated {node_type} #{node_id} private key and certificate request"
+            )
+
+    for node_type, node_id in pending:
+        sign_node(cluster, node_type, node_id)
+
+
 def do_generate_nodes(cluster):
     """Generate certificates for all nodes (master and tserver)"""
 
@@ -164,10 +178,13 @@ def do_generate_nodes(cluster):
     else:
         logger.debug("Cluster is initialized, continuing")
 
-    for node_type in ["master", "tserver"]:
-        for node_id in range(0, int(cluster.nodes_count)):
-            generate_node(cluster, node_type, node_id)
+    nodes = [
+        (node_type, node_id)
+        for node_type in ["master", "tserver"]
+        for node_id in range(0, int(cluster.nodes_count))
+    ]
+    nodes.append(("prometheus", ""))
 
-    generate_node(cluster, "prometheus", "")
+    generate_nodes(cluster, nodes)
 
     logger.info("All nodes certificates are ready")
@@ -1,11 +1,32 @@
+import base64
+import hashlib
 import logging
+import os
 import re
-import ssl
+import subprocess
 import sys
+import tempfile
 import unicodedata
 
 logger = logging.getLogger(__name__)
 
+# Arguments of `openssl genpkey` generating a private key of each supported type
+KEY_TYPES = {
+    "rsa2048": ["-algorithm", "RSA", "-pkeyopt", "rsa_keygen_bits:2048"],
+    "rsa4096": ["-algorithm", "RSA", "-pkeyopt", "rsa_keygen_bits:4096"],
+    "ecdsa-p256": [
+        "-algorithm",
+        "EC",
+        "-pkeyopt",
+        "ec_paramgen_curve:P-256",
+        "-pkeyopt",
+        "ec_param_enc:named_curve",
+    ],
+    "ed25519": ["-algorithm", "ED25519"],
+}
+
+DEFAULT_KEY_TYPE = "rsa4096"
+
 
 def slugify(text):
     text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
@@ -15,37 +36,140 @@ def slugify(text):
     return text
 
 
-def get_cert_display_name(path):
-    try:
-        cert_dict = ssl._ssl._test_decode_cert(
-            path
-        )  # We do use an internal function, to avoid installing dependencies
-    except Exception as e:
-        logger.error(e)
-        sys.exit(1)
+# DER tags and subject attributes read from certificates
+_DER_UTC_TIME = 0x17
+_DER_CONTEXT_VERSION = 0xA0
+_OID_COMMON_NAME = bytes([0x55, 0x04, 0x03])
+_OID_ORGANIZATION_NAME = bytes([0x55, 0x04, 0x0A])
+
+# Encodings of the DER string types, the others (e.g. UTF8String) being decoded as UTF-8
+_DER_STRING_ENCODINGS = {
+    0x12: "ascii",  # NumericString
+    0x13: "ascii",  # PrintableString
+    0x14: "latin-1",  # T61String (TeletexString)
+    0x16: "ascii",  # IA5String
+    0x1A: "ascii",  # VisibleString
+    0x1C: "utf-32-be",  # UniversalString
+    0x1E: "utf-16-be",  # BMPString
+}
+
+
+def _der_read(data, offset):
+    """Reads the DER element at offset, returning its tag and the bounds of its content."""
+    tag = data[offset]
+    length = data[offset + 1]
+    offset += 2
+    if length & 0x80:
+        size = length & 0x7F
+        length = int.from_bytes(data[offset : offset + size], "big")
+        offset += size
+    if offset + length > len(data):
+        raise ValueError("Truncated DER element")
+    return tag, offset, offset + length
+
+
+def _der_children(data, start, end):
+    children = []
+    while start < end:
+        child = _der_read(data, start)
+        children.append(child)
+        start = child[2]
+    return children
+
+
+def _der_time(data, tag, start, end):
+    value = data[start:end].decode("ascii").rstrip("Z")
+    if tag == _DER_UTC_TIME:
+        # Two-digits years, RFC 5280 section 4.1.2.5.1
+        value = ("19" if int(value[:2]) >= 50 else "20") + value
+    return f"{value[0:4]}-{value[4:6]}-{value[6:8]}T{value[8:10]}:{value[10:12]}:{value[12:14]}Z"
+
+
+def _der_string(data, tag, start, end):
+    return data[start:end].decode(
+        _DER_STRING_ENCODINGS.get(tag, "utf-8"), errors="replace"
+    )
 
-    serial = cert_dict.get("serialNumber", "")
+
+def decode_cert(pem):
+    """Decodes a PEM certificate in memory, returning its serial, display name, expiration and SHA-256 fingerprint."""
+    # openssl ca may write a text dump of the certificate before the PEM block
+    match = re.search(
+        r"-----BEGIN CERTIFICATE-----(.+?)-----END CERTIFICATE-----", pem, re.DOTALL
+    )
+    if not match:
+        raise ValueError("No PEM certificate found")
+    der = base64.b64decode(re.sub(r"\s", "", match.group(1)))
+
+    _, start, end = _der_read(der, 0)  # Certificate
+    _, start, end = _der_read(der, start)  # TBSCertificate
+    fields = _der_children(der, start, end)
+    if fields[0][0] == _DER_CONTEXT_VERSION:
+        fields = fields[1:]
+    serial_field, _, _, validity, subject = fields[:5]
+
+    serial = (
+        der[serial_field[1] : serial_field[2]].lstrip(b"\x00").hex().upper() or "00"
+    )
+
+    not_after = _der_children(der, validity[1], validity[2])[1]
 
     orga = ""
     cn = ""
+    for _, set_start, set_end in _der_children(der, subject[1], subject[2]):
+        for _, attr_start, attr_end in _der_children(der, set_start, set_end):
+            oid, value = _der_children(der, attr_start, attr_end)
+            oid = der[oid[1] : oid[2]]
+            value = _der_string(der, *value)
+            if oid == _OID_ORGANIZATION_NAME:
+                orga = value
+            elif oid == _OID_COMMON_NAME:
+                cn = value
 
-    for kv in cert_dict.get("subject", []):
-        for k, v in kv:
-            if k == "organizationName":
-                orga = v
-            elif k == "commonName":
-                cn = v
+    return {
+        "serial": serial,
+        "name": f"SN={serial[-8:]}, O={orga}, CN={cn}",
+        "not_after": _der_time(der, *not_after),
+        "fingerprint": hashlib.sha256(der).hexdigest(),
+    }
 
-    return f"SN={serial[-8:]}, O={orga}, CN={cn}"
 
-
-def get_cert_serial(path):
+def get_cert_metadata(pem):
     try:
-        cert_dict = ssl._ssl._test_decode_cert(
-            path
-        )  # We do use an internal function, to avoid installing dependencies
+        return decode_cert(pem)
     except Exception as e:
-        logger.error(e)
+        logger.error(f"Unable to decode certificate: {e}")
         sys.exit(1)
 
-    return cert_dict["serialNumber"]
+
+def get_cert_display_name(path):
+    with open(path, "r") as f:
+        return get_cert_metadata(f.read())["name"]
+
+
+def generate_private_key(path, key_type):
+    subprocess.check_call(
+        ["openssl", "genpkey"] + KEY_TYPES[key_type] + ["-out", path],
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def write_file_atomically(path, content):
+    """Replaces the content of path at once, so that readers never see a partially written file"""
+    with tempfile.NamedTemporaryFile(
+        "w", dir=os.path.dirname(path), suffix=".tmp", delete=False
+    ) as tf:
+        tf.write(content)
+    os.replace(tf.name, path)
+
+
+def write_if_changed(path, content):
+    """Atomically writes content to path unless it already holds it. Returns True if the file was written."""
+    try:
+        with open(path, "r") as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    write_file_atomically(path, content)
+    return True
@@ -0,0 +1,85 @@
+# Small python script measuring the duration of generate.py in the situations
+# met while developing: a first generation into an empty folder, a generation
+# whose cache was lost but whose outputs are already up to date, and a
+# generation whose inputs did not change since the previous one.
+# Example, from the root of the repository:
+#   python interfaces/openapi-to-go-server/benchmark_generate.py \
+#       --api interfaces/aux_/aux_.yaml#dss \
+#       --api interfaces/astm-utm/Protocol/utm.yaml#dss \
+#       --api interfaces/rid/v1/remoteid/augmented.yaml#dss \
+#       --api interfaces/rid/v2/remoteid/updated.yaml#dss@ridv2/rid/v2
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+GENERATE = os.path.join(os.path.dirname(os.path.realpath(__file__)), "generate.py")
+
+
+def generate(apis, api_folder, jobs):
+    command = [
+        sys.executable,
+        GENERATE,
+        "--api_import",
+        "github.com/interuss/dss/pkg/api",
+        "--api_folder",
+        api_folder,
+        "--json_codecs",
+        "--jobs",
+        str(jobs),
+    ]
+    for api in apis:
+        command += ["--api", api]
+
+    start = time.perf_counter()
+    subprocess.check_call(command, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark generate.py")
+    parser.add_argument(
+        "--api",
+        dest="apis",
+        action="append",
+        required=True,
+        help="API declaration passed to generate.py",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes used by generate.py",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="number of runs per case")
+    args = parser.parse_args()
+
+    durations = {"cold": [], "outputs up to date": [], "cached": []}
+    with tempfile.TemporaryDirectory() as directory:
+        api_folder = os.path.join(directory, "api")
+        cache_file = os.path.join(api_folder, ".generate-cache.json")
+        for _ in range(args.runs):
+            shutil.rmtree(api_folder, ignore_errors=True)
+            durations["cold"].append(generate(args.apis, api_folder, args.jobs))
+
+            os.remove(cache_file)
+            durations["outputs up to date"].append(
+                generate(args.apis, api_folder, args.jobs)
+            )
+
+            durations["cached"].append(generate(args.apis, api_folder, args.jobs))
+
+    print(f"{'case':<20} {'median ms':>10} {'max ms':>10}")
+    for case, values in durations.items():
+        print(
+            f"{case:<20} {statistics.median(values) * 1000:>10.1f} {max(values) * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,11 +13,11 @@ import (
 	semconv "go.opentelemetry.io/otel/semconv/v1.40.0"
 	"go.opentelemetry.io/otel/trace"
 	"net/http"
-	"regexp"
 )
 
 type APIRouter struct {
 	Routes         []*api.Route
+	Trie           *api.RouteTrie
 	Implementation Implementation
 	Authorizer     api.Authorizer
 }
@@ -26,32 +26,31 @@ var tracer = otel.Tracer("rid.api")
 
 // *rid.APIRouter (type defined above) implements the api.PartialRouter interface
 func (s *APIRouter) Handle(w http.ResponseWriter, r *http.Request) bool {
-	for _, route := range s.Routes {
-		if route.Method == r.Method && route.Pattern.MatchString(r.URL.Path) {
+	route, pathParams := s.Trie.Match(r.Method, r.URL.Path)
+	if route == nil {
+		return false
+	}
 
-			if labeler, ok := otelhttp.LabelerFromContext(r.Context()); ok {
-				labeler.Add(semconv.HTTPRoute(route.Path))
-			}
+	if labeler, ok := otelhttp.LabelerFromContext(r.Context()); ok {
+		labeler.Add(semconv.HTTPRoute(route.Path))
+	}
 
-			// We retrieve the current span from the otelhttp handler to set its name property.
-			span := trace.SpanFromContext(r.Context())
+	// We retrieve the current span from the otelhttp handler to set its name property.
+	span := trace.SpanFromContext(r.Context())
 
-			if span.IsRecording() { // If the span is not recording, the name cannot be changed. This also likely means the otelhttp handler is not present (tracing disabled).
-				span.SetName(fmt.Sprintf("%s %s", r.Method, route.Path))
-			}
+	if span.IsRecording() { // If the span is not recording, the name cannot be changed. This also likely means the otelhttp handler is not present (tracing disabled).
+		span.SetName(fmt.Sprintf("%s %s", r.Method, route.Path))
+	}
 
-			ctx, span := tracer.Start(r.Context(), route.Name)
-			defer span.End()
-			r = r.WithContext(ctx)
+	ctx, span := tracer.Start(r.Context(), route.Name)
+	defer span.End()
+	r = r.WithContext(ctx)
 
-			route.Handler(route.Pattern, w, r)
-			return true
-		}
-	}
-	return false
+	route.Handler(pathParams, w, r)
+	return true
 }
 
-func (s *APIRouter) SearchIdentificationServiceAreas(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) SearchIdentificationServiceAreas(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req SearchIdentificationServiceAreasRequest
 	var response SearchIdentificationServiceAreasResponseSet
 
@@ -71,7 +70,7 @@ func (s *APIRouter) SearchIdentificationServiceAreas(exp *regexp.Regexp, w http.
 	}
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, SearchIdentificationServiceAreasSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, SearchIdentificationServiceAreasSecurity, SearchIdentificationServiceAreasSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -84,42 +83,41 @@ func (s *APIRouter) SearchIdentificationServiceAreas(exp *regexp.Regexp, w http.
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response413 != nil {
-		api.WriteJSON(w, 413, response.Response413)
+		api.WriteJSONResponse(w, r, 413, response.Response413)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) GetIdentificationServiceArea(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetIdentificationServiceArea(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetIdentificationServiceAreaRequest
 	var response GetIdentificationServiceAreaResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Id = EntityUUID(pathMatch[1])
+	req.Id = EntityUUID(pathParams[0])
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, GetIdentificationServiceAreaSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, GetIdentificationServiceAreaSecurity, GetIdentificationServiceAreaSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -132,39 +130,38 @@ func (s *APIRouter) GetIdentificationServiceArea(exp *regexp.Regexp, w http.Resp
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response404 != nil {
-		api.WriteJSON(w, 404, response.Response404)
+		api.WriteJSONResponse(w, r, 404, response.Response404)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) CreateIdentificationServiceArea(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) CreateIdentificationServiceArea(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req CreateIdentificationServiceAreaRequest
 	var response CreateIdentificationServiceAreaResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Id = EntityUUID(pathMatch[1])
+	req.Id = EntityUUID(pathParams[0])
 
 	// Parse request body
 	req.Body = new(CreateIdentificationServiceAreaParameters)
@@ -172,7 +169,7 @@ func (s *APIRouter) CreateIdentificationServiceArea(exp *regexp.Regexp, w http.R
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, CreateIdentificationServiceAreaSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, CreateIdentificationServiceAreaSecurity, CreateIdentificationServiceAreaSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -185,44 +182,43 @@ func (s *APIRouter) CreateIdentificationServiceArea(exp *regexp.Regexp, w http.R
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response413 != nil {
-		api.WriteJSON(w, 413, response.Response413)
+		api.WriteJSONResponse(w, r, 413, response.Response413)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) UpdateIdentificationServiceArea(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) UpdateIdentificationServiceArea(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req UpdateIdentificationServiceAreaRequest
 	var response UpdateIdentificationServiceAreaResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Id = EntityUUID(pathMatch[1])
-	req.Version = pathMatch[2]
+	req.Id = EntityUUID(pathParams[0])
+	req.Version = pathParams[1]
 
 	// Parse request body
 	req.Body = new(UpdateIdentificationServiceAreaParameters)
@@ -230,7 +226,7 @@ func (s *APIRouter) UpdateIdentificationServiceArea(exp *regexp.Regexp, w http.R
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, UpdateIdentificationServiceAreaSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, UpdateIdentificationServiceAreaSecurity, UpdateIdentificationServiceAreaSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -243,47 +239,46 @@ func (s *APIRouter) UpdateIdentificationServiceArea(exp *regexp.Regexp, w http.R
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response413 != nil {
-		api.WriteJSON(w, 413, response.Response413)
+		api.WriteJSONResponse(w, r, 413, response.Response413)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) DeleteIdentificationServiceArea(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) DeleteIdentificationServiceArea(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req DeleteIdentificationServiceAreaRequest
 	var response DeleteIdentificationServiceAreaResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Id = EntityUUID(pathMatch[1])
-	req.Version = pathMatch[2]
+	req.Id = EntityUUID(pathParams[0])
+	req.Version = pathParams[1]
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, DeleteIdentificationServiceAreaSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, DeleteIdentificationServiceAreaSecurity, DeleteIdentificationServiceAreaSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -296,37 +291,37 @@ func (s *APIRouter) DeleteIdentificationServiceArea(exp *regexp.Regexp, w http.R
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response404 != nil {
-		api.WriteJSON(w, 404, response.Response404)
+		api.WriteJSONResponse(w, r, 404, response.Response404)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) SearchSubscriptions(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) SearchSubscriptions(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req SearchSubscriptionsRequest
 	var response SearchSubscriptionsResponseSet
 
@@ -338,7 +333,7 @@ func (s *APIRouter) SearchSubscriptions(exp *regexp.Regexp, w http.ResponseWrite
 	}
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, SearchSubscriptionsSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, SearchSubscriptionsSecurity, SearchSubscriptionsSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -351,42 +346,41 @@ func (s *APIRouter) SearchSubscriptions(exp *regexp.Regexp, w http.ResponseWrite
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response413 != nil {
-		api.WriteJSON(w, 413, response.Response413)
+		api.WriteJSONResponse(w, r, 413, response.Response413)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) GetSubscription(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetSubscription(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetSubscriptionRequest
 	var response GetSubscriptionResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Id = SubscriptionUUID(pathMatch[1])
+	req.Id = SubscriptionUUID(pathParams[0])
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, GetSubscriptionSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, GetSubscriptionSecurity, GetSubscriptionSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -399,39 +393,38 @@ func (s *APIRouter) GetSubscription(exp *regexp.Regexp, w http.ResponseWriter, r
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response404 != nil {
-		api.WriteJSON(w, 404, response.Response404)
+		api.WriteJSONResponse(w, r, 404, response.Response404)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) CreateSubscription(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) CreateSubscription(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req CreateSubscriptionRequest
 	var response CreateSubscriptionResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Id = SubscriptionUUID(pathMatch[1])
+	req.Id = SubscriptionUUID(pathParams[0])
 
 	// Parse request body
 	req.Body = new(CreateSubscriptionParameters)
@@ -439,7 +432,7 @@ func (s *APIRouter) CreateSubscription(exp *regexp.Regexp, w http.ResponseWriter
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, CreateSubscriptionSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, CreateSubscriptionSecurity, CreateSubscriptionSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -452,44 +445,43 @@ func (s *APIRouter) CreateSubscription(exp *regexp.Regexp, w http.ResponseWriter
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) UpdateSubscription(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) UpdateSubscription(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req UpdateSubscriptionRequest
 	var response UpdateSubscriptionResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Id = SubscriptionUUID(pathMatch[1])
-	req.Version = pathMatch[2]
+	req.Id = SubscriptionUUID(pathParams[0])
+	req.Version = pathParams[1]
 
 	// Parse request body
 	req.Body = new(UpdateSubscriptionParameters)
@@ -497,7 +489,7 @@ func (s *APIRouter) UpdateSubscription(exp *regexp.Regexp, w http.ResponseWriter
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, UpdateSubscriptionSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, UpdateSubscriptionSecurity, UpdateSubscriptionSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -510,47 +502,46 @@ func (s *APIRouter) UpdateSubscription(exp *regexp.Regexp, w http.ResponseWriter
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) DeleteSubscription(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) DeleteSubscription(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req DeleteSubscriptionRequest
 	var response DeleteSubscriptionResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Id = SubscriptionUUID(pathMatch[1])
-	req.Version = pathMatch[2]
+	req.Id = SubscriptionUUID(pathParams[0])
+	req.Version = pathParams[1]
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, DeleteSubscriptionSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, DeleteSubscriptionSecurity, DeleteSubscriptionSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -563,34 +554,34 @@ func (s *APIRouter) DeleteSubscription(exp *regexp.Regexp, w http.ResponseWriter
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response404 != nil {
-		api.WriteJSON(w, 404, response.Response404)
+		api.WriteJSONResponse(w, r, 404, response.Response404)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
 func setAuthError(ctx context.Context, authErr error, resp401 **ErrorResponse, resp403 **ErrorResponse, resp500 **api.InternalServerErrorBody) {
@@ -610,35 +601,17 @@ func setAuthError(ctx context.Context, authErr error, resp401 **ErrorResponse, r
 func MakeAPIRouter(impl Implementation, auth api.Authorizer) APIRouter {
 	router := APIRouter{Implementation: impl, Authorizer: auth, Routes: make([]*api.Route, 10)}
 
-	pattern := regexp.MustCompile("^/rid/v1/dss/identification_service_areas$")
-	router.Routes[0] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.SearchIdentificationServiceAreas, Name: "rid.SearchIdentificationServiceAreas", Path: "/rid/v1/dss/identification_service_areas"}
-
-	pattern = regexp.MustCompile("^/rid/v1/dss/identification_service_areas/(?P<id>[^/]*)$")
-	router.Routes[1] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetIdentificationServiceArea, Name: "rid.GetIdentificationServiceArea", Path: "/rid/v1/dss/identification_service_areas/{id}"}
-
-	pattern = regexp.MustCompile("^/rid/v1/dss/identification_service_areas/(?P<id>[^/]*)$")
-	router.Routes[2] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.CreateIdentificationServiceArea, Name: "rid.CreateIdentificationServiceArea", Path: "/rid/v1/dss/identification_service_areas/{id}"}
-
-	pattern = regexp.MustCompile("^/rid/v1/dss/identification_service_areas/(?P<id>[^/]*)/(?P<version>[^/]*)$")
-	router.Routes[3] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.UpdateIdentificationServiceArea, Name: "rid.UpdateIdentificationServiceArea", Path: "/rid/v1/dss/identification_service_areas/{id}/{version}"}
-
-	pattern = regexp.MustCompile("^/rid/v1/dss/identification_service_areas/(?P<id>[^/]*)/(?P<version>[^/]*)$")
-	router.Routes[4] = &api.Route{Method: http.MethodDelete, Pattern: pattern, Handler: router.DeleteIdentificationServiceArea, Name: "rid.DeleteIdentificationServiceArea", Path: "/rid/v1/dss/identification_service_areas/{id}/{version}"}
-
-	pattern = regexp.MustCompile("^/rid/v1/dss/subscriptions$")
-	router.Routes[5] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.SearchSubscriptions, Name: "rid.SearchSubscriptions", Path: "/rid/v1/dss/subscriptions"}
-
-	pattern = regexp.MustCompile("^/rid/v1/dss/subscriptions/(?P<id>[^/]*)$")
-	router.Routes[6] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetSubscription, Name: "rid.GetSubscription", Path: "/rid/v1/dss/subscriptions/{id}"}
-
-	pattern = regexp.MustCompile("^/rid/v1/dss/subscriptions/(?P<id>[^/]*)$")
-	router.Routes[7] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.CreateSubscription, Name: "rid.CreateSubscription", Path: "/rid/v1/dss/subscriptions/{id}"}
-
-	pattern = regexp.MustCompile("^/rid/v1/dss/subscriptions/(?P<id>[^/]*)/(?P<version>[^/]*)$")
-	router.Routes[8] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.UpdateSubscription, Name: "rid.UpdateSubscription", Path: "/rid/v1/dss/subscriptions/{id}/{version}"}
-
-	pattern = regexp.MustCompile("^/rid/v1/dss/subscriptions/(?P<id>[^/]*)/(?P<version>[^/]*)$")
-	router.Routes[9] = &api.Route{Method: http.MethodDelete, Pattern: pattern, Handler: router.DeleteSubscription, Name: "rid.DeleteSubscription", Path: "/rid/v1/dss/subscriptions/{id}/{version}"}
-
+	router.Routes[0] = &api.Route{Method: http.MethodGet, Handler: router.SearchIdentificationServiceAreas, Name: "rid.SearchIdentificationServiceAreas", Path: "/rid/v1/dss/identification_service_areas"}
+	router.Routes[1] = &api.Route{Method: http.MethodGet, Handler: router.GetIdentificationServiceArea, Name: "rid.GetIdentificationServiceArea", Path: "/rid/v1/dss/identification_service_areas/{id}"}
+	router.Routes[2] = &api.Route{Method: http.MethodPut, Handler: router.CreateIdentificationServiceArea, Name: "rid.CreateIdentificationServiceArea", Path: "/rid/v1/dss/identification_service_areas/{id}"}
+	router.Routes[3] = &api.Route{Method: http.MethodPut, Handler: router.UpdateIdentificationServiceArea, Name: "rid.UpdateIdentificationServiceArea", Path: "/rid/v1/dss/identification_service_areas/{id}/{version}"}
+	router.Routes[4] = &api.Route{Method: http.MethodDelete, Handler: router.DeleteIdentificationServiceArea, Name: "rid.DeleteIdentificationServiceArea", Path: "/rid/v1/dss/identification_service_areas/{id}/{version}"}
+	router.Routes[5] = &api.Route{Method: http.MethodGet, Handler: router.SearchSubscriptions, Name: "rid.SearchSubscriptions", Path: "/rid/v1/dss/subscriptions"}
+	router.Routes[6] = &api.Route{Method: http.MethodGet, Handler: router.GetSubscription, Name: "rid.GetSubscription", Path: "/rid/v1/dss/subscriptions/{id}"}
+	router.Routes[7] = &api.Route{Method: http.MethodPut, Handler: router.CreateSubscription, Name: "rid.CreateSubscription", Path: "/rid/v1/dss/subscriptions/{id}"}
+	router.Routes[8] = &api.Route{Method: http.MethodPut, Handler: router.UpdateSubscription, Name: "rid.UpdateSubscription", Path: "/rid/v1/dss/subscriptions/{id}/{version}"}
+	router.Routes[9] = &api.Route{Method: http.MethodDelete, Handler: router.DeleteSubscription, Name: "rid.DeleteSubscription", Path: "/rid/v1/dss/subscriptions/{id}/{version}"}
+
+	router.Trie = api.NewRouteTrie(router.Routes)
 	return router
 }
@@ -7,11 +7,18 @@ import (
 )
 
 var (
-	UtmAvailabilityArbitrationScope          = api.RequiredScope("utm.availability_arbitration")
-	UtmConformanceMonitoringSaScope          = api.RequiredScope("utm.conformance_monitoring_sa")
-	UtmConstraintManagementScope             = api.RequiredScope("utm.constraint_management")
-	UtmConstraintProcessingScope             = api.RequiredScope("utm.constraint_processing")
-	UtmStrategicCoordinationScope            = api.RequiredScope("utm.strategic_coordination")
+	UtmAvailabilityArbitrationScope = api.RequiredScope("utm.availability_arbitration")
+	UtmConformanceMonitoringSaScope = api.RequiredScope("utm.conformance_monitoring_sa")
+	UtmConstraintManagementScope    = api.RequiredScope("utm.constraint_management")
+	UtmConstraintProcessingScope    = api.RequiredScope("utm.constraint_processing")
+	UtmStrategicCoordinationScope   = api.RequiredScope("utm.strategic_coordination")
+	scopeMasks                      = api.RegisterScopes(
+		UtmAvailabilityArbitrationScope,
+		UtmConformanceMonitoringSaScope,
+		UtmConstraintManagementScope,
+		UtmConstraintProcessingScope,
+		UtmStrategicCoordinationScope,
+	)
 	QueryOperationalIntentReferencesSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmStrategicCoordinationScope},
@@ -20,6 +27,10 @@ var (
 			"Authority": {UtmConformanceMonitoringSaScope},
 		},
 	}
+	QueryOperationalIntentReferencesSecurityMasks = []api.ScopeMask{
+		scopeMasks[4],
+		scopeMasks[1],
+	}
 	GetOperationalIntentReferenceSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmStrategicCoordinationScope},
@@ -28,6 +39,10 @@ var (
 			"Authority": {UtmConformanceMonitoringSaScope},
 		},
 	}
+	GetOperationalIntentReferenceSecurityMasks = []api.ScopeMask{
+		scopeMasks[4],
+		scopeMasks[1],
+	}
 	CreateOperationalIntentReferenceSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmStrategicCoordinationScope},
@@ -39,6 +54,11 @@ var (
 			"Authority": {UtmConformanceMonitoringSaScope},
 		},
 	}
+	CreateOperationalIntentReferenceSecurityMasks = []api.ScopeMask{
+		scopeMasks[4],
+		scopeMasks[3] | scopeMasks[4],
+		scopeMasks[1],
+	}
 	UpdateOperationalIntentReferenceSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmStrategicCoordinationScope},
@@ -50,6 +70,11 @@ var (
 			"Authority": {UtmConformanceMonitoringSaScope},
 		},
 	}
+	UpdateOperationalIntentReferenceSecurityMasks = []api.ScopeMask{
+		scopeMasks[4],
+		scopeMasks[3] | scopeMasks[4],
+		scopeMasks[1],
+	}
 	DeleteOperationalIntentReferenceSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmStrategicCoordinationScope},
@@ -58,6 +83,10 @@ var (
 			"Authority": {UtmConformanceMonitoringSaScope},
 		},
 	}
+	DeleteOperationalIntentReferenceSecurityMasks = []api.ScopeMask{
+		scopeMasks[4],
+		scopeMasks[1],
+	}
 	QueryConstraintReferencesSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmConstraintManagementScope},
@@ -66,6 +95,10 @@ var (
 			"Authority": {UtmConstraintProcessingScope},
 		},
 	}
+	QueryConstraintReferencesSecurityMasks = []api.ScopeMask{
+		scopeMasks[2],
+		scopeMasks[3],
+	}
 	GetConstraintReferenceSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmConstraintManagementScope},
@@ -74,21 +107,34 @@ var (
 			"Authority": {UtmConstraintProcessingScope},
 		},
 	}
+	GetConstraintReferenceSecurityMasks = []api.ScopeMask{
+		scopeMasks[2],
+		scopeMasks[3],
+	}
 	CreateConstraintReferenceSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmConstraintManagementScope},
 		},
 	}
+	CreateConstraintReferenceSecurityMasks = []api.ScopeMask{
+		scopeMasks[2],
+	}
 	UpdateConstraintReferenceSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmConstraintManagementScope},
 		},
 	}
+	UpdateConstraintReferenceSecurityMasks = []api.ScopeMask{
+		scopeMasks[2],
+	}
 	DeleteConstraintReferenceSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmConstraintManagementScope},
 		},
 	}
+	DeleteConstraintReferenceSecurityMasks = []api.ScopeMask{
+		scopeMasks[2],
+	}
 	QuerySubscriptionsSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmConstraintProcessingScope},
@@ -97,6 +143,10 @@ var (
 			"Authority": {UtmStrategicCoordinationScope},
 		},
 	}
+	QuerySubscriptionsSecurityMasks = []api.ScopeMask{
+		scopeMasks[3],
+		scopeMasks[4],
+	}
 	GetSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmConstraintProcessingScope},
@@ -105,6 +155,10 @@ var (
 			"Authority": {UtmStrategicCoordinationScope},
 		},
 	}
+	GetSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[3],
+		scopeMasks[4],
+	}
 	CreateSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmConstraintProcessingScope},
@@ -113,6 +167,10 @@ var (
 			"Authority": {UtmStrategicCoordinationScope},
 		},
 	}
+	CreateSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[3],
+		scopeMasks[4],
+	}
 	UpdateSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmConstraintProcessingScope},
@@ -121,6 +179,10 @@ var (
 			"Authority": {UtmStrategicCoordinationScope},
 		},
 	}
+	UpdateSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[3],
+		scopeMasks[4],
+	}
 	DeleteSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmConstraintProcessingScope},
@@ -129,6 +191,10 @@ var (
 			"Authority": {UtmStrategicCoordinationScope},
 		},
 	}
+	DeleteSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[3],
+		scopeMasks[4],
+	}
 	MakeDssReportSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmConstraintManagementScope},
@@ -146,6 +212,13 @@ var (
 			"Authority": {UtmAvailabilityArbitrationScope},
 		},
 	}
+	MakeDssReportSecurityMasks = []api.ScopeMask{
+		scopeMasks[2],
+		scopeMasks[3],
+		scopeMasks[4],
+		scopeMasks[1],
+		scopeMasks[0],
+	}
 	GetUssAvailabilitySecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmAvailabilityArbitrationScope},
@@ -157,11 +230,19 @@ var (
 			"Authority": {UtmConformanceMonitoringSaScope},
 		},
 	}
+	GetUssAvailabilitySecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+		scopeMasks[4],
+		scopeMasks[1],
+	}
 	SetUssAvailabilitySecurity = []api.AuthorizationOption{
 		{
 			"Authority": {UtmAvailabilityArbitrationScope},
 		},
 	}
+	SetUssAvailabilitySecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 )
 
 type QueryOperationalIntentReferencesRequest struct {
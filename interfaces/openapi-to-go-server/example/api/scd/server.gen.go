@@ -13,11 +13,11 @@ import (
 	semconv "go.opentelemetry.io/otel/semconv/v1.40.0"
 	"go.opentelemetry.io/otel/trace"
 	"net/http"
-	"regexp"
 )
 
 type APIRouter struct {
 	Routes         []*api.Route
+	Trie           *api.RouteTrie
 	Implementation Implementation
 	Authorizer     api.Authorizer
 }
@@ -26,32 +26,31 @@ var tracer = otel.Tracer("scd.api")
 
 // *scd.APIRouter (type defined above) implements the api.PartialRouter interface
 func (s *APIRouter) Handle(w http.ResponseWriter, r *http.Request) bool {
-	for _, route := range s.Routes {
-		if route.Method == r.Method && route.Pattern.MatchString(r.URL.Path) {
+	route, pathParams := s.Trie.Match(r.Method, r.URL.Path)
+	if route == nil {
+		return false
+	}
 
-			if labeler, ok := otelhttp.LabelerFromContext(r.Context()); ok {
-				labeler.Add(semconv.HTTPRoute(route.Path))
-			}
+	if labeler, ok := otelhttp.LabelerFromContext(r.Context()); ok {
+		labeler.Add(semconv.HTTPRoute(route.Path))
+	}
 
-			// We retrieve the current span from the otelhttp handler to set its name property.
-			span := trace.SpanFromContext(r.Context())
+	// We retrieve the current span from the otelhttp handler to set its name property.
+	span := trace.SpanFromContext(r.Context())
 
-			if span.IsRecording() { // If the span is not recording, the name cannot be changed. This also likely means the otelhttp handler is not present (tracing disabled).
-				span.SetName(fmt.Sprintf("%s %s", r.Method, route.Path))
-			}
+	if span.IsRecording() { // If the span is not recording, the name cannot be changed. This also likely means the otelhttp handler is not present (tracing disabled).
+		span.SetName(fmt.Sprintf("%s %s", r.Method, route.Path))
+	}
 
-			ctx, span := tracer.Start(r.Context(), route.Name)
-			defer span.End()
-			r = r.WithContext(ctx)
+	ctx, span := tracer.Start(r.Context(), route.Name)
+	defer span.End()
+	r = r.WithContext(ctx)
 
-			route.Handler(route.Pattern, w, r)
-			return true
-		}
-	}
-	return false
+	route.Handler(pathParams, w, r)
+	return true
 }
 
-func (s *APIRouter) QueryOperationalIntentReferences(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) QueryOperationalIntentReferences(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req QueryOperationalIntentReferencesRequest
 	var response QueryOperationalIntentReferencesResponseSet
 
@@ -61,7 +60,7 @@ func (s *APIRouter) QueryOperationalIntentReferences(exp *regexp.Regexp, w http.
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, QueryOperationalIntentReferencesSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, QueryOperationalIntentReferencesSecurity, QueryOperationalIntentReferencesSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -74,46 +73,45 @@ func (s *APIRouter) QueryOperationalIntentReferences(exp *regexp.Regexp, w http.
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response413 != nil {
-		api.WriteJSON(w, 413, response.Response413)
+		api.WriteJSONResponse(w, r, 413, response.Response413)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) GetOperationalIntentReference(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetOperationalIntentReference(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetOperationalIntentReferenceRequest
 	var response GetOperationalIntentReferenceResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Entityid = EntityID(pathMatch[1])
+	req.Entityid = EntityID(pathParams[0])
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, GetOperationalIntentReferenceSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, GetOperationalIntentReferenceSecurity, GetOperationalIntentReferenceSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -126,43 +124,42 @@ func (s *APIRouter) GetOperationalIntentReference(exp *regexp.Regexp, w http.Res
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response404 != nil {
-		api.WriteJSON(w, 404, response.Response404)
+		api.WriteJSONResponse(w, r, 404, response.Response404)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) CreateOperationalIntentReference(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) CreateOperationalIntentReference(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req CreateOperationalIntentReferenceRequest
 	var response CreateOperationalIntentReferenceResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Entityid = EntityID(pathMatch[1])
+	req.Entityid = EntityID(pathParams[0])
 
 	// Parse request body
 	req.Body = new(PutOperationalIntentReferenceParameters)
@@ -170,7 +167,7 @@ func (s *APIRouter) CreateOperationalIntentReference(exp *regexp.Regexp, w http.
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, CreateOperationalIntentReferenceSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, CreateOperationalIntentReferenceSecurity, CreateOperationalIntentReferenceSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -183,52 +180,51 @@ func (s *APIRouter) CreateOperationalIntentReference(exp *regexp.Regexp, w http.
 
 	// Write response to client
 	if response.Response201 != nil {
-		api.WriteJSON(w, 201, response.Response201)
+		api.WriteJSONResponse(w, r, 201, response.Response201)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response412 != nil {
-		api.WriteJSON(w, 412, response.Response412)
+		api.WriteJSONResponse(w, r, 412, response.Response412)
 		return
 	}
 	if response.Response413 != nil {
-		api.WriteJSON(w, 413, response.Response413)
+		api.WriteJSONResponse(w, r, 413, response.Response413)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) UpdateOperationalIntentReference(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) UpdateOperationalIntentReference(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req UpdateOperationalIntentReferenceRequest
 	var response UpdateOperationalIntentReferenceResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Entityid = EntityID(pathMatch[1])
-	req.Ovn = EntityOVN(pathMatch[2])
+	req.Entityid = EntityID(pathParams[0])
+	req.Ovn = EntityOVN(pathParams[1])
 
 	// Parse request body
 	req.Body = new(PutOperationalIntentReferenceParameters)
@@ -236,7 +232,7 @@ func (s *APIRouter) UpdateOperationalIntentReference(exp *regexp.Regexp, w http.
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, UpdateOperationalIntentReferenceSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, UpdateOperationalIntentReferenceSecurity, UpdateOperationalIntentReferenceSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -249,55 +245,54 @@ func (s *APIRouter) UpdateOperationalIntentReference(exp *regexp.Regexp, w http.
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response412 != nil {
-		api.WriteJSON(w, 412, response.Response412)
+		api.WriteJSONResponse(w, r, 412, response.Response412)
 		return
 	}
 	if response.Response413 != nil {
-		api.WriteJSON(w, 413, response.Response413)
+		api.WriteJSONResponse(w, r, 413, response.Response413)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) DeleteOperationalIntentReference(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) DeleteOperationalIntentReference(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req DeleteOperationalIntentReferenceRequest
 	var response DeleteOperationalIntentReferenceResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Entityid = EntityID(pathMatch[1])
-	req.Ovn = EntityOVN(pathMatch[2])
+	req.Entityid = EntityID(pathParams[0])
+	req.Ovn = EntityOVN(pathParams[1])
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, DeleteOperationalIntentReferenceSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, DeleteOperationalIntentReferenceSecurity, DeleteOperationalIntentReferenceSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -310,45 +305,45 @@ func (s *APIRouter) DeleteOperationalIntentReference(exp *regexp.Regexp, w http.
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response404 != nil {
-		api.WriteJSON(w, 404, response.Response404)
+		api.WriteJSONResponse(w, r, 404, response.Response404)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response412 != nil {
-		api.WriteJSON(w, 412, response.Response412)
+		api.WriteJSONResponse(w, r, 412, response.Response412)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) QueryConstraintReferences(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) QueryConstraintReferences(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req QueryConstraintReferencesRequest
 	var response QueryConstraintReferencesResponseSet
 
@@ -358,7 +353,7 @@ func (s *APIRouter) QueryConstraintReferences(exp *regexp.Regexp, w http.Respons
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, QueryConstraintReferencesSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, QueryConstraintReferencesSecurity, QueryConstraintReferencesSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -371,46 +366,45 @@ func (s *APIRouter) QueryConstraintReferences(exp *regexp.Regexp, w http.Respons
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response413 != nil {
-		api.WriteJSON(w, 413, response.Response413)
+		api.WriteJSONResponse(w, r, 413, response.Response413)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) GetConstraintReference(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetConstraintReference(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetConstraintReferenceRequest
 	var response GetConstraintReferenceResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Entityid = EntityID(pathMatch[1])
+	req.Entityid = EntityID(pathParams[0])
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, GetConstraintReferenceSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, GetConstraintReferenceSecurity, GetConstraintReferenceSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -423,43 +417,42 @@ func (s *APIRouter) GetConstraintReference(exp *regexp.Regexp, w http.ResponseWr
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response404 != nil {
-		api.WriteJSON(w, 404, response.Response404)
+		api.WriteJSONResponse(w, r, 404, response.Response404)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) CreateConstraintReference(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) CreateConstraintReference(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req CreateConstraintReferenceRequest
 	var response CreateConstraintReferenceResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Entityid = EntityID(pathMatch[1])
+	req.Entityid = EntityID(pathParams[0])
 
 	// Parse request body
 	req.Body = new(PutConstraintReferenceParameters)
@@ -467,7 +460,7 @@ func (s *APIRouter) CreateConstraintReference(exp *regexp.Regexp, w http.Respons
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, CreateConstraintReferenceSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, CreateConstraintReferenceSecurity, CreateConstraintReferenceSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -480,48 +473,47 @@ func (s *APIRouter) CreateConstraintReference(exp *regexp.Regexp, w http.Respons
 
 	// Write response to client
 	if response.Response201 != nil {
-		api.WriteJSON(w, 201, response.Response201)
+		api.WriteJSONResponse(w, r, 201, response.Response201)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response413 != nil {
-		api.WriteJSON(w, 413, response.Response413)
+		api.WriteJSONResponse(w, r, 413, response.Response413)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) UpdateConstraintReference(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) UpdateConstraintReference(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req UpdateConstraintReferenceRequest
 	var response UpdateConstraintReferenceResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Entityid = EntityID(pathMatch[1])
-	req.Ovn = EntityOVN(pathMatch[2])
+	req.Entityid = EntityID(pathParams[0])
+	req.Ovn = EntityOVN(pathParams[1])
 
 	// Parse request body
 	req.Body = new(PutConstraintReferenceParameters)
@@ -529,7 +521,7 @@ func (s *APIRouter) UpdateConstraintReference(exp *regexp.Regexp, w http.Respons
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, UpdateConstraintReferenceSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, UpdateConstraintReferenceSecurity, UpdateConstraintReferenceSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -542,51 +534,50 @@ func (s *APIRouter) UpdateConstraintReference(exp *regexp.Regexp, w http.Respons
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response413 != nil {
-		api.WriteJSON(w, 413, response.Response413)
+		api.WriteJSONResponse(w, r, 413, response.Response413)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) DeleteConstraintReference(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) DeleteConstraintReference(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req DeleteConstraintReferenceRequest
 	var response DeleteConstraintReferenceResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Entityid = EntityID(pathMatch[1])
-	req.Ovn = EntityOVN(pathMatch[2])
+	req.Entityid = EntityID(pathParams[0])
+	req.Ovn = EntityOVN(pathParams[1])
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, DeleteConstraintReferenceSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, DeleteConstraintReferenceSecurity, DeleteConstraintReferenceSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -599,41 +590,41 @@ func (s *APIRouter) DeleteConstraintReference(exp *regexp.Regexp, w http.Respons
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response404 != nil {
-		api.WriteJSON(w, 404, response.Response404)
+		api.WriteJSONResponse(w, r, 404, response.Response404)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) QuerySubscriptions(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) QuerySubscriptions(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req QuerySubscriptionsRequest
 	var response QuerySubscriptionsResponseSet
 
@@ -643,7 +634,7 @@ func (s *APIRouter) QuerySubscriptions(exp *regexp.Regexp, w http.ResponseWriter
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, QuerySubscriptionsSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, QuerySubscriptionsSecurity, QuerySubscriptionsSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -656,46 +647,45 @@ func (s *APIRouter) QuerySubscriptions(exp *regexp.Regexp, w http.ResponseWriter
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response413 != nil {
-		api.WriteJSON(w, 413, response.Response413)
+		api.WriteJSONResponse(w, r, 413, response.Response413)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) GetSubscription(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetSubscription(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetSubscriptionRequest
 	var response GetSubscriptionResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Subscriptionid = SubscriptionID(pathMatch[1])
+	req.Subscriptionid = SubscriptionID(pathParams[0])
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, GetSubscriptionSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, GetSubscriptionSecurity, GetSubscriptionSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -708,43 +698,42 @@ func (s *APIRouter) GetSubscription(exp *regexp.Regexp, w http.ResponseWriter, r
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response404 != nil {
-		api.WriteJSON(w, 404, response.Response404)
+		api.WriteJSONResponse(w, r, 404, response.Response404)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) CreateSubscription(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) CreateSubscription(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req CreateSubscriptionRequest
 	var response CreateSubscriptionResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Subscriptionid = SubscriptionID(pathMatch[1])
+	req.Subscriptionid = SubscriptionID(pathParams[0])
 
 	// Parse request body
 	req.Body = new(PutSubscriptionParameters)
@@ -752,7 +741,7 @@ func (s *APIRouter) CreateSubscription(exp *regexp.Regexp, w http.ResponseWriter
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, CreateSubscriptionSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, CreateSubscriptionSecurity, CreateSubscriptionSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -765,44 +754,43 @@ func (s *APIRouter) CreateSubscription(exp *regexp.Regexp, w http.ResponseWriter
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) UpdateSubscription(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) UpdateSubscription(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req UpdateSubscriptionRequest
 	var response UpdateSubscriptionResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Subscriptionid = SubscriptionID(pathMatch[1])
-	req.Version = pathMatch[2]
+	req.Subscriptionid = SubscriptionID(pathParams[0])
+	req.Version = pathParams[1]
 
 	// Parse request body
 	req.Body = new(PutSubscriptionParameters)
@@ -810,7 +798,7 @@ func (s *APIRouter) UpdateSubscription(exp *regexp.Regexp, w http.ResponseWriter
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, UpdateSubscriptionSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, UpdateSubscriptionSecurity, UpdateSubscriptionSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -823,47 +811,46 @@ func (s *APIRouter) UpdateSubscription(exp *regexp.Regexp, w http.ResponseWriter
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) DeleteSubscription(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) DeleteSubscription(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req DeleteSubscriptionRequest
 	var response DeleteSubscriptionResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.Subscriptionid = SubscriptionID(pathMatch[1])
-	req.Version = pathMatch[2]
+	req.Subscriptionid = SubscriptionID(pathParams[0])
+	req.Version = pathParams[1]
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, DeleteSubscriptionSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, DeleteSubscriptionSecurity, DeleteSubscriptionSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -876,41 +863,41 @@ func (s *APIRouter) DeleteSubscription(exp *regexp.Regexp, w http.ResponseWriter
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response404 != nil {
-		api.WriteJSON(w, 404, response.Response404)
+		api.WriteJSONResponse(w, r, 404, response.Response404)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) MakeDssReport(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) MakeDssReport(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req MakeDssReportRequest
 	var response MakeDssReportResponseSet
 
@@ -920,7 +907,7 @@ func (s *APIRouter) MakeDssReport(exp *regexp.Regexp, w http.ResponseWriter, r *
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, MakeDssReportSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, MakeDssReportSecurity, MakeDssReportSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -933,42 +920,41 @@ func (s *APIRouter) MakeDssReport(exp *regexp.Regexp, w http.ResponseWriter, r *
 
 	// Write response to client
 	if response.Response201 != nil {
-		api.WriteJSON(w, 201, response.Response201)
+		api.WriteJSONResponse(w, r, 201, response.Response201)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) GetUssAvailability(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetUssAvailability(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetUssAvailabilityRequest
 	var response GetUssAvailabilityResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.UssId = pathMatch[1]
+	req.UssId = pathParams[0]
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, GetUssAvailabilitySecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, GetUssAvailabilitySecurity, GetUssAvailabilitySecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -981,39 +967,38 @@ func (s *APIRouter) GetUssAvailability(exp *regexp.Regexp, w http.ResponseWriter
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) SetUssAvailability(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) SetUssAvailability(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req SetUssAvailabilityRequest
 	var response SetUssAvailabilityResponseSet
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.UssId = pathMatch[1]
+	req.UssId = pathParams[0]
 
 	// Parse request body
 	req.Body = new(SetUssAvailabilityStatusParameters)
@@ -1021,7 +1006,7 @@ func (s *APIRouter) SetUssAvailability(exp *regexp.Regexp, w http.ResponseWriter
 	req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, SetUssAvailabilitySecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, SetUssAvailabilitySecurity, SetUssAvailabilitySecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -1034,34 +1019,34 @@ func (s *APIRouter) SetUssAvailability(exp *regexp.Regexp, w http.ResponseWriter
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteJSONResponse(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response409 != nil {
-		api.WriteJSON(w, 409, response.Response409)
+		api.WriteJSONResponse(w, r, 409, response.Response409)
 		return
 	}
 	if response.Response429 != nil {
-		api.WriteJSON(w, 429, response.Response429)
+		api.WriteJSONResponse(w, r, 429, response.Response429)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
 func setAuthError(ctx context.Context, authErr error, resp401 **ErrorResponse, resp403 **ErrorResponse, resp500 **api.InternalServerErrorBody) {
@@ -1081,59 +1066,25 @@ func setAuthError(ctx context.Context, authErr error, resp401 **ErrorResponse, r
 func MakeAPIRouter(impl Implementation, auth api.Authorizer) APIRouter {
 	router := APIRouter{Implementation: impl, Authorizer: auth, Routes: make([]*api.Route, 18)}
 
-	pattern := regexp.MustCompile("^/scd/dss/v1/operational_intent_references/query$")
-	router.Routes[0] = &api.Route{Method: http.MethodPost, Pattern: pattern, Handler: router.QueryOperationalIntentReferences, Name: "scd.QueryOperationalIntentReferences", Path: "/scd/dss/v1/operational_intent_references/query"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/operational_intent_references/(?P<entityid>[^/]*)$")
-	router.Routes[1] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetOperationalIntentReference, Name: "scd.GetOperationalIntentReference", Path: "/scd/dss/v1/operational_intent_references/{entityid}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/operational_intent_references/(?P<entityid>[^/]*)$")
-	router.Routes[2] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.CreateOperationalIntentReference, Name: "scd.CreateOperationalIntentReference", Path: "/scd/dss/v1/operational_intent_references/{entityid}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/operational_intent_references/(?P<entityid>[^/]*)/(?P<ovn>[^/]*)$")
-	router.Routes[3] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.UpdateOperationalIntentReference, Name: "scd.UpdateOperationalIntentReference", Path: "/scd/dss/v1/operational_intent_references/{entityid}/{ovn}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/operational_intent_references/(?P<entityid>[^/]*)/(?P<ovn>[^/]*)$")
-	router.Routes[4] = &api.Route{Method: http.MethodDelete, Pattern: pattern, Handler: router.DeleteOperationalIntentReference, Name: "scd.DeleteOperationalIntentReference", Path: "/scd/dss/v1/operational_intent_references/{entityid}/{ovn}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/constraint_references/query$")
-	router.Routes[5] = &api.Route{Method: http.MethodPost, Pattern: pattern, Handler: router.QueryConstraintReferences, Name: "scd.QueryConstraintReferences", Path: "/scd/dss/v1/constraint_references/query"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/constraint_references/(?P<entityid>[^/]*)$")
-	router.Routes[6] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetConstraintReference, Name: "scd.GetConstraintReference", Path: "/scd/dss/v1/constraint_references/{entityid}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/constraint_references/(?P<entityid>[^/]*)$")
-	router.Routes[7] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.CreateConstraintReference, Name: "scd.CreateConstraintReference", Path: "/scd/dss/v1/constraint_references/{entityid}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/constraint_references/(?P<entityid>[^/]*)/(?P<ovn>[^/]*)$")
-	router.Routes[8] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.UpdateConstraintReference, Name: "scd.UpdateConstraintReference", Path: "/scd/dss/v1/constraint_references/{entityid}/{ovn}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/constraint_references/(?P<entityid>[^/]*)/(?P<ovn>[^/]*)$")
-	router.Routes[9] = &api.Route{Method: http.MethodDelete, Pattern: pattern, Handler: router.DeleteConstraintReference, Name: "scd.DeleteConstraintReference", Path: "/scd/dss/v1/constraint_references/{entityid}/{ovn}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/subscriptions/query$")
-	router.Routes[10] = &api.Route{Method: http.MethodPost, Pattern: pattern, Handler: router.QuerySubscriptions, Name: "scd.QuerySubscriptions", Path: "/scd/dss/v1/subscriptions/query"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/subscriptions/(?P<subscriptionid>[^/]*)$")
-	router.Routes[11] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetSubscription, Name: "scd.GetSubscription", Path: "/scd/dss/v1/subscriptions/{subscriptionid}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/subscriptions/(?P<subscriptionid>[^/]*)$")
-	router.Routes[12] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.CreateSubscription, Name: "scd.CreateSubscription", Path: "/scd/dss/v1/subscriptions/{subscriptionid}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/subscriptions/(?P<subscriptionid>[^/]*)/(?P<version>[^/]*)$")
-	router.Routes[13] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.UpdateSubscription, Name: "scd.UpdateSubscription", Path: "/scd/dss/v1/subscriptions/{subscriptionid}/{version}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/subscriptions/(?P<subscriptionid>[^/]*)/(?P<version>[^/]*)$")
-	router.Routes[14] = &api.Route{Method: http.MethodDelete, Pattern: pattern, Handler: router.DeleteSubscription, Name: "scd.DeleteSubscription", Path: "/scd/dss/v1/subscriptions/{subscriptionid}/{version}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/reports$")
-	router.Routes[15] = &api.Route{Method: http.MethodPost, Pattern: pattern, Handler: router.MakeDssReport, Name: "scd.MakeDssReport", Path: "/scd/dss/v1/reports"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/uss_availability/(?P<uss_id>[^/]*)$")
-	router.Routes[16] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetUssAvailability, Name: "scd.GetUssAvailability", Path: "/scd/dss/v1/uss_availability/{uss_id}"}
-
-	pattern = regexp.MustCompile("^/scd/dss/v1/uss_availability/(?P<uss_id>[^/]*)$")
-	router.Routes[17] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.SetUssAvailability, Name: "scd.SetUssAvailability", Path: "/scd/dss/v1/uss_availability/{uss_id}"}
-
+	router.Routes[0] = &api.Route{Method: http.MethodPost, Handler: router.QueryOperationalIntentReferences, Name: "scd.QueryOperationalIntentReferences", Path: "/scd/dss/v1/operational_intent_references/query"}
+	router.Routes[1] = &api.Route{Method: http.MethodGet, Handler: router.GetOperationalIntentReference, Name: "scd.GetOperationalIntentReference", Path: "/scd/dss/v1/operational_intent_references/{entityid}"}
+	router.Routes[2] = &api.Route{Method: http.MethodPut, Handler: router.CreateOperationalIntentReference, Name: "scd.CreateOperationalIntentReference", Path: "/scd/dss/v1/operational_intent_references/{entityid}"}
+	router.Routes[3] = &api.Route{Method: http.MethodPut, Handler: router.UpdateOperationalIntentReference, Name: "scd.UpdateOperationalIntentReference", Path: "/scd/dss/v1/operational_intent_references/{entityid}/{ovn}"}
+	router.Routes[4] = &api.Route{Method: http.MethodDelete, Handler: router.DeleteOperationalIntentReference, Name: "scd.DeleteOperationalIntentReference", Path: "/scd/dss/v1/operational_intent_references/{entityid}/{ovn}"}
+	router.Routes[5] = &api.Route{Method: http.MethodPost, Handler: router.QueryConstraintReferences, Name: "scd.QueryConstraintReferences", Path: "/scd/dss/v1/constraint_references/query"}
+	router.Routes[6] = &api.Route{Method: http.MethodGet, Handler: router.GetConstraintReference, Name: "scd.GetConstraintReference", Path: "/scd/dss/v1/constraint_references/{entityid}"}
+	router.Routes[7] = &api.Route{Method: http.MethodPut, Handler: router.CreateConstraintReference, Name: "scd.CreateConstraintReference", Path: "/scd/dss/v1/constraint_references/{entityid}"}
+	router.Routes[8] = &api.Route{Method: http.MethodPut, Handler: router.UpdateConstraintReference, Name: "scd.UpdateConstraintReference", Path: "/scd/dss/v1/constraint_references/{entityid}/{ovn}"}
+	router.Routes[9] = &api.Route{Method: http.MethodDelete, Handler: router.DeleteConstraintReference, Name: "scd.DeleteConstraintReference", Path: "/scd/dss/v1/constraint_references/{entityid}/{ovn}"}
+	router.Routes[10] = &api.Route{Method: http.MethodPost, Handler: router.QuerySubscriptions, Name: "scd.QuerySubscriptions", Path: "/scd/dss/v1/subscriptions/query"}
+	router.Routes[11] = &api.Route{Method: http.MethodGet, Handler: router.GetSubscription, Name: "scd.GetSubscription", Path: "/scd/dss/v1/subscriptions/{subscriptionid}"}
+	router.Routes[12] = &api.Route{Method: http.MethodPut, Handler: router.CreateSubscription, Name: "scd.CreateSubscription", Path: "/scd/dss/v1/subscriptions/{subscriptionid}"}
+	router.Routes[13] = &api.Route{Method: http.MethodPut, Handler: router.UpdateSubscription, Name: "scd.UpdateSubscription", Path: "/scd/dss/v1/subscriptions/{subscriptionid}/{version}"}
+	router.Routes[14] = &api.Route{Method: http.MethodDelete, Handler: router.DeleteSubscription, Name: "scd.DeleteSubscription", Path: "/scd/dss/v1/subscriptions/{subscriptionid}/{version}"}
+	router.Routes[15] = &api.Route{Method: http.MethodPost, Handler: router.MakeDssReport, Name: "scd.MakeDssReport", Path: "/scd/dss/v1/reports"}
+	router.Routes[16] = &api.Route{Method: http.MethodGet, Handler: router.GetUssAvailability, Name: "scd.GetUssAvailability", Path: "/scd/dss/v1/uss_availability/{uss_id}"}
+	router.Routes[17] = &api.Route{Method: http.MethodPut, Handler: router.SetUssAvailability, Name: "scd.SetUssAvailability", Path: "/scd/dss/v1/uss_availability/{uss_id}"}
+
+	router.Trie = api.NewRouteTrie(router.Routes)
 	return router
 }
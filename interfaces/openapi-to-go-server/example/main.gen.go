@@ -13,7 +13,7 @@ import (
 
 type PermissiveAuthorizer struct{}
 
-func (*PermissiveAuthorizer) Authorize(w http.ResponseWriter, r *http.Request, authOptions []api.AuthorizationOption) api.AuthorizationResult {
+func (*PermissiveAuthorizer) Authorize(w http.ResponseWriter, r *http.Request, authOptions []api.AuthorizationOption, authMasks []api.ScopeMask) api.AuthorizationResult {
 	return api.AuthorizationResult{}
 }
 
@@ -1,8 +1,14 @@
 # This tool generates Go server code from an OpenAPI YAML file.
 
 import argparse
+import functools
+import glob
+import hashlib
+import json
 import os
-from typing import List, Dict
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple
 
 import yaml
 
@@ -46,89 +52,160 @@ def _parse_args():
         type=str,
         help="Full Go import path for the API package",
     )
+    parser.add_argument(
+        "--json_codecs",
+        dest="json_codecs",
+        action="store_true",
+        default=False,
+        help="Generate reflection-free JSON decoders and encoders for API data types and use them in the generated servers instead of encoding/json",
+    )
+    parser.add_argument(
+        "--route_manifest",
+        dest="route_manifest",
+        action="store_true",
+        default=False,
+        help="Also write routes.gen.json, a manifest describing the routes of the APIs, into the API folder",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes parsing and rendering APIs in parallel (1 to do everything in this process).  Defaults to the number of CPUs",
+    )
+    parser.add_argument(
+        "--cache_file",
+        dest="cache_file",
+        type=str,
+        default=None,
+        help="File recording the inputs and outputs of the last generation, to skip it when nothing changed.  Defaults to .generate-cache.json in the API (or example) folder",
+    )
 
     return parser.parse_args()
 
 
-def _generate_apis(
-    api_list: List[apis.API], apis_folder: str, api_import: str, ensure_500: bool
-):
-    """Generate Go libraries for APIs.
+def _generate_common(
+    api_list: List[apis.API], apis_folder: str, json_codecs: bool, route_manifest: bool
+) -> Dict[str, str]:
+    """Generate the Go utilities and route manifest shared by all APIs.
 
     :param api_list: APIs implemented and hosted in example
     :param apis_folder: Root location where generated Go API packages should be written
+    :param json_codecs: True to generate JSON codecs for each API's data types and use them in the servers
+    :param route_manifest: True to generate a manifest describing the routes of all APIs
+    :return: Content of each generated file, by path
+    """
+    files: Dict[str, str] = {}
+
+    # Generate Go utilities common to any API generated with this tool
+    common_package = os.path.split(apis_folder)[-1]
+    common_template_vars = {"<PACKAGE>": common_package}
+    files[os.path.join(apis_folder, "common.gen.go")] = (
+        rendering.templates_content(["header", "common"], common_template_vars) + "\n"
+    )
+    if json_codecs:
+        files[os.path.join(apis_folder, "json.gen.go")] = rendering.templates_content(
+            ["header", "json"], common_template_vars
+        )
+
+    # Describe every route in a manifest usable by tools that do not read Go code
+    if route_manifest:
+        files[os.path.join(apis_folder, "routes.gen.json")] = (
+            json.dumps(rendering.route_manifest(api_list), indent=2) + "\n"
+        )
+
+    return files
+
+
+def _generate_api(
+    api: apis.API,
+    apis_folder: str,
+    api_import: str,
+    ensure_500: bool,
+    json_codecs: bool,
+) -> Dict[str, str]:
+    """Generate the Go package of an API.
+
+    :param api: API to generate
+    :param apis_folder: Root location where generated Go API packages should be written
     :param api_import: Go import path for the root api package
     :param ensure_500: True to auto-generate a 500 response for each operation when one is not already declared in the API
+    :param json_codecs: True to generate JSON codecs for each API's data types and use them in the servers
+    :return: Content of each generated file, by path
     """
     api_package = formatting.package_of_import(api_import)
+    files: Dict[str, str] = {}
+    api_folder = os.path.join(apis_folder, api.package)
 
-    # Generate Go utilities common to any API generated with this tool
-    os.makedirs(apis_folder, exist_ok=True)
-    common_package = os.path.split(apis_folder)[-1]
-    common_template_vars = {
-        "<PACKAGE>": common_package,
-        "<IMPORTS>": rendering.imports([api_import]),
-        "<API_PACKAGE>": api_package,
-    }
-    with open(os.path.join(apis_folder, "common.gen.go"), "w") as f:
-        f.write(rendering.template_content("header", common_template_vars))
-        f.write(rendering.template_content("common", common_template_vars))
-        f.write("\n")
+    # Generate Go type definitions
+    types_template_vars = {"<PACKAGE>": api.package}
+    files[os.path.join(api_folder, "types.gen.go")] = rendering.template_content(
+        "header", types_template_vars
+    ) + "".join(
+        "\n".join(rendering.data_type(data_type)) + "\n" * 2
+        for data_type in api.data_types
+    )
 
-    # Generate a package for each API
-    for api in api_list:
-        api_folder = os.path.join(apis_folder, api.package)
-        os.makedirs(api_folder, exist_ok=True)
-
-        # Generate Go type definitions
-        with open(os.path.join(api_folder, "types.gen.go"), "w") as f:
-            types_template_vars = {"<PACKAGE>": api.package}
-            f.write(rendering.template_content("header", types_template_vars))
-            for data_type in api.data_types:
-                f.write("\n".join(rendering.data_type(data_type)) + "\n" * 2)
-
-        # Generate Go handler implementation interface
-        interface_template_vars = {
+    # Generate Go JSON codecs for the type definitions
+    if json_codecs:
+        codecs_template_vars = {
             "<PACKAGE>": api.package,
             "<IMPORTS>": rendering.imports([api_import]),
-            "<INTERFACES>": "\n".join(
-                rendering.implementation_interface(api, api_package, ensure_500)
-            ),
         }
-        with open(os.path.join(api_folder, "interface.gen.go"), "w") as f:
-            f.write(rendering.template_content("header", interface_template_vars))
-            f.write(rendering.template_content("interface", interface_template_vars))
+        files[os.path.join(api_folder, "codecs.gen.go")] = (
+            rendering.templates_content(["header", "codecs"], codecs_template_vars)
+            + "\n".join(rendering.json_codecs(api, api_package))
+            + "\n"
+        )
 
-        # Generate Go server factory
-        routes, new_imports = rendering.routes(api, api_package, ensure_500)
-        server_template_vars = {
-            "<PACKAGE>": api.package,
-            "<IMPORTS>": rendering.imports(
-                list(new_imports)
-                + [
-                    api_import,
-                    "fmt",
-                    "go.opentelemetry.io/otel",
-                    "go.opentelemetry.io/otel/trace",
-                    "go.opentelemetry.io/contrib/instrumentation/net/http/otelhttp",
-                    'semconv "go.opentelemetry.io/otel/semconv/v1.40.0"',
-                ]
-            ),
-            "<API_PACKAGE>": api_package,
-            "<ROUTES>": "\n".join(routes),
-            "<ROUTING>": "\n".join(rendering.routing(api, api_package)),
-        }
-        with open(os.path.join(api_folder, "server.gen.go"), "w") as f:
-            f.write(rendering.template_content("header", server_template_vars))
-            f.write(rendering.template_content("server", server_template_vars))
+    # Generate Go handler implementation interface
+    interface_template_vars = {
+        "<PACKAGE>": api.package,
+        "<IMPORTS>": rendering.imports([api_import]),
+        "<INTERFACES>": "\n".join(
+            rendering.implementation_interface(api, api_package, ensure_500)
+        ),
+    }
+    files[os.path.join(api_folder, "interface.gen.go")] = rendering.templates_content(
+        ["header", "interface"], interface_template_vars
+    )
 
+    # Generate Go server factory
+    routes, new_imports = rendering.routes(api, api_package, ensure_500, json_codecs)
+    server_template_vars = {
+        "<PACKAGE>": api.package,
+        "<IMPORTS>": rendering.imports(
+            list(new_imports)
+            + [
+                api_import,
+                "fmt",
+                "go.opentelemetry.io/otel",
+                "go.opentelemetry.io/otel/trace",
+                "go.opentelemetry.io/contrib/instrumentation/net/http/otelhttp",
+                'semconv "go.opentelemetry.io/otel/semconv/v1.40.0"',
+            ]
+        ),
+        "<API_PACKAGE>": api_package,
+        "<ROUTES>": "\n".join(routes),
+        "<ROUTING>": "\n".join(rendering.routing(api, api_package)),
+    }
+    files[os.path.join(api_folder, "server.gen.go")] = rendering.templates_content(
+        ["header", "server"], server_template_vars
+    )
 
-def _generate_example(api_list: List[apis.API], output_folder: str, api_import: str):
+    return files
+
+
+def _generate_example(
+    api_list: List[apis.API], output_folder: str, api_import: str
+) -> Dict[str, str]:
     """Generate example implementations and entry point.
 
     :param api_list: APIs implemented and hosted in example
     :param output_folder: Location where example Go code should be written
     :param api_import: Go import path for the root api package
+    :return: Content of each generated file, by path
     """
     api_package = formatting.package_of_import(api_import)
 
@@ -156,50 +233,222 @@ def _generate_example(api_list: List[apis.API], output_folder: str, api_import:
         "<IMPLEMENTATIONS>": "\n".join(implementation_lines),
         "<ROUTER_DEFS>": "\n".join(router_def_lines),
     }
-    with open(os.path.join(output_folder, "main.gen.go"), "w") as f:
-        f.write(rendering.template_content("header", template_vars))
-        f.write(rendering.template_content("main", template_vars))
+    return {
+        os.path.join(output_folder, "main.gen.go"): rendering.templates_content(
+            ["header", "main"], template_vars
+        )
+    }
+
+
+def _parse_api_declaration(api_declaration: str) -> Tuple[str, str, str, List[str]]:
+    """Parse an --api argument.
+
+    :param api_declaration: Form of PATH_TO_YAML#TAG1,TAG2@API_NAME[/PATH_PREFIX]
+    :return: Path to the YAML, package name, path prefix and sorted tags of the API
+    """
+    if "@" in api_declaration:
+        input_yaml, package = api_declaration.split("@")
+        if "/" in package:
+            package, api_path = package.split("/", 1)
+        else:
+            api_path = package
+    else:
+        input_yaml = api_declaration
+        package = os.path.split(api_declaration)[-1].split(".")[0]
+        api_path = ""
+        package = package.replace("-", "").replace("_", "")
+
+    if "#" in input_yaml:
+        input_yaml, tag_list = input_yaml.split("#")
+        tags = sorted({t.strip() for t in tag_list.split(",")})
+    else:
+        tags = []
+
+    return input_yaml, package, api_path, tags
+
+
+def _load_and_generate_api(
+    declaration: Tuple[str, str, str, List[str]],
+    apis_folder: str,
+    api_import: str,
+    json_codecs: bool,
+) -> Tuple[apis.API, Dict[str, str]]:
+    """Parse an API and, if apis_folder is specified, render its formatted Go package.
+
+    This is the unit of work distributed to the processes of the --jobs pool.
+
+    :param declaration: Parsed --api argument (see _parse_api_declaration)
+    :return: Parsed API, and content of each generated file by path
+    """
+    input_yaml, package, api_path, tags = declaration
+
+    # Parse the API definition, with the C YAML parser if available
+    with open(input_yaml, mode="r") as f:
+        spec = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    api = apis.make_api(package, api_path, spec)
+    if tags:
+        api.filter_operations(set(tags))
+
+    files: Dict[str, str] = {}
+    if apis_folder:
+        files = _format_files(
+            _generate_api(api, apis_folder, api_import, True, json_codecs)
+        )
+    return api, files
+
+
+def _generator_sources() -> List[str]:
+    """List the files defining the behavior of this generator."""
+    generator_folder = os.path.dirname(os.path.abspath(__file__))
+    return sorted(
+        glob.glob(os.path.join(generator_folder, "*.py"))
+        + glob.glob(os.path.join(generator_folder, "templates", "*.template"))
+    )
+
+
+def _inputs_hash(args: argparse.Namespace, declarations: List[Tuple]) -> str:
+    """Hash everything the generated content depends on: specs, tag filters, options, templates and generator code."""
+    h = hashlib.sha256()
+    options = [
+        args.api_folder,
+        args.example_folder,
+        args.api_import,
+        args.json_codecs,
+        args.route_manifest,
+    ]
+    h.update(json.dumps([options, declarations]).encode("utf-8"))
+    for path in [d[0] for d in declarations] + _generator_sources():
+        with open(path, "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _format_go(content: str) -> str:
+    """Format Go code like gofmt -s would.
+
+    Fails if gofmt is not available or rejects the code, so that unformatted code is never written and cached.
+    """
+    try:
+        process = subprocess.run(
+            ["gofmt", "-s"], input=content, capture_output=True, text=True
+        )
+    except FileNotFoundError:
+        raise RuntimeError("gofmt is required to format the generated Go code")
+    if process.returncode != 0:
+        raise RuntimeError(
+            "gofmt failed to format the generated Go code: " + process.stderr.strip()
+        )
+    return process.stdout
+
+
+def _format_files(files: Dict[str, str]) -> Dict[str, str]:
+    return {
+        path: _format_go(content) if path.endswith(".go") else content
+        for path, content in files.items()
+    }
+
+
+def _write_files(files: Dict[str, str]) -> Dict[str, str]:
+    """Write each file whose content changed.
+
+    :param files: Content of each file, by path
+    :return: Hash of the content of each file, by path
+    """
+    hashes: Dict[str, str] = {}
+    written = 0
+    for path, content in files.items():
+        hashes[path] = _content_hash(content)
+        try:
+            with open(path, "r") as f:
+                if f.read() == content:
+                    continue
+        except FileNotFoundError:
+            pass
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+        written += 1
+    print("Wrote {} file(s), {} unchanged".format(written, len(files) - written))
+    return hashes
+
+
+def _outputs_unchanged(outputs: Dict[str, str]) -> bool:
+    for path, content_hash in outputs.items():
+        try:
+            with open(path, "r") as f:
+                if _content_hash(f.read()) != content_hash:
+                    return False
+        except FileNotFoundError:
+            return False
+    return True
 
 
 def main():
     args = _parse_args()
 
-    # Parse API definitions
-    api_list: List[apis.API] = []
-    for api_declaration in args.apis:
-        if "@" in api_declaration:
-            input_yaml, package = api_declaration.split("@")
-            if "/" in package:
-                package, api_path = package.split("/", 1)
-            else:
-                api_path = package
-        else:
-            input_yaml = api_declaration
-            package = os.path.split(api_declaration)[-1].split(".")[0]
-            api_path = ""
-            package = package.replace("-", "").replace("_", "")
-
-        if "#" in input_yaml:
-            input_yaml, tag_list = input_yaml.split("#")
-            tags = {t.strip() for t in tag_list.split(",")}
-        else:
-            tags = set()
+    declarations = [_parse_api_declaration(d) for d in args.apis]
 
-        with open(input_yaml, mode="r") as f:
-            spec = yaml.full_load(f)
+    # Skip the generation entirely if neither its inputs nor its outputs changed since the last one
+    cache_file = args.cache_file
+    if not cache_file and (args.api_folder or args.example_folder):
+        cache_file = os.path.join(
+            args.api_folder or args.example_folder, ".generate-cache.json"
+        )
+    inputs_hash = _inputs_hash(args, declarations)
+    cache = {}
+    if cache_file and os.path.exists(cache_file):
+        with open(cache_file, "r") as f:
+            cache = json.load(f)
+    if cache.get("inputs") == inputs_hash and _outputs_unchanged(
+        cache.get("outputs", {})
+    ):
+        print("Generated code is up to date")
+        return
 
-        api = apis.make_api(package, api_path, spec)
-        if tags:
-            api.filter_operations(tags)
-        api_list.append(api)
+    # Parse API definitions and render their Go packages, in parallel if requested
+    load_and_generate_api = functools.partial(
+        _load_and_generate_api,
+        apis_folder=args.api_folder,
+        api_import=args.api_import,
+        json_codecs=args.json_codecs,
+    )
+    jobs = min(args.jobs, len(declarations))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # map preserves the order of the declarations, so the output is deterministic
+            results = list(executor.map(load_and_generate_api, declarations))
+    else:
+        results = [load_and_generate_api(d) for d in declarations]
+    api_list: List[apis.API] = [api for api, _ in results]
 
-    # Render Go code
+    # Render Go code depending on all APIs
+    files: Dict[str, str] = {}
     if args.api_folder:
-        _generate_apis(api_list, args.api_folder, args.api_import, True)
-        os.system("cd {} && gofmt -s -w .".format(args.api_folder))
+        files.update(
+            _format_files(
+                _generate_common(
+                    api_list, args.api_folder, args.json_codecs, args.route_manifest
+                )
+            )
+        )
+        for _, api_files in results:
+            files.update(api_files)
     if args.example_folder:
-        _generate_example(api_list, args.example_folder, args.api_import)
-        os.system("cd {} && gofmt -s -w .".format(args.example_folder))
+        files.update(
+            _format_files(
+                _generate_example(api_list, args.example_folder, args.api_import)
+            )
+        )
+
+    outputs = _write_files(files)
+
+    if cache_file:
+        with open(cache_file, "w") as f:
+            json.dump({"inputs": inputs_hash, "outputs": outputs}, f, indent=2)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
+import dataclasses
+import functools
+import os
 import re
-from typing import Dict, List, Set, Tuple
+from typing import Dict, FrozenSet, List, Set, Tuple
 
 import apis
 import data_types
@@ -34,6 +37,49 @@ def imports(import_list: List[str]) -> str:
     )
 
 
+TEMPLATES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# Sentinels in templates look like <SOME_NAME>
+_SENTINEL = re.compile(r"(<[A-Z][A-Z0-9_]*>)")
+
+
+@dataclasses.dataclass(frozen=True)
+class Template:
+    """A template file, tokenized once so that filling it in takes a single pass"""
+
+    name: str
+    """Name of the template, for error messages"""
+
+    parts: Tuple[str, ...]
+    """Template content split around sentinels: literal text at even indices and sentinels at odd indices"""
+
+    sentinels: FrozenSet[str]
+    """All sentinels found in the template"""
+
+    @staticmethod
+    def compile(name: str, content: str) -> "Template":
+        parts = tuple(_SENTINEL.split(content))
+        return Template(name=name, parts=parts, sentinels=frozenset(parts[1::2]))
+
+    def render(self, template_vars: Dict[str, str]) -> str:
+        """Replace every sentinel with its value in a single pass (values are never searched for sentinels)."""
+        return "".join(
+            template_vars[part] if i % 2 else part for i, part in enumerate(self.parts)
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def load_template(template_name: str) -> Template:
+    """Read and compile a template once per run.
+
+    :param template_name: Name of template file in `templates` folder (e.g., 'common' reads from `templates/common.go.template`)
+    """
+    with open(
+        os.path.join(TEMPLATES_FOLDER, "{}.go.template".format(template_name)), "r"
+    ) as f:
+        return Template.compile(template_name, f.read())
+
+
 def template_content(template_name: str, template_vars: Dict[str, str]) -> str:
     """Fill in a template with provided values and return the entire content.
 
@@ -41,11 +87,35 @@ def template_content(template_name: str, template_vars: Dict[str, str]) -> str:
     :param template_vars: Mapping of key (sentinel in template) to value (what to replace the sentinel with)
     :return: Template content with filled values
     """
-    with open("templates/{}.go.template".format(template_name), "r") as f:
-        content = f.read()
-    for k, v in template_vars.items():
-        content = content.replace(k, v)
-    return content
+    return templates_content([template_name], template_vars)
+
+
+def templates_content(template_names: List[str], template_vars: Dict[str, str]) -> str:
+    """Fill in several templates with provided values and return their concatenated content.
+
+    :param template_names: Names of template files in `templates` folder, in order of concatenation
+    :param template_vars: Mapping of key (sentinel in any of the templates) to value (what to replace the sentinel with)
+    :return: Concatenated templates content with filled values
+    """
+    templates = [load_template(name) for name in template_names]
+
+    sentinels = frozenset().union(*(t.sentinels for t in templates))
+    unknown = sentinels - template_vars.keys()
+    if unknown:
+        raise ValueError(
+            "No value provided for {} in template(s) {}".format(
+                ", ".join(sorted(unknown)), ", ".join(template_names)
+            )
+        )
+    unused = template_vars.keys() - sentinels
+    if unused:
+        raise ValueError(
+            "Value(s) provided for {} are not used by template(s) {}".format(
+                ", ".join(sorted(unused)), ", ".join(template_names)
+            )
+        )
+
+    return "".join(t.render(template_vars) for t in templates)
 
 
 def data_type(d_type: data_types.DataType) -> List[str]:
@@ -108,27 +178,286 @@ def _object_field(field: data_types.ObjectField) -> List[str]:
     return lines
 
 
-def implementation_interface(
-    api: apis.API, api_package: str, ensure_500: bool
-) -> List[str]:
-    """Generate Go code defining the interface an API implementation must implement.
+_json_readers: Dict[str, str] = {
+    "string": "ReadString",
+    "bool": "ReadBool",
+    "float32": "ReadFloat32",
+    "float64": "ReadFloat64",
+    "int32": "ReadInt32",
+    "int64": "ReadInt64",
+}
+"""Maps Go primitive type to the JSONReader method decoding it"""
 
-    :param api: API to be rendered into an interface
+_json_appenders: Dict[str, str] = {
+    "string": "AppendJSONString(b, {})",
+    "bool": "AppendJSONBool(b, {})",
+    "float32": "AppendJSONFloat(b, float64({}), 32)",
+    "float64": "AppendJSONFloat(b, {}, 64)",
+    "int32": "AppendJSONInt(b, int64({}))",
+    "int64": "AppendJSONInt(b, {})",
+}
+"""Maps Go primitive type to the api function call appending a value of that type"""
+
+
+def json_codecs(api: apis.API, api_package: str) -> List[str]:
+    """Generate Go code decoding and encoding each of the API's data types to and from JSON without reflection.
+
+    The generated functions rely on the JSONReader and Append* helpers in the
+    root api package, and follow encoding/json's behavior for the Go types
+    produced by data_type.
+
+    :param api: API whose data types should have JSON codecs
     :param api_package: Name of root/common API package
-    :param ensure_500: If True, add a 500 response to all operations that don't already define a 500 response
-    :return: Lines of Go code defining the interface
+    :return: Lines of Go code defining DecodeJSON and AppendJSON methods for each data type
     """
     lines: List[str] = []
+    for d_type in api.data_types:
+        lines.extend(_json_decoder(d_type, api_package))
+        lines.append("")
+        lines.extend(_json_encoder(d_type, api_package))
+        lines.append("")
+    if lines:
+        lines.pop()
+    return lines
+
+
+def _json_decoder(d_type: data_types.DataType, api_package: str) -> List[str]:
+    lines: List[str] = []
+    if d_type.go_type == "struct" and d_type.fields:
+        fields_var = "jsonFields" + d_type.name
+        lines.append(
+            "var %s = []string{%s}"
+            % (fields_var, ", ".join('"%s"' % f.api_name for f in d_type.fields))
+        )
+        lines.append("")
+
+    lines.append(
+        "func (v *%s) DecodeJSON(r *%s.JSONReader) error {" % (d_type.name, api_package)
+    )
+    body: List[str] = []
+    if d_type.go_type == "struct":
+        if d_type.fields:
+            body.append("return r.ReadObject(func(key []byte) error {")
+            cases: List[str] = [
+                "switch %s.MatchJSONField(key, %s) {" % (api_package, fields_var)
+            ]
+            for field in d_type.fields:
+                cases.append('case "%s":' % field.api_name)
+                cases.extend(indent(_json_decode_field(field), 1))
+            cases.append("}")
+            cases.append("return r.Skip()")
+            body.extend(indent(cases, 1))
+            body.append("})")
+        else:
+            body.append("return r.ReadObject(func([]byte) error { return r.Skip() })")
+    else:
+        # A pointer to a named slice type can be used as-is; other types are decoded through their underlying type
+        ptr = "v" if d_type.go_type.startswith("[]") else "(*%s)(v)" % d_type.go_type
+        body.extend(_json_decode_into(d_type.go_type, ptr))
+    lines.extend(indent(body, 1))
+    lines.append("}")
+    return lines
 
-    # Provide security constants
-    lines.append("var (")
+
+def _json_decode_field(field: data_types.ObjectField) -> List[str]:
+    target = "v." + field.go_name
+    if field.required:
+        return _json_decode_into(field.go_type, "&" + target)
+    lines = [
+        "if r.ReadNull() {",
+        "  %s = nil" % target,
+        "  return nil",
+        "}",
+        "if %s == nil {" % target,
+        "  %s = new(%s)" % (target, field.go_type),
+        "}",
+    ]
+    lines.extend(_json_decode_into(field.go_type, target, null_checked=True))
+    return lines
+
+
+def _json_decode_into(go_type: str, ptr: str, null_checked: bool = False) -> List[str]:
+    """Generate Go statements decoding the next JSON value into a Go value.
+
+    :param go_type: Go type of the value to decode into
+    :param ptr: Go expression of type *go_type pointing to the value to decode into
+    :param null_checked: True if the generated code is only reached when the next JSON value is not null
+    :return: Lines of Go code, ending with a return of the decoding error (if any)
+    """
+    if go_type in _json_readers:
+        return ["return r.{}({})".format(_json_readers[go_type], ptr)]
+    elif go_type.startswith("[]"):
+        item_type = go_type[2:]
+        if ptr.startswith("&"):
+            slice_value = slice_operand = ptr[1:]
+        else:
+            slice_value = "*" + ptr
+            slice_operand = "(*{})".format(ptr)
+        lines: List[str] = []
+        if not null_checked:
+            lines.extend(
+                [
+                    "if r.ReadNull() {",
+                    "  {} = nil".format(slice_value),
+                    "  return nil",
+                    "}",
+                ]
+            )
+        lines.extend(
+            [
+                "{} = {}{{}}".format(slice_value, go_type),
+                "return r.ReadArray(func() error {",
+            ]
+        )
+        item_body = [
+            "var item {}".format(item_type),
+            "{s} = append({s}, item)".format(s=slice_value),
+        ]
+        item_body.extend(
+            _json_decode_into(
+                item_type, "&{}[len({})-1]".format(slice_operand, slice_value)
+            )
+        )
+        lines.extend(indent(item_body, 1))
+        lines.append("})")
+        return lines
+    else:
+        # Methods may be called directly on the value an address-of expression points to
+        return [
+            "return {}.DecodeJSON(r)".format(ptr[1:] if ptr.startswith("&") else ptr)
+        ]
+
+
+def _json_encoder(d_type: data_types.DataType, api_package: str) -> List[str]:
+    lines = [
+        "func (v *%s) AppendJSON(b []byte) []byte {" % d_type.name,
+        "  if v == nil {",
+        '    return append(b, "null"...)',
+        "  }",
+    ]
+    body: List[str] = []
+    if d_type.go_type == "struct":
+        if d_type.fields:
+            body.append("start := len(b)")
+            for field in d_type.fields:
+                key = 'b = append(b, `,"%s":`...)' % field.api_name
+                if field.required:
+                    body.append(key)
+                    body.extend(
+                        _json_append_value(
+                            field.go_type, "v." + field.go_name, 0, api_package
+                        )
+                    )
+                else:
+                    body.append("if v.%s != nil {" % field.go_name)
+                    field_body = [key]
+                    field_body.extend(
+                        _json_append_value(
+                            field.go_type, "(*v.%s)" % field.go_name, 0, api_package
+                        )
+                    )
+                    body.extend(indent(field_body, 1))
+                    body.append("}")
+            body.append("return %s.EndJSONObject(b, start)" % api_package)
+        else:
+            body.append("return append(b, '{', '}')")
+    elif d_type.go_type in _json_appenders:
+        body.append(
+            "return %s.%s"
+            % (
+                api_package,
+                _json_appenders[d_type.go_type].format("%s(*v)" % d_type.go_type),
+            )
+        )
+    elif d_type.go_type.startswith("[]"):
+        body.extend(_json_append_value(d_type.go_type, "(*v)", 0, api_package))
+        body.append("return b")
+    else:
+        body.append("return (*%s)(v).AppendJSON(b)" % d_type.go_type)
+    lines.extend(indent(body, 1))
+    lines.append("}")
+    return lines
+
+
+def _json_append_value(
+    go_type: str, value: str, depth: int, api_package: str
+) -> List[str]:
+    """Generate Go statements appending the JSON encoding of a Go value to `b`.
+
+    :param go_type: Go type of the value to encode
+    :param value: Addressable Go expression of type go_type
+    :param depth: Nesting level of arrays being encoded, to avoid shadowing loop indices
+    :param api_package: Name of root/common API package
+    :return: Lines of Go code
+    """
+    if go_type in _json_appenders:
+        return ["b = {}.{}".format(api_package, _json_appenders[go_type].format(value))]
+    elif go_type.startswith("[]"):
+        i = "ijklmn"[depth]
+        lines = [
+            "if {} == nil {{".format(value),
+            '  b = append(b, "null"...)',
+            "} else {",
+            "  b = append(b, '[')",
+            "  for {i} := range {v} {{".format(i=i, v=value),
+            "    if {} > 0 {{".format(i),
+            "      b = append(b, ',')",
+            "    }",
+        ]
+        lines.extend(
+            indent(
+                _json_append_value(
+                    go_type[2:], "{}[{}]".format(value, i), depth + 1, api_package
+                ),
+                2,
+            )
+        )
+        lines.extend(["  }", "  b = append(b, ']')", "}"])
+        return lines
+    else:
+        return ["b = {}.AppendJSON(b)".format(value)]
+
+
+def scope_bits(api: apis.API) -> Dict[str, int]:
+    """Assign an index to each scope used by an API, in the order of `API.security_scopes`.
+
+    :param api: API using the scopes
+    :return: Mapping of scope name to the index of the scope among the scopes registered by the API
+    """
+    bits: Dict[str, int] = {}
+    for _, scope in api.security_scopes():
+        bits.setdefault(scope.name, len(bits))
+    return bits
+
+
+def security(api: apis.API, api_package: str) -> List[str]:
+    """Generate Go code defining the scopes of an API and the security requirements of its operations.
+
+    Each operation's requirements are defined both as AuthorizationOptions, for display, and as one ScopeMask per
+    AuthorizationOption, so that an Authorizer may evaluate them with bitwise operations.
+
+    :param api: API which operations' security should be rendered
+    :param api_package: Name of root/common API package
+    :return: Lines of Go code defining the scope constants and the security variables of each operation
+    """
+    lines: List[str] = ["var ("]
 
     for _, scope in api.security_scopes():
         lines.append(
             '%s = api.RequiredScope("%s")' % (scope.go_constant_name, scope.name)
         )
 
+    bits = scope_bits(api)
     var_body: List[str] = []
+    if bits:
+        var_body.append("scopeMasks = %s.RegisterScopes(" % api_package)
+        var_body.extend(
+            indent(
+                [operations.Scope(name).go_constant_name + "," for name in bits.keys()],
+                1,
+            )
+        )
+        var_body.append(")")
     for operation in api.operations:
         var_body.append(
             "%sSecurity = []%s.AuthorizationOption{"
@@ -155,9 +484,44 @@ def implementation_interface(
         var_body.extend(indent(init_body, 1))
 
         var_body.append("}")
+
+        # Masks of the options above, in the same order
+        var_body.append(
+            "%sSecurityMasks = []%s.ScopeMask{"
+            % (operation.interface_name, api_package)
+        )
+        masks_body: List[str] = []
+        for auth_option in operation.security.options:
+            option_bits = sorted(
+                {
+                    bits[scope.name]
+                    for scopes in auth_option.option.values()
+                    for scope in scopes
+                }
+            )
+            masks_body.append(
+                "%s,"
+                % (" | ".join("scopeMasks[%d]" % bit for bit in option_bits) or "0")
+            )
+        var_body.extend(indent(masks_body, 1))
+        var_body.append("}")
     lines.extend(indent(var_body, 1))
 
     lines.append(")")
+    return lines
+
+
+def implementation_interface(
+    api: apis.API, api_package: str, ensure_500: bool
+) -> List[str]:
+    """Generate Go code defining the interface an API implementation must implement.
+
+    :param api: API to be rendered into an interface
+    :param api_package: Name of root/common API package
+    :param ensure_500: If True, add a 500 response to all operations that don't already define a 500 response
+    :return: Lines of Go code defining the interface
+    """
+    lines: List[str] = security(api, api_package)
 
     # Declare request & response types for all operations
     for operation in api.operations:
@@ -279,13 +643,14 @@ def implementation_interface(
 
 
 def routes(
-    api: apis.API, api_package: str, ensure_500: bool
+    api: apis.API, api_package: str, ensure_500: bool, json_codecs: bool
 ) -> Tuple[List[str], Set[str]]:
     """Generate handler Go code for each operation, routed appropriately.
 
     :param api: API to have its operation routes rendered
     :param api_package: Name of root/common API package
     :param ensure_500: If True, add a 500 response to all operations that don't already define a 500 response
+    :param json_codecs: If True, decode request bodies and encode response bodies with the generated JSON codecs (see json_codecs) rather than encoding/json
     :return:
         * Lines of Go code defining the handler functions and router creation function
         * Go packages that need to be imported
@@ -296,10 +661,9 @@ def routes(
 
     # Define a top-level routed HTTP handler function for each operation
     for operation in api.operations:
-        imports.add("regexp")
         imports.add("net/http")
         lines.append(
-            "func (s *APIRouter) {}(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {{".format(
+            "func (s *APIRouter) {}(pathParams []string, w http.ResponseWriter, r *http.Request) {{".format(
                 operation.interface_name
             )
         )
@@ -314,14 +678,13 @@ def routes(
         # Parse any path parameters
         if operation.path_parameters:
             body.extend(comment(["Parse path parameters"]))
-            body.append("pathMatch := exp.FindStringSubmatch(r.URL.Path)")
             for i, p in enumerate(operation.path_parameters):
                 if p.go_type == "string":
-                    body.append("req.{} = pathMatch[{}]".format(p.go_field_name, i + 1))
+                    body.append("req.{} = pathParams[{}]".format(p.go_field_name, i))
                 else:
                     body.append(
-                        "req.{} = {}(pathMatch[{}])".format(
-                            p.go_field_name, p.go_type, i + 1
+                        "req.{} = {}(pathParams[{}])".format(
+                            p.go_field_name, p.go_type, i
                         )
                     )
             body.append("")
@@ -384,11 +747,20 @@ def routes(
 
         # Attempt to parse the request body JSON, if defined
         if operation.json_request_body_type:
-            imports.add("encoding/json")
             body.extend(comment(["Parse request body"]))
             body.append("req.Body = new({})".format(operation.json_request_body_type))
             body.append("defer r.Body.Close()")
-            body.append("req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)")
+            if json_codecs:
+                body.append(
+                    "req.BodyParseError = {}.DecodeJSONBody(r.Body, req.Body)".format(
+                        api_package
+                    )
+                )
+            else:
+                imports.add("encoding/json")
+                body.append(
+                    "req.BodyParseError = json.NewDecoder(r.Body).Decode(req.Body)"
+                )
             body.append("")
 
         # Actually invoke the API Implementation with the processed request to obtain the response
@@ -410,7 +782,7 @@ def routes(
             # Authorize & verify the call
             body.extend(comment(["Authorize request"]))
             body.append(
-                "req.Auth = s.Authorizer.Authorize(w, r, {}Security)".format(
+                "req.Auth = s.Authorizer.Authorize(w, r, {0}Security, {0}SecurityMasks)".format(
                     operation.interface_name
                 )
             )
@@ -443,13 +815,17 @@ def routes(
                     json_body_type="{}.InternalServerErrorBody".format(api_package),
                 )
             )
+        write_json = "WriteAppendedJSON" if json_codecs else "WriteJSONResponse"
         for response in responses:
             body.append("if response.{} != nil {{".format(response.response_set_field))
             body.extend(
                 indent(
                     [
-                        "{}.WriteJSON(w, {}, response.{})".format(
-                            api_package, response.code, response.response_set_field
+                        "{}.{}(w, r, {}, response.{})".format(
+                            api_package,
+                            write_json,
+                            response.code,
+                            response.response_set_field,
                         )
                     ],
                     1,
@@ -458,8 +834,8 @@ def routes(
             body.extend(indent(["return"], 1))
             body.append("}")
         body.append(
-            '%s.WriteJSON(w, 500, %s.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})'
-            % (api_package, api_package)
+            '%s.%s(w, r, 500, %s%s.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})'
+            % (api_package, write_json, "&" if json_codecs else "", api_package)
         )
 
         lines.extend(indent(body, 1))
@@ -533,17 +909,10 @@ def routing(api: apis.API, api_package: str) -> List[str]:
         % (api_package, len(api.operations))
     )
     lines.append("")
-    first_assignment = True
     for i, operation in enumerate(api.operations):
         prefix = ("/" + api.path_prefix) if api.path_prefix else ""
-        path_regex = prefix + re.sub(r"{([^}]*)}", r"(?P<\1>[^/]*)", operation.path)
         lines.append(
-            'pattern {}= regexp.MustCompile("^{}$")'.format(
-                ":" if first_assignment else "", path_regex
-            )
-        )
-        lines.append(
-            'router.Routes[%d] = &%s.Route{Method: %s, Pattern: pattern, Handler: router.%s, Name: "%s.%s", Path: "%s%s"}'
+            'router.Routes[%d] = &%s.Route{Method: %s, Handler: router.%s, Name: "%s.%s", Path: "%s%s"}'
             % (
                 i,
                 api_package,
@@ -555,12 +924,64 @@ def routing(api: apis.API, api_package: str) -> List[str]:
                 operation.path,
             )
         )
-        lines.append("")
-        first_assignment = False
+    lines.append("")
+    lines.append("router.Trie = %s.NewRouteTrie(router.Routes)" % api_package)
     lines.append("return router")
     return lines
 
 
+def route_manifest(api_list: List[apis.API]) -> Dict:
+    """Generate a machine-readable description of the routes of the provided APIs.
+
+    The manifest lists the operations in the same order and with the same paths as the Routes created by `routing`, so
+    tools may enumerate the routes served without parsing Go code.
+
+    :param api_list: APIs to have their operation routes described
+    :return: JSON-serializable manifest with the scopes used by each API and the method, path, path regex, security
+        options and request/response types of each operation
+    """
+    manifest = {"apis": {}, "operations": []}
+    for api in api_list:
+        prefix = ("/" + api.path_prefix) if api.path_prefix else ""
+        manifest["apis"][api.package] = {
+            "path_prefix": prefix,
+            "scopes": [
+                {"scheme": scheme, "scope": scope.name}
+                for scheme, scope in api.security_scopes()
+            ],
+        }
+        for operation in api.operations:
+            path = prefix + operation.path
+            segments = []
+            for segment in path.split("/"):
+                if segment.startswith("{") and segment.endswith("}"):
+                    segments.append("(?P<%s>[^/]*)" % segment[1:-1])
+                else:
+                    segments.append(re.escape(segment))
+            manifest["operations"].append(
+                {
+                    "api": api.package,
+                    "name": "%s.%s" % (api.package, operation.interface_name),
+                    "method": operation.verb.upper(),
+                    "path": path,
+                    "regex": "^" + "/".join(segments) + "$",
+                    "security": [
+                        {
+                            scheme: [scope.name for scope in scopes]
+                            for scheme, scopes in option.option.items()
+                        }
+                        for option in operation.security.options
+                    ],
+                    "request_type": operation.json_request_body_type or None,
+                    "response_types": {
+                        str(response.code): response.json_body_type or None
+                        for response in operation.responses
+                    },
+                }
+            )
+    return manifest
+
+
 def example_implementation(api: apis.API, implementation_name: str) -> List[str]:
     """Generate Go code for a dummy API Implementation and a main routine to run it.
 
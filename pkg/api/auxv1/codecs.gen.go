@@ -0,0 +1,354 @@
+// This file is auto-generated; do not change as any changes will be overwritten
+package auxv1
+
+import (
+	"github.com/interuss/dss/pkg/api"
+)
+
+var jsonFieldsVersionResponse = []string{"version"}
+
+func (v *VersionResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsVersionResponse) {
+		case "version":
+			return r.ReadString(&v.Version)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *VersionResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"version":`...)
+	b = api.AppendJSONString(b, v.Version)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsErrorResponse = []string{"message"}
+
+func (v *ErrorResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsErrorResponse) {
+		case "message":
+			if r.ReadNull() {
+				v.Message = nil
+				return nil
+			}
+			if v.Message == nil {
+				v.Message = new(string)
+			}
+			return r.ReadString(v.Message)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *ErrorResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.Message != nil {
+		b = append(b, `,"message":`...)
+		b = api.AppendJSONString(b, (*v.Message))
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsPoolResponse = []string{"dar_id"}
+
+func (v *PoolResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsPoolResponse) {
+		case "dar_id":
+			if r.ReadNull() {
+				v.DarId = nil
+				return nil
+			}
+			if v.DarId == nil {
+				v.DarId = new(string)
+			}
+			return r.ReadString(v.DarId)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *PoolResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.DarId != nil {
+		b = append(b, `,"dar_id":`...)
+		b = api.AppendJSONString(b, (*v.DarId))
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsDSSInstancesResponse = []string{"dss_instances"}
+
+func (v *DSSInstancesResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsDSSInstancesResponse) {
+		case "dss_instances":
+			if r.ReadNull() {
+				v.DssInstances = nil
+				return nil
+			}
+			if v.DssInstances == nil {
+				v.DssInstances = new([]DSSInstance)
+			}
+			*v.DssInstances = []DSSInstance{}
+			return r.ReadArray(func() error {
+				var item DSSInstance
+				*v.DssInstances = append(*v.DssInstances, item)
+				return (*v.DssInstances)[len(*v.DssInstances)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *DSSInstancesResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.DssInstances != nil {
+		b = append(b, `,"dss_instances":`...)
+		if (*v.DssInstances) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.DssInstances {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.DssInstances)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsDSSInstance = []string{"id", "public_endpoint", "most_recent_heartbeat"}
+
+func (v *DSSInstance) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsDSSInstance) {
+		case "id":
+			return r.ReadString(&v.Id)
+		case "public_endpoint":
+			if r.ReadNull() {
+				v.PublicEndpoint = nil
+				return nil
+			}
+			if v.PublicEndpoint == nil {
+				v.PublicEndpoint = new(string)
+			}
+			return r.ReadString(v.PublicEndpoint)
+		case "most_recent_heartbeat":
+			if r.ReadNull() {
+				v.MostRecentHeartbeat = nil
+				return nil
+			}
+			if v.MostRecentHeartbeat == nil {
+				v.MostRecentHeartbeat = new(Heartbeat)
+			}
+			return v.MostRecentHeartbeat.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *DSSInstance) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"id":`...)
+	b = api.AppendJSONString(b, v.Id)
+	if v.PublicEndpoint != nil {
+		b = append(b, `,"public_endpoint":`...)
+		b = api.AppendJSONString(b, (*v.PublicEndpoint))
+	}
+	if v.MostRecentHeartbeat != nil {
+		b = append(b, `,"most_recent_heartbeat":`...)
+		b = (*v.MostRecentHeartbeat).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsHeartbeat = []string{"timestamp", "reporter", "source", "index", "next_heartbeat_expected_before"}
+
+func (v *Heartbeat) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsHeartbeat) {
+		case "timestamp":
+			return r.ReadString(&v.Timestamp)
+		case "reporter":
+			if r.ReadNull() {
+				v.Reporter = nil
+				return nil
+			}
+			if v.Reporter == nil {
+				v.Reporter = new(string)
+			}
+			return r.ReadString(v.Reporter)
+		case "source":
+			return r.ReadString(&v.Source)
+		case "index":
+			if r.ReadNull() {
+				v.Index = nil
+				return nil
+			}
+			if v.Index == nil {
+				v.Index = new(int64)
+			}
+			return r.ReadInt64(v.Index)
+		case "next_heartbeat_expected_before":
+			if r.ReadNull() {
+				v.NextHeartbeatExpectedBefore = nil
+				return nil
+			}
+			if v.NextHeartbeatExpectedBefore == nil {
+				v.NextHeartbeatExpectedBefore = new(string)
+			}
+			return r.ReadString(v.NextHeartbeatExpectedBefore)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Heartbeat) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"timestamp":`...)
+	b = api.AppendJSONString(b, v.Timestamp)
+	if v.Reporter != nil {
+		b = append(b, `,"reporter":`...)
+		b = api.AppendJSONString(b, (*v.Reporter))
+	}
+	b = append(b, `,"source":`...)
+	b = api.AppendJSONString(b, v.Source)
+	if v.Index != nil {
+		b = append(b, `,"index":`...)
+		b = api.AppendJSONInt(b, (*v.Index))
+	}
+	if v.NextHeartbeatExpectedBefore != nil {
+		b = append(b, `,"next_heartbeat_expected_before":`...)
+		b = api.AppendJSONString(b, (*v.NextHeartbeatExpectedBefore))
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsCAsResponse = []string{"CAs"}
+
+func (v *CAsResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsCAsResponse) {
+		case "CAs":
+			if r.ReadNull() {
+				v.Cas = nil
+				return nil
+			}
+			if v.Cas == nil {
+				v.Cas = new([]string)
+			}
+			*v.Cas = []string{}
+			return r.ReadArray(func() error {
+				var item string
+				*v.Cas = append(*v.Cas, item)
+				return r.ReadString(&(*v.Cas)[len(*v.Cas)-1])
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *CAsResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.Cas != nil {
+		b = append(b, `,"CAs":`...)
+		if (*v.Cas) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.Cas {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = api.AppendJSONString(b, (*v.Cas)[i])
+			}
+			b = append(b, ']')
+		}
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsGlobalOptionsResponse = []string{"scd_global_lock", "scd_hash_lock", "time_based_notification_index"}
+
+func (v *GlobalOptionsResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsGlobalOptionsResponse) {
+		case "scd_global_lock":
+			if r.ReadNull() {
+				v.ScdGlobalLock = nil
+				return nil
+			}
+			if v.ScdGlobalLock == nil {
+				v.ScdGlobalLock = new(bool)
+			}
+			return r.ReadBool(v.ScdGlobalLock)
+		case "scd_hash_lock":
+			if r.ReadNull() {
+				v.ScdHashLock = nil
+				return nil
+			}
+			if v.ScdHashLock == nil {
+				v.ScdHashLock = new(bool)
+			}
+			return r.ReadBool(v.ScdHashLock)
+		case "time_based_notification_index":
+			if r.ReadNull() {
+				v.TimeBasedNotificationIndex = nil
+				return nil
+			}
+			if v.TimeBasedNotificationIndex == nil {
+				v.TimeBasedNotificationIndex = new(bool)
+			}
+			return r.ReadBool(v.TimeBasedNotificationIndex)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *GlobalOptionsResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.ScdGlobalLock != nil {
+		b = append(b, `,"scd_global_lock":`...)
+		b = api.AppendJSONBool(b, (*v.ScdGlobalLock))
+	}
+	if v.ScdHashLock != nil {
+		b = append(b, `,"scd_hash_lock":`...)
+		b = api.AppendJSONBool(b, (*v.ScdHashLock))
+	}
+	if v.TimeBasedNotificationIndex != nil {
+		b = append(b, `,"time_based_notification_index":`...)
+		b = api.AppendJSONBool(b, (*v.TimeBasedNotificationIndex))
+	}
+	return api.EndJSONObject(b, start)
+}
@@ -11,8 +11,15 @@ var (
 	DssWriteIdentificationServiceAreasScope = api.RequiredScope("dss.write.identification_service_areas")
 	InterussPoolStatusHeartbeatWriteScope   = api.RequiredScope("interuss.pool_status.heartbeat.write")
 	InterussPoolStatusReadScope             = api.RequiredScope("interuss.pool_status.read")
-	GetVersionSecurity                      = []api.AuthorizationOption{}
-	ValidateOauthSecurity                   = []api.AuthorizationOption{
+	scopeMasks                              = api.RegisterScopes(
+		DssReadIdentificationServiceAreasScope,
+		DssWriteIdentificationServiceAreasScope,
+		InterussPoolStatusHeartbeatWriteScope,
+		InterussPoolStatusReadScope,
+	)
+	GetVersionSecurity      = []api.AuthorizationOption{}
+	GetVersionSecurityMasks = []api.ScopeMask{}
+	ValidateOauthSecurity   = []api.AuthorizationOption{
 		{
 			"Auth": {DssReadIdentificationServiceAreasScope},
 		},
@@ -20,28 +27,46 @@ var (
 			"Auth": {DssWriteIdentificationServiceAreasScope},
 		},
 	}
+	ValidateOauthSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+		scopeMasks[1],
+	}
 	GetPoolSecurity = []api.AuthorizationOption{
 		{
 			"Auth": {InterussPoolStatusReadScope},
 		},
 	}
+	GetPoolSecurityMasks = []api.ScopeMask{
+		scopeMasks[3],
+	}
 	GetDSSInstancesSecurity = []api.AuthorizationOption{
 		{
 			"Auth": {InterussPoolStatusReadScope},
 		},
 	}
+	GetDSSInstancesSecurityMasks = []api.ScopeMask{
+		scopeMasks[3],
+	}
 	PutDSSInstancesHeartbeatSecurity = []api.AuthorizationOption{
 		{
 			"Auth": {InterussPoolStatusHeartbeatWriteScope},
 		},
 	}
-	GetAcceptedCAsSecurity   = []api.AuthorizationOption{}
-	GetInstanceCAsSecurity   = []api.AuthorizationOption{}
-	GetGlobalOptionsSecurity = []api.AuthorizationOption{
+	PutDSSInstancesHeartbeatSecurityMasks = []api.ScopeMask{
+		scopeMasks[2],
+	}
+	GetAcceptedCAsSecurity      = []api.AuthorizationOption{}
+	GetAcceptedCAsSecurityMasks = []api.ScopeMask{}
+	GetInstanceCAsSecurity      = []api.AuthorizationOption{}
+	GetInstanceCAsSecurityMasks = []api.ScopeMask{}
+	GetGlobalOptionsSecurity    = []api.AuthorizationOption{
 		{
 			"Auth": {InterussPoolStatusReadScope},
 		},
 	}
+	GetGlobalOptionsSecurityMasks = []api.ScopeMask{
+		scopeMasks[3],
+	}
 )
 
 type GetVersionRequest struct {
@@ -12,11 +12,11 @@ import (
 	semconv "go.opentelemetry.io/otel/semconv/v1.40.0"
 	"go.opentelemetry.io/otel/trace"
 	"net/http"
-	"regexp"
 )
 
 type APIRouter struct {
 	Routes         []*api.Route
+	Trie           *api.RouteTrie
 	Implementation Implementation
 	Authorizer     api.Authorizer
 }
@@ -25,32 +25,31 @@ var tracer = otel.Tracer("auxv1.api")
 
 // *auxv1.APIRouter (type defined above) implements the api.PartialRouter interface
 func (s *APIRouter) Handle(w http.ResponseWriter, r *http.Request) bool {
-	for _, route := range s.Routes {
-		if route.Method == r.Method && route.Pattern.MatchString(r.URL.Path) {
+	route, pathParams := s.Trie.Match(r.Method, r.URL.Path)
+	if route == nil {
+		return false
+	}
 
-			if labeler, ok := otelhttp.LabelerFromContext(r.Context()); ok {
-				labeler.Add(semconv.HTTPRoute(route.Path))
-			}
+	if labeler, ok := otelhttp.LabelerFromContext(r.Context()); ok {
+		labeler.Add(semconv.HTTPRoute(route.Path))
+	}
 
-			// We retrieve the current span from the otelhttp handler to set its name property.
-			span := trace.SpanFromContext(r.Context())
+	// We retrieve the current span from the otelhttp handler to set its name property.
+	span := trace.SpanFromContext(r.Context())
 
-			if span.IsRecording() { // If the span is not recording, the name cannot be changed. This also likely means the otelhttp handler is not present (tracing disabled).
-				span.SetName(fmt.Sprintf("%s %s", r.Method, route.Path))
-			}
+	if span.IsRecording() { // If the span is not recording, the name cannot be changed. This also likely means the otelhttp handler is not present (tracing disabled).
+		span.SetName(fmt.Sprintf("%s %s", r.Method, route.Path))
+	}
 
-			ctx, span := tracer.Start(r.Context(), route.Name)
-			defer span.End()
-			r = r.WithContext(ctx)
+	ctx, span := tracer.Start(r.Context(), route.Name)
+	defer span.End()
+	r = r.WithContext(ctx)
 
-			route.Handler(route.Pattern, w, r)
-			return true
-		}
-	}
-	return false
+	route.Handler(pathParams, w, r)
+	return true
 }
 
-func (s *APIRouter) GetVersion(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetVersion(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetVersionRequest
 	var response GetVersionResponseSet
 
@@ -61,17 +60,17 @@ func (s *APIRouter) GetVersion(exp *regexp.Regexp, w http.ResponseWriter, r *htt
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteAppendedJSON(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteAppendedJSON(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteAppendedJSON(w, r, 500, &api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) ValidateOauth(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) ValidateOauth(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req ValidateOauthRequest
 	var response ValidateOauthResponseSet
 
@@ -83,7 +82,7 @@ func (s *APIRouter) ValidateOauth(exp *regexp.Regexp, w http.ResponseWriter, r *
 	}
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, ValidateOauthSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, ValidateOauthSecurity, ValidateOauthSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -96,30 +95,30 @@ func (s *APIRouter) ValidateOauth(exp *regexp.Regexp, w http.ResponseWriter, r *
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteAppendedJSON(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteAppendedJSON(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteAppendedJSON(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteAppendedJSON(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteAppendedJSON(w, r, 500, &api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) GetPool(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetPool(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetPoolRequest
 	var response GetPoolResponseSet
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, GetPoolSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, GetPoolSecurity, GetPoolSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -132,34 +131,34 @@ func (s *APIRouter) GetPool(exp *regexp.Regexp, w http.ResponseWriter, r *http.R
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteAppendedJSON(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteAppendedJSON(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteAppendedJSON(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response501 != nil {
-		api.WriteJSON(w, 501, response.Response501)
+		api.WriteAppendedJSON(w, r, 501, response.Response501)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteAppendedJSON(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteAppendedJSON(w, r, 500, &api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) GetDSSInstances(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetDSSInstances(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetDSSInstancesRequest
 	var response GetDSSInstancesResponseSet
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, GetDSSInstancesSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, GetDSSInstancesSecurity, GetDSSInstancesSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -172,29 +171,29 @@ func (s *APIRouter) GetDSSInstances(exp *regexp.Regexp, w http.ResponseWriter, r
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteAppendedJSON(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteAppendedJSON(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteAppendedJSON(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response501 != nil {
-		api.WriteJSON(w, 501, response.Response501)
+		api.WriteAppendedJSON(w, r, 501, response.Response501)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteAppendedJSON(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteAppendedJSON(w, r, 500, &api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) PutDSSInstancesHeartbeat(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) PutDSSInstancesHeartbeat(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req PutDSSInstancesHeartbeatRequest
 	var response PutDSSInstancesHeartbeatResponseSet
 
@@ -214,7 +213,7 @@ func (s *APIRouter) PutDSSInstancesHeartbeat(exp *regexp.Regexp, w http.Response
 	}
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, PutDSSInstancesHeartbeatSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, PutDSSInstancesHeartbeatSecurity, PutDSSInstancesHeartbeatSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -227,33 +226,33 @@ func (s *APIRouter) PutDSSInstancesHeartbeat(exp *regexp.Regexp, w http.Response
 
 	// Write response to client
 	if response.Response201 != nil {
-		api.WriteJSON(w, 201, response.Response201)
+		api.WriteAppendedJSON(w, r, 201, response.Response201)
 		return
 	}
 	if response.Response400 != nil {
-		api.WriteJSON(w, 400, response.Response400)
+		api.WriteAppendedJSON(w, r, 400, response.Response400)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteAppendedJSON(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteAppendedJSON(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response501 != nil {
-		api.WriteJSON(w, 501, response.Response501)
+		api.WriteAppendedJSON(w, r, 501, response.Response501)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteAppendedJSON(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteAppendedJSON(w, r, 500, &api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) GetAcceptedCAs(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetAcceptedCAs(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetAcceptedCAsRequest
 	var response GetAcceptedCAsResponseSet
 
@@ -264,21 +263,21 @@ func (s *APIRouter) GetAcceptedCAs(exp *regexp.Regexp, w http.ResponseWriter, r
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteAppendedJSON(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response501 != nil {
-		api.WriteJSON(w, 501, response.Response501)
+		api.WriteAppendedJSON(w, r, 501, response.Response501)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteAppendedJSON(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteAppendedJSON(w, r, 500, &api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) GetInstanceCAs(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetInstanceCAs(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetInstanceCAsRequest
 	var response GetInstanceCAsResponseSet
 
@@ -289,26 +288,26 @@ func (s *APIRouter) GetInstanceCAs(exp *regexp.Regexp, w http.ResponseWriter, r
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteAppendedJSON(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response501 != nil {
-		api.WriteJSON(w, 501, response.Response501)
+		api.WriteAppendedJSON(w, r, 501, response.Response501)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteAppendedJSON(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteAppendedJSON(w, r, 500, &api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
-func (s *APIRouter) GetGlobalOptions(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetGlobalOptions(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetGlobalOptionsRequest
 	var response GetGlobalOptionsResponseSet
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, GetGlobalOptionsSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, GetGlobalOptionsSecurity, GetGlobalOptionsSecurityMasks)
 	// Verify authorization
 	if req.Auth.Error != nil {
 		setAuthError(r.Context(), stacktrace.Propagate(req.Auth.Error, "Auth failed"), &response.Response401, &response.Response403, &response.Response500)
@@ -321,26 +320,26 @@ func (s *APIRouter) GetGlobalOptions(exp *regexp.Regexp, w http.ResponseWriter,
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteAppendedJSON(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteAppendedJSON(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteAppendedJSON(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response501 != nil {
-		api.WriteJSON(w, 501, response.Response501)
+		api.WriteAppendedJSON(w, r, 501, response.Response501)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteAppendedJSON(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteAppendedJSON(w, r, 500, &api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
 func setAuthError(ctx context.Context, authErr error, resp401 **ErrorResponse, resp403 **ErrorResponse, resp500 **api.InternalServerErrorBody) {
@@ -360,29 +359,15 @@ func setAuthError(ctx context.Context, authErr error, resp401 **ErrorResponse, r
 func MakeAPIRouter(impl Implementation, auth api.Authorizer) APIRouter {
 	router := APIRouter{Implementation: impl, Authorizer: auth, Routes: make([]*api.Route, 8)}
 
-	pattern := regexp.MustCompile("^/aux/v1/version$")
-	router.Routes[0] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetVersion, Name: "auxv1.GetVersion", Path: "/aux/v1/version"}
-
-	pattern = regexp.MustCompile("^/aux/v1/validate_oauth$")
-	router.Routes[1] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.ValidateOauth, Name: "auxv1.ValidateOauth", Path: "/aux/v1/validate_oauth"}
-
-	pattern = regexp.MustCompile("^/aux/v1/pool$")
-	router.Routes[2] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetPool, Name: "auxv1.GetPool", Path: "/aux/v1/pool"}
-
-	pattern = regexp.MustCompile("^/aux/v1/pool/dss_instances$")
-	router.Routes[3] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetDSSInstances, Name: "auxv1.GetDSSInstances", Path: "/aux/v1/pool/dss_instances"}
-
-	pattern = regexp.MustCompile("^/aux/v1/pool/dss_instances/heartbeat$")
-	router.Routes[4] = &api.Route{Method: http.MethodPut, Pattern: pattern, Handler: router.PutDSSInstancesHeartbeat, Name: "auxv1.PutDSSInstancesHeartbeat", Path: "/aux/v1/pool/dss_instances/heartbeat"}
-
-	pattern = regexp.MustCompile("^/aux/v1/configuration/accepted_ca_certs$")
-	router.Routes[5] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetAcceptedCAs, Name: "auxv1.GetAcceptedCAs", Path: "/aux/v1/configuration/accepted_ca_certs"}
-
-	pattern = regexp.MustCompile("^/aux/v1/configuration/ca_certs$")
-	router.Routes[6] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetInstanceCAs, Name: "auxv1.GetInstanceCAs", Path: "/aux/v1/configuration/ca_certs"}
-
-	pattern = regexp.MustCompile("^/aux/v1/configuration/global_options$")
-	router.Routes[7] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetGlobalOptions, Name: "auxv1.GetGlobalOptions", Path: "/aux/v1/configuration/global_options"}
+	router.Routes[0] = &api.Route{Method: http.MethodGet, Handler: router.GetVersion, Name: "auxv1.GetVersion", Path: "/aux/v1/version"}
+	router.Routes[1] = &api.Route{Method: http.MethodGet, Handler: router.ValidateOauth, Name: "auxv1.ValidateOauth", Path: "/aux/v1/validate_oauth"}
+	router.Routes[2] = &api.Route{Method: http.MethodGet, Handler: router.GetPool, Name: "auxv1.GetPool", Path: "/aux/v1/pool"}
+	router.Routes[3] = &api.Route{Method: http.MethodGet, Handler: router.GetDSSInstances, Name: "auxv1.GetDSSInstances", Path: "/aux/v1/pool/dss_instances"}
+	router.Routes[4] = &api.Route{Method: http.MethodPut, Handler: router.PutDSSInstancesHeartbeat, Name: "auxv1.PutDSSInstancesHeartbeat", Path: "/aux/v1/pool/dss_instances/heartbeat"}
+	router.Routes[5] = &api.Route{Method: http.MethodGet, Handler: router.GetAcceptedCAs, Name: "auxv1.GetAcceptedCAs", Path: "/aux/v1/configuration/accepted_ca_certs"}
+	router.Routes[6] = &api.Route{Method: http.MethodGet, Handler: router.GetInstanceCAs, Name: "auxv1.GetInstanceCAs", Path: "/aux/v1/configuration/ca_certs"}
+	router.Routes[7] = &api.Route{Method: http.MethodGet, Handler: router.GetGlobalOptions, Name: "auxv1.GetGlobalOptions", Path: "/aux/v1/configuration/global_options"}
 
+	router.Trie = api.NewRouteTrie(router.Routes)
 	return router
 }
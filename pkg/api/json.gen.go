@@ -0,0 +1,640 @@
+// This file is auto-generated; do not change as any changes will be overwritten
+package api
+
+import (
+	"errors"
+	"fmt"
+	"io"
+	"math"
+	"net/http"
+	"strconv"
+	"unicode"
+	"unicode/utf16"
+	"unicode/utf8"
+)
+
+// --- Generated JSON codec support ---
+
+// JSONDecodable is implemented by data types with a generated JSON decoder.
+type JSONDecodable interface {
+	DecodeJSON(r *JSONReader) error
+}
+
+// JSONAppender is implemented by data types with a generated JSON encoder.
+type JSONAppender interface {
+	AppendJSON(b []byte) []byte
+}
+
+// DecodeJSONBody reads the entire body into a pooled buffer and decodes the JSON value it contains into v.
+// Like json.Decoder.Decode, io.EOF is returned for an empty body and any content after the first JSON value is ignored.
+func DecodeJSONBody(body io.Reader, v JSONDecodable) error {
+	p := getJSONBuffer()
+	b := *p
+	var err error
+	for {
+		if len(b) == cap(b) {
+			b = append(b, 0)[:len(b)]
+		}
+		var n int
+		n, err = body.Read(b[len(b):cap(b)])
+		b = b[:len(b)+n]
+		if err != nil {
+			break
+		}
+	}
+	defer putJSONBuffer(p, b)
+	if err != io.EOF {
+		return err
+	}
+
+	r := JSONReader{data: b}
+	r.skipWhitespace()
+	if r.pos == len(r.data) {
+		return io.EOF
+	}
+	return v.DecodeJSON(&r)
+}
+
+// WriteAppendedJSON encodes obj into a pooled buffer using its generated JSON encoder and writes it to w in the same way as WriteJSONResponse.
+func WriteAppendedJSON(w http.ResponseWriter, r *http.Request, code int, obj JSONAppender) {
+	p := getJSONBuffer()
+	b := append(obj.AppendJSON((*p)[:0]), '\n')
+	defer putJSONBuffer(p, b)
+	writeJSONBody(w, r, code, b)
+}
+
+func (v *EmptyResponseBody) AppendJSON(b []byte) []byte {
+	return append(b, '{', '}')
+}
+
+func (v *InternalServerErrorBody) AppendJSON(b []byte) []byte {
+	b = append(b, `{"error_message":`...)
+	b = AppendJSONString(b, v.ErrorMessage)
+	return append(b, '}')
+}
+
+// --- JSON decoding ---
+
+// JSONReader decodes JSON values from an in-memory document on behalf of generated decoders.
+// Its behavior follows encoding/json: null leaves the destination unchanged (or sets slices and pointers to nil), unknown object keys are skipped, and keys are matched case-insensitively when there is no exact match.
+type JSONReader struct {
+	data    []byte
+	pos     int
+	scratch []byte
+}
+
+type JSONSyntaxError struct {
+	Offset int
+	msg    string
+}
+
+func (e *JSONSyntaxError) Error() string {
+	return fmt.Sprintf("invalid JSON at offset %d: %s", e.Offset, e.msg)
+}
+
+var errUnexpectedEnd = errors.New("unexpected end of JSON input")
+
+func NewJSONReader(data []byte) *JSONReader {
+	return &JSONReader{data: data}
+}
+
+func (r *JSONReader) syntaxError(msg string) error {
+	if r.pos >= len(r.data) {
+		return errUnexpectedEnd
+	}
+	return &JSONSyntaxError{Offset: r.pos, msg: msg}
+}
+
+// mismatch skips the next value, which cannot be decoded into the expected type, and returns the corresponding error.
+func (r *JSONReader) mismatch(expected string) error {
+	err := fmt.Errorf("cannot unmarshal JSON %s at offset %d into Go value of type %s", r.kind(), r.pos, expected)
+	if skipErr := r.Skip(); skipErr != nil {
+		return skipErr
+	}
+	return err
+}
+
+func (r *JSONReader) kind() string {
+	switch r.peek() {
+	case '{':
+		return "object"
+	case '[':
+		return "array"
+	case '"':
+		return "string"
+	case 't', 'f':
+		return "bool"
+	case 'n':
+		return "null"
+	default:
+		return "number"
+	}
+}
+
+func (r *JSONReader) skipWhitespace() {
+	for r.pos < len(r.data) {
+		switch r.data[r.pos] {
+		case ' ', '\t', '\n', '\r':
+			r.pos++
+		default:
+			return
+		}
+	}
+}
+
+// peek returns the next non-whitespace byte without consuming it, or 0 at the end of the document.
+func (r *JSONReader) peek() byte {
+	r.skipWhitespace()
+	if r.pos < len(r.data) {
+		return r.data[r.pos]
+	}
+	return 0
+}
+
+func (r *JSONReader) readLiteral(literal string) error {
+	if len(r.data)-r.pos < len(literal) || string(r.data[r.pos:r.pos+len(literal)]) != literal {
+		return r.syntaxError("invalid literal")
+	}
+	r.pos += len(literal)
+	return nil
+}
+
+// ReadNull consumes the next value and returns true if it is null; otherwise, nothing is consumed.
+func (r *JSONReader) ReadNull() bool {
+	if r.peek() == 'n' && r.readLiteral("null") == nil {
+		return true
+	}
+	return false
+}
+
+// ReadObject calls field for each key of the next object value, with the reader positioned at the corresponding value.
+// field must consume that value.  key is only valid for the duration of the call.
+func (r *JSONReader) ReadObject(field func(key []byte) error) error {
+	if r.ReadNull() {
+		return nil
+	}
+	if r.peek() != '{' {
+		return r.mismatch("object")
+	}
+	r.pos++
+	if r.peek() == '}' {
+		r.pos++
+		return nil
+	}
+	for {
+		if r.peek() != '"' {
+			return r.syntaxError("expected object key")
+		}
+		key, err := r.readStringBytes()
+		if err != nil {
+			return err
+		}
+		if r.peek() != ':' {
+			return r.syntaxError("expected ':' after object key")
+		}
+		r.pos++
+		r.skipWhitespace()
+		if err := field(key); err != nil {
+			return err
+		}
+		switch r.peek() {
+		case ',':
+			r.pos++
+		case '}':
+			r.pos++
+			return nil
+		default:
+			return r.syntaxError("expected ',' or '}' after object value")
+		}
+	}
+}
+
+// ReadArray calls item for each element of the next array value, with the reader positioned at that element.
+// item must consume the element.  ReadArray does nothing for null; callers handle null before calling ReadArray.
+func (r *JSONReader) ReadArray(item func() error) error {
+	if r.ReadNull() {
+		return nil
+	}
+	if r.peek() != '[' {
+		return r.mismatch("array")
+	}
+	r.pos++
+	if r.peek() == ']' {
+		r.pos++
+		return nil
+	}
+	for {
+		r.skipWhitespace()
+		if err := item(); err != nil {
+			return err
+		}
+		switch r.peek() {
+		case ',':
+			r.pos++
+		case ']':
+			r.pos++
+			return nil
+		default:
+			return r.syntaxError("expected ',' or ']' after array element")
+		}
+	}
+}
+
+func (r *JSONReader) ReadString(p *string) error {
+	if r.ReadNull() {
+		return nil
+	}
+	if r.peek() != '"' {
+		return r.mismatch("string")
+	}
+	s, err := r.readStringBytes()
+	if err != nil {
+		return err
+	}
+	*p = string(s)
+	return nil
+}
+
+func (r *JSONReader) ReadBool(p *bool) error {
+	if r.ReadNull() {
+		return nil
+	}
+	switch r.peek() {
+	case 't':
+		if err := r.readLiteral("true"); err != nil {
+			return err
+		}
+		*p = true
+		return nil
+	case 'f':
+		if err := r.readLiteral("false"); err != nil {
+			return err
+		}
+		*p = false
+		return nil
+	}
+	return r.mismatch("bool")
+}
+
+func (r *JSONReader) ReadFloat64(p *float64) error {
+	return r.readFloat(64, func(f float64) { *p = f })
+}
+
+func (r *JSONReader) ReadFloat32(p *float32) error {
+	return r.readFloat(32, func(f float64) { *p = float32(f) })
+}
+
+func (r *JSONReader) ReadInt64(p *int64) error {
+	return r.readInt(64, func(i int64) { *p = i })
+}
+
+func (r *JSONReader) ReadInt32(p *int32) error {
+	return r.readInt(32, func(i int64) { *p = int32(i) })
+}
+
+func (r *JSONReader) readFloat(bitSize int, set func(float64)) error {
+	if r.ReadNull() {
+		return nil
+	}
+	start := r.pos
+	number, err := r.readNumber()
+	if err != nil {
+		return err
+	}
+	f, err := strconv.ParseFloat(string(number), bitSize)
+	if err != nil {
+		return fmt.Errorf("cannot unmarshal JSON number %s at offset %d into Go value of type float%d", number, start, bitSize)
+	}
+	set(f)
+	return nil
+}
+
+func (r *JSONReader) readInt(bitSize int, set func(int64)) error {
+	if r.ReadNull() {
+		return nil
+	}
+	start := r.pos
+	number, err := r.readNumber()
+	if err != nil {
+		return err
+	}
+	i, err := strconv.ParseInt(string(number), 10, bitSize)
+	if err != nil {
+		return fmt.Errorf("cannot unmarshal JSON number %s at offset %d into Go value of type int%d", number, start, bitSize)
+	}
+	set(i)
+	return nil
+}
+
+// readNumber consumes the next value, which must be a number, and returns its text.
+func (r *JSONReader) readNumber() ([]byte, error) {
+	c := r.peek()
+	if c != '-' && (c < '0' || c > '9') {
+		return nil, r.mismatch("number")
+	}
+	start := r.pos
+	if c == '-' {
+		r.pos++
+	}
+	if r.pos < len(r.data) && r.data[r.pos] == '0' {
+		r.pos++
+	} else if !r.skipDigits() {
+		return nil, r.syntaxError("invalid number")
+	}
+	if r.pos < len(r.data) && r.data[r.pos] == '.' {
+		r.pos++
+		if !r.skipDigits() {
+			return nil, r.syntaxError("invalid number")
+		}
+	}
+	if r.pos < len(r.data) && (r.data[r.pos] == 'e' || r.data[r.pos] == 'E') {
+		r.pos++
+		if r.pos < len(r.data) && (r.data[r.pos] == '+' || r.data[r.pos] == '-') {
+			r.pos++
+		}
+		if !r.skipDigits() {
+			return nil, r.syntaxError("invalid number")
+		}
+	}
+	return r.data[start:r.pos], nil
+}
+
+func (r *JSONReader) skipDigits() bool {
+	start := r.pos
+	for r.pos < len(r.data) && r.data[r.pos] >= '0' && r.data[r.pos] <= '9' {
+		r.pos++
+	}
+	return r.pos > start
+}
+
+// readStringBytes consumes the string value at the current position and returns its unescaped content.
+// The returned slice aliases either the document or the reader's scratch space, so it is only valid until the next read.
+func (r *JSONReader) readStringBytes() ([]byte, error) {
+	r.pos++ // opening quote
+	start := r.pos
+	for r.pos < len(r.data) {
+		c := r.data[r.pos]
+		switch {
+		case c == '"':
+			r.pos++
+			return r.data[start : r.pos-1], nil
+		case c == '\\' || c >= utf8.RuneSelf:
+			return r.readEscapedString(start)
+		case c < 0x20:
+			return nil, r.syntaxError("invalid character in string literal")
+		default:
+			r.pos++
+		}
+	}
+	return nil, errUnexpectedEnd
+}
+
+func (r *JSONReader) readEscapedString(start int) ([]byte, error) {
+	b := append(r.scratch[:0], r.data[start:r.pos]...)
+	for r.pos < len(r.data) {
+		c := r.data[r.pos]
+		switch {
+		case c == '"':
+			r.pos++
+			r.scratch = b
+			return b, nil
+		case c == '\\':
+			r.pos++
+			if r.pos >= len(r.data) {
+				return nil, errUnexpectedEnd
+			}
+			e := r.data[r.pos]
+			r.pos++
+			switch e {
+			case '"', '\\', '/':
+				b = append(b, e)
+			case 'b':
+				b = append(b, '\b')
+			case 'f':
+				b = append(b, '\f')
+			case 'n':
+				b = append(b, '\n')
+			case 'r':
+				b = append(b, '\r')
+			case 't':
+				b = append(b, '\t')
+			case 'u':
+				rr, ok := r.readHex4()
+				if !ok {
+					return nil, r.syntaxError("invalid \\u escape in string literal")
+				}
+				if utf16.IsSurrogate(rr) {
+					rr2 := unicode.ReplacementChar
+					if r.pos+1 < len(r.data) && r.data[r.pos] == '\\' && r.data[r.pos+1] == 'u' {
+						save := r.pos
+						r.pos += 2
+						if next, ok := r.readHex4(); ok {
+							if dec := utf16.DecodeRune(rr, next); dec != unicode.ReplacementChar {
+								rr2 = dec
+							} else {
+								r.pos = save
+							}
+						} else {
+							r.pos = save
+						}
+					}
+					rr = rr2
+				}
+				b = utf8.AppendRune(b, rr)
+			default:
+				r.pos--
+				return nil, r.syntaxError("invalid escape in string literal")
+			}
+		case c < 0x20:
+			return nil, r.syntaxError("invalid character in string literal")
+		case c < utf8.RuneSelf:
+			b = append(b, c)
+			r.pos++
+		default:
+			rr, size := utf8.DecodeRune(r.data[r.pos:])
+			r.pos += size
+			if rr == utf8.RuneError && size == 1 {
+				b = utf8.AppendRune(b, unicode.ReplacementChar)
+			} else {
+				b = append(b, r.data[r.pos-size:r.pos]...)
+			}
+		}
+	}
+	return nil, errUnexpectedEnd
+}
+
+func (r *JSONReader) readHex4() (rune, bool) {
+	if len(r.data)-r.pos < 4 {
+		return 0, false
+	}
+	var v rune
+	for _, c := range r.data[r.pos : r.pos+4] {
+		switch {
+		case c >= '0' && c <= '9':
+			c -= '0'
+		case c >= 'a' && c <= 'f':
+			c = c - 'a' + 10
+		case c >= 'A' && c <= 'F':
+			c = c - 'A' + 10
+		default:
+			return 0, false
+		}
+		v = v<<4 | rune(c)
+	}
+	r.pos += 4
+	return v, true
+}
+
+// Skip consumes the next value, whatever its type, validating its syntax.
+func (r *JSONReader) Skip() error {
+	switch c := r.peek(); {
+	case c == '{':
+		return r.ReadObject(func([]byte) error { return r.Skip() })
+	case c == '[':
+		return r.ReadArray(r.Skip)
+	case c == '"':
+		_, err := r.readStringBytes()
+		return err
+	case c == 't':
+		return r.readLiteral("true")
+	case c == 'f':
+		return r.readLiteral("false")
+	case c == 'n':
+		return r.readLiteral("null")
+	case c == '-' || (c >= '0' && c <= '9'):
+		_, err := r.readNumber()
+		return err
+	default:
+		return r.syntaxError("invalid character looking for beginning of value")
+	}
+}
+
+// MatchJSONField returns the entry of fields matching key exactly or, failing that, case-insensitively, as encoding/json does.
+// An empty string is returned if no field matches.
+func MatchJSONField(key []byte, fields []string) string {
+	for _, f := range fields {
+		if string(key) == f {
+			return f
+		}
+	}
+	for _, f := range fields {
+		if len(f) == len(key) && bytesEqualFold(key, f) {
+			return f
+		}
+	}
+	return ""
+}
+
+func bytesEqualFold(b []byte, s string) bool {
+	for i := 0; i < len(s); i++ {
+		x, y := b[i], s[i]
+		if 'A' <= x && x <= 'Z' {
+			x += 'a' - 'A'
+		}
+		if 'A' <= y && y <= 'Z' {
+			y += 'a' - 'A'
+		}
+		if x != y {
+			return false
+		}
+	}
+	return true
+}
+
+// --- JSON encoding ---
+
+const hexDigits = "0123456789abcdef"
+
+// AppendJSONString appends s as a JSON string, escaped the same way as encoding/json (including HTML characters).
+func AppendJSONString(b []byte, s string) []byte {
+	b = append(b, '"')
+	start := 0
+	for i := 0; i < len(s); {
+		c := s[i]
+		if c < utf8.RuneSelf {
+			if c >= 0x20 && c != '"' && c != '\\' && c != '<' && c != '>' && c != '&' {
+				i++
+				continue
+			}
+			b = append(b, s[start:i]...)
+			switch c {
+			case '"', '\\':
+				b = append(b, '\\', c)
+			case '\b':
+				b = append(b, '\\', 'b')
+			case '\f':
+				b = append(b, '\\', 'f')
+			case '\n':
+				b = append(b, '\\', 'n')
+			case '\r':
+				b = append(b, '\\', 'r')
+			case '\t':
+				b = append(b, '\\', 't')
+			default:
+				b = append(b, '\\', 'u', '0', '0', hexDigits[c>>4], hexDigits[c&0xF])
+			}
+			i++
+			start = i
+			continue
+		}
+		rr, size := utf8.DecodeRuneInString(s[i:])
+		if rr == utf8.RuneError && size == 1 {
+			b = append(b, s[start:i]...)
+			b = append(b, `\ufffd`...)
+			i += size
+			start = i
+			continue
+		}
+		if rr == '\u2028' || rr == '\u2029' {
+			b = append(b, s[start:i]...)
+			b = append(b, '\\', 'u', '2', '0', '2', hexDigits[rr&0xF])
+			i += size
+			start = i
+			continue
+		}
+		i += size
+	}
+	b = append(b, s[start:]...)
+	return append(b, '"')
+}
+
+// AppendJSONFloat appends f formatted the same way as encoding/json.  NaN and infinities, which encoding/json refuses to encode, are written as null.
+func AppendJSONFloat(b []byte, f float64, bitSize int) []byte {
+	if math.IsInf(f, 0) || math.IsNaN(f) {
+		return append(b, "null"...)
+	}
+	format := byte('f')
+	if abs := math.Abs(f); abs != 0 {
+		if bitSize == 64 && (abs < 1e-6 || abs >= 1e21) || bitSize == 32 && (float32(abs) < 1e-6 || float32(abs) >= 1e21) {
+			format = 'e'
+		}
+	}
+	b = strconv.AppendFloat(b, f, format, -1, bitSize)
+	if format == 'e' {
+		// Clean up e-09 to e-9
+		n := len(b)
+		if n >= 4 && b[n-4] == 'e' && b[n-3] == '-' && b[n-2] == '0' {
+			b[n-2] = b[n-1]
+			b = b[:n-1]
+		}
+	}
+	return b
+}
+
+func AppendJSONBool(b []byte, v bool) []byte {
+	return strconv.AppendBool(b, v)
+}
+
+func AppendJSONInt(b []byte, i int64) []byte {
+	return strconv.AppendInt(b, i, 10)
+}
+
+// EndJSONObject terminates an object whose members were each appended with a leading comma, starting at index start of b.
+func EndJSONObject(b []byte, start int) []byte {
+	if len(b) == start {
+		b = append(b, '{')
+	} else {
+		b[start] = '{'
+	}
+	return append(b, '}')
+}
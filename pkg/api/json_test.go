@@ -0,0 +1,226 @@
+package api_test
+
+import (
+	"bytes"
+	"encoding/json"
+	"fmt"
+	"io"
+	"strings"
+	"testing"
+
+	"github.com/interuss/dss/pkg/api"
+	"github.com/interuss/dss/pkg/api/scdv1"
+
+	"github.com/stretchr/testify/require"
+)
+
+const putOperationalIntentReferenceBody = `{
+  "extents": [
+    {
+      "volume": {
+        "outline_polygon": {
+          "vertices": [
+            {"lng": 7.4774, "lat": 46.9749},
+            {"lng": 7.4780, "lat": 46.9751},
+            {"lng": 7.4786, "lat": 46.9745},
+            {"lng": 7.4775, "lat": 46.9740}
+          ]
+        },
+        "altitude_lower": {"value": 0, "reference": "W84", "units": "M"},
+        "altitude_upper": {"value": 120.5, "reference": "W84", "units": "M"}
+      },
+      "time_start": {"value": "2026-10-18T10:00:00Z", "format": "RFC3339"},
+      "time_end": {"value": "2026-10-18T10:30:00Z", "format": "RFC3339"}
+    },
+    {
+      "volume": {
+        "outline_circle": {
+          "center": {"lng": -122.106, "lat": 37.4},
+          "radius": {"value": 300.25, "units": "M"}
+        },
+        "altitude_lower": {"value": 1e-7, "reference": "W84", "units": "M"},
+        "altitude_upper": {"value": 3.5E+2, "reference": "W84", "units": "M"}
+      },
+      "time_start": {"value": "2026-10-18T10:30:00Z", "format": "RFC3339"},
+      "time_end": null
+    }
+  ],
+  "key": ["ovn-1", "ovn-é😀", "ovn-<&>\n"],
+  "state": "Accepted",
+  "uss_base_url": "https://uss.example.com/utm",
+  "new_subscription": {"uss_base_url": "https://uss.example.com/utm", "notify_for_constraints": true},
+  "unknown_field": {"nested": [1, 2.5, "three", true, false, null, {"a": []}]},
+  "SUBSCRIPTION_ID": "a69fa1b2-6f63-4bd8-9ac3-f6be0c3b2e2a"
+}`
+
+func decodeGenerated(t testing.TB, body string, v api.JSONDecodable) error {
+	t.Helper()
+	return api.DecodeJSONBody(strings.NewReader(body), v)
+}
+
+func TestGeneratedDecoderMatchesEncodingJSON(t *testing.T) {
+	var expected, actual scdv1.PutOperationalIntentReferenceParameters
+	require.NoError(t, json.Unmarshal([]byte(putOperationalIntentReferenceBody), &expected))
+	require.NoError(t, decodeGenerated(t, putOperationalIntentReferenceBody, &actual))
+	require.Equal(t, expected, actual)
+	require.NotNil(t, actual.SubscriptionId)
+}
+
+func TestGeneratedEncoderMatchesEncodingJSON(t *testing.T) {
+	var params scdv1.PutOperationalIntentReferenceParameters
+	require.NoError(t, json.Unmarshal([]byte(putOperationalIntentReferenceBody), &params))
+	expected, err := json.Marshal(&params)
+	require.NoError(t, err)
+	require.Equal(t, string(expected), string(params.AppendJSON(nil)))
+
+	response := searchResponse(50)
+	expected, err = json.Marshal(response)
+	require.NoError(t, err)
+	require.Equal(t, string(expected), string(response.AppendJSON(nil)))
+
+	for _, s := range []string{"", "plain", "quote\" backslash\\ slash/", "<html>&amp;", "\x00\x1f\t\r\n", "é😀  ", "invalid \xff utf8"} {
+		expected, err := json.Marshal(s)
+		require.NoError(t, err)
+		require.Equal(t, string(expected), string(api.AppendJSONString(nil, s)))
+	}
+	for _, f := range []float64{0, -0.5, 1, 123456789, 1e20, 1e21, 1e-6, 1e-7, -3.25e-9, 46.97491234567} {
+		expected, err := json.Marshal(f)
+		require.NoError(t, err)
+		require.Equal(t, string(expected), string(api.AppendJSONFloat(nil, f, 64)))
+
+		expected, err = json.Marshal(float32(f))
+		require.NoError(t, err)
+		require.Equal(t, string(expected), string(api.AppendJSONFloat(nil, float64(float32(f)), 32)))
+	}
+}
+
+func TestGeneratedDecoderEdgeCases(t *testing.T) {
+	for _, body := range []string{
+		`{}`,
+		`null`,
+		`{"extents": null, "key": null, "state": null}`,
+		`{"extents": [], "key": []}`,
+		`{"state": "A\"\\\/\b\f\n\r\tA\ud800\u00"}`,
+		`{"state": "lone surrogate \ud800 and pair 😀", "uss_base_url": "caf\xc3\xa9 \xff"}`,
+		`{"STATE": "Accepted", "State": "Activated"}`,
+		`{"extents": [{"volume": {"altitude_lower": {"value": -0}}}]} trailing content`,
+	} {
+		var expected, actual scdv1.PutOperationalIntentReferenceParameters
+		expectedErr := json.NewDecoder(strings.NewReader(body)).Decode(&expected)
+		actualErr := decodeGenerated(t, body, &actual)
+		require.Equal(t, expectedErr == nil, actualErr == nil, "%s: %v / %v", body, expectedErr, actualErr)
+		if expectedErr == nil {
+			require.Equal(t, expected, actual, body)
+		}
+	}
+
+	for _, body := range []string{
+		``,
+		`   `,
+		`{`,
+		`{"state": "Accepted",}`,
+		`{"state": "Accepted" "key": []}`,
+		`{"state": 'Accepted'}`,
+		`{"state": 3}`,
+		`{"extents": {}}`,
+		`{"extents": [{"volume": {"altitude_lower": {"value": "high"}}}]}`,
+		`{"extents": [{"volume": {"altitude_lower": {"value": 01}}}]}`,
+		`{"extents": [{"volume": {"outline_circle": {"radius": {"value": 1e40}}}}]}`,
+		`{"new_subscription": {"notify_for_constraints": "true"}}`,
+		`{"unknown": [1, 2,]}`,
+		`{"unknown": tru}`,
+		`{"state": "unterminated}`,
+		"{\"state\": \"control\x01character\"}",
+	} {
+		var expected, actual scdv1.PutOperationalIntentReferenceParameters
+		expectedErr := json.NewDecoder(strings.NewReader(body)).Decode(&expected)
+		actualErr := decodeGenerated(t, body, &actual)
+		require.Error(t, expectedErr, body)
+		require.Error(t, actualErr, body)
+		if expectedErr == io.EOF {
+			require.Equal(t, io.EOF, actualErr, body)
+		}
+	}
+}
+
+func TestGeneratedIntegerDecoding(t *testing.T) {
+	for _, body := range []string{
+		`{"notification_index": 3}`,
+		`{"notification_index": -2147483648}`,
+		`{"notification_index": 2147483648}`,
+		`{"notification_index": 1.5}`,
+		`{"notification_index": 1e2}`,
+		`{"notification_index": -}`,
+	} {
+		var expected, actual scdv1.SubscriptionState
+		expectedErr := json.Unmarshal([]byte(body), &expected)
+		actualErr := decodeGenerated(t, body, &actual)
+		require.Equal(t, expectedErr == nil, actualErr == nil, "%s: %v / %v", body, expectedErr, actualErr)
+		if expectedErr == nil {
+			require.Equal(t, expected, actual, body)
+		}
+	}
+}
+
+func searchResponse(n int) *scdv1.QueryOperationalIntentReferenceResponse {
+	response := &scdv1.QueryOperationalIntentReferenceResponse{
+		OperationalIntentReferences: make([]scdv1.OperationalIntentReference, n),
+	}
+	for i := range response.OperationalIntentReferences {
+		ovn := scdv1.EntityOVN(fmt.Sprintf("ovn-%d", i))
+		response.OperationalIntentReferences[i] = scdv1.OperationalIntentReference{
+			Id:              scdv1.EntityID(fmt.Sprintf("00000000-0000-4000-8000-%012d", i)),
+			Manager:         "uss1",
+			UssAvailability: "Normal",
+			Version:         scdv1.EntityVersion(i),
+			State:           "Accepted",
+			Ovn:             &ovn,
+			TimeStart:       scdv1.Time{Value: "2026-10-18T10:00:00Z", Format: "RFC3339"},
+			TimeEnd:         scdv1.Time{Value: "2026-10-18T10:30:00Z", Format: "RFC3339"},
+			UssBaseUrl:      "https://uss.example.com/utm",
+			SubscriptionId:  "a69fa1b2-6f63-4bd8-9ac3-f6be0c3b2e2a",
+		}
+	}
+	return response
+}
+
+func BenchmarkDecodePutOperationalIntentReference(b *testing.B) {
+	body := []byte(putOperationalIntentReferenceBody)
+	b.Run("encoding/json", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			var params scdv1.PutOperationalIntentReferenceParameters
+			if err := json.NewDecoder(bytes.NewReader(body)).Decode(&params); err != nil {
+				b.Fatal(err)
+			}
+		}
+	})
+	b.Run("generated", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			var params scdv1.PutOperationalIntentReferenceParameters
+			if err := api.DecodeJSONBody(bytes.NewReader(body), &params); err != nil {
+				b.Fatal(err)
+			}
+		}
+	})
+}
+
+func BenchmarkEncodeQueryOperationalIntentReferenceResponse(b *testing.B) {
+	response := searchResponse(200)
+	b.Run("encoding/json", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			if err := json.NewEncoder(io.Discard).Encode(response); err != nil {
+				b.Fatal(err)
+			}
+		}
+	})
+	b.Run("generated", func(b *testing.B) {
+		b.ReportAllocs()
+		buf := make([]byte, 0, 4096)
+		for i := 0; i < b.N; i++ {
+			buf = response.AppendJSON(buf[:0])
+		}
+	})
+}
@@ -0,0 +1,118 @@
+package api_test
+
+import (
+	"bytes"
+	"compress/gzip"
+	"encoding/json"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"strconv"
+	"testing"
+
+	"github.com/interuss/dss/pkg/api"
+
+	"github.com/stretchr/testify/require"
+)
+
+func writeSearchResponse(t testing.TB, acceptEncoding string, generated bool) *httptest.ResponseRecorder {
+	t.Helper()
+	r := httptest.NewRequest(http.MethodPost, "/dss/v1/operational_intent_references/query", nil)
+	if acceptEncoding != "" {
+		r.Header.Set("Accept-Encoding", acceptEncoding)
+	}
+	w := httptest.NewRecorder()
+	if generated {
+		api.WriteAppendedJSON(w, r, http.StatusOK, searchResponse(50))
+	} else {
+		api.WriteJSONResponse(w, r, http.StatusOK, searchResponse(50))
+	}
+	return w
+}
+
+func TestWriteJSONResponse(t *testing.T) {
+	expected, err := json.Marshal(searchResponse(50))
+	require.NoError(t, err)
+	expected = append(expected, '\n')
+
+	defer func(minSize int) { api.ResponseCompressionMinSize = minSize }(api.ResponseCompressionMinSize)
+	for _, tc := range []struct {
+		minSize        int
+		acceptEncoding string
+		compressed     bool
+	}{
+		{0, "gzip", false},
+		{1024, "", false},
+		{1024, "gzip", true},
+		{1024, "br;q=1.0, GZIP;q=0.5", true},
+		{1024, "*", true},
+		{1024, "gzip;q=0", false},
+		{1024, "*, gzip;q=0", false},
+		{1024, "deflate, br", false},
+		{len(expected) + 1, "gzip", false},
+	} {
+		api.ResponseCompressionMinSize = tc.minSize
+		for _, generated := range []bool{false, true} {
+			w := writeSearchResponse(t, tc.acceptEncoding, generated)
+			require.Equal(t, http.StatusOK, w.Code)
+			require.Equal(t, "application/json; charset=utf-8", w.Header().Get("Content-Type"))
+			require.Equal(t, strconv.Itoa(w.Body.Len()), w.Header().Get("Content-Length"))
+
+			body := w.Body.Bytes()
+			if tc.compressed {
+				require.Equal(t, "gzip", w.Header().Get("Content-Encoding"), tc.acceptEncoding)
+				zr, err := gzip.NewReader(bytes.NewReader(body))
+				require.NoError(t, err)
+				body, err = io.ReadAll(zr)
+				require.NoError(t, err)
+				require.Less(t, w.Body.Len(), len(body))
+			} else {
+				require.Empty(t, w.Header().Get("Content-Encoding"), tc.acceptEncoding)
+			}
+			require.Equal(t, string(expected), string(body))
+		}
+	}
+}
+
+// BenchmarkWriteJSONResponse compares writing a 200-entry query response by encoding directly into the ResponseWriter (the previous WriteJSON) with the pooled response writers.
+func BenchmarkWriteJSONResponse(b *testing.B) {
+	response := searchResponse(200)
+	r := httptest.NewRequest(http.MethodPost, "/dss/v1/operational_intent_references/query", nil)
+	r.Header.Set("Accept-Encoding", "gzip")
+	w := httptest.NewRecorder()
+
+	b.Run("encoding/json direct", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			w.Body.Reset()
+			w.Header().Set("Content-Type", "application/json; charset=utf-8")
+			if err := json.NewEncoder(w).Encode(response); err != nil {
+				b.Fatal(err)
+			}
+		}
+	})
+	b.Run("pooled", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			w.Body.Reset()
+			api.WriteJSONResponse(w, r, http.StatusOK, response)
+		}
+	})
+	b.Run("pooled generated", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			w.Body.Reset()
+			api.WriteAppendedJSON(w, r, http.StatusOK, response)
+		}
+	})
+
+	defer func(minSize int) { api.ResponseCompressionMinSize = minSize }(api.ResponseCompressionMinSize)
+	api.ResponseCompressionMinSize = 1024
+	b.Run("pooled generated gzip", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			w.Body.Reset()
+			api.WriteAppendedJSON(w, r, http.StatusOK, response)
+		}
+	})
+}
@@ -0,0 +1,957 @@
+// This file is auto-generated; do not change as any changes will be overwritten
+package ridv1
+
+import (
+	"github.com/interuss/dss/pkg/api"
+)
+
+var jsonFieldsVolume3D = []string{"footprint", "altitude_lo", "altitude_hi"}
+
+func (v *Volume3D) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsVolume3D) {
+		case "footprint":
+			return v.Footprint.DecodeJSON(r)
+		case "altitude_lo":
+			if r.ReadNull() {
+				v.AltitudeLo = nil
+				return nil
+			}
+			if v.AltitudeLo == nil {
+				v.AltitudeLo = new(Altitude)
+			}
+			return v.AltitudeLo.DecodeJSON(r)
+		case "altitude_hi":
+			if r.ReadNull() {
+				v.AltitudeHi = nil
+				return nil
+			}
+			if v.AltitudeHi == nil {
+				v.AltitudeHi = new(Altitude)
+			}
+			return v.AltitudeHi.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Volume3D) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"footprint":`...)
+	b = v.Footprint.AppendJSON(b)
+	if v.AltitudeLo != nil {
+		b = append(b, `,"altitude_lo":`...)
+		b = (*v.AltitudeLo).AppendJSON(b)
+	}
+	if v.AltitudeHi != nil {
+		b = append(b, `,"altitude_hi":`...)
+		b = (*v.AltitudeHi).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsVolume4D = []string{"spatial_volume", "time_start", "time_end"}
+
+func (v *Volume4D) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsVolume4D) {
+		case "spatial_volume":
+			return v.SpatialVolume.DecodeJSON(r)
+		case "time_start":
+			if r.ReadNull() {
+				v.TimeStart = nil
+				return nil
+			}
+			if v.TimeStart == nil {
+				v.TimeStart = new(string)
+			}
+			return r.ReadString(v.TimeStart)
+		case "time_end":
+			if r.ReadNull() {
+				v.TimeEnd = nil
+				return nil
+			}
+			if v.TimeEnd == nil {
+				v.TimeEnd = new(string)
+			}
+			return r.ReadString(v.TimeEnd)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Volume4D) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"spatial_volume":`...)
+	b = v.SpatialVolume.AppendJSON(b)
+	if v.TimeStart != nil {
+		b = append(b, `,"time_start":`...)
+		b = api.AppendJSONString(b, (*v.TimeStart))
+	}
+	if v.TimeEnd != nil {
+		b = append(b, `,"time_end":`...)
+		b = api.AppendJSONString(b, (*v.TimeEnd))
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsGetSubscriptionResponse = []string{"subscription"}
+
+func (v *GetSubscriptionResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsGetSubscriptionResponse) {
+		case "subscription":
+			return v.Subscription.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *GetSubscriptionResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscription":`...)
+	b = v.Subscription.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsSearchSubscriptionsResponse = []string{"subscriptions"}
+
+func (v *SearchSubscriptionsResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSearchSubscriptionsResponse) {
+		case "subscriptions":
+			if r.ReadNull() {
+				v.Subscriptions = nil
+				return nil
+			}
+			v.Subscriptions = []Subscription{}
+			return r.ReadArray(func() error {
+				var item Subscription
+				v.Subscriptions = append(v.Subscriptions, item)
+				return v.Subscriptions[len(v.Subscriptions)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SearchSubscriptionsResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscriptions":`...)
+	if v.Subscriptions == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Subscriptions {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Subscriptions[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	return api.EndJSONObject(b, start)
+}
+
+func (v *URL) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *URL) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *SubscriptionNotificationIndex) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadInt32((*int32)(v))
+}
+
+func (v *SubscriptionNotificationIndex) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONInt(b, int64(int32(*v)))
+}
+
+var jsonFieldsSubscriptionState = []string{"subscription_id", "notification_index"}
+
+func (v *SubscriptionState) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSubscriptionState) {
+		case "subscription_id":
+			if r.ReadNull() {
+				v.SubscriptionId = nil
+				return nil
+			}
+			if v.SubscriptionId == nil {
+				v.SubscriptionId = new(SubscriptionUUID)
+			}
+			return v.SubscriptionId.DecodeJSON(r)
+		case "notification_index":
+			if r.ReadNull() {
+				v.NotificationIndex = nil
+				return nil
+			}
+			if v.NotificationIndex == nil {
+				v.NotificationIndex = new(SubscriptionNotificationIndex)
+			}
+			return v.NotificationIndex.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SubscriptionState) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.SubscriptionId != nil {
+		b = append(b, `,"subscription_id":`...)
+		b = (*v.SubscriptionId).AppendJSON(b)
+	}
+	if v.NotificationIndex != nil {
+		b = append(b, `,"notification_index":`...)
+		b = (*v.NotificationIndex).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+func (v *UUIDv4) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *UUIDv4) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *Version) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *Version) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *EntityUUID) DecodeJSON(r *api.JSONReader) error {
+	return (*UUIDv4)(v).DecodeJSON(r)
+}
+
+func (v *EntityUUID) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return (*UUIDv4)(v).AppendJSON(b)
+}
+
+func (v *SubscriptionUUID) DecodeJSON(r *api.JSONReader) error {
+	return (*UUIDv4)(v).DecodeJSON(r)
+}
+
+func (v *SubscriptionUUID) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return (*UUIDv4)(v).AppendJSON(b)
+}
+
+var jsonFieldsErrorResponse = []string{"message"}
+
+func (v *ErrorResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsErrorResponse) {
+		case "message":
+			if r.ReadNull() {
+				v.Message = nil
+				return nil
+			}
+			if v.Message == nil {
+				v.Message = new(string)
+			}
+			return r.ReadString(v.Message)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *ErrorResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.Message != nil {
+		b = append(b, `,"message":`...)
+		b = api.AppendJSONString(b, (*v.Message))
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsDeleteSubscriptionResponse = []string{"subscription"}
+
+func (v *DeleteSubscriptionResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsDeleteSubscriptionResponse) {
+		case "subscription":
+			return v.Subscription.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *DeleteSubscriptionResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscription":`...)
+	b = v.Subscription.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+func (v *GeoPolygonString) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *GeoPolygonString) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *Latitude) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadFloat64((*float64)(v))
+}
+
+func (v *Latitude) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONFloat(b, float64(*v), 64)
+}
+
+func (v *Longitude) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadFloat64((*float64)(v))
+}
+
+func (v *Longitude) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONFloat(b, float64(*v), 64)
+}
+
+var jsonFieldsLatLngPoint = []string{"lng", "lat"}
+
+func (v *LatLngPoint) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsLatLngPoint) {
+		case "lng":
+			return v.Lng.DecodeJSON(r)
+		case "lat":
+			return v.Lat.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *LatLngPoint) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"lng":`...)
+	b = v.Lng.AppendJSON(b)
+	b = append(b, `,"lat":`...)
+	b = v.Lat.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+func (v *Altitude) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadFloat32((*float32)(v))
+}
+
+func (v *Altitude) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONFloat(b, float64(float32(*v)), 32)
+}
+
+var jsonFieldsGeoPolygon = []string{"vertices"}
+
+func (v *GeoPolygon) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsGeoPolygon) {
+		case "vertices":
+			if r.ReadNull() {
+				v.Vertices = nil
+				return nil
+			}
+			v.Vertices = []LatLngPoint{}
+			return r.ReadArray(func() error {
+				var item LatLngPoint
+				v.Vertices = append(v.Vertices, item)
+				return v.Vertices[len(v.Vertices)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *GeoPolygon) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"vertices":`...)
+	if v.Vertices == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Vertices {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Vertices[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsPutIdentificationServiceAreaResponse = []string{"subscribers", "service_area"}
+
+func (v *PutIdentificationServiceAreaResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsPutIdentificationServiceAreaResponse) {
+		case "subscribers":
+			if r.ReadNull() {
+				v.Subscribers = nil
+				return nil
+			}
+			v.Subscribers = []SubscriberToNotify{}
+			return r.ReadArray(func() error {
+				var item SubscriberToNotify
+				v.Subscribers = append(v.Subscribers, item)
+				return v.Subscribers[len(v.Subscribers)-1].DecodeJSON(r)
+			})
+		case "service_area":
+			return v.ServiceArea.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *PutIdentificationServiceAreaResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscribers":`...)
+	if v.Subscribers == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Subscribers {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Subscribers[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	b = append(b, `,"service_area":`...)
+	b = v.ServiceArea.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsSearchIdentificationServiceAreasResponse = []string{"service_areas"}
+
+func (v *SearchIdentificationServiceAreasResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSearchIdentificationServiceAreasResponse) {
+		case "service_areas":
+			if r.ReadNull() {
+				v.ServiceAreas = nil
+				return nil
+			}
+			v.ServiceAreas = []IdentificationServiceArea{}
+			return r.ReadArray(func() error {
+				var item IdentificationServiceArea
+				v.ServiceAreas = append(v.ServiceAreas, item)
+				return v.ServiceAreas[len(v.ServiceAreas)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SearchIdentificationServiceAreasResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"service_areas":`...)
+	if v.ServiceAreas == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.ServiceAreas {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.ServiceAreas[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsSubscriberToNotify = []string{"subscriptions", "url"}
+
+func (v *SubscriberToNotify) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSubscriberToNotify) {
+		case "subscriptions":
+			if r.ReadNull() {
+				v.Subscriptions = nil
+				return nil
+			}
+			v.Subscriptions = []SubscriptionState{}
+			return r.ReadArray(func() error {
+				var item SubscriptionState
+				v.Subscriptions = append(v.Subscriptions, item)
+				return v.Subscriptions[len(v.Subscriptions)-1].DecodeJSON(r)
+			})
+		case "url":
+			return v.Url.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SubscriberToNotify) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscriptions":`...)
+	if v.Subscriptions == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Subscriptions {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Subscriptions[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	b = append(b, `,"url":`...)
+	b = v.Url.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsDeleteIdentificationServiceAreaResponse = []string{"service_area", "subscribers"}
+
+func (v *DeleteIdentificationServiceAreaResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsDeleteIdentificationServiceAreaResponse) {
+		case "service_area":
+			return v.ServiceArea.DecodeJSON(r)
+		case "subscribers":
+			if r.ReadNull() {
+				v.Subscribers = nil
+				return nil
+			}
+			v.Subscribers = []SubscriberToNotify{}
+			return r.ReadArray(func() error {
+				var item SubscriberToNotify
+				v.Subscribers = append(v.Subscribers, item)
+				return v.Subscribers[len(v.Subscribers)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *DeleteIdentificationServiceAreaResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"service_area":`...)
+	b = v.ServiceArea.AppendJSON(b)
+	b = append(b, `,"subscribers":`...)
+	if v.Subscribers == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Subscribers {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Subscribers[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	return api.EndJSONObject(b, start)
+}
+
+func (v *IdentificationServiceAreaURL) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *IdentificationServiceAreaURL) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+var jsonFieldsSubscriptionCallbacks = []string{"identification_service_area_url"}
+
+func (v *SubscriptionCallbacks) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSubscriptionCallbacks) {
+		case "identification_service_area_url":
+			if r.ReadNull() {
+				v.IdentificationServiceAreaUrl = nil
+				return nil
+			}
+			if v.IdentificationServiceAreaUrl == nil {
+				v.IdentificationServiceAreaUrl = new(IdentificationServiceAreaURL)
+			}
+			return v.IdentificationServiceAreaUrl.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SubscriptionCallbacks) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.IdentificationServiceAreaUrl != nil {
+		b = append(b, `,"identification_service_area_url":`...)
+		b = (*v.IdentificationServiceAreaUrl).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsPutSubscriptionResponse = []string{"service_areas", "subscription"}
+
+func (v *PutSubscriptionResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsPutSubscriptionResponse) {
+		case "service_areas":
+			if r.ReadNull() {
+				v.ServiceAreas = nil
+				return nil
+			}
+			if v.ServiceAreas == nil {
+				v.ServiceAreas = new([]IdentificationServiceArea)
+			}
+			*v.ServiceAreas = []IdentificationServiceArea{}
+			return r.ReadArray(func() error {
+				var item IdentificationServiceArea
+				*v.ServiceAreas = append(*v.ServiceAreas, item)
+				return (*v.ServiceAreas)[len(*v.ServiceAreas)-1].DecodeJSON(r)
+			})
+		case "subscription":
+			return v.Subscription.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *PutSubscriptionResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.ServiceAreas != nil {
+		b = append(b, `,"service_areas":`...)
+		if (*v.ServiceAreas) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.ServiceAreas {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.ServiceAreas)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	b = append(b, `,"subscription":`...)
+	b = v.Subscription.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsGetIdentificationServiceAreaResponse = []string{"service_area"}
+
+func (v *GetIdentificationServiceAreaResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsGetIdentificationServiceAreaResponse) {
+		case "service_area":
+			return v.ServiceArea.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *GetIdentificationServiceAreaResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"service_area":`...)
+	b = v.ServiceArea.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsCreateIdentificationServiceAreaParameters = []string{"extents", "flights_url"}
+
+func (v *CreateIdentificationServiceAreaParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsCreateIdentificationServiceAreaParameters) {
+		case "extents":
+			return v.Extents.DecodeJSON(r)
+		case "flights_url":
+			return v.FlightsUrl.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *CreateIdentificationServiceAreaParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"extents":`...)
+	b = v.Extents.AppendJSON(b)
+	b = append(b, `,"flights_url":`...)
+	b = v.FlightsUrl.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsUpdateIdentificationServiceAreaParameters = []string{"extents", "flights_url"}
+
+func (v *UpdateIdentificationServiceAreaParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsUpdateIdentificationServiceAreaParameters) {
+		case "extents":
+			return v.Extents.DecodeJSON(r)
+		case "flights_url":
+			return v.FlightsUrl.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *UpdateIdentificationServiceAreaParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"extents":`...)
+	b = v.Extents.AppendJSON(b)
+	b = append(b, `,"flights_url":`...)
+	b = v.FlightsUrl.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsCreateSubscriptionParameters = []string{"extents", "callbacks"}
+
+func (v *CreateSubscriptionParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsCreateSubscriptionParameters) {
+		case "extents":
+			return v.Extents.DecodeJSON(r)
+		case "callbacks":
+			return v.Callbacks.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *CreateSubscriptionParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"extents":`...)
+	b = v.Extents.AppendJSON(b)
+	b = append(b, `,"callbacks":`...)
+	b = v.Callbacks.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsUpdateSubscriptionParameters = []string{"extents", "callbacks"}
+
+func (v *UpdateSubscriptionParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsUpdateSubscriptionParameters) {
+		case "extents":
+			return v.Extents.DecodeJSON(r)
+		case "callbacks":
+			return v.Callbacks.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *UpdateSubscriptionParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"extents":`...)
+	b = v.Extents.AppendJSON(b)
+	b = append(b, `,"callbacks":`...)
+	b = v.Callbacks.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsSubscription = []string{"id", "callbacks", "owner", "notification_index", "time_end", "time_start", "version"}
+
+func (v *Subscription) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSubscription) {
+		case "id":
+			return v.Id.DecodeJSON(r)
+		case "callbacks":
+			return v.Callbacks.DecodeJSON(r)
+		case "owner":
+			return r.ReadString(&v.Owner)
+		case "notification_index":
+			return v.NotificationIndex.DecodeJSON(r)
+		case "time_end":
+			if r.ReadNull() {
+				v.TimeEnd = nil
+				return nil
+			}
+			if v.TimeEnd == nil {
+				v.TimeEnd = new(string)
+			}
+			return r.ReadString(v.TimeEnd)
+		case "time_start":
+			if r.ReadNull() {
+				v.TimeStart = nil
+				return nil
+			}
+			if v.TimeStart == nil {
+				v.TimeStart = new(string)
+			}
+			return r.ReadString(v.TimeStart)
+		case "version":
+			return v.Version.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Subscription) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"id":`...)
+	b = v.Id.AppendJSON(b)
+	b = append(b, `,"callbacks":`...)
+	b = v.Callbacks.AppendJSON(b)
+	b = append(b, `,"owner":`...)
+	b = api.AppendJSONString(b, v.Owner)
+	b = append(b, `,"notification_index":`...)
+	b = v.NotificationIndex.AppendJSON(b)
+	if v.TimeEnd != nil {
+		b = append(b, `,"time_end":`...)
+		b = api.AppendJSONString(b, (*v.TimeEnd))
+	}
+	if v.TimeStart != nil {
+		b = append(b, `,"time_start":`...)
+		b = api.AppendJSONString(b, (*v.TimeStart))
+	}
+	b = append(b, `,"version":`...)
+	b = v.Version.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsIdentificationServiceArea = []string{"flights_url", "owner", "time_start", "time_end", "version", "id"}
+
+func (v *IdentificationServiceArea) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsIdentificationServiceArea) {
+		case "flights_url":
+			return v.FlightsUrl.DecodeJSON(r)
+		case "owner":
+			return r.ReadString(&v.Owner)
+		case "time_start":
+			return r.ReadString(&v.TimeStart)
+		case "time_end":
+			return r.ReadString(&v.TimeEnd)
+		case "version":
+			return v.Version.DecodeJSON(r)
+		case "id":
+			return v.Id.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *IdentificationServiceArea) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"flights_url":`...)
+	b = v.FlightsUrl.AppendJSON(b)
+	b = append(b, `,"owner":`...)
+	b = api.AppendJSONString(b, v.Owner)
+	b = append(b, `,"time_start":`...)
+	b = api.AppendJSONString(b, v.TimeStart)
+	b = append(b, `,"time_end":`...)
+	b = api.AppendJSONString(b, v.TimeEnd)
+	b = append(b, `,"version":`...)
+	b = v.Version.AppendJSON(b)
+	b = append(b, `,"id":`...)
+	b = v.Id.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+func (v *RIDFlightsURL) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *RIDFlightsURL) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
@@ -7,38 +7,60 @@ import (
 )
 
 var (
-	DssReadIdentificationServiceAreasScope   = api.RequiredScope("dss.read.identification_service_areas")
-	DssWriteIdentificationServiceAreasScope  = api.RequiredScope("dss.write.identification_service_areas")
+	DssReadIdentificationServiceAreasScope  = api.RequiredScope("dss.read.identification_service_areas")
+	DssWriteIdentificationServiceAreasScope = api.RequiredScope("dss.write.identification_service_areas")
+	scopeMasks                              = api.RegisterScopes(
+		DssReadIdentificationServiceAreasScope,
+		DssWriteIdentificationServiceAreasScope,
+	)
 	SearchIdentificationServiceAreasSecurity = []api.AuthorizationOption{
 		{
 			"AuthFromAuthorizationAuthority": {DssReadIdentificationServiceAreasScope},
 		},
 	}
+	SearchIdentificationServiceAreasSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 	GetIdentificationServiceAreaSecurity = []api.AuthorizationOption{
 		{
 			"AuthFromAuthorizationAuthority": {DssReadIdentificationServiceAreasScope},
 		},
 	}
+	GetIdentificationServiceAreaSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 	CreateIdentificationServiceAreaSecurity = []api.AuthorizationOption{
 		{
 			"AuthFromAuthorizationAuthority": {DssWriteIdentificationServiceAreasScope},
 		},
 	}
+	CreateIdentificationServiceAreaSecurityMasks = []api.ScopeMask{
+		scopeMasks[1],
+	}
 	UpdateIdentificationServiceAreaSecurity = []api.AuthorizationOption{
 		{
 			"AuthFromAuthorizationAuthority": {DssWriteIdentificationServiceAreasScope},
 		},
 	}
+	UpdateIdentificationServiceAreaSecurityMasks = []api.ScopeMask{
+		scopeMasks[1],
+	}
 	DeleteIdentificationServiceAreaSecurity = []api.AuthorizationOption{
 		{
 			"AuthFromAuthorizationAuthority": {DssWriteIdentificationServiceAreasScope},
 		},
 	}
+	DeleteIdentificationServiceAreaSecurityMasks = []api.ScopeMask{
+		scopeMasks[1],
+	}
 	SearchSubscriptionsSecurity = []api.AuthorizationOption{
 		{
 			"AuthFromAuthorizationAuthority": {DssReadIdentificationServiceAreasScope},
 		},
 	}
+	SearchSubscriptionsSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 	GetSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"AuthFromAuthorizationAuthority": {DssReadIdentificationServiceAreasScope},
@@ -47,21 +69,34 @@ var (
 			"AuthFromAuthorizationAuthority": {DssWriteIdentificationServiceAreasScope},
 		},
 	}
+	GetSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+		scopeMasks[1],
+	}
 	CreateSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"AuthFromAuthorizationAuthority": {DssReadIdentificationServiceAreasScope},
 		},
 	}
+	CreateSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 	UpdateSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"AuthFromAuthorizationAuthority": {DssReadIdentificationServiceAreasScope},
 		},
 	}
+	UpdateSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 	DeleteSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"AuthFromAuthorizationAuthority": {DssReadIdentificationServiceAreasScope},
 		},
 	}
+	DeleteSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 )
 
 type SearchIdentificationServiceAreasRequest struct {
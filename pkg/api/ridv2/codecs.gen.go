@@ -0,0 +1,1094 @@
+// This file is auto-generated; do not change as any changes will be overwritten
+package ridv2
+
+import (
+	"github.com/interuss/dss/pkg/api"
+)
+
+var jsonFieldsTime = []string{"value", "format"}
+
+func (v *Time) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsTime) {
+		case "value":
+			return r.ReadString(&v.Value)
+		case "format":
+			return r.ReadString(&v.Format)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Time) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"value":`...)
+	b = api.AppendJSONString(b, v.Value)
+	b = append(b, `,"format":`...)
+	b = api.AppendJSONString(b, v.Format)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsRadius = []string{"value", "units"}
+
+func (v *Radius) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsRadius) {
+		case "value":
+			return r.ReadFloat32(&v.Value)
+		case "units":
+			return r.ReadString(&v.Units)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Radius) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"value":`...)
+	b = api.AppendJSONFloat(b, float64(v.Value), 32)
+	b = append(b, `,"units":`...)
+	b = api.AppendJSONString(b, v.Units)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsCircle = []string{"center", "radius"}
+
+func (v *Circle) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsCircle) {
+		case "center":
+			if r.ReadNull() {
+				v.Center = nil
+				return nil
+			}
+			if v.Center == nil {
+				v.Center = new(LatLngPoint)
+			}
+			return v.Center.DecodeJSON(r)
+		case "radius":
+			if r.ReadNull() {
+				v.Radius = nil
+				return nil
+			}
+			if v.Radius == nil {
+				v.Radius = new(Radius)
+			}
+			return v.Radius.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Circle) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.Center != nil {
+		b = append(b, `,"center":`...)
+		b = (*v.Center).AppendJSON(b)
+	}
+	if v.Radius != nil {
+		b = append(b, `,"radius":`...)
+		b = (*v.Radius).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsVolume3D = []string{"outline_circle", "outline_polygon", "altitude_lower", "altitude_upper"}
+
+func (v *Volume3D) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsVolume3D) {
+		case "outline_circle":
+			if r.ReadNull() {
+				v.OutlineCircle = nil
+				return nil
+			}
+			if v.OutlineCircle == nil {
+				v.OutlineCircle = new(Circle)
+			}
+			return v.OutlineCircle.DecodeJSON(r)
+		case "outline_polygon":
+			if r.ReadNull() {
+				v.OutlinePolygon = nil
+				return nil
+			}
+			if v.OutlinePolygon == nil {
+				v.OutlinePolygon = new(Polygon)
+			}
+			return v.OutlinePolygon.DecodeJSON(r)
+		case "altitude_lower":
+			if r.ReadNull() {
+				v.AltitudeLower = nil
+				return nil
+			}
+			if v.AltitudeLower == nil {
+				v.AltitudeLower = new(Altitude)
+			}
+			return v.AltitudeLower.DecodeJSON(r)
+		case "altitude_upper":
+			if r.ReadNull() {
+				v.AltitudeUpper = nil
+				return nil
+			}
+			if v.AltitudeUpper == nil {
+				v.AltitudeUpper = new(Altitude)
+			}
+			return v.AltitudeUpper.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Volume3D) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.OutlineCircle != nil {
+		b = append(b, `,"outline_circle":`...)
+		b = (*v.OutlineCircle).AppendJSON(b)
+	}
+	if v.OutlinePolygon != nil {
+		b = append(b, `,"outline_polygon":`...)
+		b = (*v.OutlinePolygon).AppendJSON(b)
+	}
+	if v.AltitudeLower != nil {
+		b = append(b, `,"altitude_lower":`...)
+		b = (*v.AltitudeLower).AppendJSON(b)
+	}
+	if v.AltitudeUpper != nil {
+		b = append(b, `,"altitude_upper":`...)
+		b = (*v.AltitudeUpper).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsVolume4D = []string{"volume", "time_start", "time_end"}
+
+func (v *Volume4D) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsVolume4D) {
+		case "volume":
+			return v.Volume.DecodeJSON(r)
+		case "time_start":
+			if r.ReadNull() {
+				v.TimeStart = nil
+				return nil
+			}
+			if v.TimeStart == nil {
+				v.TimeStart = new(Time)
+			}
+			return v.TimeStart.DecodeJSON(r)
+		case "time_end":
+			if r.ReadNull() {
+				v.TimeEnd = nil
+				return nil
+			}
+			if v.TimeEnd == nil {
+				v.TimeEnd = new(Time)
+			}
+			return v.TimeEnd.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Volume4D) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"volume":`...)
+	b = v.Volume.AppendJSON(b)
+	if v.TimeStart != nil {
+		b = append(b, `,"time_start":`...)
+		b = (*v.TimeStart).AppendJSON(b)
+	}
+	if v.TimeEnd != nil {
+		b = append(b, `,"time_end":`...)
+		b = (*v.TimeEnd).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsGetSubscriptionResponse = []string{"subscription"}
+
+func (v *GetSubscriptionResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsGetSubscriptionResponse) {
+		case "subscription":
+			return v.Subscription.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *GetSubscriptionResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscription":`...)
+	b = v.Subscription.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsSearchSubscriptionsResponse = []string{"subscriptions"}
+
+func (v *SearchSubscriptionsResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSearchSubscriptionsResponse) {
+		case "subscriptions":
+			if r.ReadNull() {
+				v.Subscriptions = nil
+				return nil
+			}
+			if v.Subscriptions == nil {
+				v.Subscriptions = new([]Subscription)
+			}
+			*v.Subscriptions = []Subscription{}
+			return r.ReadArray(func() error {
+				var item Subscription
+				*v.Subscriptions = append(*v.Subscriptions, item)
+				return (*v.Subscriptions)[len(*v.Subscriptions)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SearchSubscriptionsResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.Subscriptions != nil {
+		b = append(b, `,"subscriptions":`...)
+		if (*v.Subscriptions) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.Subscriptions {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.Subscriptions)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	return api.EndJSONObject(b, start)
+}
+
+func (v *URL) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *URL) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *SubscriptionNotificationIndex) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadInt32((*int32)(v))
+}
+
+func (v *SubscriptionNotificationIndex) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONInt(b, int64(int32(*v)))
+}
+
+var jsonFieldsSubscriptionState = []string{"subscription_id", "notification_index"}
+
+func (v *SubscriptionState) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSubscriptionState) {
+		case "subscription_id":
+			return v.SubscriptionId.DecodeJSON(r)
+		case "notification_index":
+			if r.ReadNull() {
+				v.NotificationIndex = nil
+				return nil
+			}
+			if v.NotificationIndex == nil {
+				v.NotificationIndex = new(SubscriptionNotificationIndex)
+			}
+			return v.NotificationIndex.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SubscriptionState) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscription_id":`...)
+	b = v.SubscriptionId.AppendJSON(b)
+	if v.NotificationIndex != nil {
+		b = append(b, `,"notification_index":`...)
+		b = (*v.NotificationIndex).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+func (v *UUIDv4) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *UUIDv4) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *Version) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *Version) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *EntityUUID) DecodeJSON(r *api.JSONReader) error {
+	return (*UUIDv4)(v).DecodeJSON(r)
+}
+
+func (v *EntityUUID) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return (*UUIDv4)(v).AppendJSON(b)
+}
+
+func (v *SubscriptionUUID) DecodeJSON(r *api.JSONReader) error {
+	return (*UUIDv4)(v).DecodeJSON(r)
+}
+
+func (v *SubscriptionUUID) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return (*UUIDv4)(v).AppendJSON(b)
+}
+
+var jsonFieldsErrorResponse = []string{"message"}
+
+func (v *ErrorResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsErrorResponse) {
+		case "message":
+			if r.ReadNull() {
+				v.Message = nil
+				return nil
+			}
+			if v.Message == nil {
+				v.Message = new(string)
+			}
+			return r.ReadString(v.Message)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *ErrorResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.Message != nil {
+		b = append(b, `,"message":`...)
+		b = api.AppendJSONString(b, (*v.Message))
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsDeleteSubscriptionResponse = []string{"subscription"}
+
+func (v *DeleteSubscriptionResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsDeleteSubscriptionResponse) {
+		case "subscription":
+			return v.Subscription.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *DeleteSubscriptionResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscription":`...)
+	b = v.Subscription.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+func (v *GeoPolygonString) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *GeoPolygonString) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *Latitude) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadFloat64((*float64)(v))
+}
+
+func (v *Latitude) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONFloat(b, float64(*v), 64)
+}
+
+func (v *Longitude) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadFloat64((*float64)(v))
+}
+
+func (v *Longitude) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONFloat(b, float64(*v), 64)
+}
+
+var jsonFieldsLatLngPoint = []string{"lng", "lat"}
+
+func (v *LatLngPoint) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsLatLngPoint) {
+		case "lng":
+			return v.Lng.DecodeJSON(r)
+		case "lat":
+			return v.Lat.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *LatLngPoint) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"lng":`...)
+	b = v.Lng.AppendJSON(b)
+	b = append(b, `,"lat":`...)
+	b = v.Lat.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsAltitude = []string{"value", "reference", "units"}
+
+func (v *Altitude) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsAltitude) {
+		case "value":
+			return r.ReadFloat64(&v.Value)
+		case "reference":
+			return r.ReadString(&v.Reference)
+		case "units":
+			return r.ReadString(&v.Units)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Altitude) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"value":`...)
+	b = api.AppendJSONFloat(b, v.Value, 64)
+	b = append(b, `,"reference":`...)
+	b = api.AppendJSONString(b, v.Reference)
+	b = append(b, `,"units":`...)
+	b = api.AppendJSONString(b, v.Units)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsPolygon = []string{"vertices"}
+
+func (v *Polygon) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsPolygon) {
+		case "vertices":
+			if r.ReadNull() {
+				v.Vertices = nil
+				return nil
+			}
+			v.Vertices = []LatLngPoint{}
+			return r.ReadArray(func() error {
+				var item LatLngPoint
+				v.Vertices = append(v.Vertices, item)
+				return v.Vertices[len(v.Vertices)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Polygon) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"vertices":`...)
+	if v.Vertices == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Vertices {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Vertices[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsPutIdentificationServiceAreaResponse = []string{"subscribers", "service_area"}
+
+func (v *PutIdentificationServiceAreaResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsPutIdentificationServiceAreaResponse) {
+		case "subscribers":
+			if r.ReadNull() {
+				v.Subscribers = nil
+				return nil
+			}
+			if v.Subscribers == nil {
+				v.Subscribers = new([]SubscriberToNotify)
+			}
+			*v.Subscribers = []SubscriberToNotify{}
+			return r.ReadArray(func() error {
+				var item SubscriberToNotify
+				*v.Subscribers = append(*v.Subscribers, item)
+				return (*v.Subscribers)[len(*v.Subscribers)-1].DecodeJSON(r)
+			})
+		case "service_area":
+			return v.ServiceArea.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *PutIdentificationServiceAreaResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.Subscribers != nil {
+		b = append(b, `,"subscribers":`...)
+		if (*v.Subscribers) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.Subscribers {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.Subscribers)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	b = append(b, `,"service_area":`...)
+	b = v.ServiceArea.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsSearchIdentificationServiceAreasResponse = []string{"service_areas"}
+
+func (v *SearchIdentificationServiceAreasResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSearchIdentificationServiceAreasResponse) {
+		case "service_areas":
+			if r.ReadNull() {
+				v.ServiceAreas = nil
+				return nil
+			}
+			if v.ServiceAreas == nil {
+				v.ServiceAreas = new([]IdentificationServiceArea)
+			}
+			*v.ServiceAreas = []IdentificationServiceArea{}
+			return r.ReadArray(func() error {
+				var item IdentificationServiceArea
+				*v.ServiceAreas = append(*v.ServiceAreas, item)
+				return (*v.ServiceAreas)[len(*v.ServiceAreas)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SearchIdentificationServiceAreasResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.ServiceAreas != nil {
+		b = append(b, `,"service_areas":`...)
+		if (*v.ServiceAreas) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.ServiceAreas {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.ServiceAreas)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsSubscriberToNotify = []string{"subscriptions", "url"}
+
+func (v *SubscriberToNotify) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSubscriberToNotify) {
+		case "subscriptions":
+			if r.ReadNull() {
+				v.Subscriptions = nil
+				return nil
+			}
+			v.Subscriptions = []SubscriptionState{}
+			return r.ReadArray(func() error {
+				var item SubscriptionState
+				v.Subscriptions = append(v.Subscriptions, item)
+				return v.Subscriptions[len(v.Subscriptions)-1].DecodeJSON(r)
+			})
+		case "url":
+			return v.Url.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SubscriberToNotify) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscriptions":`...)
+	if v.Subscriptions == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Subscriptions {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Subscriptions[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	b = append(b, `,"url":`...)
+	b = v.Url.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsDeleteIdentificationServiceAreaResponse = []string{"service_area", "subscribers"}
+
+func (v *DeleteIdentificationServiceAreaResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsDeleteIdentificationServiceAreaResponse) {
+		case "service_area":
+			return v.ServiceArea.DecodeJSON(r)
+		case "subscribers":
+			if r.ReadNull() {
+				v.Subscribers = nil
+				return nil
+			}
+			if v.Subscribers == nil {
+				v.Subscribers = new([]SubscriberToNotify)
+			}
+			*v.Subscribers = []SubscriberToNotify{}
+			return r.ReadArray(func() error {
+				var item SubscriberToNotify
+				*v.Subscribers = append(*v.Subscribers, item)
+				return (*v.Subscribers)[len(*v.Subscribers)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *DeleteIdentificationServiceAreaResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"service_area":`...)
+	b = v.ServiceArea.AppendJSON(b)
+	if v.Subscribers != nil {
+		b = append(b, `,"subscribers":`...)
+		if (*v.Subscribers) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.Subscribers {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.Subscribers)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsPutSubscriptionResponse = []string{"service_areas", "subscription"}
+
+func (v *PutSubscriptionResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsPutSubscriptionResponse) {
+		case "service_areas":
+			if r.ReadNull() {
+				v.ServiceAreas = nil
+				return nil
+			}
+			if v.ServiceAreas == nil {
+				v.ServiceAreas = new([]IdentificationServiceArea)
+			}
+			*v.ServiceAreas = []IdentificationServiceArea{}
+			return r.ReadArray(func() error {
+				var item IdentificationServiceArea
+				*v.ServiceAreas = append(*v.ServiceAreas, item)
+				return (*v.ServiceAreas)[len(*v.ServiceAreas)-1].DecodeJSON(r)
+			})
+		case "subscription":
+			return v.Subscription.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *PutSubscriptionResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.ServiceAreas != nil {
+		b = append(b, `,"service_areas":`...)
+		if (*v.ServiceAreas) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.ServiceAreas {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.ServiceAreas)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	b = append(b, `,"subscription":`...)
+	b = v.Subscription.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsGetIdentificationServiceAreaResponse = []string{"service_area"}
+
+func (v *GetIdentificationServiceAreaResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsGetIdentificationServiceAreaResponse) {
+		case "service_area":
+			return v.ServiceArea.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *GetIdentificationServiceAreaResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"service_area":`...)
+	b = v.ServiceArea.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsCreateIdentificationServiceAreaParameters = []string{"extents", "uss_base_url"}
+
+func (v *CreateIdentificationServiceAreaParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsCreateIdentificationServiceAreaParameters) {
+		case "extents":
+			return v.Extents.DecodeJSON(r)
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *CreateIdentificationServiceAreaParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"extents":`...)
+	b = v.Extents.AppendJSON(b)
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsUpdateIdentificationServiceAreaParameters = []string{"extents", "uss_base_url"}
+
+func (v *UpdateIdentificationServiceAreaParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsUpdateIdentificationServiceAreaParameters) {
+		case "extents":
+			return v.Extents.DecodeJSON(r)
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *UpdateIdentificationServiceAreaParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"extents":`...)
+	b = v.Extents.AppendJSON(b)
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsCreateSubscriptionParameters = []string{"extents", "uss_base_url"}
+
+func (v *CreateSubscriptionParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsCreateSubscriptionParameters) {
+		case "extents":
+			return v.Extents.DecodeJSON(r)
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *CreateSubscriptionParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"extents":`...)
+	b = v.Extents.AppendJSON(b)
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsUpdateSubscriptionParameters = []string{"extents", "uss_base_url"}
+
+func (v *UpdateSubscriptionParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsUpdateSubscriptionParameters) {
+		case "extents":
+			return v.Extents.DecodeJSON(r)
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *UpdateSubscriptionParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"extents":`...)
+	b = v.Extents.AppendJSON(b)
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsSubscription = []string{"id", "uss_base_url", "owner", "notification_index", "time_end", "time_start", "version"}
+
+func (v *Subscription) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSubscription) {
+		case "id":
+			return v.Id.DecodeJSON(r)
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		case "owner":
+			return r.ReadString(&v.Owner)
+		case "notification_index":
+			if r.ReadNull() {
+				v.NotificationIndex = nil
+				return nil
+			}
+			if v.NotificationIndex == nil {
+				v.NotificationIndex = new(SubscriptionNotificationIndex)
+			}
+			return v.NotificationIndex.DecodeJSON(r)
+		case "time_end":
+			if r.ReadNull() {
+				v.TimeEnd = nil
+				return nil
+			}
+			if v.TimeEnd == nil {
+				v.TimeEnd = new(Time)
+			}
+			return v.TimeEnd.DecodeJSON(r)
+		case "time_start":
+			if r.ReadNull() {
+				v.TimeStart = nil
+				return nil
+			}
+			if v.TimeStart == nil {
+				v.TimeStart = new(Time)
+			}
+			return v.TimeStart.DecodeJSON(r)
+		case "version":
+			return v.Version.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Subscription) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"id":`...)
+	b = v.Id.AppendJSON(b)
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	b = append(b, `,"owner":`...)
+	b = api.AppendJSONString(b, v.Owner)
+	if v.NotificationIndex != nil {
+		b = append(b, `,"notification_index":`...)
+		b = (*v.NotificationIndex).AppendJSON(b)
+	}
+	if v.TimeEnd != nil {
+		b = append(b, `,"time_end":`...)
+		b = (*v.TimeEnd).AppendJSON(b)
+	}
+	if v.TimeStart != nil {
+		b = append(b, `,"time_start":`...)
+		b = (*v.TimeStart).AppendJSON(b)
+	}
+	b = append(b, `,"version":`...)
+	b = v.Version.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsIdentificationServiceArea = []string{"uss_base_url", "owner", "time_start", "time_end", "version", "id"}
+
+func (v *IdentificationServiceArea) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsIdentificationServiceArea) {
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		case "owner":
+			return r.ReadString(&v.Owner)
+		case "time_start":
+			return v.TimeStart.DecodeJSON(r)
+		case "time_end":
+			return v.TimeEnd.DecodeJSON(r)
+		case "version":
+			return v.Version.DecodeJSON(r)
+		case "id":
+			return v.Id.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *IdentificationServiceArea) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	b = append(b, `,"owner":`...)
+	b = api.AppendJSONString(b, v.Owner)
+	b = append(b, `,"time_start":`...)
+	b = v.TimeStart.AppendJSON(b)
+	b = append(b, `,"time_end":`...)
+	b = v.TimeEnd.AppendJSON(b)
+	b = append(b, `,"version":`...)
+	b = v.Version.AppendJSON(b)
+	b = append(b, `,"id":`...)
+	b = v.Id.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+func (v *USSBaseURL) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *USSBaseURL) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *SubscriptionUSSBaseURL) DecodeJSON(r *api.JSONReader) error {
+	return (*USSBaseURL)(v).DecodeJSON(r)
+}
+
+func (v *SubscriptionUSSBaseURL) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return (*USSBaseURL)(v).AppendJSON(b)
+}
+
+func (v *FlightsUSSBaseURL) DecodeJSON(r *api.JSONReader) error {
+	return (*USSBaseURL)(v).DecodeJSON(r)
+}
+
+func (v *FlightsUSSBaseURL) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return (*USSBaseURL)(v).AppendJSON(b)
+}
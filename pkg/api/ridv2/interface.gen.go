@@ -7,13 +7,20 @@ import (
 )
 
 var (
-	RidDisplayProviderScope                  = api.RequiredScope("rid.display_provider")
-	RidServiceProviderScope                  = api.RequiredScope("rid.service_provider")
+	RidDisplayProviderScope = api.RequiredScope("rid.display_provider")
+	RidServiceProviderScope = api.RequiredScope("rid.service_provider")
+	scopeMasks              = api.RegisterScopes(
+		RidDisplayProviderScope,
+		RidServiceProviderScope,
+	)
 	SearchIdentificationServiceAreasSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {RidDisplayProviderScope},
 		},
 	}
+	SearchIdentificationServiceAreasSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 	GetIdentificationServiceAreaSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {RidDisplayProviderScope},
@@ -22,26 +29,42 @@ var (
 			"Authority": {RidServiceProviderScope},
 		},
 	}
+	GetIdentificationServiceAreaSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+		scopeMasks[1],
+	}
 	CreateIdentificationServiceAreaSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {RidServiceProviderScope},
 		},
 	}
+	CreateIdentificationServiceAreaSecurityMasks = []api.ScopeMask{
+		scopeMasks[1],
+	}
 	UpdateIdentificationServiceAreaSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {RidServiceProviderScope},
 		},
 	}
+	UpdateIdentificationServiceAreaSecurityMasks = []api.ScopeMask{
+		scopeMasks[1],
+	}
 	DeleteIdentificationServiceAreaSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {RidServiceProviderScope},
 		},
 	}
+	DeleteIdentificationServiceAreaSecurityMasks = []api.ScopeMask{
+		scopeMasks[1],
+	}
 	SearchSubscriptionsSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {RidDisplayProviderScope},
 		},
 	}
+	SearchSubscriptionsSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 	GetSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {RidDisplayProviderScope},
@@ -50,21 +73,34 @@ var (
 			"Authority": {RidServiceProviderScope},
 		},
 	}
+	GetSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+		scopeMasks[1],
+	}
 	CreateSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {RidDisplayProviderScope},
 		},
 	}
+	CreateSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 	UpdateSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {RidDisplayProviderScope},
 		},
 	}
+	UpdateSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 	DeleteSubscriptionSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {RidDisplayProviderScope},
 		},
 	}
+	DeleteSubscriptionSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 )
 
 type SearchIdentificationServiceAreasRequest struct {
@@ -0,0 +1,158 @@
+package api_test
+
+import (
+	"net/http"
+	"regexp"
+	"testing"
+
+	"github.com/interuss/dss/pkg/api"
+	"github.com/interuss/dss/pkg/api/auxv1"
+	"github.com/interuss/dss/pkg/api/ridv2"
+	"github.com/interuss/dss/pkg/api/scdv1"
+
+	"github.com/stretchr/testify/require"
+)
+
+var pathParamRegexp = regexp.MustCompile(`{([^}]*)}`)
+
+type routedRequest struct {
+	method string
+	path   string
+	route  *api.Route
+	params []string
+}
+
+// dssRoutes returns the route sets of the auxv1, ridv2 and scdv1 APIs, in the order they are mounted by the core-service.
+func dssRoutes() [][]*api.Route {
+	aux := auxv1.MakeAPIRouter(nil, nil)
+	rid := ridv2.MakeAPIRouter(nil, nil)
+	scd := scdv1.MakeAPIRouter(nil, nil)
+	return [][]*api.Route{aux.Routes, rid.Routes, scd.Routes}
+}
+
+// routedRequests returns one concrete request for each provided route, with every path parameter filled by a distinct value.
+func routedRequests(routeSets [][]*api.Route) []routedRequest {
+	var requests []routedRequest
+	for _, routes := range routeSets {
+		for _, route := range routes {
+			req := routedRequest{method: route.Method, route: route}
+			req.path = pathParamRegexp.ReplaceAllStringFunc(route.Path, func(string) string {
+				value := "3ce1ad0b-5f6e-4b3c-9b6e-" + string(rune('a'+len(req.params))) + "00000000000"
+				req.params = append(req.params, value)
+				return value
+			})
+			requests = append(requests, req)
+		}
+	}
+	return requests
+}
+
+func TestRouteTrieMatchesEveryDSSRoute(t *testing.T) {
+	routeSets := dssRoutes()
+	tries := make([]*api.RouteTrie, len(routeSets))
+	for i, routes := range routeSets {
+		tries[i] = api.NewRouteTrie(routes)
+	}
+
+	for _, req := range routedRequests(routeSets) {
+		var route *api.Route
+		var params []string
+		for _, trie := range tries {
+			if route, params = trie.Match(req.method, req.path); route != nil {
+				break
+			}
+		}
+		require.NotNil(t, route, "%s %s", req.method, req.path)
+		require.Equal(t, req.route.Name, route.Name)
+		require.Equal(t, len(req.params), len(params))
+		for i := range req.params {
+			require.Equal(t, req.params[i], params[i])
+		}
+	}
+}
+
+func TestRouteTrie(t *testing.T) {
+	handler := func([]string, http.ResponseWriter, *http.Request) {}
+	byID := &api.Route{Method: http.MethodGet, Handler: handler, Name: "byID", Path: "/v1/things/{id}"}
+	query := &api.Route{Method: http.MethodGet, Handler: handler, Name: "query", Path: "/v1/things/query"}
+	nested := &api.Route{Method: http.MethodPut, Handler: handler, Name: "nested", Path: "/v1/things/{id}/{version}"}
+	queryAll := &api.Route{Method: http.MethodGet, Handler: handler, Name: "queryAll", Path: "/v1/things/query/all"}
+	trie := api.NewRouteTrie([]*api.Route{byID, query, nested, queryAll})
+
+	for _, tc := range []struct {
+		method string
+		path   string
+		route  *api.Route
+		params []string
+	}{
+		{http.MethodGet, "/v1/things/abc", byID, []string{"abc"}},
+		{http.MethodGet, "/v1/things/query", query, []string{}},
+		{http.MethodGet, "/v1/things/query/all", queryAll, []string{}},
+		{http.MethodGet, "/v1/things/", byID, []string{""}},
+		{http.MethodPut, "/v1/things/query/3", nested, []string{"query", "3"}},
+		{http.MethodPut, "/v1/things/abc", nil, nil},
+		{http.MethodGet, "/v1/things/abc/", nil, nil},
+		{http.MethodGet, "/v1/things", nil, nil},
+		{http.MethodGet, "v1/things/abc", nil, nil},
+		{http.MethodDelete, "/v1/things/abc", nil, nil},
+	} {
+		route, params := trie.Match(tc.method, tc.path)
+		require.Equal(t, tc.route, route, "%s %s", tc.method, tc.path)
+		if tc.route != nil {
+			require.Equal(t, tc.params, append([]string{}, params...), "%s %s", tc.method, tc.path)
+		}
+	}
+}
+
+// BenchmarkRouteTrie measures the cost of routing one request through the auxv1, ridv2 and scdv1 APIRouters mounted in a MultiRouter.
+func BenchmarkRouteTrie(b *testing.B) {
+	routeSets := dssRoutes()
+	tries := make([]*api.RouteTrie, len(routeSets))
+	for i, routes := range routeSets {
+		tries[i] = api.NewRouteTrie(routes)
+	}
+	requests := routedRequests(routeSets)
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		req := requests[i%len(requests)]
+		for _, trie := range tries {
+			if route, _ := trie.Match(req.method, req.path); route != nil {
+				break
+			}
+		}
+	}
+}
+
+// BenchmarkRouteRegexp measures the cost of routing one request with the previous linear scan of per-route regular expressions followed by path parameter extraction, for comparison with BenchmarkRouteTrie.
+func BenchmarkRouteRegexp(b *testing.B) {
+	type regexpRoute struct {
+		method  string
+		pattern *regexp.Regexp
+	}
+	routeSets := dssRoutes()
+	regexpRouteSets := make([][]regexpRoute, len(routeSets))
+	for i, routes := range routeSets {
+		for _, route := range routes {
+			pattern := regexp.MustCompile("^" + pathParamRegexp.ReplaceAllString(route.Path, `(?P<$1>[^/]*)`) + "$")
+			regexpRouteSets[i] = append(regexpRouteSets[i], regexpRoute{method: route.Method, pattern: pattern})
+		}
+	}
+	requests := routedRequests(routeSets)
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		req := requests[i%len(requests)]
+	routers:
+		for _, routes := range regexpRouteSets {
+			for _, route := range routes {
+				if route.method == req.method && route.pattern.MatchString(req.path) {
+					_ = route.pattern.FindStringSubmatch(req.path)
+					break routers
+				}
+			}
+		}
+	}
+}
@@ -0,0 +1,1916 @@
+// This file is auto-generated; do not change as any changes will be overwritten
+package scdv1
+
+import (
+	"github.com/interuss/dss/pkg/api"
+)
+
+func (v *UUIDv4Format) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *UUIDv4Format) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *UUIDv7Format) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *UUIDv7Format) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *EntityID) DecodeJSON(r *api.JSONReader) error {
+	return (*UUIDv4Format)(v).DecodeJSON(r)
+}
+
+func (v *EntityID) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return (*UUIDv4Format)(v).AppendJSON(b)
+}
+
+func (v *EntityOVN) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *EntityOVN) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *EntityVersion) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadInt32((*int32)(v))
+}
+
+func (v *EntityVersion) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONInt(b, int64(int32(*v)))
+}
+
+func (v *SubscriptionID) DecodeJSON(r *api.JSONReader) error {
+	return (*UUIDv4Format)(v).DecodeJSON(r)
+}
+
+func (v *SubscriptionID) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return (*UUIDv4Format)(v).AppendJSON(b)
+}
+
+func (v *Key) DecodeJSON(r *api.JSONReader) error {
+	if r.ReadNull() {
+		*v = nil
+		return nil
+	}
+	*v = []EntityOVN{}
+	return r.ReadArray(func() error {
+		var item EntityOVN
+		*v = append(*v, item)
+		return (*v)[len(*v)-1].DecodeJSON(r)
+	})
+}
+
+func (v *Key) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	if (*v) == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range *v {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = (*v)[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	return b
+}
+
+var jsonFieldsTime = []string{"value", "format"}
+
+func (v *Time) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsTime) {
+		case "value":
+			return r.ReadString(&v.Value)
+		case "format":
+			return r.ReadString(&v.Format)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Time) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"value":`...)
+	b = api.AppendJSONString(b, v.Value)
+	b = append(b, `,"format":`...)
+	b = api.AppendJSONString(b, v.Format)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsRadius = []string{"value", "units"}
+
+func (v *Radius) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsRadius) {
+		case "value":
+			return r.ReadFloat32(&v.Value)
+		case "units":
+			return r.ReadString(&v.Units)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Radius) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"value":`...)
+	b = api.AppendJSONFloat(b, float64(v.Value), 32)
+	b = append(b, `,"units":`...)
+	b = api.AppendJSONString(b, v.Units)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsAltitude = []string{"value", "reference", "units"}
+
+func (v *Altitude) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsAltitude) {
+		case "value":
+			return r.ReadFloat64(&v.Value)
+		case "reference":
+			return r.ReadString(&v.Reference)
+		case "units":
+			return r.ReadString(&v.Units)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Altitude) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"value":`...)
+	b = api.AppendJSONFloat(b, v.Value, 64)
+	b = append(b, `,"reference":`...)
+	b = api.AppendJSONString(b, v.Reference)
+	b = append(b, `,"units":`...)
+	b = api.AppendJSONString(b, v.Units)
+	return api.EndJSONObject(b, start)
+}
+
+func (v *Latitude) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadFloat64((*float64)(v))
+}
+
+func (v *Latitude) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONFloat(b, float64(*v), 64)
+}
+
+func (v *Longitude) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadFloat64((*float64)(v))
+}
+
+func (v *Longitude) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONFloat(b, float64(*v), 64)
+}
+
+var jsonFieldsPolygon = []string{"vertices"}
+
+func (v *Polygon) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsPolygon) {
+		case "vertices":
+			if r.ReadNull() {
+				v.Vertices = nil
+				return nil
+			}
+			v.Vertices = []LatLngPoint{}
+			return r.ReadArray(func() error {
+				var item LatLngPoint
+				v.Vertices = append(v.Vertices, item)
+				return v.Vertices[len(v.Vertices)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Polygon) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"vertices":`...)
+	if v.Vertices == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Vertices {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Vertices[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsLatLngPoint = []string{"lng", "lat"}
+
+func (v *LatLngPoint) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsLatLngPoint) {
+		case "lng":
+			return v.Lng.DecodeJSON(r)
+		case "lat":
+			return v.Lat.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *LatLngPoint) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"lng":`...)
+	b = v.Lng.AppendJSON(b)
+	b = append(b, `,"lat":`...)
+	b = v.Lat.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsCircle = []string{"center", "radius"}
+
+func (v *Circle) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsCircle) {
+		case "center":
+			if r.ReadNull() {
+				v.Center = nil
+				return nil
+			}
+			if v.Center == nil {
+				v.Center = new(LatLngPoint)
+			}
+			return v.Center.DecodeJSON(r)
+		case "radius":
+			if r.ReadNull() {
+				v.Radius = nil
+				return nil
+			}
+			if v.Radius == nil {
+				v.Radius = new(Radius)
+			}
+			return v.Radius.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Circle) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.Center != nil {
+		b = append(b, `,"center":`...)
+		b = (*v.Center).AppendJSON(b)
+	}
+	if v.Radius != nil {
+		b = append(b, `,"radius":`...)
+		b = (*v.Radius).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsVolume3D = []string{"outline_circle", "outline_polygon", "altitude_lower", "altitude_upper"}
+
+func (v *Volume3D) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsVolume3D) {
+		case "outline_circle":
+			if r.ReadNull() {
+				v.OutlineCircle = nil
+				return nil
+			}
+			if v.OutlineCircle == nil {
+				v.OutlineCircle = new(Circle)
+			}
+			return v.OutlineCircle.DecodeJSON(r)
+		case "outline_polygon":
+			if r.ReadNull() {
+				v.OutlinePolygon = nil
+				return nil
+			}
+			if v.OutlinePolygon == nil {
+				v.OutlinePolygon = new(Polygon)
+			}
+			return v.OutlinePolygon.DecodeJSON(r)
+		case "altitude_lower":
+			if r.ReadNull() {
+				v.AltitudeLower = nil
+				return nil
+			}
+			if v.AltitudeLower == nil {
+				v.AltitudeLower = new(Altitude)
+			}
+			return v.AltitudeLower.DecodeJSON(r)
+		case "altitude_upper":
+			if r.ReadNull() {
+				v.AltitudeUpper = nil
+				return nil
+			}
+			if v.AltitudeUpper == nil {
+				v.AltitudeUpper = new(Altitude)
+			}
+			return v.AltitudeUpper.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Volume3D) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.OutlineCircle != nil {
+		b = append(b, `,"outline_circle":`...)
+		b = (*v.OutlineCircle).AppendJSON(b)
+	}
+	if v.OutlinePolygon != nil {
+		b = append(b, `,"outline_polygon":`...)
+		b = (*v.OutlinePolygon).AppendJSON(b)
+	}
+	if v.AltitudeLower != nil {
+		b = append(b, `,"altitude_lower":`...)
+		b = (*v.AltitudeLower).AppendJSON(b)
+	}
+	if v.AltitudeUpper != nil {
+		b = append(b, `,"altitude_upper":`...)
+		b = (*v.AltitudeUpper).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsVolume4D = []string{"volume", "time_start", "time_end"}
+
+func (v *Volume4D) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsVolume4D) {
+		case "volume":
+			return v.Volume.DecodeJSON(r)
+		case "time_start":
+			if r.ReadNull() {
+				v.TimeStart = nil
+				return nil
+			}
+			if v.TimeStart == nil {
+				v.TimeStart = new(Time)
+			}
+			return v.TimeStart.DecodeJSON(r)
+		case "time_end":
+			if r.ReadNull() {
+				v.TimeEnd = nil
+				return nil
+			}
+			if v.TimeEnd == nil {
+				v.TimeEnd = new(Time)
+			}
+			return v.TimeEnd.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Volume4D) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"volume":`...)
+	b = v.Volume.AppendJSON(b)
+	if v.TimeStart != nil {
+		b = append(b, `,"time_start":`...)
+		b = (*v.TimeStart).AppendJSON(b)
+	}
+	if v.TimeEnd != nil {
+		b = append(b, `,"time_end":`...)
+		b = (*v.TimeEnd).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsErrorResponse = []string{"message"}
+
+func (v *ErrorResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsErrorResponse) {
+		case "message":
+			if r.ReadNull() {
+				v.Message = nil
+				return nil
+			}
+			if v.Message == nil {
+				v.Message = new(string)
+			}
+			return r.ReadString(v.Message)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *ErrorResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.Message != nil {
+		b = append(b, `,"message":`...)
+		b = api.AppendJSONString(b, (*v.Message))
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsSubscriptionState = []string{"subscription_id", "notification_index"}
+
+func (v *SubscriptionState) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSubscriptionState) {
+		case "subscription_id":
+			return v.SubscriptionId.DecodeJSON(r)
+		case "notification_index":
+			return v.NotificationIndex.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SubscriptionState) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscription_id":`...)
+	b = v.SubscriptionId.AppendJSON(b)
+	b = append(b, `,"notification_index":`...)
+	b = v.NotificationIndex.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsSubscriberToNotify = []string{"subscriptions", "uss_base_url"}
+
+func (v *SubscriberToNotify) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSubscriberToNotify) {
+		case "subscriptions":
+			if r.ReadNull() {
+				v.Subscriptions = nil
+				return nil
+			}
+			v.Subscriptions = []SubscriptionState{}
+			return r.ReadArray(func() error {
+				var item SubscriptionState
+				v.Subscriptions = append(v.Subscriptions, item)
+				return v.Subscriptions[len(v.Subscriptions)-1].DecodeJSON(r)
+			})
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SubscriberToNotify) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscriptions":`...)
+	if v.Subscriptions == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Subscriptions {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Subscriptions[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsSubscription = []string{"id", "version", "notification_index", "time_start", "time_end", "uss_base_url", "notify_for_operational_intents", "notify_for_constraints", "implicit_subscription", "dependent_operational_intents"}
+
+func (v *Subscription) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSubscription) {
+		case "id":
+			return v.Id.DecodeJSON(r)
+		case "version":
+			return r.ReadString(&v.Version)
+		case "notification_index":
+			return v.NotificationIndex.DecodeJSON(r)
+		case "time_start":
+			if r.ReadNull() {
+				v.TimeStart = nil
+				return nil
+			}
+			if v.TimeStart == nil {
+				v.TimeStart = new(Time)
+			}
+			return v.TimeStart.DecodeJSON(r)
+		case "time_end":
+			if r.ReadNull() {
+				v.TimeEnd = nil
+				return nil
+			}
+			if v.TimeEnd == nil {
+				v.TimeEnd = new(Time)
+			}
+			return v.TimeEnd.DecodeJSON(r)
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		case "notify_for_operational_intents":
+			if r.ReadNull() {
+				v.NotifyForOperationalIntents = nil
+				return nil
+			}
+			if v.NotifyForOperationalIntents == nil {
+				v.NotifyForOperationalIntents = new(bool)
+			}
+			return r.ReadBool(v.NotifyForOperationalIntents)
+		case "notify_for_constraints":
+			if r.ReadNull() {
+				v.NotifyForConstraints = nil
+				return nil
+			}
+			if v.NotifyForConstraints == nil {
+				v.NotifyForConstraints = new(bool)
+			}
+			return r.ReadBool(v.NotifyForConstraints)
+		case "implicit_subscription":
+			if r.ReadNull() {
+				v.ImplicitSubscription = nil
+				return nil
+			}
+			if v.ImplicitSubscription == nil {
+				v.ImplicitSubscription = new(bool)
+			}
+			return r.ReadBool(v.ImplicitSubscription)
+		case "dependent_operational_intents":
+			if r.ReadNull() {
+				v.DependentOperationalIntents = nil
+				return nil
+			}
+			if v.DependentOperationalIntents == nil {
+				v.DependentOperationalIntents = new([]EntityID)
+			}
+			*v.DependentOperationalIntents = []EntityID{}
+			return r.ReadArray(func() error {
+				var item EntityID
+				*v.DependentOperationalIntents = append(*v.DependentOperationalIntents, item)
+				return (*v.DependentOperationalIntents)[len(*v.DependentOperationalIntents)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *Subscription) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"id":`...)
+	b = v.Id.AppendJSON(b)
+	b = append(b, `,"version":`...)
+	b = api.AppendJSONString(b, v.Version)
+	b = append(b, `,"notification_index":`...)
+	b = v.NotificationIndex.AppendJSON(b)
+	if v.TimeStart != nil {
+		b = append(b, `,"time_start":`...)
+		b = (*v.TimeStart).AppendJSON(b)
+	}
+	if v.TimeEnd != nil {
+		b = append(b, `,"time_end":`...)
+		b = (*v.TimeEnd).AppendJSON(b)
+	}
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	if v.NotifyForOperationalIntents != nil {
+		b = append(b, `,"notify_for_operational_intents":`...)
+		b = api.AppendJSONBool(b, (*v.NotifyForOperationalIntents))
+	}
+	if v.NotifyForConstraints != nil {
+		b = append(b, `,"notify_for_constraints":`...)
+		b = api.AppendJSONBool(b, (*v.NotifyForConstraints))
+	}
+	if v.ImplicitSubscription != nil {
+		b = append(b, `,"implicit_subscription":`...)
+		b = api.AppendJSONBool(b, (*v.ImplicitSubscription))
+	}
+	if v.DependentOperationalIntents != nil {
+		b = append(b, `,"dependent_operational_intents":`...)
+		if (*v.DependentOperationalIntents) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.DependentOperationalIntents {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.DependentOperationalIntents)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	return api.EndJSONObject(b, start)
+}
+
+func (v *SubscriptionNotificationIndex) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadInt32((*int32)(v))
+}
+
+func (v *SubscriptionNotificationIndex) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONInt(b, int64(int32(*v)))
+}
+
+var jsonFieldsQuerySubscriptionParameters = []string{"area_of_interest"}
+
+func (v *QuerySubscriptionParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsQuerySubscriptionParameters) {
+		case "area_of_interest":
+			if r.ReadNull() {
+				v.AreaOfInterest = nil
+				return nil
+			}
+			if v.AreaOfInterest == nil {
+				v.AreaOfInterest = new(Volume4D)
+			}
+			return v.AreaOfInterest.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *QuerySubscriptionParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.AreaOfInterest != nil {
+		b = append(b, `,"area_of_interest":`...)
+		b = (*v.AreaOfInterest).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsQuerySubscriptionsResponse = []string{"subscriptions"}
+
+func (v *QuerySubscriptionsResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsQuerySubscriptionsResponse) {
+		case "subscriptions":
+			if r.ReadNull() {
+				v.Subscriptions = nil
+				return nil
+			}
+			v.Subscriptions = []Subscription{}
+			return r.ReadArray(func() error {
+				var item Subscription
+				v.Subscriptions = append(v.Subscriptions, item)
+				return v.Subscriptions[len(v.Subscriptions)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *QuerySubscriptionsResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscriptions":`...)
+	if v.Subscriptions == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Subscriptions {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Subscriptions[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsGetSubscriptionResponse = []string{"subscription"}
+
+func (v *GetSubscriptionResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsGetSubscriptionResponse) {
+		case "subscription":
+			return v.Subscription.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *GetSubscriptionResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscription":`...)
+	b = v.Subscription.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsPutSubscriptionParameters = []string{"extents", "uss_base_url", "notify_for_operational_intents", "notify_for_constraints"}
+
+func (v *PutSubscriptionParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsPutSubscriptionParameters) {
+		case "extents":
+			return v.Extents.DecodeJSON(r)
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		case "notify_for_operational_intents":
+			if r.ReadNull() {
+				v.NotifyForOperationalIntents = nil
+				return nil
+			}
+			if v.NotifyForOperationalIntents == nil {
+				v.NotifyForOperationalIntents = new(bool)
+			}
+			return r.ReadBool(v.NotifyForOperationalIntents)
+		case "notify_for_constraints":
+			if r.ReadNull() {
+				v.NotifyForConstraints = nil
+				return nil
+			}
+			if v.NotifyForConstraints == nil {
+				v.NotifyForConstraints = new(bool)
+			}
+			return r.ReadBool(v.NotifyForConstraints)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *PutSubscriptionParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"extents":`...)
+	b = v.Extents.AppendJSON(b)
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	if v.NotifyForOperationalIntents != nil {
+		b = append(b, `,"notify_for_operational_intents":`...)
+		b = api.AppendJSONBool(b, (*v.NotifyForOperationalIntents))
+	}
+	if v.NotifyForConstraints != nil {
+		b = append(b, `,"notify_for_constraints":`...)
+		b = api.AppendJSONBool(b, (*v.NotifyForConstraints))
+	}
+	return api.EndJSONObject(b, start)
+}
+
+func (v *SubscriptionUssBaseURL) DecodeJSON(r *api.JSONReader) error {
+	return (*UssBaseURL)(v).DecodeJSON(r)
+}
+
+func (v *SubscriptionUssBaseURL) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return (*UssBaseURL)(v).AppendJSON(b)
+}
+
+var jsonFieldsPutSubscriptionResponse = []string{"subscription", "operational_intent_references", "constraint_references"}
+
+func (v *PutSubscriptionResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsPutSubscriptionResponse) {
+		case "subscription":
+			return v.Subscription.DecodeJSON(r)
+		case "operational_intent_references":
+			if r.ReadNull() {
+				v.OperationalIntentReferences = nil
+				return nil
+			}
+			if v.OperationalIntentReferences == nil {
+				v.OperationalIntentReferences = new([]OperationalIntentReference)
+			}
+			*v.OperationalIntentReferences = []OperationalIntentReference{}
+			return r.ReadArray(func() error {
+				var item OperationalIntentReference
+				*v.OperationalIntentReferences = append(*v.OperationalIntentReferences, item)
+				return (*v.OperationalIntentReferences)[len(*v.OperationalIntentReferences)-1].DecodeJSON(r)
+			})
+		case "constraint_references":
+			if r.ReadNull() {
+				v.ConstraintReferences = nil
+				return nil
+			}
+			if v.ConstraintReferences == nil {
+				v.ConstraintReferences = new([]ConstraintReference)
+			}
+			*v.ConstraintReferences = []ConstraintReference{}
+			return r.ReadArray(func() error {
+				var item ConstraintReference
+				*v.ConstraintReferences = append(*v.ConstraintReferences, item)
+				return (*v.ConstraintReferences)[len(*v.ConstraintReferences)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *PutSubscriptionResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscription":`...)
+	b = v.Subscription.AppendJSON(b)
+	if v.OperationalIntentReferences != nil {
+		b = append(b, `,"operational_intent_references":`...)
+		if (*v.OperationalIntentReferences) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.OperationalIntentReferences {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.OperationalIntentReferences)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	if v.ConstraintReferences != nil {
+		b = append(b, `,"constraint_references":`...)
+		if (*v.ConstraintReferences) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.ConstraintReferences {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.ConstraintReferences)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsDeleteSubscriptionResponse = []string{"subscription"}
+
+func (v *DeleteSubscriptionResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsDeleteSubscriptionResponse) {
+		case "subscription":
+			return v.Subscription.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *DeleteSubscriptionResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscription":`...)
+	b = v.Subscription.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+func (v *UssBaseURL) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *UssBaseURL) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+func (v *OperationalIntentState) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *OperationalIntentState) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+var jsonFieldsOperationalIntentReference = []string{"id", "manager", "uss_availability", "version", "state", "ovn", "time_start", "time_end", "uss_base_url", "subscription_id"}
+
+func (v *OperationalIntentReference) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsOperationalIntentReference) {
+		case "id":
+			return v.Id.DecodeJSON(r)
+		case "manager":
+			return r.ReadString(&v.Manager)
+		case "uss_availability":
+			return v.UssAvailability.DecodeJSON(r)
+		case "version":
+			return v.Version.DecodeJSON(r)
+		case "state":
+			return v.State.DecodeJSON(r)
+		case "ovn":
+			if r.ReadNull() {
+				v.Ovn = nil
+				return nil
+			}
+			if v.Ovn == nil {
+				v.Ovn = new(EntityOVN)
+			}
+			return v.Ovn.DecodeJSON(r)
+		case "time_start":
+			return v.TimeStart.DecodeJSON(r)
+		case "time_end":
+			return v.TimeEnd.DecodeJSON(r)
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		case "subscription_id":
+			return v.SubscriptionId.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *OperationalIntentReference) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"id":`...)
+	b = v.Id.AppendJSON(b)
+	b = append(b, `,"manager":`...)
+	b = api.AppendJSONString(b, v.Manager)
+	b = append(b, `,"uss_availability":`...)
+	b = v.UssAvailability.AppendJSON(b)
+	b = append(b, `,"version":`...)
+	b = v.Version.AppendJSON(b)
+	b = append(b, `,"state":`...)
+	b = v.State.AppendJSON(b)
+	if v.Ovn != nil {
+		b = append(b, `,"ovn":`...)
+		b = (*v.Ovn).AppendJSON(b)
+	}
+	b = append(b, `,"time_start":`...)
+	b = v.TimeStart.AppendJSON(b)
+	b = append(b, `,"time_end":`...)
+	b = v.TimeEnd.AppendJSON(b)
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	b = append(b, `,"subscription_id":`...)
+	b = v.SubscriptionId.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+func (v *OperationalIntentUssBaseURL) DecodeJSON(r *api.JSONReader) error {
+	return (*UssBaseURL)(v).DecodeJSON(r)
+}
+
+func (v *OperationalIntentUssBaseURL) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return (*UssBaseURL)(v).AppendJSON(b)
+}
+
+var jsonFieldsPutOperationalIntentReferenceParameters = []string{"extents", "key", "state", "uss_base_url", "subscription_id", "new_subscription", "requested_ovn_suffix"}
+
+func (v *PutOperationalIntentReferenceParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsPutOperationalIntentReferenceParameters) {
+		case "extents":
+			if r.ReadNull() {
+				v.Extents = nil
+				return nil
+			}
+			v.Extents = []Volume4D{}
+			return r.ReadArray(func() error {
+				var item Volume4D
+				v.Extents = append(v.Extents, item)
+				return v.Extents[len(v.Extents)-1].DecodeJSON(r)
+			})
+		case "key":
+			if r.ReadNull() {
+				v.Key = nil
+				return nil
+			}
+			if v.Key == nil {
+				v.Key = new(Key)
+			}
+			return v.Key.DecodeJSON(r)
+		case "state":
+			return v.State.DecodeJSON(r)
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		case "subscription_id":
+			if r.ReadNull() {
+				v.SubscriptionId = nil
+				return nil
+			}
+			if v.SubscriptionId == nil {
+				v.SubscriptionId = new(EntityID)
+			}
+			return v.SubscriptionId.DecodeJSON(r)
+		case "new_subscription":
+			if r.ReadNull() {
+				v.NewSubscription = nil
+				return nil
+			}
+			if v.NewSubscription == nil {
+				v.NewSubscription = new(ImplicitSubscriptionParameters)
+			}
+			return v.NewSubscription.DecodeJSON(r)
+		case "requested_ovn_suffix":
+			if r.ReadNull() {
+				v.RequestedOvnSuffix = nil
+				return nil
+			}
+			if v.RequestedOvnSuffix == nil {
+				v.RequestedOvnSuffix = new(UUIDv7Format)
+			}
+			return v.RequestedOvnSuffix.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *PutOperationalIntentReferenceParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"extents":`...)
+	if v.Extents == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Extents {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Extents[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	if v.Key != nil {
+		b = append(b, `,"key":`...)
+		b = (*v.Key).AppendJSON(b)
+	}
+	b = append(b, `,"state":`...)
+	b = v.State.AppendJSON(b)
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	if v.SubscriptionId != nil {
+		b = append(b, `,"subscription_id":`...)
+		b = (*v.SubscriptionId).AppendJSON(b)
+	}
+	if v.NewSubscription != nil {
+		b = append(b, `,"new_subscription":`...)
+		b = (*v.NewSubscription).AppendJSON(b)
+	}
+	if v.RequestedOvnSuffix != nil {
+		b = append(b, `,"requested_ovn_suffix":`...)
+		b = (*v.RequestedOvnSuffix).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsImplicitSubscriptionParameters = []string{"uss_base_url", "notify_for_constraints"}
+
+func (v *ImplicitSubscriptionParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsImplicitSubscriptionParameters) {
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		case "notify_for_constraints":
+			if r.ReadNull() {
+				v.NotifyForConstraints = nil
+				return nil
+			}
+			if v.NotifyForConstraints == nil {
+				v.NotifyForConstraints = new(bool)
+			}
+			return r.ReadBool(v.NotifyForConstraints)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *ImplicitSubscriptionParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	if v.NotifyForConstraints != nil {
+		b = append(b, `,"notify_for_constraints":`...)
+		b = api.AppendJSONBool(b, (*v.NotifyForConstraints))
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsGetOperationalIntentReferenceResponse = []string{"operational_intent_reference"}
+
+func (v *GetOperationalIntentReferenceResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsGetOperationalIntentReferenceResponse) {
+		case "operational_intent_reference":
+			return v.OperationalIntentReference.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *GetOperationalIntentReferenceResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"operational_intent_reference":`...)
+	b = v.OperationalIntentReference.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsChangeOperationalIntentReferenceResponse = []string{"subscribers", "operational_intent_reference"}
+
+func (v *ChangeOperationalIntentReferenceResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsChangeOperationalIntentReferenceResponse) {
+		case "subscribers":
+			if r.ReadNull() {
+				v.Subscribers = nil
+				return nil
+			}
+			v.Subscribers = []SubscriberToNotify{}
+			return r.ReadArray(func() error {
+				var item SubscriberToNotify
+				v.Subscribers = append(v.Subscribers, item)
+				return v.Subscribers[len(v.Subscribers)-1].DecodeJSON(r)
+			})
+		case "operational_intent_reference":
+			return v.OperationalIntentReference.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *ChangeOperationalIntentReferenceResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscribers":`...)
+	if v.Subscribers == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Subscribers {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Subscribers[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	b = append(b, `,"operational_intent_reference":`...)
+	b = v.OperationalIntentReference.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsQueryOperationalIntentReferenceParameters = []string{"area_of_interest"}
+
+func (v *QueryOperationalIntentReferenceParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsQueryOperationalIntentReferenceParameters) {
+		case "area_of_interest":
+			if r.ReadNull() {
+				v.AreaOfInterest = nil
+				return nil
+			}
+			if v.AreaOfInterest == nil {
+				v.AreaOfInterest = new(Volume4D)
+			}
+			return v.AreaOfInterest.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *QueryOperationalIntentReferenceParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.AreaOfInterest != nil {
+		b = append(b, `,"area_of_interest":`...)
+		b = (*v.AreaOfInterest).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsQueryOperationalIntentReferenceResponse = []string{"operational_intent_references"}
+
+func (v *QueryOperationalIntentReferenceResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsQueryOperationalIntentReferenceResponse) {
+		case "operational_intent_references":
+			if r.ReadNull() {
+				v.OperationalIntentReferences = nil
+				return nil
+			}
+			v.OperationalIntentReferences = []OperationalIntentReference{}
+			return r.ReadArray(func() error {
+				var item OperationalIntentReference
+				v.OperationalIntentReferences = append(v.OperationalIntentReferences, item)
+				return v.OperationalIntentReferences[len(v.OperationalIntentReferences)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *QueryOperationalIntentReferenceResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"operational_intent_references":`...)
+	if v.OperationalIntentReferences == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.OperationalIntentReferences {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.OperationalIntentReferences[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsConstraintReference = []string{"id", "manager", "uss_availability", "version", "ovn", "time_start", "time_end", "uss_base_url"}
+
+func (v *ConstraintReference) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsConstraintReference) {
+		case "id":
+			return v.Id.DecodeJSON(r)
+		case "manager":
+			return r.ReadString(&v.Manager)
+		case "uss_availability":
+			return v.UssAvailability.DecodeJSON(r)
+		case "version":
+			return v.Version.DecodeJSON(r)
+		case "ovn":
+			if r.ReadNull() {
+				v.Ovn = nil
+				return nil
+			}
+			if v.Ovn == nil {
+				v.Ovn = new(EntityOVN)
+			}
+			return v.Ovn.DecodeJSON(r)
+		case "time_start":
+			return v.TimeStart.DecodeJSON(r)
+		case "time_end":
+			return v.TimeEnd.DecodeJSON(r)
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *ConstraintReference) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"id":`...)
+	b = v.Id.AppendJSON(b)
+	b = append(b, `,"manager":`...)
+	b = api.AppendJSONString(b, v.Manager)
+	b = append(b, `,"uss_availability":`...)
+	b = v.UssAvailability.AppendJSON(b)
+	b = append(b, `,"version":`...)
+	b = v.Version.AppendJSON(b)
+	if v.Ovn != nil {
+		b = append(b, `,"ovn":`...)
+		b = (*v.Ovn).AppendJSON(b)
+	}
+	b = append(b, `,"time_start":`...)
+	b = v.TimeStart.AppendJSON(b)
+	b = append(b, `,"time_end":`...)
+	b = v.TimeEnd.AppendJSON(b)
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+func (v *ConstraintUssBaseURL) DecodeJSON(r *api.JSONReader) error {
+	return (*UssBaseURL)(v).DecodeJSON(r)
+}
+
+func (v *ConstraintUssBaseURL) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return (*UssBaseURL)(v).AppendJSON(b)
+}
+
+var jsonFieldsPutConstraintReferenceParameters = []string{"extents", "uss_base_url"}
+
+func (v *PutConstraintReferenceParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsPutConstraintReferenceParameters) {
+		case "extents":
+			if r.ReadNull() {
+				v.Extents = nil
+				return nil
+			}
+			v.Extents = []Volume4D{}
+			return r.ReadArray(func() error {
+				var item Volume4D
+				v.Extents = append(v.Extents, item)
+				return v.Extents[len(v.Extents)-1].DecodeJSON(r)
+			})
+		case "uss_base_url":
+			return v.UssBaseUrl.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *PutConstraintReferenceParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"extents":`...)
+	if v.Extents == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Extents {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Extents[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	b = append(b, `,"uss_base_url":`...)
+	b = v.UssBaseUrl.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsGetConstraintReferenceResponse = []string{"constraint_reference"}
+
+func (v *GetConstraintReferenceResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsGetConstraintReferenceResponse) {
+		case "constraint_reference":
+			return v.ConstraintReference.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *GetConstraintReferenceResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"constraint_reference":`...)
+	b = v.ConstraintReference.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsChangeConstraintReferenceResponse = []string{"subscribers", "constraint_reference"}
+
+func (v *ChangeConstraintReferenceResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsChangeConstraintReferenceResponse) {
+		case "subscribers":
+			if r.ReadNull() {
+				v.Subscribers = nil
+				return nil
+			}
+			v.Subscribers = []SubscriberToNotify{}
+			return r.ReadArray(func() error {
+				var item SubscriberToNotify
+				v.Subscribers = append(v.Subscribers, item)
+				return v.Subscribers[len(v.Subscribers)-1].DecodeJSON(r)
+			})
+		case "constraint_reference":
+			return v.ConstraintReference.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *ChangeConstraintReferenceResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"subscribers":`...)
+	if v.Subscribers == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.Subscribers {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.Subscribers[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	b = append(b, `,"constraint_reference":`...)
+	b = v.ConstraintReference.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsQueryConstraintReferenceParameters = []string{"area_of_interest"}
+
+func (v *QueryConstraintReferenceParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsQueryConstraintReferenceParameters) {
+		case "area_of_interest":
+			if r.ReadNull() {
+				v.AreaOfInterest = nil
+				return nil
+			}
+			if v.AreaOfInterest == nil {
+				v.AreaOfInterest = new(Volume4D)
+			}
+			return v.AreaOfInterest.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *QueryConstraintReferenceParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.AreaOfInterest != nil {
+		b = append(b, `,"area_of_interest":`...)
+		b = (*v.AreaOfInterest).AppendJSON(b)
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsQueryConstraintReferencesResponse = []string{"constraint_references"}
+
+func (v *QueryConstraintReferencesResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsQueryConstraintReferencesResponse) {
+		case "constraint_references":
+			if r.ReadNull() {
+				v.ConstraintReferences = nil
+				return nil
+			}
+			v.ConstraintReferences = []ConstraintReference{}
+			return r.ReadArray(func() error {
+				var item ConstraintReference
+				v.ConstraintReferences = append(v.ConstraintReferences, item)
+				return v.ConstraintReferences[len(v.ConstraintReferences)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *QueryConstraintReferencesResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"constraint_references":`...)
+	if v.ConstraintReferences == nil {
+		b = append(b, "null"...)
+	} else {
+		b = append(b, '[')
+		for i := range v.ConstraintReferences {
+			if i > 0 {
+				b = append(b, ',')
+			}
+			b = v.ConstraintReferences[i].AppendJSON(b)
+		}
+		b = append(b, ']')
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsAirspaceConflictResponse = []string{"message", "missing_operational_intents", "missing_constraints"}
+
+func (v *AirspaceConflictResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsAirspaceConflictResponse) {
+		case "message":
+			if r.ReadNull() {
+				v.Message = nil
+				return nil
+			}
+			if v.Message == nil {
+				v.Message = new(string)
+			}
+			return r.ReadString(v.Message)
+		case "missing_operational_intents":
+			if r.ReadNull() {
+				v.MissingOperationalIntents = nil
+				return nil
+			}
+			if v.MissingOperationalIntents == nil {
+				v.MissingOperationalIntents = new([]OperationalIntentReference)
+			}
+			*v.MissingOperationalIntents = []OperationalIntentReference{}
+			return r.ReadArray(func() error {
+				var item OperationalIntentReference
+				*v.MissingOperationalIntents = append(*v.MissingOperationalIntents, item)
+				return (*v.MissingOperationalIntents)[len(*v.MissingOperationalIntents)-1].DecodeJSON(r)
+			})
+		case "missing_constraints":
+			if r.ReadNull() {
+				v.MissingConstraints = nil
+				return nil
+			}
+			if v.MissingConstraints == nil {
+				v.MissingConstraints = new([]ConstraintReference)
+			}
+			*v.MissingConstraints = []ConstraintReference{}
+			return r.ReadArray(func() error {
+				var item ConstraintReference
+				*v.MissingConstraints = append(*v.MissingConstraints, item)
+				return (*v.MissingConstraints)[len(*v.MissingConstraints)-1].DecodeJSON(r)
+			})
+		}
+		return r.Skip()
+	})
+}
+
+func (v *AirspaceConflictResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.Message != nil {
+		b = append(b, `,"message":`...)
+		b = api.AppendJSONString(b, (*v.Message))
+	}
+	if v.MissingOperationalIntents != nil {
+		b = append(b, `,"missing_operational_intents":`...)
+		if (*v.MissingOperationalIntents) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.MissingOperationalIntents {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.MissingOperationalIntents)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	if v.MissingConstraints != nil {
+		b = append(b, `,"missing_constraints":`...)
+		if (*v.MissingConstraints) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.MissingConstraints {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = (*v.MissingConstraints)[i].AppendJSON(b)
+			}
+			b = append(b, ']')
+		}
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsUssAvailabilityStatus = []string{"uss", "availability"}
+
+func (v *UssAvailabilityStatus) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsUssAvailabilityStatus) {
+		case "uss":
+			return r.ReadString(&v.Uss)
+		case "availability":
+			return v.Availability.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *UssAvailabilityStatus) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"uss":`...)
+	b = api.AppendJSONString(b, v.Uss)
+	b = append(b, `,"availability":`...)
+	b = v.Availability.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+func (v *UssAvailabilityState) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadString((*string)(v))
+}
+
+func (v *UssAvailabilityState) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	return api.AppendJSONString(b, string(*v))
+}
+
+var jsonFieldsSetUssAvailabilityStatusParameters = []string{"old_version", "availability"}
+
+func (v *SetUssAvailabilityStatusParameters) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsSetUssAvailabilityStatusParameters) {
+		case "old_version":
+			return r.ReadString(&v.OldVersion)
+		case "availability":
+			return v.Availability.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *SetUssAvailabilityStatusParameters) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"old_version":`...)
+	b = api.AppendJSONString(b, v.OldVersion)
+	b = append(b, `,"availability":`...)
+	b = v.Availability.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsUssAvailabilityStatusResponse = []string{"version", "status"}
+
+func (v *UssAvailabilityStatusResponse) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsUssAvailabilityStatusResponse) {
+		case "version":
+			return r.ReadString(&v.Version)
+		case "status":
+			return v.Status.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *UssAvailabilityStatusResponse) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"version":`...)
+	b = api.AppendJSONString(b, v.Version)
+	b = append(b, `,"status":`...)
+	b = v.Status.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsExchangeRecord = []string{"url", "method", "headers", "recorder_role", "request_time", "request_body", "response_time", "response_body", "response_code", "problem"}
+
+func (v *ExchangeRecord) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsExchangeRecord) {
+		case "url":
+			return r.ReadString(&v.Url)
+		case "method":
+			return r.ReadString(&v.Method)
+		case "headers":
+			if r.ReadNull() {
+				v.Headers = nil
+				return nil
+			}
+			if v.Headers == nil {
+				v.Headers = new([]string)
+			}
+			*v.Headers = []string{}
+			return r.ReadArray(func() error {
+				var item string
+				*v.Headers = append(*v.Headers, item)
+				return r.ReadString(&(*v.Headers)[len(*v.Headers)-1])
+			})
+		case "recorder_role":
+			return r.ReadString(&v.RecorderRole)
+		case "request_time":
+			return v.RequestTime.DecodeJSON(r)
+		case "request_body":
+			if r.ReadNull() {
+				v.RequestBody = nil
+				return nil
+			}
+			if v.RequestBody == nil {
+				v.RequestBody = new(string)
+			}
+			return r.ReadString(v.RequestBody)
+		case "response_time":
+			if r.ReadNull() {
+				v.ResponseTime = nil
+				return nil
+			}
+			if v.ResponseTime == nil {
+				v.ResponseTime = new(Time)
+			}
+			return v.ResponseTime.DecodeJSON(r)
+		case "response_body":
+			if r.ReadNull() {
+				v.ResponseBody = nil
+				return nil
+			}
+			if v.ResponseBody == nil {
+				v.ResponseBody = new(string)
+			}
+			return r.ReadString(v.ResponseBody)
+		case "response_code":
+			if r.ReadNull() {
+				v.ResponseCode = nil
+				return nil
+			}
+			if v.ResponseCode == nil {
+				v.ResponseCode = new(int32)
+			}
+			return r.ReadInt32(v.ResponseCode)
+		case "problem":
+			if r.ReadNull() {
+				v.Problem = nil
+				return nil
+			}
+			if v.Problem == nil {
+				v.Problem = new(string)
+			}
+			return r.ReadString(v.Problem)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *ExchangeRecord) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	b = append(b, `,"url":`...)
+	b = api.AppendJSONString(b, v.Url)
+	b = append(b, `,"method":`...)
+	b = api.AppendJSONString(b, v.Method)
+	if v.Headers != nil {
+		b = append(b, `,"headers":`...)
+		if (*v.Headers) == nil {
+			b = append(b, "null"...)
+		} else {
+			b = append(b, '[')
+			for i := range *v.Headers {
+				if i > 0 {
+					b = append(b, ',')
+				}
+				b = api.AppendJSONString(b, (*v.Headers)[i])
+			}
+			b = append(b, ']')
+		}
+	}
+	b = append(b, `,"recorder_role":`...)
+	b = api.AppendJSONString(b, v.RecorderRole)
+	b = append(b, `,"request_time":`...)
+	b = v.RequestTime.AppendJSON(b)
+	if v.RequestBody != nil {
+		b = append(b, `,"request_body":`...)
+		b = api.AppendJSONString(b, (*v.RequestBody))
+	}
+	if v.ResponseTime != nil {
+		b = append(b, `,"response_time":`...)
+		b = (*v.ResponseTime).AppendJSON(b)
+	}
+	if v.ResponseBody != nil {
+		b = append(b, `,"response_body":`...)
+		b = api.AppendJSONString(b, (*v.ResponseBody))
+	}
+	if v.ResponseCode != nil {
+		b = append(b, `,"response_code":`...)
+		b = api.AppendJSONInt(b, int64((*v.ResponseCode)))
+	}
+	if v.Problem != nil {
+		b = append(b, `,"problem":`...)
+		b = api.AppendJSONString(b, (*v.Problem))
+	}
+	return api.EndJSONObject(b, start)
+}
+
+var jsonFieldsErrorReport = []string{"report_id", "exchange"}
+
+func (v *ErrorReport) DecodeJSON(r *api.JSONReader) error {
+	return r.ReadObject(func(key []byte) error {
+		switch api.MatchJSONField(key, jsonFieldsErrorReport) {
+		case "report_id":
+			if r.ReadNull() {
+				v.ReportId = nil
+				return nil
+			}
+			if v.ReportId == nil {
+				v.ReportId = new(string)
+			}
+			return r.ReadString(v.ReportId)
+		case "exchange":
+			return v.Exchange.DecodeJSON(r)
+		}
+		return r.Skip()
+	})
+}
+
+func (v *ErrorReport) AppendJSON(b []byte) []byte {
+	if v == nil {
+		return append(b, "null"...)
+	}
+	start := len(b)
+	if v.ReportId != nil {
+		b = append(b, `,"report_id":`...)
+		b = api.AppendJSONString(b, (*v.ReportId))
+	}
+	b = append(b, `,"exchange":`...)
+	b = v.Exchange.AppendJSON(b)
+	return api.EndJSONObject(b, start)
+}
@@ -8,11 +8,17 @@ import (
 
 var (
 	InterussVersioningReadSystemVersionsScope = api.RequiredScope("interuss.versioning.read_system_versions")
-	GetVersionSecurity                        = []api.AuthorizationOption{
+	scopeMasks                                = api.RegisterScopes(
+		InterussVersioningReadSystemVersionsScope,
+	)
+	GetVersionSecurity = []api.AuthorizationOption{
 		{
 			"Authority": {InterussVersioningReadSystemVersionsScope},
 		},
 	}
+	GetVersionSecurityMasks = []api.ScopeMask{
+		scopeMasks[0],
+	}
 )
 
 type GetVersionRequest struct {
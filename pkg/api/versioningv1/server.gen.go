@@ -5,35 +5,33 @@ import (
 	"context"
 	"github.com/interuss/dss/pkg/api"
 	"net/http"
-	"regexp"
 )
 
 type APIRouter struct {
 	Routes         []*api.Route
+	Trie           *api.RouteTrie
 	Implementation Implementation
 	Authorizer     api.Authorizer
 }
 
 // *versioning.APIRouter (type defined above) implements the api.PartialRouter interface
 func (s *APIRouter) Handle(w http.ResponseWriter, r *http.Request) bool {
-	for _, route := range s.Routes {
-		if route.Method == r.Method && route.Pattern.MatchString(r.URL.Path) {
-			route.Handler(route.Pattern, w, r)
-			return true
-		}
+	route, pathParams := s.Trie.Match(r.Method, r.URL.Path)
+	if route == nil {
+		return false
 	}
-	return false
+	route.Handler(pathParams, w, r)
+	return true
 }
 
-func (s *APIRouter) GetVersion(exp *regexp.Regexp, w http.ResponseWriter, r *http.Request) {
+func (s *APIRouter) GetVersion(pathParams []string, w http.ResponseWriter, r *http.Request) {
 	var req GetVersionRequest
 
 	// Authorize request
-	req.Auth = s.Authorizer.Authorize(w, r, GetVersionSecurity)
+	req.Auth = s.Authorizer.Authorize(w, r, GetVersionSecurity, GetVersionSecurityMasks)
 
 	// Parse path parameters
-	pathMatch := exp.FindStringSubmatch(r.URL.Path)
-	req.SystemIdentity = SystemBoundaryIdentifier(pathMatch[1])
+	req.SystemIdentity = SystemBoundaryIdentifier(pathParams[0])
 
 	// Call implementation
 	ctx, cancel := context.WithCancel(r.Context())
@@ -42,33 +40,33 @@ func (s *APIRouter) GetVersion(exp *regexp.Regexp, w http.ResponseWriter, r *htt
 
 	// Write response to client
 	if response.Response200 != nil {
-		api.WriteJSON(w, 200, response.Response200)
+		api.WriteJSONResponse(w, r, 200, response.Response200)
 		return
 	}
 	if response.Response401 != nil {
-		api.WriteJSON(w, 401, response.Response401)
+		api.WriteJSONResponse(w, r, 401, response.Response401)
 		return
 	}
 	if response.Response403 != nil {
-		api.WriteJSON(w, 403, response.Response403)
+		api.WriteJSONResponse(w, r, 403, response.Response403)
 		return
 	}
 	if response.Response404 != nil {
-		api.WriteJSON(w, 404, response.Response404)
+		api.WriteJSONResponse(w, r, 404, response.Response404)
 		return
 	}
 	if response.Response500 != nil {
-		api.WriteJSON(w, 500, response.Response500)
+		api.WriteJSONResponse(w, r, 500, response.Response500)
 		return
 	}
-	api.WriteJSON(w, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
+	api.WriteJSONResponse(w, r, 500, api.InternalServerErrorBody{ErrorMessage: "Handler implementation did not set a response"})
 }
 
 func MakeAPIRouter(impl Implementation, auth api.Authorizer) APIRouter {
 	router := APIRouter{Implementation: impl, Authorizer: auth, Routes: make([]*api.Route, 1)}
 
-	pattern := regexp.MustCompile("^/versions/(?P<system_identity>[^/]*)$")
-	router.Routes[0] = &api.Route{Method: http.MethodGet, Pattern: pattern, Handler: router.GetVersion}
+	router.Routes[0] = &api.Route{Method: http.MethodGet, Handler: router.GetVersion, Name: "versioning.GetVersion", Path: "/versions/{system_identity}"}
 
+	router.Trie = api.NewRouteTrie(router.Routes)
 	return router
 }
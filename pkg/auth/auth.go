@@ -6,6 +6,7 @@ import (
 	"crypto/x509"
 	"encoding/json"
 	"encoding/pem"
+	"errors"
 	"fmt"
 	"net/http"
 	"net/url"
@@ -27,10 +28,17 @@ import (
 
 // KeyResolver abstracts resolving keys.
 type KeyResolver interface {
-	// ResolveKeys returns a public or private key, most commonly an rsa.PublicKey.
+	// ResolveKeys returns a public or private key, most commonly an rsa.PublicKey. Keys wrapped in an IdentifiedKey
+	// are selected by the kid header of the tokens to verify.
 	ResolveKeys(context.Context) ([]interface{}, error)
 }
 
+// IdentifiedKey is a key resolved along with its ID.
+type IdentifiedKey struct {
+	ID  string
+	Key interface{}
+}
+
 type fromMemoryKeyResolver struct {
 	Keys []interface{}
 }
@@ -80,13 +88,26 @@ type JWKSResolver struct {
 	Endpoint *url.URL
 	// If empty, will use all the keys provided by the jwks Endpoint.
 	KeyIDs []string
+
+	mu sync.Mutex
+	// ETag of the JWK set the keys were last resolved from, sent back to the Endpoint to only download it again when
+	// it changed.
+	etag string
+	keys []interface{}
 }
 
-// ResolveKeys resolves an RSA public key from file for verifying JWTs.
+// ResolveKeys resolves the RSA public keys served by the Endpoint for verifying JWTs, as IdentifiedKey.
 func (r *JWKSResolver) ResolveKeys(ctx context.Context) ([]interface{}, error) {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+
 	req := http.Request{
 		Method: http.MethodGet,
 		URL:    r.Endpoint,
+		Header: make(http.Header),
+	}
+	if r.etag != "" {
+		req.Header.Set("If-None-Match", r.etag)
 	}
 
 	resp, err := http.DefaultClient.Do(req.WithContext(ctx))
@@ -95,6 +116,9 @@ func (r *JWKSResolver) ResolveKeys(ctx context.Context) ([]interface{}, error) {
 	}
 	defer func() { _ = resp.Body.Close() }()
 
+	if resp.StatusCode == http.StatusNotModified && r.etag != "" {
+		return r.keys, nil
+	}
 	if resp.StatusCode >= 400 {
 		return nil, stacktrace.NewErrorWithCode(dsserr.Unavailable, "Error retrieving JWKS at %s: status %d", req.URL, resp.StatusCode)
 	}
@@ -118,8 +142,11 @@ func (r *JWKSResolver) ResolveKeys(ctx context.Context) ([]interface{}, error) {
 		webKeys = append(webKeys, jkeys...)
 	}
 	for _, w := range webKeys {
-		keys = append(keys, w.Key)
+		keys = append(keys, IdentifiedKey{ID: w.KeyID, Key: w.Key})
 	}
+
+	r.etag = resp.Header.Get("ETag")
+	r.keys = keys
 	return keys, nil
 }
 
@@ -127,16 +154,20 @@ func (r *JWKSResolver) ResolveKeys(ctx context.Context) ([]interface{}, error) {
 type Authorizer struct {
 	logger            *zap.Logger
 	keys              []interface{}
+	keysByID          map[string]interface{}
 	keyGuard          sync.RWMutex
+	keyRefreshes      chan struct{}
 	acceptedAudiences []string
+	tokenCache        *tokenCache
 }
 
 // Configuration bundles up creation-time parameters for an Authorizer instance.
 type Configuration struct {
 	KeyResolver        KeyResolver   // Used to initialize and periodically refresh keys.
-	KeyRefreshInterval time.Duration // Keys are refreshed on this cadence.
+	KeyRefreshInterval time.Duration // Keys are refreshed on this cadence, shifted by up to 10% at random.
 	KeyTTL             time.Duration // Maximum age of the cached keys before a failing refresh becomes fatal.
 	AcceptedAudiences  []string      // AcceptedAudiences enforces the aud keyClaim on the jwt. An empty string allows no aud keyClaim.
+	TokenCacheSize     int           // Maximum number of validated tokens which claims are cached until they expire. 0 disables the cache.
 }
 
 // NewRSAAuthorizer returns an Authorizer instance using values from configuration.
@@ -151,43 +182,23 @@ func NewRSAAuthorizer(ctx context.Context, configuration Configuration) (*Author
 	authorizer := &Authorizer{
 		acceptedAudiences: configuration.AcceptedAudiences,
 		logger:            logger,
-		keys:              keys,
+		keyRefreshes:      make(chan struct{}, 1),
+		tokenCache:        newTokenCache(configuration.TokenCacheSize),
 	}
+	authorizer.setKeys(keys)
 
-	go func() {
-		ticker := time.NewTicker(configuration.KeyRefreshInterval)
-		defer ticker.Stop()
-
-		lastSuccess := time.Now()
-
-		for {
-			select {
-			case <-ticker.C:
-				keys, err := configuration.KeyResolver.ResolveKeys(ctx)
-				if err != nil {
-					if stacktrace.GetCode(err) != dsserr.Unavailable || time.Since(lastSuccess) >= configuration.KeyTTL {
-						logger.Panic("failed to refresh key", zap.Error(err))
-					} else {
-						logger.Error("failed to refresh key, using cached keys", zap.Error(err))
-					}
-					continue
-				}
-
-				lastSuccess = time.Now()
-				authorizer.setKeys(keys)
-			case <-ctx.Done():
-				logger.Warn("finalizing key refresh worker", zap.Error(ctx.Err()))
-				return
-			}
-		}
-	}()
+	go authorizer.refreshKeys(ctx, configuration, keys)
 
 	return authorizer, nil
 }
 
 func (a *Authorizer) setKeys(keys []interface{}) {
+	verificationKeys, keysByID := indexKeys(keys)
 	a.keyGuard.Lock()
-	a.keys = keys
+	a.keys = verificationKeys
+	a.keysByID = keysByID
+	// Tokens validated with the previous keys must be validated again
+	a.tokenCache.purge()
 	a.keyGuard.Unlock()
 }
 
@@ -207,7 +218,8 @@ func (a *Authorizer) TokenMiddleware(handler http.Handler) http.Handler {
 }
 
 // Authorize extracts and verifies bearer tokens from a http.Request after it was validated by the TokenMiddleware.
-func (a *Authorizer) Authorize(_ http.ResponseWriter, r *http.Request, authOptions []api.AuthorizationOption) api.AuthorizationResult {
+// Scopes are matched against authMasks when it holds the mask of each of authOptions, or against authOptions otherwise.
+func (a *Authorizer) Authorize(_ http.ResponseWriter, r *http.Request, authOptions []api.AuthorizationOption, authMasks []api.ScopeMask) api.AuthorizationResult {
 	keyClaims, err := claims.FromContext(r.Context())
 	if err != nil {
 		return api.AuthorizationResult{Error: stacktrace.Propagate(err, "Error retrieving claims from context")}
@@ -228,6 +240,14 @@ func (a *Authorizer) Authorize(_ http.ResponseWriter, r *http.Request, authOptio
 		return api.AuthorizationResult{Error: stacktrace.NewErrorWithCode(dsserr.Unauthenticated, "Invalid access token audience: %v", keyClaims.Audience)}
 	}
 
+	if len(authMasks) == len(authOptions) && validateScopeMasks(authMasks, keyClaims.ScopeMask) {
+		return api.AuthorizationResult{
+			ClientID: &keyClaims.Subject,
+			Scopes:   keyClaims.Scopes.ToStringSlice(),
+		}
+	}
+
+	// Either the masks are not available, or they don't match and the missing scopes are described below
 	if pass, missing := validateScopes(authOptions, keyClaims.Scopes); !pass {
 		return api.AuthorizationResult{Error: stacktrace.NewErrorWithCode(dsserr.PermissionDenied,
 			"Access token missing scopes (%v) while expecting %v and got %v",
@@ -246,32 +266,49 @@ func (a *Authorizer) extractClaims(r *http.Request) (claims.Claims, error) {
 		return claims.Claims{}, stacktrace.NewErrorWithCode(dsserr.Unauthenticated, "Missing access token")
 	}
 
+	cacheKey := tokenCacheKey(tknStr)
+	if keyClaims, ok := a.tokenCache.get(cacheKey, jwt.TimeFunc()); ok {
+		return keyClaims, nil
+	}
+
 	a.keyGuard.RLock()
-	keys := a.keys
+	keys, keysByID := a.keys, a.keysByID
+	cacheGeneration := a.tokenCache.currentGeneration()
 	a.keyGuard.RUnlock()
-	validated := false
-	var err error
 	var keyClaims claims.Claims
 
-	for _, key := range keys {
-		keyClaims = claims.Claims{}
-		key := key
-		_, err = jwt.ParseWithClaims(tknStr, &keyClaims, func(token *jwt.Token) (interface{}, error) {
+	// The token is verified with the key matching its kid header if there is one, or else with each key in turn
+	_, err := jwt.ParseWithClaims(tknStr, &keyClaims, func(token *jwt.Token) (interface{}, error) {
+		kid, _ := token.Header["kid"].(string)
+		if key, ok := keysByID[kid]; ok {
 			return key, nil
-		})
-		if err == nil {
-			validated = true
-			break
 		}
-	}
+		if kid != "" && keysByID != nil {
+			// The token may be signed with a key published since the last refresh
+			a.requestKeyRefresh()
+		}
+		return nil, errUnknownKeyID
+	})
 
-	if !validated {
-		if err == nil { // If we have no keys, errs may be nil
-			err = stacktrace.NewErrorWithCode(dsserr.Unauthenticated, "No keys to validate against")
+	if errors.Is(err, errUnknownKeyID) {
+		err = stacktrace.NewErrorWithCode(dsserr.Unauthenticated, "No keys to validate against")
+		for _, key := range keys {
+			keyClaims = claims.Claims{}
+			key := key
+			_, err = jwt.ParseWithClaims(tknStr, &keyClaims, func(token *jwt.Token) (interface{}, error) {
+				return key, nil
+			})
+			if err == nil {
+				break
+			}
 		}
+	}
+	if err != nil {
 		return claims.Claims{}, stacktrace.PropagateWithCode(err, dsserr.Unauthenticated, "Access token validation failed")
 	}
 
+	keyClaims.ScopeMask = keyClaims.Scopes.ToScopeMask()
+	a.tokenCache.add(cacheKey, keyClaims, cacheGeneration)
 	return keyClaims, nil
 }
 
@@ -340,6 +377,20 @@ func validateScopes(authOptions []api.AuthorizationOption, clientScopes claims.S
 	return false, strings.Join(validationFailures, " ; ")
 }
 
+// validateScopeMasks is the equivalent of validateScopes for the masks of a set of authorization options: the validation
+// succeeds if the client has all the scopes of at least one of them, or if there are none.
+func validateScopeMasks(authMasks []api.ScopeMask, clientScopes api.ScopeMask) bool {
+	if len(authMasks) == 0 {
+		return true
+	}
+	for _, mask := range authMasks {
+		if clientScopes.Contains(mask) {
+			return true
+		}
+	}
+	return false
+}
+
 func getToken(r *http.Request) (string, bool) {
 	authHeader := r.Header.Get("authorization")
 	if len(authHeader) < 7 || strings.ToLower(authHeader[0:6]) != "bearer" {
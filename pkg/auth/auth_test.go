@@ -14,6 +14,7 @@ import (
 	"time"
 
 	"github.com/interuss/dss/pkg/api"
+	"github.com/interuss/dss/pkg/api/auxv1"
 	"github.com/interuss/dss/pkg/api/scdv1"
 	"github.com/interuss/dss/pkg/auth/claims"
 	dsserr "github.com/interuss/dss/pkg/errors"
@@ -174,7 +175,7 @@ func TestRSAAuthInterceptor(t *testing.T) {
 				ctx = claims.NewContext(ctx, claimsValue)
 			}
 
-			res := a.Authorize(nil, test.req.WithContext(ctx), []api.AuthorizationOption{})
+			res := a.Authorize(nil, test.req.WithContext(ctx), []api.AuthorizationOption{}, nil)
 			if test.code != stacktrace.ErrorCode(0) && stacktrace.GetCode(res.Error) != test.code {
 				t.Logf("%v", res.Error)
 				t.Errorf("expected: %v, got: %v, with message %s", test.code, stacktrace.GetCode(res.Error), res.Error.Error())
@@ -372,7 +373,7 @@ func TestRSAAuthAudiences(t *testing.T) {
 				ctx = claims.NewContext(ctx, claimsValue)
 			}
 
-			res := a.Authorize(nil, req.WithContext(ctx), []api.AuthorizationOption{})
+			res := a.Authorize(nil, req.WithContext(ctx), []api.AuthorizationOption{}, nil)
 			if code != stacktrace.ErrorCode(0) && stacktrace.GetCode(res.Error) != code {
 				t.Logf("%v", res.Error)
 				t.Errorf("expected: %v, got: %v, with message %s", code, stacktrace.GetCode(res.Error), res.Error.Error())
@@ -449,6 +450,102 @@ func TestMissingScopes(t *testing.T) {
 	}
 }
 
+// Registered during the package initialization, like the scopes of generated APIs.
+var testScopeMasks = api.RegisterScopes("required1", "required2", "required3", "required4")
+
+func TestScopeMasksMatchScopes(t *testing.T) {
+	authOptions := []api.AuthorizationOption{
+		{"TestAuth1": {"required1"}},
+		{"TestAuth2": {"required2"}},
+		{"TestAuth3": {"required3", "required4"}},
+	}
+	authMasks := []api.ScopeMask{
+		testScopeMasks[0],
+		testScopeMasks[1],
+		testScopeMasks[2] | testScopeMasks[3],
+	}
+
+	for _, scopes := range []claims.ScopeSet{
+		{},
+		{"unknown": {}},
+		{"required1": {}},
+		{"required2": {}, "unknown": {}},
+		{"required3": {}},
+		{"required4": {}},
+		{"required3": {}, "required4": {}},
+		{"required1": {}, "required3": {}, "required4": {}},
+	} {
+		pass, _ := validateScopes(authOptions, scopes)
+		require.Equal(t, pass, validateScopeMasks(authMasks, scopes.ToScopeMask()), "scopes: %v", scopes)
+	}
+
+	require.True(t, validateScopeMasks(nil, 0))
+}
+
+func TestGeneratedScopeMasks(t *testing.T) {
+	// Scopes shared by several APIs share the same bit
+	require.Equal(t, api.ScopeMaskOf(scdv1.UtmStrategicCoordinationScope), scdv1.QueryOperationalIntentReferencesSecurityMasks[0])
+	require.Len(t, scdv1.CreateOperationalIntentReferenceSecurityMasks, len(scdv1.CreateOperationalIntentReferenceSecurity))
+
+	scopes := claims.ScopeSet{string(scdv1.UtmConformanceMonitoringSaScope): {}}
+	require.True(t, validateScopeMasks(scdv1.CreateOperationalIntentReferenceSecurityMasks, scopes.ToScopeMask()))
+	require.False(t, validateScopeMasks(scdv1.CreateConstraintReferenceSecurityMasks, scopes.ToScopeMask()))
+	require.False(t, validateScopeMasks(auxv1.GetPoolSecurityMasks, scopes.ToScopeMask()))
+}
+
+// Client scopes of a typical SCD token, only matching the last option of multi-option operations.
+var benchmarkScopes = claims.ScopeSet{
+	string(scdv1.UtmConformanceMonitoringSaScope): {},
+	string(auxv1.InterussPoolStatusReadScope):     {},
+}
+
+func BenchmarkValidateScopes(b *testing.B) {
+	for _, bc := range []struct {
+		name        string
+		authOptions []api.AuthorizationOption
+	}{
+		{"SingleOption", auxv1.GetPoolSecurity},
+		{"MultiOption", scdv1.CreateOperationalIntentReferenceSecurity},
+	} {
+		b.Run(bc.name, func(b *testing.B) {
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				if pass, _ := validateScopes(bc.authOptions, benchmarkScopes); !pass {
+					b.Fatal("validation failed")
+				}
+			}
+		})
+	}
+}
+
+func BenchmarkValidateScopeMasks(b *testing.B) {
+	for _, bc := range []struct {
+		name      string
+		authMasks []api.ScopeMask
+	}{
+		{"SingleOption", auxv1.GetPoolSecurityMasks},
+		{"MultiOption", scdv1.CreateOperationalIntentReferenceSecurityMasks},
+	} {
+		b.Run(bc.name, func(b *testing.B) {
+			b.ReportAllocs()
+			clientScopes := benchmarkScopes.ToScopeMask()
+			for i := 0; i < b.N; i++ {
+				if !validateScopeMasks(bc.authMasks, clientScopes) {
+					b.Fatal("validation failed")
+				}
+			}
+		})
+	}
+}
+
+// BenchmarkToScopeMask measures the conversion done once per request by the TokenMiddleware.
+func BenchmarkToScopeMask(b *testing.B) {
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		_ = benchmarkScopes.ToScopeMask()
+	}
+}
+
 func TestClaimsValidation(t *testing.T) {
 	claims.Now = func() time.Time {
 		return time.Unix(42, 0)
@@ -8,6 +8,7 @@ import (
 	"time"
 
 	"github.com/golang-jwt/jwt/v4"
+	"github.com/interuss/dss/pkg/api"
 	"github.com/interuss/stacktrace"
 )
 
@@ -82,6 +83,16 @@ func (s *ScopeSet) ValidateRequiredScopes(reqScopes []string) (bool, []string) {
 	return true, nil
 }
 
+// ToScopeMask returns the ScopeMask of the scopes of this ScopeSet registered by the APIs. Other scopes are not required
+// by any operation and are left out.
+func (s *ScopeSet) ToScopeMask() api.ScopeMask {
+	var mask api.ScopeMask
+	for scope := range *s {
+		mask |= api.ScopeMaskOf(api.RequiredScope(scope))
+	}
+	return mask
+}
+
 func (s *ScopeSet) ToStringSlice() []string {
 	scopes := make([]string, 0, len(*s))
 	for scope := range *s {
@@ -93,6 +104,8 @@ func (s *ScopeSet) ToStringSlice() []string {
 type Claims struct {
 	jwt.RegisteredClaims
 	Scopes ScopeSet `json:"scope"`
+	// ScopeMask holds Scopes as a mask, computed once the token is validated.
+	ScopeMask api.ScopeMask `json:"-"`
 }
 
 func (c *Claims) Valid() error {
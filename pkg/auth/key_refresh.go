@@ -0,0 +1,137 @@
+package auth
+
+import (
+	"context"
+	"crypto"
+	"errors"
+	"math/rand/v2"
+	"reflect"
+	"time"
+
+	dsserr "github.com/interuss/dss/pkg/errors"
+	"github.com/interuss/stacktrace"
+	"go.uber.org/zap"
+)
+
+// minOnDemandKeyRefreshInterval is the minimum duration between two refreshes of the keys requested by tokens with an
+// unknown kid, so that such tokens can't be used to flood the key endpoint.
+const minOnDemandKeyRefreshInterval = 10 * time.Second
+
+// errUnknownKeyID is returned when looking up the key of a token which kid header doesn't match any key.
+var errUnknownKeyID = errors.New("no key matching the ID of the token")
+
+// indexKeys returns the resolved keys without their ID, and the keys with a unique ID indexed by it.
+func indexKeys(resolved []interface{}) ([]interface{}, map[string]interface{}) {
+	keys := make([]interface{}, 0, len(resolved))
+	var keysByID map[string]interface{}
+	duplicates := map[string]bool{}
+	for _, key := range resolved {
+		if identified, ok := key.(IdentifiedKey); ok {
+			key = identified.Key
+			if identified.ID != "" && !duplicates[identified.ID] {
+				if keysByID == nil {
+					keysByID = map[string]interface{}{}
+				}
+				if _, ok := keysByID[identified.ID]; ok {
+					// Tokens with this ID are verified with each key instead
+					delete(keysByID, identified.ID)
+					duplicates[identified.ID] = true
+				} else {
+					keysByID[identified.ID] = key
+				}
+			}
+		}
+		keys = append(keys, key)
+	}
+	return keys, keysByID
+}
+
+// sameKeys returns whether both sets of resolved keys hold the same keys with the same IDs, in the same order.
+func sameKeys(a, b []interface{}) bool {
+	if len(a) != len(b) {
+		return false
+	}
+	for i := range a {
+		if !sameKey(a[i], b[i]) {
+			return false
+		}
+	}
+	return true
+}
+
+func sameKey(a, b interface{}) bool {
+	identifiedA, okA := a.(IdentifiedKey)
+	identifiedB, okB := b.(IdentifiedKey)
+	if okA != okB || identifiedA.ID != identifiedB.ID {
+		return false
+	}
+	if okA {
+		a, b = identifiedA.Key, identifiedB.Key
+	}
+	if key, ok := a.(interface{ Equal(crypto.PublicKey) bool }); ok {
+		return key.Equal(b)
+	}
+	return reflect.DeepEqual(a, b)
+}
+
+// jittered returns interval shifted by up to 10% at random, so that instances started together don't all refresh their
+// keys at the same time.
+func jittered(interval time.Duration) time.Duration {
+	spread := interval / 10
+	if spread <= 0 {
+		return interval
+	}
+	return interval - spread + time.Duration(rand.Int64N(2*int64(spread)+1))
+}
+
+// refreshKeys resolves the keys of the authorizer every configuration.KeyRefreshInterval and when requested by
+// requestKeyRefresh, until ctx is done. The current keys are used to verify tokens while new ones are resolved, and
+// for up to configuration.KeyTTL when they could not be resolved because of a transient failure. The authorizer is
+// only updated when the resolved keys differ from current, so that the tokens validated with unchanged keys stay
+// cached.
+func (a *Authorizer) refreshKeys(ctx context.Context, configuration Configuration, current []interface{}) {
+	timer := time.NewTimer(jittered(configuration.KeyRefreshInterval))
+	defer timer.Stop()
+
+	lastSuccess := time.Now()
+	var lastOnDemandRefresh time.Time
+
+	for {
+		select {
+		case <-timer.C:
+			timer.Reset(jittered(configuration.KeyRefreshInterval))
+		case <-a.keyRefreshes:
+			if time.Since(lastOnDemandRefresh) < minOnDemandKeyRefreshInterval {
+				continue
+			}
+			lastOnDemandRefresh = time.Now()
+		case <-ctx.Done():
+			a.logger.Warn("finalizing key refresh worker", zap.Error(ctx.Err()))
+			return
+		}
+
+		keys, err := configuration.KeyResolver.ResolveKeys(ctx)
+		if err != nil {
+			if stacktrace.GetCode(err) != dsserr.Unavailable || time.Since(lastSuccess) >= configuration.KeyTTL {
+				a.logger.Panic("failed to refresh key", zap.Error(err))
+			} else {
+				a.logger.Error("failed to refresh key, using cached keys", zap.Error(err))
+			}
+			continue
+		}
+
+		lastSuccess = time.Now()
+		if !sameKeys(keys, current) {
+			a.setKeys(keys)
+			current = keys
+		}
+	}
+}
+
+// requestKeyRefresh asks for the keys to be refreshed in the background, without waiting for it.
+func (a *Authorizer) requestKeyRefresh() {
+	select {
+	case a.keyRefreshes <- struct{}{}:
+	default:
+	}
+}
@@ -0,0 +1,244 @@
+package auth
+
+import (
+	"crypto/rand"
+	"crypto/rsa"
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"net/url"
+	"strconv"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/go-jose/go-jose/v4"
+	"github.com/golang-jwt/jwt/v4"
+	"github.com/stretchr/testify/require"
+)
+
+// stubJWKSServer serves a JWK set with an ETag changing each time a key is published, and counts the requests it
+// receives.
+type stubJWKSServer struct {
+	*httptest.Server
+	mu          sync.Mutex
+	jwks        jose.JSONWebKeySet
+	requests    int
+	notModified int
+}
+
+func newStubJWKSServer(t *testing.T) *stubJWKSServer {
+	s := &stubJWKSServer{}
+	s.Server = httptest.NewServer(http.HandlerFunc(s.serveJWKS))
+	t.Cleanup(s.Close)
+	return s
+}
+
+func (s *stubJWKSServer) serveJWKS(w http.ResponseWriter, r *http.Request) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	s.requests++
+	etag := strconv.Quote(strconv.Itoa(len(s.jwks.Keys)))
+	if r.Header.Get("If-None-Match") == etag {
+		s.notModified++
+		w.WriteHeader(http.StatusNotModified)
+		return
+	}
+	w.Header().Set("ETag", etag)
+	_ = json.NewEncoder(w).Encode(s.jwks)
+}
+
+func (s *stubJWKSServer) publish(kid string, key *rsa.PrivateKey) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	s.jwks.Keys = append(s.jwks.Keys, jose.JSONWebKey{Key: &key.PublicKey, KeyID: kid, Algorithm: "RS256", Use: "sig"})
+}
+
+func (s *stubJWKSServer) counts() (requests int, notModified int) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	return s.requests, s.notModified
+}
+
+func (s *stubJWKSServer) resolver(t *testing.T) *JWKSResolver {
+	endpoint, err := url.Parse(s.URL)
+	require.NoError(t, err)
+	return &JWKSResolver{Endpoint: endpoint}
+}
+
+func newJWKSAuthorizer(t *testing.T, s *stubJWKSServer, refreshInterval time.Duration, cacheSize int) *Authorizer {
+	a, err := NewRSAAuthorizer(t.Context(), Configuration{
+		KeyResolver:        s.resolver(t),
+		KeyRefreshInterval: refreshInterval,
+		KeyTTL:             time.Hour,
+		AcceptedAudiences:  []string{"test-aud"},
+		TokenCacheSize:     cacheSize,
+	})
+	require.NoError(t, err)
+	return a
+}
+
+func rsaTokenReqWithKeyID(key *rsa.PrivateKey, kid string, exp, nbf int64) *http.Request {
+	token := jwt.NewWithClaims(jwt.SigningMethodRS256, jwt.MapClaims{
+		"exp": exp,
+		"nbf": nbf,
+		"sub": "real_owner",
+		"iss": "baz",
+		"aud": "test-aud",
+	})
+	token.Header["kid"] = kid
+
+	tokenString, _ := token.SignedString(key)
+	req := &http.Request{Header: make(http.Header)}
+	req.Header.Set("Authorization", "Bearer "+tokenString)
+	return req
+}
+
+func generateKeys(t *testing.T, n int) []*rsa.PrivateKey {
+	keys := make([]*rsa.PrivateKey, n)
+	for i := range keys {
+		key, err := rsa.GenerateKey(rand.Reader, 1024)
+		require.NoError(t, err)
+		keys[i] = key
+	}
+	return keys
+}
+
+func TestJWKSResolverReusesKeysWhenNotModified(t *testing.T) {
+	key := generateKeys(t, 1)[0]
+	server := newStubJWKSServer(t)
+	server.publish("k1", key)
+	resolver := server.resolver(t)
+
+	first, err := resolver.ResolveKeys(t.Context())
+	require.NoError(t, err)
+	require.Len(t, first, 1)
+	require.Equal(t, "k1", first[0].(IdentifiedKey).ID)
+	require.True(t, key.PublicKey.Equal(first[0].(IdentifiedKey).Key))
+
+	second, err := resolver.ResolveKeys(t.Context())
+	require.NoError(t, err)
+	require.Equal(t, first, second)
+	requests, notModified := server.counts()
+	require.Equal(t, 2, requests)
+	require.Equal(t, 1, notModified)
+}
+
+func TestAuthorizerSelectsKeyByID(t *testing.T) {
+	setJWTTime(t, 42)
+	keys := generateKeys(t, 2)
+	server := newStubJWKSServer(t)
+	server.publish("k1", keys[0])
+	server.publish("k2", keys[1])
+	a := newJWKSAuthorizer(t, server, time.Hour, 0)
+
+	a.keyGuard.RLock()
+	require.Len(t, a.keysByID, 2)
+	a.keyGuard.RUnlock()
+
+	_, err := a.extractClaims(rsaTokenReqWithKeyID(keys[1], "k2", 100, 20))
+	require.NoError(t, err)
+
+	// Only the key with the ID of the token is tried
+	_, err = a.extractClaims(rsaTokenReqWithKeyID(keys[1], "k1", 100, 20))
+	require.Error(t, err)
+
+	// Tokens without ID are verified with each key
+	_, err = a.extractClaims(rsaTokenReq(keys[1], 100, 20))
+	require.NoError(t, err)
+}
+
+func TestAuthorizerRefreshesKeysForUnknownKeyID(t *testing.T) {
+	setJWTTime(t, 42)
+	keys := generateKeys(t, 2)
+	server := newStubJWKSServer(t)
+	server.publish("k1", keys[0])
+	a := newJWKSAuthorizer(t, server, time.Hour, 0)
+
+	server.publish("k2", keys[1])
+	req := rsaTokenReqWithKeyID(keys[1], "k2", 100, 20)
+	_, err := a.extractClaims(req)
+	require.Error(t, err)
+
+	require.Eventually(t, func() bool {
+		_, err := a.extractClaims(req)
+		return err == nil
+	}, time.Second, time.Millisecond)
+}
+
+func TestKeyRefreshKeepsUnchangedKeys(t *testing.T) {
+	setJWTTime(t, 42)
+	key := generateKeys(t, 1)[0]
+	server := newStubJWKSServer(t)
+	server.publish("k1", key)
+	a := newJWKSAuthorizer(t, server, time.Millisecond, 10)
+	generation := a.tokenCache.currentGeneration()
+	req := rsaTokenReqWithKeyID(key, "k1", 100, 20)
+
+	_, err := a.extractClaims(req)
+	require.NoError(t, err)
+
+	require.Eventually(t, func() bool {
+		_, notModified := server.counts()
+		return notModified >= 3
+	}, time.Second, time.Millisecond)
+
+	// Neither the keys nor the validated tokens were replaced
+	require.Equal(t, generation, a.tokenCache.currentGeneration())
+	_, err = a.extractClaims(req)
+	require.NoError(t, err)
+	hits, _ := a.TokenCacheStats()
+	require.Equal(t, int64(1), hits)
+}
+
+func TestJittered(t *testing.T) {
+	require.Equal(t, time.Duration(0), jittered(0))
+	for i := 0; i < 100; i++ {
+		d := jittered(time.Minute)
+		require.GreaterOrEqual(t, d, 54*time.Second)
+		require.LessOrEqual(t, d, 66*time.Second)
+	}
+}
+
+// BenchmarkKeySelection measures the verification of a token signed with the last of several keys, depending on
+// whether the token identifies its key.
+func BenchmarkKeySelection(b *testing.B) {
+	jwt.TimeFunc = func() time.Time {
+		return time.Unix(42, 0)
+	}
+	defer func() {
+		jwt.TimeFunc = time.Now
+	}()
+
+	var resolved []interface{}
+	var last *rsa.PrivateKey
+	for i := 0; i < 4; i++ {
+		key, err := rsa.GenerateKey(rand.Reader, 2048)
+		require.NoError(b, err)
+		resolved = append(resolved, IdentifiedKey{ID: strconv.Itoa(i), Key: &key.PublicKey})
+		last = key
+	}
+	a, err := NewRSAAuthorizer(b.Context(), Configuration{
+		KeyResolver:        &fromMemoryKeyResolver{Keys: resolved},
+		KeyRefreshInterval: time.Hour,
+	})
+	require.NoError(b, err)
+
+	for _, bc := range []struct {
+		name string
+		req  *http.Request
+	}{
+		{"WithoutKeyID", rsaTokenReq(last, 100, 20)},
+		{"WithKeyID", rsaTokenReqWithKeyID(last, "3", 100, 20)},
+	} {
+		b.Run(bc.name, func(b *testing.B) {
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				if _, err := a.extractClaims(bc.req); err != nil {
+					b.Fatal(err)
+				}
+			}
+		})
+	}
+}
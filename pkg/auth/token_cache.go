@@ -0,0 +1,132 @@
+package auth
+
+import (
+	"container/list"
+	"crypto/sha256"
+	"sync"
+	"sync/atomic"
+	"time"
+
+	"github.com/interuss/dss/pkg/auth/claims"
+)
+
+// tokenCache is a bounded LRU cache of the claims of access tokens which signature and claims were already validated,
+// indexed by a hash of the raw token. Entries are only returned until the expiration of their token.
+type tokenCache struct {
+	mu       sync.Mutex
+	capacity int
+	entries  map[[sha256.Size]byte]*list.Element
+	// Most recently used entries are at the front.
+	lru *list.List
+	// Incremented each time the cache is purged, to ignore the tokens validated before the purge.
+	generation uint64
+
+	hits   atomic.Int64
+	misses atomic.Int64
+}
+
+type tokenCacheEntry struct {
+	key       [sha256.Size]byte
+	claims    claims.Claims
+	expiresAt time.Time
+}
+
+// newTokenCache returns a tokenCache holding up to capacity tokens, or nil if capacity is not positive. A nil
+// tokenCache caches nothing.
+func newTokenCache(capacity int) *tokenCache {
+	if capacity <= 0 {
+		return nil
+	}
+	return &tokenCache{
+		capacity: capacity,
+		entries:  make(map[[sha256.Size]byte]*list.Element, capacity),
+		lru:      list.New(),
+	}
+}
+
+func tokenCacheKey(token string) [sha256.Size]byte {
+	return sha256.Sum256([]byte(token))
+}
+
+// get returns the claims of the token if it was validated and has not expired at now. The returned claims are shared
+// and must not be modified.
+func (c *tokenCache) get(key [sha256.Size]byte, now time.Time) (claims.Claims, bool) {
+	if c == nil {
+		return claims.Claims{}, false
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	element, ok := c.entries[key]
+	if ok {
+		entry := element.Value.(*tokenCacheEntry)
+		if now.Before(entry.expiresAt) {
+			c.lru.MoveToFront(element)
+			c.hits.Add(1)
+			return entry.claims, true
+		}
+		c.lru.Remove(element)
+		delete(c.entries, key)
+	}
+	c.misses.Add(1)
+	return claims.Claims{}, false
+}
+
+// add caches the claims of a validated token until the token expires, unless the cache was purged since generation
+// was read.
+func (c *tokenCache) add(key [sha256.Size]byte, keyClaims claims.Claims, generation uint64) {
+	if c == nil || keyClaims.ExpiresAt == nil {
+		return
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if generation != c.generation {
+		return
+	}
+	if element, ok := c.entries[key]; ok {
+		c.lru.MoveToFront(element)
+		return
+	}
+	if c.lru.Len() >= c.capacity {
+		oldest := c.lru.Back()
+		c.lru.Remove(oldest)
+		delete(c.entries, oldest.Value.(*tokenCacheEntry).key)
+	}
+	c.entries[key] = c.lru.PushFront(&tokenCacheEntry{key: key, claims: keyClaims, expiresAt: keyClaims.ExpiresAt.Time})
+}
+
+// currentGeneration returns the generation to provide to add for the tokens about to be validated.
+func (c *tokenCache) currentGeneration() uint64 {
+	if c == nil {
+		return 0
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	return c.generation
+}
+
+// purge removes all the cached tokens.
+func (c *tokenCache) purge() {
+	if c == nil {
+		return
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.generation++
+	clear(c.entries)
+	c.lru.Init()
+}
+
+// TokenCacheStats returns the number of tokens found and not found in the cache of validated tokens since the creation
+// of the Authorizer.
+func (a *Authorizer) TokenCacheStats() (hits int64, misses int64) {
+	if a.tokenCache == nil {
+		return 0, 0
+	}
+	return a.tokenCache.hits.Load(), a.tokenCache.misses.Load()
+}
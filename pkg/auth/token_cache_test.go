@@ -0,0 +1,175 @@
+package auth
+
+import (
+	"crypto/rand"
+	"crypto/rsa"
+	"testing"
+	"time"
+
+	"github.com/golang-jwt/jwt/v4"
+	"github.com/interuss/dss/pkg/auth/claims"
+	"github.com/stretchr/testify/require"
+)
+
+func newCachingAuthorizer(t testing.TB, key *rsa.PrivateKey, cacheSize int) *Authorizer {
+	a, err := NewRSAAuthorizer(t.Context(), Configuration{
+		KeyResolver: &fromMemoryKeyResolver{
+			Keys: []interface{}{&key.PublicKey},
+		},
+		KeyRefreshInterval: time.Hour,
+		AcceptedAudiences:  []string{"test-aud"},
+		TokenCacheSize:     cacheSize,
+	})
+	require.NoError(t, err)
+	return a
+}
+
+func setJWTTime(t *testing.T, unix int64) {
+	jwt.TimeFunc = func() time.Time {
+		return time.Unix(unix, 0)
+	}
+	t.Cleanup(func() {
+		jwt.TimeFunc = time.Now
+	})
+}
+
+func TestTokenCacheHitsUntilExpiration(t *testing.T) {
+	setJWTTime(t, 42)
+	key, err := rsa.GenerateKey(rand.Reader, 1024)
+	require.NoError(t, err)
+	a := newCachingAuthorizer(t, key, 10)
+	req := rsaTokenReq(key, 100, 20)
+
+	first, err := a.extractClaims(req)
+	require.NoError(t, err)
+	second, err := a.extractClaims(req)
+	require.NoError(t, err)
+	require.Equal(t, first, second)
+	hits, misses := a.TokenCacheStats()
+	require.Equal(t, int64(1), hits)
+	require.Equal(t, int64(1), misses)
+
+	// Once expired, the token is validated again, and rejected
+	setJWTTime(t, 150)
+	_, err = a.extractClaims(req)
+	require.Error(t, err)
+	hits, misses = a.TokenCacheStats()
+	require.Equal(t, int64(1), hits)
+	require.Equal(t, int64(2), misses)
+}
+
+func TestTokenCacheDoesNotCacheInvalidTokens(t *testing.T) {
+	setJWTTime(t, 42)
+	key, err := rsa.GenerateKey(rand.Reader, 1024)
+	require.NoError(t, err)
+	badKey, err := rsa.GenerateKey(rand.Reader, 1024)
+	require.NoError(t, err)
+	a := newCachingAuthorizer(t, key, 10)
+	req := rsaTokenReq(badKey, 100, 20)
+
+	for i := 0; i < 2; i++ {
+		_, err = a.extractClaims(req)
+		require.Error(t, err)
+	}
+	hits, misses := a.TokenCacheStats()
+	require.Equal(t, int64(0), hits)
+	require.Equal(t, int64(2), misses)
+}
+
+func TestTokenCacheInvalidatedBySetKeys(t *testing.T) {
+	setJWTTime(t, 42)
+	key, err := rsa.GenerateKey(rand.Reader, 1024)
+	require.NoError(t, err)
+	newKey, err := rsa.GenerateKey(rand.Reader, 1024)
+	require.NoError(t, err)
+	a := newCachingAuthorizer(t, key, 10)
+	req := rsaTokenReq(key, 100, 20)
+
+	_, err = a.extractClaims(req)
+	require.NoError(t, err)
+
+	// The token was signed with a key which is not trusted anymore
+	a.setKeys([]interface{}{&newKey.PublicKey})
+	_, err = a.extractClaims(req)
+	require.Error(t, err)
+}
+
+func TestTokenCacheEvictsLeastRecentlyUsed(t *testing.T) {
+	c := newTokenCache(2)
+	now := time.Unix(42, 0)
+	entry := claims.Claims{RegisteredClaims: jwt.RegisteredClaims{ExpiresAt: jwt.NewNumericDate(time.Unix(100, 0))}}
+	k1, k2, k3 := tokenCacheKey("1"), tokenCacheKey("2"), tokenCacheKey("3")
+
+	c.add(k1, entry, c.currentGeneration())
+	c.add(k2, entry, c.currentGeneration())
+	_, ok := c.get(k1, now)
+	require.True(t, ok)
+	c.add(k3, entry, c.currentGeneration())
+
+	_, ok = c.get(k2, now)
+	require.False(t, ok)
+	_, ok = c.get(k1, now)
+	require.True(t, ok)
+	_, ok = c.get(k3, now)
+	require.True(t, ok)
+}
+
+func TestTokenCacheIgnoresTokensValidatedBeforePurge(t *testing.T) {
+	c := newTokenCache(2)
+	entry := claims.Claims{RegisteredClaims: jwt.RegisteredClaims{ExpiresAt: jwt.NewNumericDate(time.Unix(100, 0))}}
+	k := tokenCacheKey("1")
+
+	generation := c.currentGeneration()
+	c.purge()
+	c.add(k, entry, generation)
+
+	_, ok := c.get(k, time.Unix(42, 0))
+	require.False(t, ok)
+}
+
+func TestNilTokenCache(t *testing.T) {
+	c := newTokenCache(0)
+	require.Nil(t, c)
+	c.add(tokenCacheKey("1"), claims.Claims{}, c.currentGeneration())
+	_, ok := c.get(tokenCacheKey("1"), time.Now())
+	require.False(t, ok)
+	c.purge()
+}
+
+// BenchmarkAuthorization measures the authorization cost of a request reusing the token of previous requests.
+func BenchmarkAuthorization(b *testing.B) {
+	jwt.TimeFunc = func() time.Time {
+		return time.Unix(42, 0)
+	}
+	defer func() {
+		jwt.TimeFunc = time.Now
+	}()
+
+	key, err := rsa.GenerateKey(rand.Reader, 2048)
+	require.NoError(b, err)
+	req := rsaTokenReq(key, 100, 20)
+
+	for _, bc := range []struct {
+		name      string
+		cacheSize int
+	}{
+		{"WithoutCache", 0},
+		{"WithCache", 10000},
+	} {
+		b.Run(bc.name, func(b *testing.B) {
+			a := newCachingAuthorizer(b, key, bc.cacheSize)
+			b.ReportAllocs()
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				keyClaims, err := a.extractClaims(req)
+				if err != nil {
+					b.Fatal(err)
+				}
+				res := a.Authorize(nil, req.WithContext(claims.NewContext(req.Context(), keyClaims)), nil, nil)
+				if res.Error != nil {
+					b.Fatal(res.Error)
+				}
+			}
+		})
+	}
+}
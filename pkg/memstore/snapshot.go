@@ -0,0 +1,399 @@
+package memstore
+
+import (
+	"bufio"
+	"encoding/binary"
+	"hash/crc32"
+	"io"
+	"math"
+	"time"
+
+	"github.com/golang/geo/s2"
+	"github.com/interuss/stacktrace"
+)
+
+// Snapshot format
+//
+// A snapshot starts with snapshotMagic and the uvarint version of the repo-specific content, followed by sections and
+// a 0 byte marking the end of the snapshot. Each section starts with the uvarint length of its name plus one, then its
+// name, then chunks of records. Each chunk is a uvarint length followed by that many bytes holding whole records; a
+// 0 length marks the end of the section and is followed by the little-endian CRC-32C of all the chunks of the section.
+
+var snapshotMagic = []byte("DSSMEMSNAP")
+
+const (
+	// snapshotChunkSize is the size above which buffered records are written out as a chunk.
+	snapshotChunkSize = 64 << 10
+	// maxSnapshotChunkSize bounds the memory allocated for a chunk read from an untrusted snapshot.
+	maxSnapshotChunkSize = 64 << 20
+	// maxSnapshotSectionNameSize bounds the size of section names.
+	maxSnapshotSectionNameSize = 256
+)
+
+var snapshotCRCTable = crc32.MakeTable(crc32.Castagnoli)
+
+// SnapshotWriter streams a snapshot to an io.Writer. Records are appended field by field to the current chunk,
+// which is written out once it exceeds snapshotChunkSize, so that only one chunk is held in memory at a time.
+// Errors are sticky: once one occurs, later calls do nothing and Close returns it.
+type SnapshotWriter struct {
+	w         io.Writer
+	chunk     []byte
+	crc       uint32
+	inSection bool
+	err       error
+}
+
+// NewSnapshotWriter starts a snapshot of the provided version on w.
+func NewSnapshotWriter(w io.Writer, version int) *SnapshotWriter {
+	sw := &SnapshotWriter{w: w, chunk: make([]byte, 0, 2*snapshotChunkSize)}
+	header := binary.AppendUvarint(append([]byte{}, snapshotMagic...), uint64(version))
+	sw.write(header)
+	return sw
+}
+
+func (sw *SnapshotWriter) write(b []byte) {
+	if sw.err != nil {
+		return
+	}
+	if _, err := sw.w.Write(b); err != nil {
+		sw.err = stacktrace.Propagate(err, "Failed to write memstore snapshot")
+	}
+}
+
+// BeginSection starts a section holding the records written until EndSection.
+func (sw *SnapshotWriter) BeginSection(name string) {
+	if sw.inSection && sw.err == nil {
+		sw.err = stacktrace.NewError("Snapshot section %s started before the end of the previous one", name)
+	}
+	header := binary.AppendUvarint(nil, uint64(len(name))+1)
+	sw.write(append(header, name...))
+	sw.crc = 0
+	sw.inSection = true
+}
+
+// EndRecord marks the end of a record. Records never span chunks.
+func (sw *SnapshotWriter) EndRecord() {
+	if len(sw.chunk) >= snapshotChunkSize {
+		sw.flushChunk()
+	}
+}
+
+func (sw *SnapshotWriter) flushChunk() {
+	if len(sw.chunk) == 0 {
+		return
+	}
+	sw.crc = crc32.Update(sw.crc, snapshotCRCTable, sw.chunk)
+	sw.write(binary.AppendUvarint(nil, uint64(len(sw.chunk))))
+	sw.write(sw.chunk)
+	sw.chunk = sw.chunk[:0]
+}
+
+// EndSection writes the remaining records of the current section, followed by its checksum.
+func (sw *SnapshotWriter) EndSection() {
+	sw.flushChunk()
+	trailer := []byte{0}
+	sw.write(binary.LittleEndian.AppendUint32(trailer, sw.crc))
+	sw.inSection = false
+}
+
+// Close ends the snapshot and returns the first error encountered while writing it. It does not close the
+// underlying io.Writer.
+func (sw *SnapshotWriter) Close() error {
+	if sw.inSection && sw.err == nil {
+		sw.err = stacktrace.NewError("Snapshot ended before the end of its last section")
+	}
+	sw.write([]byte{0})
+	return sw.err
+}
+
+func (sw *SnapshotWriter) Uint(v uint64) {
+	sw.chunk = binary.AppendUvarint(sw.chunk, v)
+}
+
+func (sw *SnapshotWriter) Int(v int64) {
+	sw.chunk = binary.AppendVarint(sw.chunk, v)
+}
+
+func (sw *SnapshotWriter) Bool(v bool) {
+	if v {
+		sw.chunk = append(sw.chunk, 1)
+	} else {
+		sw.chunk = append(sw.chunk, 0)
+	}
+}
+
+func (sw *SnapshotWriter) String(v string) {
+	sw.Uint(uint64(len(v)))
+	sw.chunk = append(sw.chunk, v...)
+}
+
+func (sw *SnapshotWriter) Float32(v float32) {
+	sw.chunk = binary.LittleEndian.AppendUint32(sw.chunk, math.Float32bits(v))
+}
+
+// Time writes t with its location offset, as time.Time.MarshalBinary does.
+func (sw *SnapshotWriter) Time(t time.Time) {
+	// The binary encoding of a time is shorter than 128 bytes, so its length prefix takes a single byte.
+	start := len(sw.chunk)
+	chunk, err := t.AppendBinary(append(sw.chunk, 0))
+	if err != nil {
+		if sw.err == nil {
+			sw.err = stacktrace.Propagate(err, "Failed to encode time in memstore snapshot")
+		}
+		sw.chunk = sw.chunk[:start]
+		return
+	}
+	chunk[start] = byte(len(chunk) - start - 1)
+	sw.chunk = chunk
+}
+
+func (sw *SnapshotWriter) TimePtr(t *time.Time) {
+	sw.Bool(t != nil)
+	if t != nil {
+		sw.Time(*t)
+	}
+}
+
+func (sw *SnapshotWriter) Float32Ptr(v *float32) {
+	sw.Bool(v != nil)
+	if v != nil {
+		sw.Float32(*v)
+	}
+}
+
+func (sw *SnapshotWriter) Cells(cells s2.CellUnion) {
+	sw.Uint(uint64(len(cells)))
+	for _, cell := range cells {
+		sw.chunk = binary.LittleEndian.AppendUint64(sw.chunk, uint64(cell))
+	}
+}
+
+// SnapshotReader streams a snapshot written by SnapshotWriter from an io.Reader, one chunk at a time. The checksum
+// of each section is verified once all its records have been read, so a snapshot must be read to its end before
+// its content is trusted. Errors are sticky: once one occurs, reads return zero values and Err returns it.
+type SnapshotReader struct {
+	r         *bufio.Reader
+	version   int
+	buf       []byte
+	chunk     []byte
+	crc       uint32
+	inSection bool
+	err       error
+}
+
+// NewSnapshotReader reads the header of the snapshot provided by r.
+func NewSnapshotReader(r io.Reader) (*SnapshotReader, error) {
+	sr := &SnapshotReader{r: bufio.NewReader(r)}
+	magic := make([]byte, len(snapshotMagic))
+	if _, err := io.ReadFull(sr.r, magic); err != nil || string(magic) != string(snapshotMagic) {
+		return nil, stacktrace.NewError("Data is not a memstore snapshot")
+	}
+	version, err := binary.ReadUvarint(sr.r)
+	if err != nil {
+		return nil, stacktrace.Propagate(err, "Failed to read memstore snapshot version")
+	}
+	sr.version = int(version)
+	return sr, nil
+}
+
+// Version returns the version of the snapshot, as provided to NewSnapshotWriter.
+func (sr *SnapshotReader) Version() int {
+	return sr.version
+}
+
+// Err returns the first error encountered while reading the snapshot.
+func (sr *SnapshotReader) Err() error {
+	return sr.err
+}
+
+func (sr *SnapshotReader) fail(err error, msg string) {
+	if sr.err != nil {
+		return
+	}
+	if err == io.EOF {
+		err = io.ErrUnexpectedEOF
+	}
+	if err != nil {
+		sr.err = stacktrace.Propagate(err, "%s", msg)
+	} else {
+		sr.err = stacktrace.NewError("%s", msg)
+	}
+}
+
+// NextSection skips what remains of the current section and moves to the next one. It returns the name of that
+// section, or ok=false at the end of the snapshot.
+func (sr *SnapshotReader) NextSection() (name string, ok bool, err error) {
+	for sr.More() {
+		sr.chunk = nil
+	}
+	if sr.err != nil {
+		return "", false, sr.err
+	}
+	n, err := binary.ReadUvarint(sr.r)
+	if err != nil {
+		sr.fail(err, "Failed to read memstore snapshot section")
+		return "", false, sr.err
+	}
+	if n == 0 {
+		return "", false, nil
+	}
+	if n-1 > maxSnapshotSectionNameSize {
+		sr.fail(nil, "Invalid memstore snapshot section name")
+		return "", false, sr.err
+	}
+	b := make([]byte, n-1)
+	if _, err := io.ReadFull(sr.r, b); err != nil {
+		sr.fail(err, "Failed to read memstore snapshot section name")
+		return "", false, sr.err
+	}
+	sr.crc = 0
+	sr.inSection = true
+	return string(b), true, nil
+}
+
+// More reports whether the current section has records left to read. At the end of the section, it verifies its
+// checksum.
+func (sr *SnapshotReader) More() bool {
+	if sr.err != nil || !sr.inSection {
+		return false
+	}
+	if len(sr.chunk) > 0 {
+		return true
+	}
+	n, err := binary.ReadUvarint(sr.r)
+	if err != nil {
+		sr.fail(err, "Failed to read memstore snapshot chunk")
+		return false
+	}
+	if n == 0 {
+		var sum [4]byte
+		if _, err := io.ReadFull(sr.r, sum[:]); err != nil {
+			sr.fail(err, "Failed to read memstore snapshot section checksum")
+			return false
+		}
+		if binary.LittleEndian.Uint32(sum[:]) != sr.crc {
+			sr.fail(nil, "Memstore snapshot section checksum mismatch")
+			return false
+		}
+		sr.inSection = false
+		return false
+	}
+	if n > maxSnapshotChunkSize {
+		sr.fail(nil, "Invalid memstore snapshot chunk size")
+		return false
+	}
+	if uint64(cap(sr.buf)) < n {
+		sr.buf = make([]byte, n)
+	}
+	sr.chunk = sr.buf[:n]
+	if _, err := io.ReadFull(sr.r, sr.chunk); err != nil {
+		sr.fail(err, "Failed to read memstore snapshot chunk")
+		return false
+	}
+	sr.crc = crc32.Update(sr.crc, snapshotCRCTable, sr.chunk)
+	return true
+}
+
+// next consumes and returns the next n bytes of the current chunk.
+func (sr *SnapshotReader) next(n uint64) []byte {
+	if sr.err != nil {
+		return nil
+	}
+	if uint64(len(sr.chunk)) < n {
+		sr.fail(nil, "Truncated record in memstore snapshot")
+		sr.chunk = nil
+		return nil
+	}
+	b := sr.chunk[:n]
+	sr.chunk = sr.chunk[n:]
+	return b
+}
+
+func (sr *SnapshotReader) Uint() uint64 {
+	if sr.err != nil {
+		return 0
+	}
+	v, n := binary.Uvarint(sr.chunk)
+	if n <= 0 {
+		sr.fail(nil, "Invalid integer in memstore snapshot")
+		return 0
+	}
+	sr.chunk = sr.chunk[n:]
+	return v
+}
+
+func (sr *SnapshotReader) Int() int64 {
+	if sr.err != nil {
+		return 0
+	}
+	v, n := binary.Varint(sr.chunk)
+	if n <= 0 {
+		sr.fail(nil, "Invalid integer in memstore snapshot")
+		return 0
+	}
+	sr.chunk = sr.chunk[n:]
+	return v
+}
+
+func (sr *SnapshotReader) Bool() bool {
+	b := sr.next(1)
+	return b != nil && b[0] != 0
+}
+
+func (sr *SnapshotReader) String() string {
+	return string(sr.next(sr.Uint()))
+}
+
+func (sr *SnapshotReader) Float32() float32 {
+	b := sr.next(4)
+	if b == nil {
+		return 0
+	}
+	return math.Float32frombits(binary.LittleEndian.Uint32(b))
+}
+
+func (sr *SnapshotReader) Time() time.Time {
+	var t time.Time
+	b := sr.next(sr.Uint())
+	if b == nil {
+		return t
+	}
+	if err := t.UnmarshalBinary(b); err != nil {
+		sr.fail(err, "Invalid time in memstore snapshot")
+	}
+	return t
+}
+
+func (sr *SnapshotReader) TimePtr() *time.Time {
+	if !sr.Bool() {
+		return nil
+	}
+	t := sr.Time()
+	return &t
+}
+
+func (sr *SnapshotReader) Float32Ptr() *float32 {
+	if !sr.Bool() {
+		return nil
+	}
+	v := sr.Float32()
+	return &v
+}
+
+// Cells reads a cell union, returning nil when it is empty.
+func (sr *SnapshotReader) Cells() s2.CellUnion {
+	n := sr.Uint()
+	if n > uint64(len(sr.chunk))/8 {
+		sr.fail(nil, "Truncated record in memstore snapshot")
+		return nil
+	}
+	b := sr.next(8 * n)
+	if len(b) == 0 {
+		return nil
+	}
+	cells := make(s2.CellUnion, n)
+	for i := range cells {
+		cells[i] = s2.CellID(binary.LittleEndian.Uint64(b[8*i:]))
+	}
+	return cells
+}
@@ -0,0 +1,194 @@
+package memstore
+
+import (
+	"bytes"
+	"fmt"
+	"testing"
+	"time"
+
+	"github.com/golang/geo/s2"
+	"github.com/stretchr/testify/require"
+)
+
+type snapshotTestRecord struct {
+	ID       string
+	Index    int64
+	Count    uint64
+	Flag     bool
+	Altitude *float32
+	Start    *time.Time
+	Updated  time.Time
+	Cells    s2.CellUnion
+}
+
+func snapshotTestRecords(n int) []snapshotTestRecord {
+	base := time.Date(2024, time.August, 14, 15, 48, 36, 123, time.FixedZone("CEST", 2*3600))
+	records := make([]snapshotTestRecord, n)
+	for i := range records {
+		rec := snapshotTestRecord{
+			ID:      fmt.Sprintf("00000185-e36d-40be-8d38-%012d", i),
+			Index:   int64(i) - int64(n/2),
+			Count:   uint64(i) << 40,
+			Flag:    i%2 == 0,
+			Updated: base.Add(time.Duration(i) * time.Second),
+		}
+		if i%3 == 0 {
+			altitude := float32(i) / 3
+			start := base.Add(-time.Duration(i) * time.Minute).UTC()
+			rec.Altitude, rec.Start = &altitude, &start
+		}
+		for j := 0; j < i%4; j++ {
+			rec.Cells = append(rec.Cells, s2.CellID(uint64(i)<<32|uint64(j)))
+		}
+		records[i] = rec
+	}
+	return records
+}
+
+func writeSnapshotTestRecords(sw *SnapshotWriter, section string, records []snapshotTestRecord) {
+	sw.BeginSection(section)
+	for _, rec := range records {
+		sw.String(rec.ID)
+		sw.Int(rec.Index)
+		sw.Uint(rec.Count)
+		sw.Bool(rec.Flag)
+		sw.Float32Ptr(rec.Altitude)
+		sw.TimePtr(rec.Start)
+		sw.Time(rec.Updated)
+		sw.Cells(rec.Cells)
+		sw.EndRecord()
+	}
+	sw.EndSection()
+}
+
+func readSnapshotTestRecords(sr *SnapshotReader) []snapshotTestRecord {
+	var records []snapshotTestRecord
+	for sr.More() {
+		records = append(records, snapshotTestRecord{
+			ID:       sr.String(),
+			Index:    sr.Int(),
+			Count:    sr.Uint(),
+			Flag:     sr.Bool(),
+			Altitude: sr.Float32Ptr(),
+			Start:    sr.TimePtr(),
+			Updated:  sr.Time(),
+			Cells:    sr.Cells(),
+		})
+	}
+	return records
+}
+
+// testSnapshot returns a snapshot holding a large section spanning several chunks, an empty section and a small one.
+func testSnapshot(t *testing.T) ([]byte, []snapshotTestRecord) {
+	records := snapshotTestRecords(5000)
+	var buf bytes.Buffer
+	sw := NewSnapshotWriter(&buf, 3)
+	writeSnapshotTestRecords(sw, "large", records)
+	writeSnapshotTestRecords(sw, "empty", nil)
+	writeSnapshotTestRecords(sw, "small", records[:3])
+	require.NoError(t, sw.Close())
+	require.Greater(t, buf.Len(), 2*snapshotChunkSize)
+	return buf.Bytes(), records
+}
+
+func TestSnapshotRoundTrip(t *testing.T) {
+	data, records := testSnapshot(t)
+	sr, err := NewSnapshotReader(bytes.NewReader(data))
+	require.NoError(t, err)
+	require.Equal(t, 3, sr.Version())
+
+	for _, want := range []struct {
+		name    string
+		records []snapshotTestRecord
+	}{{"large", records}, {"empty", nil}, {"small", records[:3]}} {
+		name, ok, err := sr.NextSection()
+		require.NoError(t, err)
+		require.True(t, ok)
+		require.Equal(t, want.name, name)
+		got := readSnapshotTestRecords(sr)
+		require.NoError(t, sr.Err())
+		require.Equal(t, len(want.records), len(got))
+		for i := range got {
+			require.True(t, want.records[i].Updated.Equal(got[i].Updated))
+			require.Equal(t, want.records[i].Updated.Format(time.RFC3339Nano), got[i].Updated.Format(time.RFC3339Nano))
+			got[i].Updated = want.records[i].Updated
+			require.Equal(t, want.records[i], got[i])
+		}
+	}
+	_, ok, err := sr.NextSection()
+	require.NoError(t, err)
+	require.False(t, ok)
+}
+
+func TestSnapshotSkipsUnreadRecords(t *testing.T) {
+	data, records := testSnapshot(t)
+	sr, err := NewSnapshotReader(bytes.NewReader(data))
+	require.NoError(t, err)
+
+	name, ok, err := sr.NextSection()
+	require.NoError(t, err)
+	require.True(t, ok)
+	require.Equal(t, "large", name)
+	require.True(t, sr.More())
+	require.Equal(t, records[0].ID, sr.String())
+
+	for _, want := range []string{"empty", "small"} {
+		name, ok, err = sr.NextSection()
+		require.NoError(t, err)
+		require.True(t, ok)
+		require.Equal(t, want, name)
+	}
+	require.Len(t, readSnapshotTestRecords(sr), 3)
+	_, ok, err = sr.NextSection()
+	require.NoError(t, err)
+	require.False(t, ok)
+}
+
+// readAll reads every section of a snapshot and returns the first error encountered.
+func readAll(data []byte) error {
+	sr, err := NewSnapshotReader(bytes.NewReader(data))
+	if err != nil {
+		return err
+	}
+	for {
+		_, ok, err := sr.NextSection()
+		if err != nil || !ok {
+			return err
+		}
+		readSnapshotTestRecords(sr)
+		if err := sr.Err(); err != nil {
+			return err
+		}
+	}
+}
+
+func TestSnapshotDetectsCorruption(t *testing.T) {
+	data, _ := testSnapshot(t)
+	require.NoError(t, readAll(data))
+
+	require.Error(t, readAll(nil))
+	require.Error(t, readAll([]byte("random value that is definitely not valid")))
+	for _, n := range []int{len(snapshotMagic) + 1, len(data) / 3, len(data) / 2, len(data) - 5, len(data) - 1} {
+		require.Error(t, readAll(data[:n]), "truncated to %d bytes", n)
+	}
+	for _, i := range []int{len(snapshotMagic) + 10, len(data) / 3, len(data) / 2, len(data) - 10} {
+		corrupted := bytes.Clone(data)
+		corrupted[i] ^= 0x01
+		require.Error(t, readAll(corrupted), "byte %d corrupted", i)
+	}
+}
+
+func BenchmarkSnapshotWriter(b *testing.B) {
+	records := snapshotTestRecords(10000)
+	var buf bytes.Buffer
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		buf.Reset()
+		sw := NewSnapshotWriter(&buf, 1)
+		writeSnapshotTestRecords(sw, "records", records)
+		if err := sw.Close(); err != nil {
+			b.Fatal(err)
+		}
+	}
+	b.SetBytes(int64(buf.Len()))
+}
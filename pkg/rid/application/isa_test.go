@@ -49,6 +49,18 @@ func (store *isaStore) DeleteISA(ctx context.Context, isa *ridmodels.Identificat
 	return isa, nil
 }
 
+// Implements repos.ISA.DeleteISAs
+func (store *isaStore) DeleteISAs(ctx context.Context, ids []dssmodels.ID) (int64, error) {
+	var deleted int64
+	for _, id := range ids {
+		if _, ok := store.isas[id]; ok {
+			delete(store.isas, id)
+			deleted++
+		}
+	}
+	return deleted, nil
+}
+
 // Implements repos.ISA.InsertISA
 func (store *isaStore) InsertISA(ctx context.Context, isa *ridmodels.IdentificationServiceArea) (*ridmodels.IdentificationServiceArea, error) {
 	storedCopy := *isa
@@ -85,10 +97,15 @@ func (store *isaStore) SearchISAs(ctx context.Context, cells s2.CellUnion, earli
 }
 
 // Implements repos.ISA.ListExpiredISAs
-func (store *isaStore) ListExpiredISAs(ctx context.Context, writer string, threshold time.Time) ([]*ridmodels.IdentificationServiceArea, error) {
+func (store *isaStore) ListExpiredISAs(ctx context.Context, writer string, threshold time.Time, limit int) ([]*ridmodels.IdentificationServiceArea, error) {
 	return make([]*ridmodels.IdentificationServiceArea, 0), nil
 }
 
+// Implements repos.ISA.CountExpiredISAs
+func (store *isaStore) CountExpiredISAs(ctx context.Context, writer string, threshold time.Time) (int64, error) {
+	return 0, nil
+}
+
 // Implements repos.ISA.CountISAs
 func (store *isaStore) CountISAs(ctx context.Context) (int64, error) {
 	return int64(len(store.isas)), nil
@@ -79,6 +79,17 @@ func (store *subscriptionStore) DeleteSubscription(ctx context.Context, s *ridmo
 	return nil, nil
 }
 
+func (store *subscriptionStore) DeleteSubscriptions(ctx context.Context, ids []dssmodels.ID) (int64, error) {
+	var deleted int64
+	for _, id := range ids {
+		if _, ok := store.subs[id]; ok {
+			delete(store.subs, id)
+			deleted++
+		}
+	}
+	return deleted, nil
+}
+
 func (store *subscriptionStore) InsertSubscription(ctx context.Context, s *ridmodels.Subscription) (*ridmodels.Subscription, error) {
 	storedCopy := *s
 	storedCopy.Version = dssmodels.VersionFromTime(time.Now())
@@ -158,10 +169,14 @@ func (store *subscriptionStore) SearchSubscriptions(ctx context.Context, cells s
 	return subs, nil
 }
 
-func (store *subscriptionStore) ListExpiredSubscriptions(ctx context.Context, writer string, threshold time.Time) ([]*ridmodels.Subscription, error) {
+func (store *subscriptionStore) ListExpiredSubscriptions(ctx context.Context, writer string, threshold time.Time, limit int) ([]*ridmodels.Subscription, error) {
 	return make([]*ridmodels.Subscription, 0), nil
 }
 
+func (store *subscriptionStore) CountExpiredSubscriptions(ctx context.Context, writer string, threshold time.Time) (int64, error) {
+	return 0, nil
+}
+
 // Implements repos.ISA.CountSubscriptions
 func (store *subscriptionStore) CountSubscriptions(ctx context.Context) (int64, error) {
 	return int64(len(store.subs)), nil
@@ -19,6 +19,10 @@ type ISA interface {
 	// Returns nil, nil if ID, version not found
 	DeleteISA(ctx context.Context, isa *ridmodels.IdentificationServiceArea) (*ridmodels.IdentificationServiceArea, error)
 
+	// DeleteISAs deletes the IdentificationServiceAreas identified by "ids" and returns the number of ISAs deleted.
+	// IDs that do not identify an existing ISA are ignored.
+	DeleteISAs(ctx context.Context, ids []dssmodels.ID) (int64, error)
+
 	// InsertISA inserts or updates an ISA.
 	InsertISA(ctx context.Context, isa *ridmodels.IdentificationServiceArea) (*ridmodels.IdentificationServiceArea, error)
 
@@ -29,8 +33,11 @@ type ISA interface {
 	// SearchISAs returns all subscriptions ownded by "owner" in "cells".
 	SearchISAs(ctx context.Context, cells s2.CellUnion, earliest *time.Time, latest *time.Time) ([]*ridmodels.IdentificationServiceArea, error)
 
-	// ListExpiredISAs lists all expired ISAs based on writer
-	ListExpiredISAs(ctx context.Context, writer string, threshold time.Time) ([]*ridmodels.IdentificationServiceArea, error)
+	// ListExpiredISAs lists at most "limit" expired ISAs based on writer
+	ListExpiredISAs(ctx context.Context, writer string, threshold time.Time, limit int) ([]*ridmodels.IdentificationServiceArea, error)
+
+	// CountExpiredISAs counts the expired ISAs based on writer, as listed by ListExpiredISAs.
+	CountExpiredISAs(ctx context.Context, writer string, threshold time.Time) (int64, error)
 
 	// Count the number of existing ISA
 	CountISAs(ctx context.Context) (int64, error)
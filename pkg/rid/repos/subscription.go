@@ -19,6 +19,10 @@ type Subscription interface {
 	// Returns nil, nil if ID, version not found
 	DeleteSubscription(ctx context.Context, sub *ridmodels.Subscription) (*ridmodels.Subscription, error)
 
+	// DeleteSubscriptions deletes the Subscriptions identified by "ids" and returns the number of Subscriptions deleted.
+	// IDs that do not identify an existing Subscription are ignored.
+	DeleteSubscriptions(ctx context.Context, ids []dssmodels.ID) (int64, error)
+
 	// InsertSubscription inserts or updates an ISA.
 	InsertSubscription(ctx context.Context, sub *ridmodels.Subscription) (*ridmodels.Subscription, error)
 
@@ -39,8 +43,11 @@ type Subscription interface {
 	// belonging to the given owner, and returns that number.
 	MaxSubscriptionCountInCellsByOwner(ctx context.Context, cells s2.CellUnion, owner dssmodels.Owner) (int, error)
 
-	// ListExpiredSubscriptions lists all expired Subscriptions based on writer.
-	ListExpiredSubscriptions(ctx context.Context, writer string, threshold time.Time) ([]*ridmodels.Subscription, error)
+	// ListExpiredSubscriptions lists at most "limit" expired Subscriptions based on writer.
+	ListExpiredSubscriptions(ctx context.Context, writer string, threshold time.Time, limit int) ([]*ridmodels.Subscription, error)
+
+	// CountExpiredSubscriptions counts the expired Subscriptions based on writer, as listed by ListExpiredSubscriptions.
+	CountExpiredSubscriptions(ctx context.Context, writer string, threshold time.Time) (int64, error)
 
 	// Count the number of existing subscriptions
 	CountSubscriptions(ctx context.Context) (int64, error)
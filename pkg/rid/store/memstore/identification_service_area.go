@@ -96,6 +96,10 @@ func (r *repo) DeleteISA(_ context.Context, isa *ridmodels.IdentificationService
 	return out, nil
 }
 
+func (r *repo) DeleteISAs(_ context.Context, ids []dssmodels.ID) (int64, error) {
+	return deleteAll(r.state.ISAs, ids), nil
+}
+
 func (r *repo) SearchISAs(_ context.Context, cells s2.CellUnion, earliest *time.Time, latest *time.Time) ([]*ridmodels.IdentificationServiceArea, error) {
 	if len(cells) == 0 {
 		return nil, stacktrace.NewErrorWithCode(dsserr.BadRequest, "Missing cell IDs for query")
@@ -127,8 +131,12 @@ func (r *repo) SearchISAs(_ context.Context, cells s2.CellUnion, earliest *time.
 	return out, nil
 }
 
-func (r *repo) ListExpiredISAs(_ context.Context, writer string, threshold time.Time) ([]*ridmodels.IdentificationServiceArea, error) {
-	return listExpired[ridmodels.IdentificationServiceArea](r.state.ISAs, writer, threshold, dssmodels.MaxResultLimit), nil
+func (r *repo) ListExpiredISAs(_ context.Context, writer string, threshold time.Time, limit int) ([]*ridmodels.IdentificationServiceArea, error) {
+	return listExpired[ridmodels.IdentificationServiceArea](r.state.ISAs, writer, threshold, limit), nil
+}
+
+func (r *repo) CountExpiredISAs(_ context.Context, writer string, threshold time.Time) (int64, error) {
+	return countExpired[ridmodels.IdentificationServiceArea](r.state.ISAs, writer, threshold), nil
 }
 
 func (r *repo) CountISAs(_ context.Context) (int64, error) {
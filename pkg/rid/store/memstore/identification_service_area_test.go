@@ -254,9 +254,13 @@ func TestListExpiredISAs(t *testing.T) {
 	require.NoError(t, err)
 	require.NotNil(t, saOut2)
 
-	serviceAreas, err := repo.ListExpiredISAs(ctx, writer, fakeClock.Now().Add(-30*time.Minute))
+	serviceAreas, err := repo.ListExpiredISAs(ctx, writer, fakeClock.Now().Add(-30*time.Minute), dssmodels.MaxResultLimit)
 	require.NoError(t, err)
 	require.Len(t, serviceAreas, 1)
+
+	count, err := repo.CountExpiredISAs(ctx, writer, fakeClock.Now().Add(-30*time.Minute))
+	require.NoError(t, err)
+	require.Equal(t, int64(1), count)
 }
 
 func TestListExpiredISAsWithEmptyWriter(t *testing.T) {
@@ -287,11 +291,52 @@ func TestListExpiredISAsWithEmptyWriter(t *testing.T) {
 	require.NoError(t, err)
 	require.NotNil(t, saOut2)
 
-	serviceAreas, err := repo.ListExpiredISAs(ctx, "", fakeClock.Now().Add(-30*time.Minute))
+	serviceAreas, err := repo.ListExpiredISAs(ctx, "", fakeClock.Now().Add(-30*time.Minute), dssmodels.MaxResultLimit)
 	require.NoError(t, err)
 	require.Len(t, serviceAreas, 1)
 }
 
+func TestDeleteExpiredISAsByPage(t *testing.T) {
+	ctx := context.Background()
+	ctx = timestamp.WithRequestTimestamp(ctx, fakeClock.Now())
+	repo := setUpStore(t)
+
+	// Insert 5 ISAs with endtime to 30 minutes ago
+	for i := 0; i < 5; i++ {
+		isa := *serviceArea
+		startTime := fakeClock.Now().Add(-1 * time.Hour)
+		isa.StartTime = &startTime
+		endTime := fakeClock.Now().Add(-30 * time.Minute)
+		isa.EndTime = &endTime
+		isa.ID = dssmodels.ID(uuid.New().String())
+		_, err := repo.InsertISA(ctx, &isa)
+		require.NoError(t, err)
+	}
+
+	var pages int
+	for {
+		serviceAreas, err := repo.ListExpiredISAs(ctx, writer, fakeClock.Now().Add(-30*time.Minute), 2)
+		require.NoError(t, err)
+		require.LessOrEqual(t, len(serviceAreas), 2)
+		if len(serviceAreas) == 0 {
+			break
+		}
+		ids := make([]dssmodels.ID, 0, len(serviceAreas))
+		for _, isa := range serviceAreas {
+			ids = append(ids, isa.ID)
+		}
+		deleted, err := repo.DeleteISAs(ctx, ids)
+		require.NoError(t, err)
+		require.Equal(t, int64(len(ids)), deleted)
+		pages++
+	}
+	require.Equal(t, 3, pages)
+
+	count, err := repo.CountISAs(ctx)
+	require.NoError(t, err)
+	require.Equal(t, int64(0), count)
+}
+
 func TestStoreCountISAs(t *testing.T) {
 	ctx := context.Background()
 	ctx = timestamp.WithRequestTimestamp(ctx, fakeClock.Now())
@@ -2,42 +2,157 @@ package memstore
 
 import (
 	"bytes"
-	"encoding/gob"
+	"io"
 
+	"github.com/interuss/dss/pkg/memstore"
 	dssmodels "github.com/interuss/dss/pkg/models"
 	"github.com/interuss/stacktrace"
 )
 
-const snapshotVersion = 1
+// snapshotVersion is the version of the content of the snapshot sections. Version 1 was a gob-encoded state.
+const snapshotVersion = 2
 
-type snapshotEnvelope struct {
-	Version int
-	State   state
-}
+const (
+	isasSection          = "isas"
+	subscriptionsSection = "subscriptions"
+)
 
 func (r *repo) GetSnapshot() ([]byte, error) {
 	var buf bytes.Buffer
-	if err := gob.NewEncoder(&buf).Encode(snapshotEnvelope{Version: snapshotVersion, State: r.state}); err != nil {
-		return nil, stacktrace.Propagate(err, "Failed to encode memstore snapshot")
+	if err := r.WriteSnapshot(&buf); err != nil {
+		return nil, err
 	}
 	return buf.Bytes(), nil
 }
 
 func (r *repo) RestoreFromSnapshot(data []byte) error {
-	var env snapshotEnvelope
-	if err := gob.NewDecoder(bytes.NewReader(data)).Decode(&env); err != nil {
+	return r.ReadSnapshot(bytes.NewReader(data))
+}
+
+// WriteSnapshot streams the state of the repo to w, in the format of memstore.SnapshotWriter.
+func (r *repo) WriteSnapshot(w io.Writer) error {
+	sw := memstore.NewSnapshotWriter(w, snapshotVersion)
+
+	sw.BeginSection(isasSection)
+	for _, rec := range r.state.ISAs {
+		writeISARecord(sw, rec)
+	}
+	sw.EndSection()
+
+	sw.BeginSection(subscriptionsSection)
+	for _, rec := range r.state.Subscriptions {
+		writeSubscriptionRecord(sw, rec)
+	}
+	sw.EndSection()
+
+	if err := sw.Close(); err != nil {
+		return stacktrace.Propagate(err, "Failed to encode memstore snapshot")
+	}
+	return nil
+}
+
+// ReadSnapshot replaces the state of the repo with the snapshot streamed from rd. The state is left untouched if
+// the snapshot is invalid.
+func (r *repo) ReadSnapshot(rd io.Reader) error {
+	sr, err := memstore.NewSnapshotReader(rd)
+	if err != nil {
 		return stacktrace.Propagate(err, "Failed to decode memstore snapshot")
 	}
-	if env.Version != snapshotVersion {
-		return stacktrace.NewError("Unsupported memstore snapshot version %d, expected %d", env.Version, snapshotVersion)
+	if sr.Version() != snapshotVersion {
+		return stacktrace.NewError("Unsupported memstore snapshot version %d, expected %d", sr.Version(), snapshotVersion)
 	}
-	r.state = env.State
-	// gob decodes an empty map as nil; re-initialize to keep the repo writable.
-	if r.state.ISAs == nil {
-		r.state.ISAs = map[dssmodels.ID]*isaRecord{}
+
+	s := state{
+		ISAs:          map[dssmodels.ID]*isaRecord{},
+		Subscriptions: map[dssmodels.ID]*subscriptionRecord{},
 	}
-	if r.state.Subscriptions == nil {
-		r.state.Subscriptions = map[dssmodels.ID]*subscriptionRecord{}
+	for {
+		name, ok, err := sr.NextSection()
+		if err != nil {
+			return stacktrace.Propagate(err, "Failed to decode memstore snapshot")
+		}
+		if !ok {
+			break
+		}
+		switch name {
+		case isasSection:
+			for sr.More() {
+				rec := readISARecord(sr)
+				s.ISAs[rec.ID] = rec
+			}
+		case subscriptionsSection:
+			for sr.More() {
+				rec := readSubscriptionRecord(sr)
+				s.Subscriptions[rec.ID] = rec
+			}
+		default:
+			return stacktrace.NewError("Unknown section %s in memstore snapshot", name)
+		}
+		if err := sr.Err(); err != nil {
+			return stacktrace.Propagate(err, "Failed to decode memstore snapshot section %s", name)
+		}
 	}
+
+	r.state = s
 	return nil
 }
+
+func writeISARecord(sw *memstore.SnapshotWriter, rec *isaRecord) {
+	sw.String(rec.ID.String())
+	sw.String(rec.URL)
+	sw.String(rec.Owner.String())
+	sw.Cells(rec.Cells)
+	sw.TimePtr(rec.StartTime)
+	sw.TimePtr(rec.EndTime)
+	sw.Float32Ptr(rec.AltitudeHi)
+	sw.Float32Ptr(rec.AltitudeLo)
+	sw.String(rec.Writer)
+	sw.Time(rec.UpdatedAt)
+	sw.EndRecord()
+}
+
+func readISARecord(sr *memstore.SnapshotReader) *isaRecord {
+	return &isaRecord{
+		ID:         dssmodels.ID(sr.String()),
+		URL:        sr.String(),
+		Owner:      dssmodels.Owner(sr.String()),
+		Cells:      sr.Cells(),
+		StartTime:  sr.TimePtr(),
+		EndTime:    sr.TimePtr(),
+		AltitudeHi: sr.Float32Ptr(),
+		AltitudeLo: sr.Float32Ptr(),
+		Writer:     sr.String(),
+		UpdatedAt:  sr.Time(),
+	}
+}
+
+func writeSubscriptionRecord(sw *memstore.SnapshotWriter, rec *subscriptionRecord) {
+	sw.String(rec.ID.String())
+	sw.String(rec.URL)
+	sw.Int(int64(rec.NotificationIndex))
+	sw.String(rec.Owner.String())
+	sw.Cells(rec.Cells)
+	sw.TimePtr(rec.StartTime)
+	sw.TimePtr(rec.EndTime)
+	sw.Float32Ptr(rec.AltitudeHi)
+	sw.Float32Ptr(rec.AltitudeLo)
+	sw.String(rec.Writer)
+	sw.Time(rec.UpdatedAt)
+	sw.EndRecord()
+}
+
+func readSubscriptionRecord(sr *memstore.SnapshotReader) *subscriptionRecord {
+	return &subscriptionRecord{
+		ID:                dssmodels.ID(sr.String()),
+		URL:               sr.String(),
+		NotificationIndex: int(sr.Int()),
+		Owner:             dssmodels.Owner(sr.String()),
+		Cells:             sr.Cells(),
+		StartTime:         sr.TimePtr(),
+		EndTime:           sr.TimePtr(),
+		AltitudeHi:        sr.Float32Ptr(),
+		AltitudeLo:        sr.Float32Ptr(),
+		Writer:            sr.String(),
+		UpdatedAt:         sr.Time(),
+	}
+}
@@ -3,11 +3,11 @@ package memstore
 import (
 	"bytes"
 	"context"
-	"encoding/gob"
 	"testing"
 
 	"github.com/google/go-cmp/cmp"
 	"github.com/google/go-cmp/cmp/cmpopts"
+	"github.com/interuss/dss/pkg/memstore"
 	"github.com/interuss/dss/pkg/models"
 	"github.com/interuss/dss/pkg/timestamp"
 	"github.com/stretchr/testify/require"
@@ -80,6 +80,6 @@ func TestRestoreFromSnapshotInvalidData(t *testing.T) {
 
 func TestRestoreFromSnapshotVersionMismatch(t *testing.T) {
 	var buf bytes.Buffer
-	require.NoError(t, gob.NewEncoder(&buf).Encode(snapshotEnvelope{Version: snapshotVersion + 1}))
+	require.NoError(t, memstore.NewSnapshotWriter(&buf, snapshotVersion+1).Close())
 	require.Error(t, setUpStore(t).RestoreFromSnapshot(buf.Bytes()))
 }
@@ -29,7 +29,7 @@ type state struct {
 	Subscriptions map[dssmodels.ID]*subscriptionRecord
 }
 
-// isaRecord is the gob-serializable representation of an ISA. It intentionally
+// isaRecord is the serializable representation of an ISA. It intentionally
 // stores only primitive fields: the model's Version is never persisted, it is
 // derived from UpdatedAt on read.
 type isaRecord struct {
@@ -45,7 +45,7 @@ type isaRecord struct {
 	UpdatedAt  time.Time
 }
 
-// subscriptionRecord is the gob-serializable representation of a Subscription.
+// subscriptionRecord is the serializable representation of a Subscription.
 type subscriptionRecord struct {
 	ID                dssmodels.ID
 	URL               string
@@ -158,21 +158,48 @@ func (rec *subscriptionRecord) writerName() string { return rec.Writer } //nolin
 func listExpired[M any, R expiringRecord[M]](store map[dssmodels.ID]R, writer string, threshold time.Time, limit int) []*M {
 	var out []*M
 	for _, rec := range store {
-		if t := rec.endTime(); t == nil || t.After(threshold) { // TODO: Don't allow endtime to be null, see #1492
-			continue
-		}
-		if rec.writerName() != writer {
+		if !isExpired(rec, writer, threshold) {
 			continue
 		}
 		out = append(out, rec.toModel())
 
-		if limit > 0 && len(out) > limit { // This mimics sqlstore behaviour, but it's not very good.
+		if limit > 0 && len(out) >= limit { // mirror SQL "LIMIT $limit"
 			break
 		}
 	}
 	return out
 }
 
+// countExpired returns the number of records listed by listExpired without limit.
+func countExpired[M any, R expiringRecord[M]](store map[dssmodels.ID]R, writer string, threshold time.Time) int64 {
+	var count int64
+	for _, rec := range store {
+		if isExpired(rec, writer, threshold) {
+			count++
+		}
+	}
+	return count
+}
+
+func isExpired[M any, R expiringRecord[M]](rec R, writer string, threshold time.Time) bool {
+	if t := rec.endTime(); t == nil || t.After(threshold) { // TODO: Don't allow endtime to be null, see #1492
+		return false
+	}
+	return rec.writerName() == writer
+}
+
+// deleteAll deletes the records identified by ids from store and returns the number of records deleted.
+func deleteAll[R any](store map[dssmodels.ID]R, ids []dssmodels.ID) int64 {
+	var deleted int64
+	for _, id := range ids {
+		if _, ok := store[id]; ok {
+			delete(store, id)
+			deleted++
+		}
+	}
+	return deleted
+}
+
 func (rec *isaRecord) clone() *isaRecord {
 	cp := *rec
 	cp.Cells = slices.Clone(rec.Cells)
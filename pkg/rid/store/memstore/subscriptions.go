@@ -101,6 +101,10 @@ func (r *repo) DeleteSubscription(_ context.Context, s *ridmodels.Subscription)
 	return out, nil
 }
 
+func (r *repo) DeleteSubscriptions(_ context.Context, ids []dssmodels.ID) (int64, error) {
+	return deleteAll(r.state.Subscriptions, ids), nil
+}
+
 // liveSubscriptionsInCells yields the non-expired subscriptions touching cells,
 // optionally restricted to a single owner.
 func (r *repo) liveSubscriptionsInCells(now time.Time, cells s2.CellUnion, owner *dssmodels.Owner) iter.Seq[*subscriptionRecord] {
@@ -183,9 +187,12 @@ func (r *repo) MaxSubscriptionCountInCellsByOwner(ctx context.Context, cells s2.
 	return slices.Max(slices.Collect(maps.Values(counts))), nil
 }
 
-func (r *repo) ListExpiredSubscriptions(_ context.Context, writer string, threshold time.Time) ([]*ridmodels.Subscription, error) {
-	// TODO: This mimics sqlstore inconsistency of not limiting results there, compared to ISAs. Should it be normalized?
-	return listExpired[ridmodels.Subscription](r.state.Subscriptions, writer, threshold, 0), nil
+func (r *repo) ListExpiredSubscriptions(_ context.Context, writer string, threshold time.Time, limit int) ([]*ridmodels.Subscription, error) {
+	return listExpired[ridmodels.Subscription](r.state.Subscriptions, writer, threshold, limit), nil
+}
+
+func (r *repo) CountExpiredSubscriptions(_ context.Context, writer string, threshold time.Time) (int64, error) {
+	return countExpired[ridmodels.Subscription](r.state.Subscriptions, writer, threshold), nil
 }
 
 func (r *repo) CountSubscriptions(_ context.Context) (int64, error) {
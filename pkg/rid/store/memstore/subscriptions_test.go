@@ -302,9 +302,13 @@ func TestListExpiredSubscriptions(t *testing.T) {
 	require.NoError(t, err)
 	require.NotNil(t, subOut2)
 
-	subscriptions, err := repo.ListExpiredSubscriptions(ctx, writer, fakeClock.Now().Add(-30*time.Minute))
+	subscriptions, err := repo.ListExpiredSubscriptions(ctx, writer, fakeClock.Now().Add(-30*time.Minute), dssmodels.MaxResultLimit)
 	require.NoError(t, err)
 	require.Len(t, subscriptions, 1)
+
+	count, err := repo.CountExpiredSubscriptions(ctx, writer, fakeClock.Now().Add(-30*time.Minute))
+	require.NoError(t, err)
+	require.Equal(t, int64(1), count)
 }
 
 func TestListExpiredSubscriptionsWithEmptyWriter(t *testing.T) {
@@ -335,7 +339,7 @@ func TestListExpiredSubscriptionsWithEmptyWriter(t *testing.T) {
 	require.NoError(t, err)
 	require.NotNil(t, subOut2)
 
-	subscriptions, err := repo.ListExpiredSubscriptions(ctx, "", fakeClock.Now().Add(-30*time.Minute))
+	subscriptions, err := repo.ListExpiredSubscriptions(ctx, "", fakeClock.Now().Add(-30*time.Minute), dssmodels.MaxResultLimit)
 	require.NoError(t, err)
 	require.Len(t, subscriptions, 1)
 }
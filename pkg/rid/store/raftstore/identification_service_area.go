@@ -19,6 +19,10 @@ func (r *repo) DeleteISA(_ context.Context, isa *ridmodels.IdentificationService
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "DeleteISA not implemented for raftstore")
 }
 
+func (r *repo) DeleteISAs(_ context.Context, ids []dssmodels.ID) (int64, error) {
+	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "DeleteISAs not implemented for raftstore")
+}
+
 func (r *repo) InsertISA(_ context.Context, isa *ridmodels.IdentificationServiceArea) (*ridmodels.IdentificationServiceArea, error) {
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "InsertISA not implemented for raftstore")
 }
@@ -31,10 +35,14 @@ func (r *repo) SearchISAs(_ context.Context, cells s2.CellUnion, earliest *time.
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "SearchISAs not implemented for raftstore")
 }
 
-func (r *repo) ListExpiredISAs(_ context.Context, writer string, threshold time.Time) ([]*ridmodels.IdentificationServiceArea, error) {
+func (r *repo) ListExpiredISAs(_ context.Context, writer string, threshold time.Time, limit int) ([]*ridmodels.IdentificationServiceArea, error) {
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "ListExpiredISAs not implemented for raftstore")
 }
 
+func (r *repo) CountExpiredISAs(_ context.Context, writer string, threshold time.Time) (int64, error) {
+	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "CountExpiredISAs not implemented for raftstore")
+}
+
 func (r *repo) CountISAs(_ context.Context) (int64, error) {
 	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "CountISAs not implemented for raftstore")
 }
@@ -19,6 +19,10 @@ func (r *repo) DeleteSubscription(_ context.Context, sub *ridmodels.Subscription
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "DeleteSubscription not implemented for raftstore")
 }
 
+func (r *repo) DeleteSubscriptions(_ context.Context, ids []dssmodels.ID) (int64, error) {
+	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "DeleteSubscriptions not implemented for raftstore")
+}
+
 func (r *repo) InsertSubscription(_ context.Context, sub *ridmodels.Subscription) (*ridmodels.Subscription, error) {
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "InsertSubscription not implemented for raftstore")
 }
@@ -43,10 +47,14 @@ func (r *repo) MaxSubscriptionCountInCellsByOwner(_ context.Context, cells s2.Ce
 	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "MaxSubscriptionCountInCellsByOwner not implemented for raftstore")
 }
 
-func (r *repo) ListExpiredSubscriptions(_ context.Context, writer string, threshold time.Time) ([]*ridmodels.Subscription, error) {
+func (r *repo) ListExpiredSubscriptions(_ context.Context, writer string, threshold time.Time, limit int) ([]*ridmodels.Subscription, error) {
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "ListExpiredSubscriptions not implemented for raftstore")
 }
 
+func (r *repo) CountExpiredSubscriptions(_ context.Context, writer string, threshold time.Time) (int64, error) {
+	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "CountExpiredSubscriptions not implemented for raftstore")
+}
+
 func (r *repo) CountSubscriptions(_ context.Context) (int64, error) {
 	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "CountSubscriptions not implemented for raftstore")
 }
@@ -178,6 +178,28 @@ func (r *repo) DeleteISA(ctx context.Context, isa *ridmodels.IdentificationServi
 	return r.fetchISA(ctx, deleteQuery, id, isa.Version.ToTimestamp())
 }
 
+// DeleteISAs deletes the IdentificationServiceAreas identified by "ids" and returns the number of ISAs deleted.
+func (r *repo) DeleteISAs(ctx context.Context, ids []dssmodels.ID) (int64, error) {
+	const deleteQuery = `
+		DELETE FROM
+			identification_service_areas
+		WHERE
+			id = ANY($1)`
+
+	if len(ids) == 0 {
+		return 0, nil
+	}
+	uids := make([]string, len(ids))
+	for i, id := range ids {
+		uids[i] = id.String()
+	}
+	res, err := r.Exec(ctx, deleteQuery, uids)
+	if err != nil {
+		return 0, stacktrace.Propagate(err, "Error in query: %s", deleteQuery)
+	}
+	return res.RowsAffected(), nil
+}
+
 // SearchISAs searches IdentificationServiceArea
 // instances that intersect with "cells" and, if set, the temporal volume
 // defined by "earliest" and "latest".
@@ -210,9 +232,9 @@ func (r *repo) SearchISAs(ctx context.Context, cells s2.CellUnion, earliest *tim
 	return r.fetchISAs(ctx, isasInCellsQuery, earliest, latest, dssql.CellUnionToCellIds(cells), dssmodels.MaxResultLimit)
 }
 
-// ListExpiredISAs lists all expired ISAs based on writer.
+// ListExpiredISAs lists at most limit expired ISAs based on writer.
 // The function queries both empty writer and null writer when passing empty string as a writer.
-func (r *repo) ListExpiredISAs(ctx context.Context, writer string, threshold time.Time) ([]*ridmodels.IdentificationServiceArea, error) {
+func (r *repo) ListExpiredISAs(ctx context.Context, writer string, threshold time.Time, limit int) ([]*ridmodels.IdentificationServiceArea, error) {
 	if len(writer) == 0 {
 		isasInCellsQuery := fmt.Sprintf(`
             SELECT
@@ -224,7 +246,7 @@ func (r *repo) ListExpiredISAs(ctx context.Context, writer string, threshold tim
             AND
                 (writer = '' OR writer IS NULL)
             LIMIT $2`, isaFields)
-		return r.fetchISAs(ctx, isasInCellsQuery, threshold, dssmodels.MaxResultLimit)
+		return r.fetchISAs(ctx, isasInCellsQuery, threshold, limit)
 	}
 
 	isasInCellsQuery := fmt.Sprintf(`
@@ -237,7 +259,44 @@ func (r *repo) ListExpiredISAs(ctx context.Context, writer string, threshold tim
         AND
             writer = $2
         LIMIT $3`, isaFields)
-	return r.fetchISAs(ctx, isasInCellsQuery, threshold, writer, dssmodels.MaxResultLimit)
+	return r.fetchISAs(ctx, isasInCellsQuery, threshold, writer, limit)
+}
+
+// CountExpiredISAs counts the expired ISAs based on writer, as listed by ListExpiredISAs.
+func (r *repo) CountExpiredISAs(ctx context.Context, writer string, threshold time.Time) (int64, error) {
+	var (
+		count int64
+		err   error
+	)
+	if len(writer) == 0 {
+		err = r.QueryRow(ctx, `
+            SELECT
+                COUNT(*)
+            FROM
+                identification_service_areas
+            WHERE
+                ends_at <= $1
+            AND
+                (writer = '' OR writer IS NULL)`,
+			threshold,
+		).Scan(&count)
+	} else {
+		err = r.QueryRow(ctx, `
+            SELECT
+                COUNT(*)
+            FROM
+                identification_service_areas
+            WHERE
+                ends_at <= $1
+            AND
+                writer = $2`,
+			threshold, writer,
+		).Scan(&count)
+	}
+	if err != nil {
+		return 0, stacktrace.Propagate(err, "Error counting expired ISAs")
+	}
+	return count, nil
 }
 
 func (r *repo) CountISAs(ctx context.Context) (int64, error) {
@@ -216,6 +216,29 @@ func (r *repo) DeleteSubscription(ctx context.Context, s *ridmodels.Subscription
 	return r.processOne(ctx, query, id, s.Version.ToTimestamp())
 }
 
+// DeleteSubscriptions deletes the subscriptions identified by "ids" and returns
+// the number of subscriptions deleted.
+func (r *repo) DeleteSubscriptions(ctx context.Context, ids []dssmodels.ID) (int64, error) {
+	const query = `
+		DELETE FROM
+			subscriptions
+		WHERE
+			id = ANY($1)`
+
+	if len(ids) == 0 {
+		return 0, nil
+	}
+	uids := make([]string, len(ids))
+	for i, id := range ids {
+		uids[i] = id.String()
+	}
+	res, err := r.Exec(ctx, query, uids)
+	if err != nil {
+		return 0, stacktrace.Propagate(err, "Error in query: %s", query)
+	}
+	return res.RowsAffected(), nil
+}
+
 // UpdateNotificationIdxsInCells incremement the notification for each sub in the given cells.
 func (r *repo) UpdateNotificationIdxsInCells(ctx context.Context, cells s2.CellUnion) ([]*ridmodels.Subscription, error) {
 
@@ -294,9 +317,9 @@ func (r *repo) SearchSubscriptionsByOwner(ctx context.Context, cells s2.CellUnio
 	return r.process(ctx, query, dssql.CellUnionToCellIds(cells), owner, r.clock.Now(), dssmodels.MaxResultLimit)
 }
 
-// ListExpiredSubscriptions lists all expired Subscriptions based on writer.
+// ListExpiredSubscriptions lists at most limit expired Subscriptions based on writer.
 // The function queries both empty writer and null writer when passing empty string as a writer.
-func (r *repo) ListExpiredSubscriptions(ctx context.Context, writer string, threshold time.Time) ([]*ridmodels.Subscription, error) {
+func (r *repo) ListExpiredSubscriptions(ctx context.Context, writer string, threshold time.Time, limit int) ([]*ridmodels.Subscription, error) {
 	if len(writer) == 0 {
 		query := fmt.Sprintf(`
             SELECT
@@ -306,8 +329,9 @@ func (r *repo) ListExpiredSubscriptions(ctx context.Context, writer string, thre
             WHERE
                 ends_at <= $1
             AND
-                (writer = '' OR writer IS NULL)`, subscriptionFields)
-		return r.process(ctx, query, threshold)
+                (writer = '' OR writer IS NULL)
+            LIMIT $2`, subscriptionFields)
+		return r.process(ctx, query, threshold, limit)
 	}
 
 	query := fmt.Sprintf(`
@@ -318,8 +342,46 @@ func (r *repo) ListExpiredSubscriptions(ctx context.Context, writer string, thre
         WHERE
             ends_at <= $1
         AND
-            writer = $2`, subscriptionFields)
-	return r.process(ctx, query, threshold, writer)
+            writer = $2
+        LIMIT $3`, subscriptionFields)
+	return r.process(ctx, query, threshold, writer, limit)
+}
+
+// CountExpiredSubscriptions counts the expired Subscriptions based on writer, as listed by ListExpiredSubscriptions.
+func (r *repo) CountExpiredSubscriptions(ctx context.Context, writer string, threshold time.Time) (int64, error) {
+	var (
+		count int64
+		err   error
+	)
+	if len(writer) == 0 {
+		err = r.QueryRow(ctx, `
+            SELECT
+                COUNT(*)
+            FROM
+                subscriptions
+            WHERE
+                ends_at <= $1
+            AND
+                (writer = '' OR writer IS NULL)`,
+			threshold,
+		).Scan(&count)
+	} else {
+		err = r.QueryRow(ctx, `
+            SELECT
+                COUNT(*)
+            FROM
+                subscriptions
+            WHERE
+                ends_at <= $1
+            AND
+                writer = $2`,
+			threshold, writer,
+		).Scan(&count)
+	}
+	if err != nil {
+		return 0, stacktrace.Propagate(err, "Error counting expired Subscriptions")
+	}
+	return count, nil
 }
 
 func (r *repo) CountSubscriptions(ctx context.Context) (int64, error) {
@@ -20,6 +20,10 @@ type OperationalIntent interface {
 	// DeleteOperationalIntent deletes the operation identified by "id".
 	DeleteOperationalIntent(ctx context.Context, id dssmodels.ID) error
 
+	// DeleteOperationalIntents deletes the operations identified by "ids" and returns the number of operations deleted.
+	// IDs that do not identify an existing operation are ignored.
+	DeleteOperationalIntents(ctx context.Context, ids []dssmodels.ID) (int64, error)
+
 	// UpsertOperationalIntent inserts or updates an operation into the store.
 	UpsertOperationalIntent(ctx context.Context, operation *scdmodels.OperationalIntent) (*scdmodels.OperationalIntent, error)
 
@@ -30,9 +34,13 @@ type OperationalIntent interface {
 	// subscription identified by "subscriptionID".
 	GetDependentOperationalIntents(ctx context.Context, subscriptionID dssmodels.ID) ([]dssmodels.ID, error)
 
-	// ListExpiredOperationalIntents lists all operational intents older than the threshold.
+	// ListExpiredOperationalIntents lists at most "limit" operational intents older than the threshold.
 	// Their age is determined by their end time, or by their update time if they do not have an end time.
-	ListExpiredOperationalIntents(ctx context.Context, threshold time.Time) ([]*scdmodels.OperationalIntent, error)
+	ListExpiredOperationalIntents(ctx context.Context, threshold time.Time, limit int) ([]*scdmodels.OperationalIntent, error)
+
+	// CountExpiredOperationalIntents counts the operational intents older than the threshold, as listed by
+	// ListExpiredOperationalIntents.
+	CountExpiredOperationalIntents(ctx context.Context, threshold time.Time) (int64, error)
 
 	// Count the number of existing operational intent
 	CountOperationalIntents(ctx context.Context) (int64, error)
@@ -56,6 +64,11 @@ type Subscription interface {
 	// exist.
 	DeleteSubscription(ctx context.Context, id dssmodels.ID) error
 
+	// DeleteSubscriptions deletes the Subscriptions identified by "ids" and
+	// returns the number of Subscriptions deleted. IDs that do not identify an
+	// existing Subscription are ignored.
+	DeleteSubscriptions(ctx context.Context, ids []dssmodels.ID) (int64, error)
+
 	// IncrementNotificationIndicesForOperationalIntents finds the Subscriptions in
 	// v4d that want operational intent notifications, increments their notification
 	// index and returns them with the new index.
@@ -69,9 +82,13 @@ type Subscription interface {
 	// LockSubscriptionsOnCells locks the subscriptions of interest on specific cells and, optionnaly, specific subscriptions via their IDs
 	LockSubscriptionsOnCells(ctx context.Context, cells s2.CellUnion, subscriptionIds []dssmodels.ID, startTime *time.Time, endTime *time.Time) error
 
-	// ListExpiredSubscriptions lists all subscriptions older than the threshold.
+	// ListExpiredSubscriptions lists at most "limit" subscriptions older than the threshold.
 	// Their age is determined by their end time, or by their update time if they do not have an end time.
-	ListExpiredSubscriptions(ctx context.Context, threshold time.Time) ([]*scdmodels.Subscription, error)
+	ListExpiredSubscriptions(ctx context.Context, threshold time.Time, limit int) ([]*scdmodels.Subscription, error)
+
+	// CountExpiredSubscriptions counts the subscriptions older than the threshold, as listed by
+	// ListExpiredSubscriptions.
+	CountExpiredSubscriptions(ctx context.Context, threshold time.Time) (int64, error)
 
 	// Count the number of existing subscriptions
 	CountSubscriptions(ctx context.Context) (int64, error)
@@ -33,6 +33,6 @@ func (r *repo) UpsertUssAvailability(ctx context.Context, s *scdmodels.UssAvaila
 		Availability: s.Availability,
 		UpdatedAt:    now,
 	}
-	r.state.Availabilities[s.Uss] = rec
+	r.writeAvailability(s.Uss, rec)
 	return rec.toModel(), nil
 }
@@ -38,13 +38,7 @@ func (r *repo) SearchConstraints(_ context.Context, v4d *dssmodels.Volume4D) ([]
 	}
 
 	var out []*scdmodels.Constraint
-	for _, rec := range r.state.Constraints {
-		if !overlaps(rec.Cells, want) {
-			continue
-		}
-		if !overlapsTime(rec.StartTime, rec.EndTime, v4d) {
-			continue
-		}
+	for rec := range searchIndexed(r.state.Constraints, r.index.constraints, want, v4d) {
 		out = append(out, rec.toModel())
 
 		if len(out) >= dssmodels.MaxResultLimit { // mirror SQL "LIMIT MaxResultLimit"
@@ -81,7 +75,7 @@ func (r *repo) UpsertConstraint(ctx context.Context, s *scdmodels.Constraint) (*
 		Cells:         slices.Clone(s.Cells),
 		UpdatedAt:     now,
 	}
-	r.state.Constraints[s.ID] = rec
+	r.writeConstraint(s.ID, rec)
 	return rec.toModel(), nil
 }
 
@@ -89,7 +83,7 @@ func (r *repo) DeleteConstraint(_ context.Context, id dssmodels.ID) error {
 	if _, ok := r.state.Constraints[id]; !ok {
 		return pgx.ErrNoRows // TODO: #1608
 	}
-	delete(r.state.Constraints, id)
+	r.writeConstraint(id, nil)
 	return nil
 }
 
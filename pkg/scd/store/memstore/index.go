@@ -0,0 +1,368 @@
+package memstore
+
+import (
+	"container/heap"
+	"iter"
+	"time"
+
+	"github.com/golang/geo/s2"
+	dssmodels "github.com/interuss/dss/pkg/models"
+)
+
+const (
+	// timeBucketWidth is the duration covered by each bucket of the time index.
+	timeBucketWidth = time.Hour
+	// maxTimeBuckets is the maximum number of buckets a record or a query may span in the time index. Records spanning
+	// more buckets (or with an unknown start or end time) are always candidates of time-based lookups, and queries
+	// spanning more buckets are served by the spatial index only.
+	maxTimeBuckets = 24
+)
+
+type idSet map[dssmodels.ID]struct{}
+
+// indexedRecord is a stored record that can be found by its spatial and temporal extents.
+type indexedRecord interface {
+	covering() s2.CellUnion
+	startTime() *time.Time
+	endTime() *time.Time
+}
+
+func (rec *constraintRecord) covering() s2.CellUnion { return rec.Cells }
+
+func (rec *constraintRecord) startTime() *time.Time { return rec.StartTime }
+
+func (rec *constraintRecord) endTime() *time.Time { return rec.EndTime }
+
+func (rec *subscriptionRecord) covering() s2.CellUnion { return rec.Cells }
+
+func (rec *subscriptionRecord) startTime() *time.Time { return rec.StartTime }
+
+func (rec *operationalIntentRecord) covering() s2.CellUnion { return rec.Cells }
+
+func (rec *operationalIntentRecord) startTime() *time.Time { return rec.StartTime }
+
+// volumeIndex is an inverted index of record IDs by S2 cell and by time bucket. It is derived from the records of
+// a state and is never serialized: it must be updated with every record written to or deleted from the state.
+type volumeIndex struct {
+	// cells lists the IDs of the records covering each cell.
+	cells map[s2.CellID]idSet
+	// buckets lists the IDs of the records whose time range intersects each time bucket.
+	buckets map[int64]idSet
+	// unbucketed holds the IDs of the records whose time range is unbounded or spans more than maxTimeBuckets.
+	unbucketed idSet
+}
+
+func newVolumeIndex() *volumeIndex {
+	return &volumeIndex{
+		cells:      map[s2.CellID]idSet{},
+		buckets:    map[int64]idSet{},
+		unbucketed: idSet{},
+	}
+}
+
+// timeBucket returns the index of the time bucket containing t.
+func timeBucket(t time.Time) int64 {
+	width := int64(timeBucketWidth / time.Second)
+	u := t.Unix()
+	if u < 0 {
+		return (u - width + 1) / width
+	}
+	return u / width
+}
+
+// bucketRange returns the range of time buckets spanned by [start, end], or ok=false if the range is unbounded
+// or spans more than maxTimeBuckets.
+func bucketRange(start, end *time.Time) (first, last int64, ok bool) {
+	if start == nil || end == nil {
+		return 0, 0, false
+	}
+	first, last = timeBucket(*start), timeBucket(*end)
+	if last < first || last-first >= maxTimeBuckets {
+		return 0, 0, false
+	}
+	return first, last, true
+}
+
+func addID[K comparable](sets map[K]idSet, key K, id dssmodels.ID) {
+	set, ok := sets[key]
+	if !ok {
+		set = idSet{}
+		sets[key] = set
+	}
+	set[id] = struct{}{}
+}
+
+func removeID[K comparable](sets map[K]idSet, key K, id dssmodels.ID) {
+	if set, ok := sets[key]; ok {
+		delete(set, id)
+		if len(set) == 0 {
+			delete(sets, key)
+		}
+	}
+}
+
+// add indexes the record with the provided ID and extents.
+func (x *volumeIndex) add(id dssmodels.ID, rec indexedRecord) {
+	for _, cell := range rec.covering() {
+		addID(x.cells, cell, id)
+	}
+	if first, last, ok := bucketRange(rec.startTime(), rec.endTime()); ok {
+		for b := first; b <= last; b++ {
+			addID(x.buckets, b, id)
+		}
+	} else {
+		x.unbucketed[id] = struct{}{}
+	}
+}
+
+// remove removes the record with the provided ID and extents, as they were when it was added, from the index.
+func (x *volumeIndex) remove(id dssmodels.ID, rec indexedRecord) {
+	for _, cell := range rec.covering() {
+		removeID(x.cells, cell, id)
+	}
+	if first, last, ok := bucketRange(rec.startTime(), rec.endTime()); ok {
+		for b := first; b <= last; b++ {
+			removeID(x.buckets, b, id)
+		}
+	} else {
+		delete(x.unbucketed, id)
+	}
+}
+
+// candidates yields, without duplicates, a superset of the IDs of the records covering any cell in want and whose time
+// range intersects the one of v4d. It walks whichever of the spatial and time indexes lists fewer IDs.
+func (x *volumeIndex) candidates(want map[s2.CellID]struct{}, v4d *dssmodels.Volume4D) iter.Seq[dssmodels.ID] {
+	var spatialCount int
+	for cell := range want {
+		spatialCount += len(x.cells[cell])
+	}
+	var sets []idSet
+	if first, last, ok := bucketRange(v4d.StartTime, v4d.EndTime); ok {
+		timeCount := len(x.unbucketed)
+		for b := first; b <= last; b++ {
+			timeCount += len(x.buckets[b])
+		}
+		if timeCount < spatialCount {
+			sets = append(sets, x.unbucketed)
+			for b := first; b <= last; b++ {
+				if set, ok := x.buckets[b]; ok {
+					sets = append(sets, set)
+				}
+			}
+		}
+	}
+	if sets == nil {
+		for cell := range want {
+			if set, ok := x.cells[cell]; ok {
+				sets = append(sets, set)
+			}
+		}
+	}
+
+	return func(yield func(dssmodels.ID) bool) {
+		if len(sets) == 1 {
+			for id := range sets[0] {
+				if !yield(id) {
+					return
+				}
+			}
+			return
+		}
+		seen := idSet{}
+		for _, set := range sets {
+			for id := range set {
+				if _, ok := seen[id]; ok {
+					continue
+				}
+				seen[id] = struct{}{}
+				if !yield(id) {
+					return
+				}
+			}
+		}
+	}
+}
+
+// searchIndexed yields the records of store intersecting want and the time range of v4d, looking up only the
+// candidates listed by index.
+func searchIndexed[R indexedRecord](store map[dssmodels.ID]R, index *volumeIndex, want map[s2.CellID]struct{}, v4d *dssmodels.Volume4D) iter.Seq[R] {
+	return func(yield func(R) bool) {
+		for id := range index.candidates(want, v4d) {
+			rec, ok := store[id]
+			if !ok {
+				continue
+			}
+			if !overlaps(rec.covering(), want) {
+				continue
+			}
+			if !overlapsTime(rec.startTime(), rec.endTime(), v4d) {
+				continue
+			}
+			if !yield(rec) {
+				return
+			}
+		}
+	}
+}
+
+// expiryEntry is the position of a record in an expiryIndex.
+type expiryEntry struct {
+	id        dssmodels.ID
+	expiresAt time.Time
+	pos       int
+}
+
+// expiryHeap is a min-heap of expiryEntry ordered by expiresAt. It implements heap.Interface.
+type expiryHeap []*expiryEntry
+
+func (h expiryHeap) Len() int { return len(h) }
+
+func (h expiryHeap) Less(i, j int) bool { return h[i].expiresAt.Before(h[j].expiresAt) }
+
+func (h expiryHeap) Swap(i, j int) {
+	h[i], h[j] = h[j], h[i]
+	h[i].pos = i
+	h[j].pos = j
+}
+
+func (h *expiryHeap) Push(x any) {
+	e := x.(*expiryEntry)
+	e.pos = len(*h)
+	*h = append(*h, e)
+}
+
+func (h *expiryHeap) Pop() any {
+	old := *h
+	e := old[len(old)-1]
+	old[len(old)-1] = nil
+	*h = old[:len(old)-1]
+	return e
+}
+
+// expiryIndex orders record IDs by the time at which the records expire (see expiresAt).
+type expiryIndex struct {
+	heap    expiryHeap
+	entries map[dssmodels.ID]*expiryEntry
+}
+
+func newExpiryIndex() *expiryIndex {
+	return &expiryIndex{entries: map[dssmodels.ID]*expiryEntry{}}
+}
+
+// expiresAt returns the time after which rec is considered expired: its end time, falling back on its last update
+// time when the end time is unknown.
+func expiresAt(rec expiringRecord) time.Time {
+	if t := rec.endTime(); t != nil { // TODO: Don't allow endtime to be null, see #1492
+		return *t
+	}
+	return rec.lastUpdate()
+}
+
+// set adds the record with the provided ID to the index, or moves it if it is already indexed.
+func (x *expiryIndex) set(id dssmodels.ID, rec expiringRecord) {
+	if e, ok := x.entries[id]; ok {
+		e.expiresAt = expiresAt(rec)
+		heap.Fix(&x.heap, e.pos)
+		return
+	}
+	e := &expiryEntry{id: id, expiresAt: expiresAt(rec)}
+	x.entries[id] = e
+	heap.Push(&x.heap, e)
+}
+
+// remove removes the record with the provided ID from the index.
+func (x *expiryIndex) remove(id dssmodels.ID) {
+	if e, ok := x.entries[id]; ok {
+		heap.Remove(&x.heap, e.pos)
+		delete(x.entries, id)
+	}
+}
+
+// expired returns the IDs of the records expiring at or before threshold. A limit of 0 means unlimited.
+// Only the part of the heap holding expired records (and its immediate children) is visited.
+func (x *expiryIndex) expired(threshold time.Time, limit int) []dssmodels.ID {
+	var ids []dssmodels.ID
+	stack := []int{0}
+	for len(stack) > 0 {
+		i := stack[len(stack)-1]
+		stack = stack[:len(stack)-1]
+		if i >= len(x.heap) || x.heap[i].expiresAt.After(threshold) {
+			continue
+		}
+		ids = append(ids, x.heap[i].id)
+		if limit > 0 && len(ids) >= limit {
+			break
+		}
+		stack = append(stack, 2*i+2, 2*i+1)
+	}
+	return ids
+}
+
+// indexes holds the indexes derived from a state.
+type indexes struct {
+	constraints        *volumeIndex
+	subscriptions      *volumeIndex
+	operationalIntents *volumeIndex
+
+	// dependentOperationalIntents lists the IDs of the operational intents relying on each subscription.
+	dependentOperationalIntents map[dssmodels.ID]idSet
+
+	expiringSubscriptions      *expiryIndex
+	expiringOperationalIntents *expiryIndex
+}
+
+// buildIndexes indexes every record of s.
+func buildIndexes(s state) indexes {
+	idx := indexes{
+		constraints:                 newVolumeIndex(),
+		subscriptions:               newVolumeIndex(),
+		operationalIntents:          newVolumeIndex(),
+		dependentOperationalIntents: map[dssmodels.ID]idSet{},
+		expiringSubscriptions:       newExpiryIndex(),
+		expiringOperationalIntents:  newExpiryIndex(),
+	}
+	for _, rec := range s.Constraints {
+		idx.addConstraint(rec)
+	}
+	for _, rec := range s.Subscriptions {
+		idx.addSubscription(rec)
+	}
+	for _, rec := range s.OperationalIntents {
+		idx.addOperationalIntent(rec)
+	}
+	return idx
+}
+
+func (idx *indexes) addConstraint(rec *constraintRecord) {
+	idx.constraints.add(rec.ID, rec)
+}
+
+func (idx *indexes) removeConstraint(rec *constraintRecord) {
+	idx.constraints.remove(rec.ID, rec)
+}
+
+func (idx *indexes) addSubscription(rec *subscriptionRecord) {
+	idx.subscriptions.add(rec.ID, rec)
+	idx.expiringSubscriptions.set(rec.ID, rec)
+}
+
+func (idx *indexes) removeSubscription(rec *subscriptionRecord) {
+	idx.subscriptions.remove(rec.ID, rec)
+	idx.expiringSubscriptions.remove(rec.ID)
+}
+
+func (idx *indexes) addOperationalIntent(rec *operationalIntentRecord) {
+	idx.operationalIntents.add(rec.ID, rec)
+	idx.expiringOperationalIntents.set(rec.ID, rec)
+	if rec.SubscriptionID != nil {
+		addID(idx.dependentOperationalIntents, *rec.SubscriptionID, rec.ID)
+	}
+}
+
+func (idx *indexes) removeOperationalIntent(rec *operationalIntentRecord) {
+	idx.operationalIntents.remove(rec.ID, rec)
+	idx.expiringOperationalIntents.remove(rec.ID)
+	if rec.SubscriptionID != nil {
+		removeID(idx.dependentOperationalIntents, *rec.SubscriptionID, rec.ID)
+	}
+}
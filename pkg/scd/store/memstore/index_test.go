@@ -0,0 +1,317 @@
+package memstore
+
+import (
+	"fmt"
+	"math/rand"
+	"slices"
+	"testing"
+	"time"
+
+	"github.com/golang/geo/s2"
+	dssmodels "github.com/interuss/dss/pkg/models"
+	scdmodels "github.com/interuss/dss/pkg/scd/models"
+	"github.com/stretchr/testify/require"
+)
+
+// cellGrid returns size*size level 13 cells around the test area.
+func cellGrid(size int) s2.CellUnion {
+	grid := make(s2.CellUnion, 0, size*size)
+	for i := 0; i < size; i++ {
+		for j := 0; j < size; j++ {
+			ll := s2.LatLngFromDegrees(46.9+float64(i)*0.02, 7.4+float64(j)*0.02)
+			grid = append(grid, s2.CellIDFromLatLng(ll).Parent(13))
+		}
+	}
+	return grid
+}
+
+// randomCells returns between 1 and 4 adjacent cells of grid.
+func randomCells(rng *rand.Rand, grid s2.CellUnion) s2.CellUnion {
+	first := rng.Intn(len(grid))
+	last := min(first+1+rng.Intn(4), len(grid))
+	return slices.Clone(grid[first:last])
+}
+
+// randomTimeRange returns a time range within 3 days of startTime, occasionally longer than maxTimeBuckets or
+// missing its end.
+func randomTimeRange(rng *rand.Rand) (*time.Time, *time.Time) {
+	start := startTime.Add(time.Duration(rng.Intn(72*60)) * time.Minute)
+	if rng.Intn(10) == 0 {
+		return &start, nil
+	}
+	var end time.Time
+	if rng.Intn(10) == 0 {
+		end = start.Add(time.Duration(25+rng.Intn(48)) * time.Hour)
+	} else {
+		end = start.Add(time.Duration(10+rng.Intn(180)) * time.Minute)
+	}
+	return &start, &end
+}
+
+func randomID(rng *rand.Rand, n int) dssmodels.ID {
+	return dssmodels.ID(fmt.Sprintf("00000185-e36d-40be-8d38-%012d", rng.Intn(n)))
+}
+
+// randomWrites upserts and deletes n random constraints, subscriptions and operational intents, reusing IDs so that
+// records get moved in space and time.
+func randomWrites(t *testing.T, r *repo, rng *rand.Rand, grid s2.CellUnion, n int) {
+	ctx := writeCtx()
+	for i := 0; i < n; i++ {
+		id := randomID(rng, n)
+		start, end := randomTimeRange(rng)
+		switch rng.Intn(4) {
+		case 0:
+			_, err := r.UpsertConstraint(ctx, &scdmodels.Constraint{ID: id, Manager: manager, StartTime: start, EndTime: end, Cells: randomCells(rng, grid)})
+			require.NoError(t, err)
+		case 1:
+			_, err := r.UpsertSubscription(ctx, &scdmodels.Subscription{ID: id, Manager: manager, StartTime: start, EndTime: end, Cells: randomCells(rng, grid)})
+			require.NoError(t, err)
+		case 2:
+			oi := &scdmodels.OperationalIntent{ID: id, Manager: manager, StartTime: start, EndTime: end, Cells: randomCells(rng, grid)}
+			if rng.Intn(4) > 0 {
+				subscriptionID := randomID(rng, 20)
+				oi.SubscriptionID = &subscriptionID
+			}
+			_, err := r.UpsertOperationalIntent(ctx, oi)
+			require.NoError(t, err)
+		case 3:
+			if _, ok := r.state.Constraints[id]; ok {
+				require.NoError(t, r.DeleteConstraint(ctx, id))
+			}
+			if _, ok := r.state.Subscriptions[id]; ok {
+				require.NoError(t, r.DeleteSubscription(ctx, id))
+			}
+			if _, ok := r.state.OperationalIntents[id]; ok {
+				require.NoError(t, r.DeleteOperationalIntent(ctx, id))
+			}
+		}
+	}
+}
+
+// scanVolume returns the sorted IDs of the records of store intersecting cells and the time range of v4d, found by
+// checking every record.
+func scanVolume[R indexedRecord](store map[dssmodels.ID]R, cells s2.CellUnion, v4d *dssmodels.Volume4D) []dssmodels.ID {
+	want := cellSet(cells)
+	ids := []dssmodels.ID{}
+	for id, rec := range store {
+		if overlaps(rec.covering(), want) && overlapsTime(rec.startTime(), rec.endTime(), v4d) {
+			ids = append(ids, id)
+		}
+	}
+	slices.Sort(ids)
+	return ids
+}
+
+func sortedIDs[M any](models []M, id func(M) dssmodels.ID) []dssmodels.ID {
+	ids := []dssmodels.ID{}
+	for _, m := range models {
+		ids = append(ids, id(m))
+	}
+	slices.Sort(ids)
+	return ids
+}
+
+// expiryTimes returns the expiry time of each record in x, after checking that x is a valid heap.
+func expiryTimes(t *testing.T, x *expiryIndex) map[dssmodels.ID]time.Time {
+	require.Len(t, x.heap, len(x.entries))
+	times := map[dssmodels.ID]time.Time{}
+	for i, e := range x.heap {
+		require.Equal(t, i, e.pos)
+		require.True(t, x.entries[e.id] == e)
+		if i > 0 {
+			require.False(t, e.expiresAt.Before(x.heap[(i-1)/2].expiresAt))
+		}
+		times[e.id] = e.expiresAt
+	}
+	return times
+}
+
+// requireIndexesConsistent checks that the indexes of r hold the same content as indexes rebuilt from its state. The
+// layout of expiry heaps depends on the order of insertion, so only their content is compared.
+func requireIndexesConsistent(t *testing.T, r *repo) {
+	expected := buildIndexes(r.state)
+	require.Equal(t, expected.constraints, r.index.constraints)
+	require.Equal(t, expected.subscriptions, r.index.subscriptions)
+	require.Equal(t, expected.operationalIntents, r.index.operationalIntents)
+	require.Equal(t, expected.dependentOperationalIntents, r.index.dependentOperationalIntents)
+	require.Equal(t, expiryTimes(t, expected.expiringSubscriptions), expiryTimes(t, r.index.expiringSubscriptions))
+	require.Equal(t, expiryTimes(t, expected.expiringOperationalIntents), expiryTimes(t, r.index.expiringOperationalIntents))
+}
+
+// scanExpired returns the sorted IDs of the records of store expiring at or before threshold, found by checking every
+// record.
+func scanExpired[R expiringRecord](store map[dssmodels.ID]R, threshold time.Time) []dssmodels.ID {
+	ids := []dssmodels.ID{}
+	for id, rec := range store {
+		if !expiresAt(rec).After(threshold) {
+			ids = append(ids, id)
+		}
+	}
+	slices.Sort(ids)
+	return ids
+}
+
+// requireIndexedLookupsMatchScans checks that the indexes of r are consistent with its state and that indexed
+// searches and listings return the same records as full scans.
+func requireIndexedLookupsMatchScans(t *testing.T, r *repo, rng *rand.Rand, grid s2.CellUnion) {
+	ctx := writeCtx()
+	requireIndexesConsistent(t, r)
+
+	for i := 0; i < 20; i++ {
+		subscriptionID := randomID(rng, 20)
+		expected := []dssmodels.ID{}
+		for id, rec := range r.state.OperationalIntents {
+			if rec.SubscriptionID != nil && *rec.SubscriptionID == subscriptionID {
+				expected = append(expected, id)
+			}
+		}
+		slices.Sort(expected)
+		dependents, err := r.GetDependentOperationalIntents(ctx, subscriptionID)
+		require.NoError(t, err)
+		require.Equal(t, expected, sortedIDs(dependents, func(id dssmodels.ID) dssmodels.ID { return id }))
+
+		threshold := startTime.Add(time.Duration(rng.Intn(96*60)) * time.Minute)
+		expiredSubscriptions, err := r.ListExpiredSubscriptions(ctx, threshold, dssmodels.MaxResultLimit)
+		require.NoError(t, err)
+		require.Equal(t, scanExpired(r.state.Subscriptions, threshold), sortedIDs(expiredSubscriptions, func(s *scdmodels.Subscription) dssmodels.ID { return s.ID }))
+		expiredOIs, err := r.ListExpiredOperationalIntents(ctx, threshold, dssmodels.MaxResultLimit)
+		require.NoError(t, err)
+		require.Equal(t, scanExpired(r.state.OperationalIntents, threshold), sortedIDs(expiredOIs, func(o *scdmodels.OperationalIntent) dssmodels.ID { return o.ID }))
+	}
+
+	for i := 0; i < 200; i++ {
+		cells := randomCells(rng, grid)
+		start, end := randomTimeRange(rng)
+		switch rng.Intn(4) {
+		case 0:
+			start, end = nil, nil
+		case 1:
+			start = nil
+		}
+		v4d := volume4D(cells, start, end, nil, nil)
+
+		constraints, err := r.SearchConstraints(ctx, v4d)
+		require.NoError(t, err)
+		require.Equal(t, scanVolume(r.state.Constraints, cells, v4d), sortedIDs(constraints, func(c *scdmodels.Constraint) dssmodels.ID { return c.ID }))
+
+		subscriptions, err := r.SearchSubscriptions(ctx, v4d)
+		require.NoError(t, err)
+		require.Equal(t, scanVolume(r.state.Subscriptions, cells, v4d), sortedIDs(subscriptions, func(s *scdmodels.Subscription) dssmodels.ID { return s.ID }))
+
+		ois, err := r.SearchOperationalIntents(ctx, v4d)
+		require.NoError(t, err)
+		require.Equal(t, scanVolume(r.state.OperationalIntents, cells, v4d), sortedIDs(ois, func(o *scdmodels.OperationalIntent) dssmodels.ID { return o.ID }))
+	}
+}
+
+func TestIndexedLookupsMatchScans(t *testing.T) {
+	rng := rand.New(rand.NewSource(1))
+	grid := cellGrid(6)
+	r := setUpStore(t)
+
+	randomWrites(t, r, rng, grid, 500)
+	requireIndexedLookupsMatchScans(t, r, rng, grid)
+
+	// Writes after a checkpoint are reflected in the indexes, and dropped from them on restore.
+	r.Checkpoint()
+	checkpointed := expiryTimes(t, r.index.expiringOperationalIntents)
+	randomWrites(t, r, rng, grid, 500)
+	requireIndexedLookupsMatchScans(t, r, rng, grid)
+	r.Restore()
+	require.Equal(t, checkpointed, expiryTimes(t, r.index.expiringOperationalIntents))
+	requireIndexedLookupsMatchScans(t, r, rng, grid)
+
+	// Indexes are rebuilt from snapshots.
+	snapshot, err := r.GetSnapshot()
+	require.NoError(t, err)
+	restored := setUpStore(t)
+	require.NoError(t, restored.RestoreFromSnapshot(snapshot))
+	requireIndexedLookupsMatchScans(t, restored, rng, grid)
+}
+
+func TestVolumeIndexTimeBuckets(t *testing.T) {
+	x := newVolumeIndex()
+	hour := startTime.Truncate(time.Hour)
+	within, later := hour.Add(10*time.Minute), hour.Add(2*time.Hour+10*time.Minute)
+	long := hour.Add(maxTimeBuckets * time.Hour)
+
+	short := &constraintRecord{ID: constraintId, StartTime: &within, EndTime: &later, Cells: cells}
+	x.add(short.ID, short)
+	require.Len(t, x.buckets, 3)
+	require.Empty(t, x.unbucketed)
+
+	unbounded := &constraintRecord{ID: subscriptionId, StartTime: &within, EndTime: &long, Cells: cells}
+	x.add(unbounded.ID, unbounded)
+	require.Len(t, x.buckets, 3)
+	require.Len(t, x.unbucketed, 1)
+
+	x.remove(short.ID, short)
+	x.remove(unbounded.ID, unbounded)
+	require.Equal(t, newVolumeIndex(), x)
+}
+
+func TestExpiryIndex(t *testing.T) {
+	x := newExpiryIndex()
+	at := func(offset time.Duration) *operationalIntentRecord {
+		end := startTime.Add(offset)
+		return &operationalIntentRecord{EndTime: &end}
+	}
+	x.set(oi1ID, at(3*time.Hour))
+	x.set(oi2ID, at(time.Hour))
+	x.set(oi3ID, &operationalIntentRecord{UpdatedAt: startTime.Add(2 * time.Hour)})
+
+	require.Empty(t, x.expired(startTime, 0))
+	require.ElementsMatch(t, []dssmodels.ID{oi2ID, oi3ID}, x.expired(startTime.Add(2*time.Hour), 0))
+	require.Len(t, x.expired(startTime.Add(2*time.Hour), 1), 1)
+
+	// Moving a record later and removing another one keeps the heap ordered.
+	x.set(oi2ID, at(4*time.Hour))
+	x.remove(oi3ID)
+	x.remove(oi3ID)
+	require.Equal(t, map[dssmodels.ID]time.Time{oi1ID: startTime.Add(3 * time.Hour), oi2ID: startTime.Add(4 * time.Hour)}, expiryTimes(t, x))
+	require.Equal(t, []dssmodels.ID{oi1ID}, x.expired(startTime.Add(3*time.Hour), 0))
+}
+
+// BenchmarkSearchOperationalIntents compares an indexed search of a few cells over one hour with a scan of every
+// stored operational intent.
+func BenchmarkSearchOperationalIntents(b *testing.B) {
+	grid := cellGrid(100)
+	for _, n := range []int{1000, 10000, 100000} {
+		rng := rand.New(rand.NewSource(1))
+		r := newRepo()
+		ctx := writeCtx()
+		for i := 0; i < n; i++ {
+			start, end := randomTimeRange(rng)
+			oi := &scdmodels.OperationalIntent{ID: dssmodels.ID(fmt.Sprintf("00000185-e36d-40be-8d38-%012d", i)), Manager: manager, StartTime: start, EndTime: end, Cells: randomCells(rng, grid)}
+			if _, err := r.UpsertOperationalIntent(ctx, oi); err != nil {
+				b.Fatal(err)
+			}
+		}
+		queryStart := startTime.Add(24 * time.Hour)
+		queryEnd := queryStart.Add(time.Hour)
+		queries := make([]*dssmodels.Volume4D, 100)
+		for i := range queries {
+			queries[i] = volume4D(randomCells(rng, grid), &queryStart, &queryEnd, nil, nil)
+		}
+
+		b.Run(fmt.Sprintf("indexed/%d", n), func(b *testing.B) {
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				if _, err := r.SearchOperationalIntents(ctx, queries[i%len(queries)]); err != nil {
+					b.Fatal(err)
+				}
+			}
+		})
+		b.Run(fmt.Sprintf("scan/%d", n), func(b *testing.B) {
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				v4d := queries[i%len(queries)]
+				cells, err := v4d.SpatialVolume.Footprint.CalculateCovering()
+				if err != nil {
+					b.Fatal(err)
+				}
+				_ = scanVolume(r.state.OperationalIntents, cells, v4d)
+			}
+		})
+	}
+}
@@ -86,10 +86,21 @@ func (r *repo) DeleteOperationalIntent(_ context.Context, id dssmodels.ID) error
 	if _, ok := r.state.OperationalIntents[id]; !ok {
 		return stacktrace.NewError("Could not delete Operation that does not exist")
 	}
-	delete(r.state.OperationalIntents, id)
+	r.writeOperationalIntent(id, nil)
 	return nil
 }
 
+func (r *repo) DeleteOperationalIntents(_ context.Context, ids []dssmodels.ID) (int64, error) {
+	var deleted int64
+	for _, id := range ids {
+		if _, ok := r.state.OperationalIntents[id]; ok {
+			r.writeOperationalIntent(id, nil)
+			deleted++
+		}
+	}
+	return deleted, nil
+}
+
 func (r *repo) UpsertOperationalIntent(ctx context.Context, operation *scdmodels.OperationalIntent) (*scdmodels.OperationalIntent, error) {
 	// An empty OVN means the DSS generates it; it is persisted as NULL in the
 	// sqlstore (represented here by an empty USSRequestedOVN).
@@ -116,7 +127,7 @@ func (r *repo) UpsertOperationalIntent(ctx context.Context, operation *scdmodels
 		PastOVNs:        slices.Clone(operation.PastOVNs),
 		UpdatedAt:       now,
 	}
-	r.state.OperationalIntents[operation.ID] = rec
+	r.writeOperationalIntent(operation.ID, rec)
 
 	built, err := r.buildOperationalIntents(ctx, []*operationalIntentRecord{rec})
 	if err != nil {
@@ -137,12 +148,8 @@ func (r *repo) SearchOperationalIntents(ctx context.Context, v4d *dssmodels.Volu
 		return nil, stacktrace.NewErrorWithCode(dsserr.BadRequest, "Missing cell IDs for query")
 	}
 
-	want := cellSet(cells)
 	var matched []*operationalIntentRecord
-	for _, rec := range r.state.OperationalIntents {
-		if !overlaps(rec.Cells, want) {
-			continue
-		}
+	for rec := range searchIndexed(r.state.OperationalIntents, r.index.operationalIntents, cellSet(cells), v4d) {
 		// COALESCE(altitude_upper >= $2, true) with $2 = SpatialVolume.AltitudeLo
 		if rec.AltitudeUpper != nil && v4d.SpatialVolume.AltitudeLo != nil && *rec.AltitudeUpper < *v4d.SpatialVolume.AltitudeLo {
 			continue
@@ -151,9 +158,6 @@ func (r *repo) SearchOperationalIntents(ctx context.Context, v4d *dssmodels.Volu
 		if rec.AltitudeLower != nil && v4d.SpatialVolume.AltitudeHi != nil && *rec.AltitudeLower > *v4d.SpatialVolume.AltitudeHi {
 			continue
 		}
-		if !overlapsTime(rec.StartTime, rec.EndTime, v4d) {
-			continue
-		}
 		matched = append(matched, rec)
 
 		if len(matched) >= dssmodels.MaxResultLimit { // mirror SQL "LIMIT MaxResultLimit"
@@ -165,16 +169,18 @@ func (r *repo) SearchOperationalIntents(ctx context.Context, v4d *dssmodels.Volu
 
 func (r *repo) GetDependentOperationalIntents(_ context.Context, subscriptionID dssmodels.ID) ([]dssmodels.ID, error) {
 	var dependentOps []dssmodels.ID
-	for _, rec := range r.state.OperationalIntents {
-		if rec.SubscriptionID != nil && *rec.SubscriptionID == subscriptionID {
-			dependentOps = append(dependentOps, rec.ID)
-		}
+	for id := range r.index.dependentOperationalIntents[subscriptionID] {
+		dependentOps = append(dependentOps, id)
 	}
 	return dependentOps, nil
 }
 
-func (r *repo) ListExpiredOperationalIntents(ctx context.Context, threshold time.Time) ([]*scdmodels.OperationalIntent, error) {
-	return r.buildOperationalIntents(ctx, listExpired(r.state.OperationalIntents, threshold, dssmodels.MaxResultLimit))
+func (r *repo) ListExpiredOperationalIntents(ctx context.Context, threshold time.Time, limit int) ([]*scdmodels.OperationalIntent, error) {
+	return r.buildOperationalIntents(ctx, listExpired(r.state.OperationalIntents, r.index.expiringOperationalIntents, threshold, limit))
+}
+
+func (r *repo) CountExpiredOperationalIntents(_ context.Context, threshold time.Time) (int64, error) {
+	return int64(len(r.index.expiringOperationalIntents.expired(threshold, 0))), nil
 }
 
 func (r *repo) CountOperationalIntents(_ context.Context) (int64, error) {
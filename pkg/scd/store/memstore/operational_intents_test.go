@@ -201,7 +201,7 @@ func TestListExpiredOperationalIntents(t *testing.T) {
 	for _, testCase := range testCases {
 		t.Run(testCase.name, func(t *testing.T) {
 			threshold := testCase.timeRef.Add(-testCase.ttl)
-			expired, err := r.ListExpiredOperationalIntents(ctx, threshold)
+			expired, err := r.ListExpiredOperationalIntents(ctx, threshold, dssmodels.MaxResultLimit)
 			require.NoError(t, err)
 
 			expiredIDs := make([]dssmodels.ID, 0, len(expired))
@@ -209,6 +209,53 @@ func TestListExpiredOperationalIntents(t *testing.T) {
 				expiredIDs = append(expiredIDs, expiredOi.ID)
 			}
 			require.ElementsMatch(t, expiredIDs, testCase.expired)
+
+			count, err := r.CountExpiredOperationalIntents(ctx, threshold)
+			require.NoError(t, err)
+			require.Equal(t, int64(len(testCase.expired)), count)
 		})
 	}
 }
+
+func TestDeleteExpiredOperationalIntentsByPage(t *testing.T) {
+	ctx := writeCtx()
+	r := setUpStore(t)
+	for _, sub := range []*scdmodels.Subscription{sub1, sub2, sub3} {
+		_, err := r.UpsertSubscription(ctx, sub)
+		require.NoError(t, err)
+	}
+	for _, oi := range []*scdmodels.OperationalIntent{oi1, oi2, oi3} {
+		_, err := r.UpsertOperationalIntent(ctx, oi)
+		require.NoError(t, err)
+	}
+
+	threshold := time.Date(2024, time.November, 15, 15, 0, 0, 0, time.UTC)
+	var deletedIDs []dssmodels.ID
+	for {
+		expired, err := r.ListExpiredOperationalIntents(ctx, threshold, 2)
+		require.NoError(t, err)
+		require.LessOrEqual(t, len(expired), 2)
+		if len(expired) == 0 {
+			break
+		}
+		ids := make([]dssmodels.ID, 0, len(expired))
+		for _, oi := range expired {
+			ids = append(ids, oi.ID)
+		}
+		deleted, err := r.DeleteOperationalIntents(ctx, ids)
+		require.NoError(t, err)
+		require.Equal(t, int64(len(ids)), deleted)
+		deletedIDs = append(deletedIDs, ids...)
+	}
+	require.ElementsMatch(t, []dssmodels.ID{oi1ID, oi2ID, oi3ID}, deletedIDs)
+
+	count, err := r.CountOperationalIntents(ctx)
+	require.NoError(t, err)
+	require.Equal(t, int64(0), count)
+	requireIndexesConsistent(t, r)
+
+	// Deleting operational intents that no longer exist is not an error.
+	deleted, err := r.DeleteOperationalIntents(ctx, deletedIDs)
+	require.NoError(t, err)
+	require.Equal(t, int64(0), deleted)
+}
@@ -2,48 +2,255 @@ package memstore
 
 import (
 	"bytes"
-	"encoding/gob"
+	"io"
 
+	"github.com/interuss/dss/pkg/memstore"
 	dssmodels "github.com/interuss/dss/pkg/models"
+	scdmodels "github.com/interuss/dss/pkg/scd/models"
 	"github.com/interuss/stacktrace"
 )
 
-const snapshotVersion = 1
+// snapshotVersion is the version of the content of the snapshot sections. Version 1 was a gob-encoded state.
+const snapshotVersion = 2
 
-type snapshotEnvelope struct {
-	Version int
-	State   state
-}
+const (
+	constraintsSection        = "constraints"
+	subscriptionsSection      = "subscriptions"
+	operationalIntentsSection = "operational_intents"
+	availabilitiesSection     = "availabilities"
+)
 
 func (r *repo) GetSnapshot() ([]byte, error) {
 	var buf bytes.Buffer
-	if err := gob.NewEncoder(&buf).Encode(snapshotEnvelope{Version: snapshotVersion, State: r.state}); err != nil {
-		return nil, stacktrace.Propagate(err, "Failed to encode memstore snapshot")
+	if err := r.WriteSnapshot(&buf); err != nil {
+		return nil, err
 	}
 	return buf.Bytes(), nil
 }
 
 func (r *repo) RestoreFromSnapshot(data []byte) error {
-	var env snapshotEnvelope
-	if err := gob.NewDecoder(bytes.NewReader(data)).Decode(&env); err != nil {
-		return stacktrace.Propagate(err, "Failed to decode memstore snapshot")
+	return r.ReadSnapshot(bytes.NewReader(data))
+}
+
+// WriteSnapshot streams the state of the repo to w, in the format of memstore.SnapshotWriter.
+func (r *repo) WriteSnapshot(w io.Writer) error {
+	sw := memstore.NewSnapshotWriter(w, snapshotVersion)
+
+	sw.BeginSection(constraintsSection)
+	for _, rec := range r.state.Constraints {
+		writeConstraintRecord(sw, rec)
+	}
+	sw.EndSection()
+
+	sw.BeginSection(subscriptionsSection)
+	for _, rec := range r.state.Subscriptions {
+		writeSubscriptionRecord(sw, rec)
+	}
+	sw.EndSection()
+
+	sw.BeginSection(operationalIntentsSection)
+	for _, rec := range r.state.OperationalIntents {
+		writeOperationalIntentRecord(sw, rec)
+	}
+	sw.EndSection()
+
+	sw.BeginSection(availabilitiesSection)
+	for _, rec := range r.state.Availabilities {
+		writeAvailabilityRecord(sw, rec)
 	}
-	if env.Version != snapshotVersion {
-		return stacktrace.NewError("Unsupported memstore snapshot version %d, expected %d", env.Version, snapshotVersion)
+	sw.EndSection()
+
+	if err := sw.Close(); err != nil {
+		return stacktrace.Propagate(err, "Failed to encode memstore snapshot")
 	}
-	r.state = env.State
-	// gob decodes an empty map as nil; re-initialize to keep the repo writable.
-	if r.state.Constraints == nil {
-		r.state.Constraints = map[dssmodels.ID]*constraintRecord{}
+	return nil
+}
+
+// ReadSnapshot replaces the state of the repo with the snapshot streamed from rd. The state is left untouched if
+// the snapshot is invalid.
+func (r *repo) ReadSnapshot(rd io.Reader) error {
+	sr, err := memstore.NewSnapshotReader(rd)
+	if err != nil {
+		return stacktrace.Propagate(err, "Failed to decode memstore snapshot")
 	}
-	if r.state.Subscriptions == nil {
-		r.state.Subscriptions = map[dssmodels.ID]*subscriptionRecord{}
+	if sr.Version() != snapshotVersion {
+		return stacktrace.NewError("Unsupported memstore snapshot version %d, expected %d", sr.Version(), snapshotVersion)
 	}
-	if r.state.OperationalIntents == nil {
-		r.state.OperationalIntents = map[dssmodels.ID]*operationalIntentRecord{}
+
+	s := state{
+		Constraints:        map[dssmodels.ID]*constraintRecord{},
+		Subscriptions:      map[dssmodels.ID]*subscriptionRecord{},
+		OperationalIntents: map[dssmodels.ID]*operationalIntentRecord{},
+		Availabilities:     map[dssmodels.Manager]*availabilityRecord{},
 	}
-	if r.state.Availabilities == nil {
-		r.state.Availabilities = map[dssmodels.Manager]*availabilityRecord{}
+	for {
+		name, ok, err := sr.NextSection()
+		if err != nil {
+			return stacktrace.Propagate(err, "Failed to decode memstore snapshot")
+		}
+		if !ok {
+			break
+		}
+		switch name {
+		case constraintsSection:
+			for sr.More() {
+				rec := readConstraintRecord(sr)
+				s.Constraints[rec.ID] = rec
+			}
+		case subscriptionsSection:
+			for sr.More() {
+				rec := readSubscriptionRecord(sr)
+				s.Subscriptions[rec.ID] = rec
+			}
+		case operationalIntentsSection:
+			for sr.More() {
+				rec := readOperationalIntentRecord(sr)
+				s.OperationalIntents[rec.ID] = rec
+			}
+		case availabilitiesSection:
+			for sr.More() {
+				rec := readAvailabilityRecord(sr)
+				s.Availabilities[rec.Uss] = rec
+			}
+		default:
+			return stacktrace.NewError("Unknown section %s in memstore snapshot", name)
+		}
+		if err := sr.Err(); err != nil {
+			return stacktrace.Propagate(err, "Failed to decode memstore snapshot section %s", name)
+		}
 	}
+
+	r.state = s
+	r.index = buildIndexes(r.state)
+	// Writes logged before the state was replaced can no longer be undone: the snapshot becomes the checkpoint.
+	r.Checkpoint()
 	return nil
 }
+
+func writeConstraintRecord(sw *memstore.SnapshotWriter, rec *constraintRecord) {
+	sw.String(rec.ID.String())
+	sw.String(rec.Manager.String())
+	sw.Int(int64(rec.Version))
+	sw.TimePtr(rec.StartTime)
+	sw.TimePtr(rec.EndTime)
+	sw.String(rec.USSBaseURL)
+	sw.Float32Ptr(rec.AltitudeLower)
+	sw.Float32Ptr(rec.AltitudeUpper)
+	sw.Cells(rec.Cells)
+	sw.Time(rec.UpdatedAt)
+	sw.EndRecord()
+}
+
+func readConstraintRecord(sr *memstore.SnapshotReader) *constraintRecord {
+	return &constraintRecord{
+		ID:            dssmodels.ID(sr.String()),
+		Manager:       dssmodels.Manager(sr.String()),
+		Version:       scdmodels.VersionNumber(sr.Int()),
+		StartTime:     sr.TimePtr(),
+		EndTime:       sr.TimePtr(),
+		USSBaseURL:    sr.String(),
+		AltitudeLower: sr.Float32Ptr(),
+		AltitudeUpper: sr.Float32Ptr(),
+		Cells:         sr.Cells(),
+		UpdatedAt:     sr.Time(),
+	}
+}
+
+func writeSubscriptionRecord(sw *memstore.SnapshotWriter, rec *subscriptionRecord) {
+	sw.String(rec.ID.String())
+	sw.String(rec.Manager.String())
+	sw.Int(int64(rec.NotificationIndex))
+	sw.String(rec.USSBaseURL)
+	sw.Bool(rec.NotifyForOperationalIntents)
+	sw.Bool(rec.NotifyForConstraints)
+	sw.Bool(rec.ImplicitSubscription)
+	sw.TimePtr(rec.StartTime)
+	sw.TimePtr(rec.EndTime)
+	sw.Cells(rec.Cells)
+	sw.Time(rec.UpdatedAt)
+	sw.EndRecord()
+}
+
+func readSubscriptionRecord(sr *memstore.SnapshotReader) *subscriptionRecord {
+	return &subscriptionRecord{
+		ID:                          dssmodels.ID(sr.String()),
+		Manager:                     dssmodels.Manager(sr.String()),
+		NotificationIndex:           int(sr.Int()),
+		USSBaseURL:                  sr.String(),
+		NotifyForOperationalIntents: sr.Bool(),
+		NotifyForConstraints:        sr.Bool(),
+		ImplicitSubscription:        sr.Bool(),
+		StartTime:                   sr.TimePtr(),
+		EndTime:                     sr.TimePtr(),
+		Cells:                       sr.Cells(),
+		UpdatedAt:                   sr.Time(),
+	}
+}
+
+func writeOperationalIntentRecord(sw *memstore.SnapshotWriter, rec *operationalIntentRecord) {
+	sw.String(rec.ID.String())
+	sw.String(rec.Manager.String())
+	sw.Int(int64(rec.Version))
+	sw.String(string(rec.State))
+	sw.TimePtr(rec.StartTime)
+	sw.TimePtr(rec.EndTime)
+	sw.String(rec.USSBaseURL)
+	sw.Bool(rec.SubscriptionID != nil)
+	if rec.SubscriptionID != nil {
+		sw.String(rec.SubscriptionID.String())
+	}
+	sw.Float32Ptr(rec.AltitudeLower)
+	sw.Float32Ptr(rec.AltitudeUpper)
+	sw.Cells(rec.Cells)
+	sw.String(rec.USSRequestedOVN)
+	sw.Uint(uint64(len(rec.PastOVNs)))
+	for _, ovn := range rec.PastOVNs {
+		sw.String(string(ovn))
+	}
+	sw.Time(rec.UpdatedAt)
+	sw.EndRecord()
+}
+
+func readOperationalIntentRecord(sr *memstore.SnapshotReader) *operationalIntentRecord {
+	rec := &operationalIntentRecord{
+		ID:        dssmodels.ID(sr.String()),
+		Manager:   dssmodels.Manager(sr.String()),
+		Version:   scdmodels.VersionNumber(sr.Int()),
+		State:     scdmodels.OperationalIntentState(sr.String()),
+		StartTime: sr.TimePtr(),
+		EndTime:   sr.TimePtr(),
+	}
+	rec.USSBaseURL = sr.String()
+	if sr.Bool() {
+		subscriptionID := dssmodels.ID(sr.String())
+		rec.SubscriptionID = &subscriptionID
+	}
+	rec.AltitudeLower = sr.Float32Ptr()
+	rec.AltitudeUpper = sr.Float32Ptr()
+	rec.Cells = sr.Cells()
+	rec.USSRequestedOVN = sr.String()
+	// The capacity is bounded so that a corrupted count cannot trigger a huge allocation.
+	if n := sr.Uint(); n > 0 && sr.Err() == nil {
+		rec.PastOVNs = make([]scdmodels.OVN, 0, min(n, 1024))
+		for i := uint64(0); i < n && sr.Err() == nil; i++ {
+			rec.PastOVNs = append(rec.PastOVNs, scdmodels.OVN(sr.String()))
+		}
+	}
+	rec.UpdatedAt = sr.Time()
+	return rec
+}
+
+func writeAvailabilityRecord(sw *memstore.SnapshotWriter, rec *availabilityRecord) {
+	sw.String(rec.Uss.String())
+	sw.String(string(rec.Availability))
+	sw.Time(rec.UpdatedAt)
+	sw.EndRecord()
+}
+
+func readAvailabilityRecord(sr *memstore.SnapshotReader) *availabilityRecord {
+	return &availabilityRecord{
+		Uss:          dssmodels.Manager(sr.String()),
+		Availability: scdmodels.UssAvailabilityState(sr.String()),
+		UpdatedAt:    sr.Time(),
+	}
+}
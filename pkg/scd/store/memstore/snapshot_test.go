@@ -3,10 +3,16 @@ package memstore
 import (
 	"bytes"
 	"encoding/gob"
+	"fmt"
+	"io"
+	"math/rand"
 	"testing"
 
 	"github.com/google/go-cmp/cmp"
 	"github.com/google/go-cmp/cmp/cmpopts"
+	"github.com/interuss/dss/pkg/memstore"
+	dssmodels "github.com/interuss/dss/pkg/models"
+	scdmodels "github.com/interuss/dss/pkg/scd/models"
 	"github.com/stretchr/testify/require"
 )
 
@@ -94,6 +100,123 @@ func TestRestoreFromSnapshotInvalidData(t *testing.T) {
 
 func TestRestoreFromSnapshotVersionMismatch(t *testing.T) {
 	var buf bytes.Buffer
-	require.NoError(t, gob.NewEncoder(&buf).Encode(snapshotEnvelope{Version: snapshotVersion + 1}))
+	require.NoError(t, memstore.NewSnapshotWriter(&buf, snapshotVersion+1).Close())
 	require.Error(t, setUpStore(t).RestoreFromSnapshot(buf.Bytes()))
 }
+
+func TestSnapshotStreamRoundTrip(t *testing.T) {
+	rng := rand.New(rand.NewSource(1))
+	src := newRepo()
+	randomWrites(t, src, rng, cellGrid(20), 5000)
+	_, err := src.UpsertUssAvailability(writeCtx(), sampleAvailability())
+	require.NoError(t, err)
+	for _, rec := range src.state.OperationalIntents {
+		rec.PastOVNs = []scdmodels.OVN{"ovn-1", "ovn-2"}
+		break
+	}
+
+	var buf bytes.Buffer
+	require.NoError(t, src.WriteSnapshot(&buf))
+
+	dst := newRepo()
+	require.NoError(t, dst.ReadSnapshot(&buf))
+	if diff := cmp.Diff(src.state, dst.state, cmpopts.EquateApproxTime(0), cmpopts.EquateEmpty()); diff != "" {
+		t.Errorf("State mismatch (-want +got):\n%s", diff)
+	}
+	requireIndexesConsistent(t, dst)
+}
+
+func TestReadSnapshotKeepsStateOnError(t *testing.T) {
+	src := newRepo()
+	randomWrites(t, src, rand.New(rand.NewSource(1)), cellGrid(20), 5000)
+	data, err := src.GetSnapshot()
+	require.NoError(t, err)
+
+	dst := setUpStore(t)
+	_, err = dst.UpsertConstraint(writeCtx(), sampleConstraint())
+	require.NoError(t, err)
+
+	truncated := data[:len(data)/2]
+	require.Error(t, dst.RestoreFromSnapshot(truncated))
+	corrupted := bytes.Clone(data)
+	corrupted[len(corrupted)/2] ^= 0xff
+	require.Error(t, dst.RestoreFromSnapshot(corrupted))
+
+	require.Len(t, dst.state.Constraints, 1)
+	require.Contains(t, dst.state.Constraints, constraintId)
+	requireIndexesConsistent(t, dst)
+}
+
+// BenchmarkSnapshot compares the streamed snapshot format with gob-encoding the whole state.
+func BenchmarkSnapshot(b *testing.B) {
+	grid := cellGrid(100)
+	for _, n := range []int{1000, 100000} {
+		rng := rand.New(rand.NewSource(1))
+		r := newRepo()
+		ctx := writeCtx()
+		for i := 0; i < n; i++ {
+			id := dssmodels.ID(fmt.Sprintf("00000185-e36d-40be-8d38-%012d", i))
+			start, end := randomTimeRange(rng)
+			if i%4 == 0 {
+				if _, err := r.UpsertSubscription(ctx, &scdmodels.Subscription{ID: id, Manager: manager, USSBaseURL: "https://uss.example.com", StartTime: start, EndTime: end, Cells: randomCells(rng, grid)}); err != nil {
+					b.Fatal(err)
+				}
+				continue
+			}
+			oi := &scdmodels.OperationalIntent{ID: id, Manager: manager, USSBaseURL: "https://uss.example.com", State: scdmodels.OperationalIntentStateAccepted, StartTime: start, EndTime: end, Cells: randomCells(rng, grid)}
+			if _, err := r.UpsertOperationalIntent(ctx, oi); err != nil {
+				b.Fatal(err)
+			}
+		}
+		var streamed, encoded bytes.Buffer
+		if err := r.WriteSnapshot(&streamed); err != nil {
+			b.Fatal(err)
+		}
+		if err := gob.NewEncoder(&encoded).Encode(r.state); err != nil {
+			b.Fatal(err)
+		}
+
+		b.Run(fmt.Sprintf("write/stream/%d", n), func(b *testing.B) {
+			b.ReportAllocs()
+			b.SetBytes(int64(streamed.Len()))
+			for i := 0; i < b.N; i++ {
+				if err := r.WriteSnapshot(io.Discard); err != nil {
+					b.Fatal(err)
+				}
+			}
+		})
+		b.Run(fmt.Sprintf("write/gob/%d", n), func(b *testing.B) {
+			b.ReportAllocs()
+			b.SetBytes(int64(encoded.Len()))
+			for i := 0; i < b.N; i++ {
+				var buf bytes.Buffer
+				if err := gob.NewEncoder(&buf).Encode(r.state); err != nil {
+					b.Fatal(err)
+				}
+			}
+		})
+		b.Run(fmt.Sprintf("read/stream/%d", n), func(b *testing.B) {
+			b.ReportAllocs()
+			b.SetBytes(int64(streamed.Len()))
+			dst := newRepo()
+			for i := 0; i < b.N; i++ {
+				if err := dst.ReadSnapshot(bytes.NewReader(streamed.Bytes())); err != nil {
+					b.Fatal(err)
+				}
+			}
+		})
+		b.Run(fmt.Sprintf("read/gob/%d", n), func(b *testing.B) {
+			b.ReportAllocs()
+			b.SetBytes(int64(encoded.Len()))
+			dst := newRepo()
+			for i := 0; i < b.N; i++ {
+				var s state
+				if err := gob.NewDecoder(bytes.NewReader(encoded.Bytes())).Decode(&s); err != nil {
+					b.Fatal(err)
+				}
+				dst.state = s
+				dst.index = buildIndexes(dst.state)
+			}
+		})
+	}
+}
@@ -17,8 +17,13 @@ import (
 
 // repo is a full implementation of scd.repos.Repository for memory-based storage.
 type repo struct {
-	state      state
-	checkpoint state
+	state state
+
+	// index is derived from state and must be kept consistent with it whenever state is modified or replaced.
+	index indexes
+
+	// undo holds, in order, the operations reverting each write to state since the latest checkpoint.
+	undo []func()
 }
 
 // state is the serializable in-memory state.
@@ -33,7 +38,7 @@ type state struct {
 	Availabilities map[dssmodels.Manager]*availabilityRecord
 }
 
-// constraintRecord is the gob-serializable representation of a Constraint. The
+// constraintRecord is the serializable representation of a Constraint. The
 // model's OVN is never persisted: it is derived from UpdatedAt on read
 type constraintRecord struct {
 	ID            dssmodels.ID
@@ -48,7 +53,7 @@ type constraintRecord struct {
 	UpdatedAt     time.Time
 }
 
-// subscriptionRecord is the gob-serializable representation of a Subscription.
+// subscriptionRecord is the serializable representation of a Subscription.
 // The sqlstore stores the version column but always writes 0 and discards it on
 // read (the model Version is derived from UpdatedAt), so it is not kept here.
 type subscriptionRecord struct {
@@ -65,7 +70,7 @@ type subscriptionRecord struct {
 	UpdatedAt                   time.Time
 }
 
-// operationalIntentRecord is the gob-serializable representation of an
+// operationalIntentRecord is the serializable representation of an
 // OperationalIntent. USSRequestedOVN is empty when the OVN is DSS-generated.
 type operationalIntentRecord struct {
 	ID              dssmodels.ID
@@ -84,7 +89,7 @@ type operationalIntentRecord struct {
 	UpdatedAt       time.Time
 }
 
-// availabilityRecord is the gob-serializable representation of a
+// availabilityRecord is the serializable representation of a
 // UssAvailabilityStatus. The model's Version is derived from UpdatedAt on read.
 type availabilityRecord struct {
 	Uss          dssmodels.Manager
@@ -105,6 +110,7 @@ func (r *repo) resetState() {
 		OperationalIntents: map[dssmodels.ID]*operationalIntentRecord{},
 		Availabilities:     map[dssmodels.Manager]*availabilityRecord{},
 	}
+	r.index = buildIndexes(r.state)
 	r.Checkpoint()
 }
 
@@ -170,96 +176,78 @@ func (rec *operationalIntentRecord) lastUpdate() time.Time { return rec.UpdatedA
 
 // listExpired returns the records whose end time is at or before threshold, falling back on the
 // last update time when the end time is unknown. A limit of 0 means unlimited.
-func listExpired[R expiringRecord](store map[dssmodels.ID]R, threshold time.Time, limit int) []R {
-	var out []R
-	for _, rec := range store {
-		// (ends_at IS NOT NULL AND ends_at <= threshold) OR (ends_at IS NULL AND updated_at <= threshold)
-		if t := rec.endTime(); t != nil { // TODO: Don't allow endtime to be null, see #1492
-			if t.After(threshold) {
-				continue
-			}
-		} else if rec.lastUpdate().After(threshold) {
-			continue
-		}
-		out = append(out, rec)
-
-		if limit > 0 && len(out) >= limit { // mirror SQL "LIMIT MaxResultLimit"
-			break
-		}
+func listExpired[R expiringRecord](store map[dssmodels.ID]R, index *expiryIndex, threshold time.Time, limit int) []R {
+	// (ends_at IS NOT NULL AND ends_at <= threshold) OR (ends_at IS NULL AND updated_at <= threshold)
+	ids := index.expired(threshold, limit) // mirror SQL "LIMIT $limit"
+	out := make([]R, 0, len(ids))
+	for _, id := range ids {
+		out = append(out, store[id])
 	}
 	return out
 }
 
-func (rec *constraintRecord) clone() *constraintRecord {
+func (rec *subscriptionRecord) clone() *subscriptionRecord {
 	cp := *rec
 	cp.Cells = slices.Clone(rec.Cells)
 	cp.StartTime = utils.ClonePtr(rec.StartTime)
 	cp.EndTime = utils.ClonePtr(rec.EndTime)
-	cp.AltitudeLower = utils.ClonePtr(rec.AltitudeLower)
-	cp.AltitudeUpper = utils.ClonePtr(rec.AltitudeUpper)
 	return &cp
 }
 
-func (rec *subscriptionRecord) clone() *subscriptionRecord {
-	cp := *rec
-	cp.Cells = slices.Clone(rec.Cells)
-	cp.StartTime = utils.ClonePtr(rec.StartTime)
-	cp.EndTime = utils.ClonePtr(rec.EndTime)
-	return &cp
+// set stores rec at key in store, or deletes key when rec is nil, and updates the indexes with remove and add (which
+// are nil for records without indexes). It returns the record previously stored at key, or nil.
+func set[K comparable, R comparable](store map[K]R, key K, rec R, add, remove func(R)) R {
+	var none R
+	old, ok := store[key]
+	if ok && remove != nil {
+		remove(old)
+	}
+	if rec == none {
+		delete(store, key)
+	} else {
+		store[key] = rec
+		if add != nil {
+			add(rec)
+		}
+	}
+	return old
 }
 
-func (rec *operationalIntentRecord) clone() *operationalIntentRecord {
-	cp := *rec
-	cp.Cells = slices.Clone(rec.Cells)
-	cp.PastOVNs = slices.Clone(rec.PastOVNs)
-	cp.StartTime = utils.ClonePtr(rec.StartTime)
-	cp.EndTime = utils.ClonePtr(rec.EndTime)
-	cp.SubscriptionID = utils.ClonePtr(rec.SubscriptionID)
-	cp.AltitudeLower = utils.ClonePtr(rec.AltitudeLower)
-	cp.AltitudeUpper = utils.ClonePtr(rec.AltitudeUpper)
-	return &cp
+// write applies set and logs how to undo it. Records are never modified once stored, so restoring the previous
+// record pointer is enough to undo the write.
+func write[K comparable, R comparable](r *repo, store map[K]R, key K, rec R, add, remove func(R)) {
+	old := set(store, key, rec, add, remove)
+	r.undo = append(r.undo, func() { set(store, key, old, add, remove) })
 }
 
-func (rec *availabilityRecord) clone() *availabilityRecord {
-	cp := *rec
-	return &cp
+func (r *repo) writeConstraint(id dssmodels.ID, rec *constraintRecord) {
+	write(r, r.state.Constraints, id, rec, r.index.addConstraint, r.index.removeConstraint)
 }
 
-// clone returns a deep copy of s. May be optimzed in speed by not cloning everything, as long
-// rest of the package don't mutate fields, iff speed of this function is important.
-func (s state) clone() state {
-	constraints := make(map[dssmodels.ID]*constraintRecord, len(s.Constraints))
-	for id, rec := range s.Constraints {
-		constraints[id] = rec.clone()
-	}
-	subs := make(map[dssmodels.ID]*subscriptionRecord, len(s.Subscriptions))
-	for id, rec := range s.Subscriptions {
-		subs[id] = rec.clone()
-	}
-	ois := make(map[dssmodels.ID]*operationalIntentRecord, len(s.OperationalIntents))
-	for id, rec := range s.OperationalIntents {
-		ois[id] = rec.clone()
-	}
-	avails := make(map[dssmodels.Manager]*availabilityRecord, len(s.Availabilities))
-	for uss, rec := range s.Availabilities {
-		avails[uss] = rec.clone()
-	}
-	return state{
-		Constraints:        constraints,
-		Subscriptions:      subs,
-		OperationalIntents: ois,
-		Availabilities:     avails,
-	}
+func (r *repo) writeSubscription(id dssmodels.ID, rec *subscriptionRecord) {
+	write(r, r.state.Subscriptions, id, rec, r.index.addSubscription, r.index.removeSubscription)
+}
+
+func (r *repo) writeOperationalIntent(id dssmodels.ID, rec *operationalIntentRecord) {
+	write(r, r.state.OperationalIntents, id, rec, r.index.addOperationalIntent, r.index.removeOperationalIntent)
+}
+
+func (r *repo) writeAvailability(uss dssmodels.Manager, rec *availabilityRecord) {
+	write(r, r.state.Availabilities, uss, rec, nil, nil)
 }
 
 // Checkpoint ask the repo to store a quick, internal checkpoint with its current state.
 // There is at most one check point, any existing checkpoint is overwritten
 func (r *repo) Checkpoint() {
-	r.checkpoint = r.state.clone()
+	clear(r.undo)
+	r.undo = r.undo[:0]
 }
 
 // Restore replaces the current state with the latest checkpoint. May be called multiple time
 // to restore the same checkpoint.
 func (r *repo) Restore() {
-	r.state = r.checkpoint.clone()
+	for i := len(r.undo) - 1; i >= 0; i-- {
+		r.undo[i]()
+	}
+	r.Checkpoint()
 }
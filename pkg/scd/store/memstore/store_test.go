@@ -2,6 +2,9 @@ package memstore
 
 import (
 	"context"
+	"fmt"
+	"maps"
+	"math/rand"
 	"testing"
 	"time"
 
@@ -164,3 +167,72 @@ func TestCheckpointIsolatesNotificationIndex(t *testing.T) {
 	require.NoError(t, err)
 	require.Equal(t, sub.NotificationIndex, restored.NotificationIndex)
 }
+
+func TestRestoreUndoesWritesSinceCheckpoint(t *testing.T) {
+	ctx := writeCtx()
+	rng := rand.New(rand.NewSource(2))
+	grid := cellGrid(6)
+	r := setUpStore(t)
+	randomWrites(t, r, rng, grid, 300)
+	_, err := r.UpsertUssAvailability(ctx, sampleAvailability())
+	require.NoError(t, err)
+
+	// Stored records are never modified in place, so the checkpointed state is fully described by the record
+	// pointers held by each map.
+	r.Checkpoint()
+	expected := state{
+		Constraints:        maps.Clone(r.state.Constraints),
+		Subscriptions:      maps.Clone(r.state.Subscriptions),
+		OperationalIntents: maps.Clone(r.state.OperationalIntents),
+		Availabilities:     maps.Clone(r.state.Availabilities),
+	}
+
+	for i := 0; i < 2; i++ {
+		randomWrites(t, r, rng, grid, 300)
+		_, err = r.IncrementNotificationIndicesForOperationalIntents(ctx, volume4D(grid, nil, nil, nil, nil))
+		require.NoError(t, err)
+		_, err = r.UpsertUssAvailability(ctx, &scdmodels.UssAvailabilityStatus{Uss: manager, Availability: scdmodels.UssAvailabilityStateDown})
+		require.NoError(t, err)
+		_, err = r.UpsertUssAvailability(ctx, &scdmodels.UssAvailabilityStatus{Uss: "other", Availability: scdmodels.UssAvailabilityStateNormal})
+		require.NoError(t, err)
+
+		r.Restore()
+		require.Equal(t, expected, r.state)
+		requireIndexesConsistent(t, r)
+	}
+
+	// Restoring again without intermediate writes keeps the same state.
+	r.Restore()
+	require.Equal(t, expected, r.state)
+}
+
+// BenchmarkCheckpointedWrite measures one write between a checkpoint and a restore, as performed for each applied
+// transaction, depending on the number of stored operational intents.
+func BenchmarkCheckpointedWrite(b *testing.B) {
+	grid := cellGrid(100)
+	for _, n := range []int{1000, 10000, 100000} {
+		b.Run(fmt.Sprintf("%d", n), func(b *testing.B) {
+			rng := rand.New(rand.NewSource(1))
+			r := newRepo()
+			ctx := writeCtx()
+			for i := 0; i < n; i++ {
+				start, end := randomTimeRange(rng)
+				oi := &scdmodels.OperationalIntent{ID: dssmodels.ID(fmt.Sprintf("00000185-e36d-40be-8d38-%012d", i)), Manager: manager, StartTime: start, EndTime: end, Cells: randomCells(rng, grid)}
+				if _, err := r.UpsertOperationalIntent(ctx, oi); err != nil {
+					b.Fatal(err)
+				}
+			}
+			oi := sampleOperationalIntent()
+
+			b.ReportAllocs()
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				r.Checkpoint()
+				if _, err := r.UpsertOperationalIntent(ctx, oi); err != nil {
+					b.Fatal(err)
+				}
+				r.Restore()
+			}
+		})
+	}
+}
@@ -37,19 +37,7 @@ func (r *repo) subscriptionsInVolume4D(v4d *dssmodels.Volume4D) (iter.Seq[*subsc
 		return nil, err
 	}
 
-	return func(yield func(*subscriptionRecord) bool) {
-		for _, rec := range r.state.Subscriptions {
-			if !overlaps(rec.Cells, want) {
-				continue
-			}
-			if !overlapsTime(rec.StartTime, rec.EndTime, v4d) {
-				continue
-			}
-			if !yield(rec) {
-				return
-			}
-		}
-	}, nil
+	return searchIndexed(r.state.Subscriptions, r.index.subscriptions, want, v4d), nil
 }
 
 func (r *repo) SearchSubscriptions(_ context.Context, v4d *dssmodels.Volume4D) ([]*scdmodels.Subscription, error) {
@@ -93,7 +81,7 @@ func (r *repo) UpsertSubscription(ctx context.Context, s *scdmodels.Subscription
 		Cells:                       slices.Clone(s.Cells),
 		UpdatedAt:                   now,
 	}
-	r.state.Subscriptions[s.ID] = rec
+	r.writeSubscription(s.ID, rec)
 	return rec.toModel(), nil
 }
 
@@ -101,10 +89,21 @@ func (r *repo) DeleteSubscription(_ context.Context, id dssmodels.ID) error {
 	if _, ok := r.state.Subscriptions[id]; !ok {
 		return stacktrace.NewError("Attempted to delete non-existent Subscription")
 	}
-	delete(r.state.Subscriptions, id)
+	r.writeSubscription(id, nil)
 	return nil
 }
 
+func (r *repo) DeleteSubscriptions(_ context.Context, ids []dssmodels.ID) (int64, error) {
+	var deleted int64
+	for _, id := range ids {
+		if _, ok := r.state.Subscriptions[id]; ok {
+			r.writeSubscription(id, nil)
+			deleted++
+		}
+	}
+	return deleted, nil
+}
+
 func (r *repo) IncrementNotificationIndicesForOperationalIntents(_ context.Context, v4d *dssmodels.Volume4D) ([]*scdmodels.Subscription, error) {
 	return r.incrementNotificationIndices(v4d, func(rec *subscriptionRecord) bool { return rec.NotifyForOperationalIntents })
 }
@@ -121,13 +120,21 @@ func (r *repo) incrementNotificationIndices(v4d *dssmodels.Volume4D, notified fu
 		return nil, err
 	}
 
-	var out []*scdmodels.Subscription
+	// Stored records are never modified (see write) and writing while iterating over the indexes is not allowed,
+	// so the subscriptions to update are collected before being replaced by incremented copies.
+	var matched []*subscriptionRecord
 	for rec := range subscriptions {
-		if !notified(rec) {
-			continue
+		if notified(rec) {
+			matched = append(matched, rec)
 		}
-		rec.NotificationIndex++
-		out = append(out, rec.toModel())
+	}
+
+	var out []*scdmodels.Subscription
+	for _, rec := range matched {
+		updated := rec.clone()
+		updated.NotificationIndex++
+		r.writeSubscription(updated.ID, updated)
+		out = append(out, updated.toModel())
 	}
 	return out, nil
 }
@@ -137,14 +144,18 @@ func (r *repo) LockSubscriptionsOnCells(_ context.Context, _ s2.CellUnion, _ []d
 	return nil
 }
 
-func (r *repo) ListExpiredSubscriptions(_ context.Context, threshold time.Time) ([]*scdmodels.Subscription, error) {
+func (r *repo) ListExpiredSubscriptions(_ context.Context, threshold time.Time, limit int) ([]*scdmodels.Subscription, error) {
 	var out []*scdmodels.Subscription
-	for _, rec := range listExpired(r.state.Subscriptions, threshold, dssmodels.MaxResultLimit) {
+	for _, rec := range listExpired(r.state.Subscriptions, r.index.expiringSubscriptions, threshold, limit) {
 		out = append(out, rec.toModel())
 	}
 	return out, nil
 }
 
+func (r *repo) CountExpiredSubscriptions(_ context.Context, threshold time.Time) (int64, error) {
+	return int64(len(r.index.expiringSubscriptions.expired(threshold, 0))), nil
+}
+
 func (r *repo) CountSubscriptions(_ context.Context) (int64, error) {
 	return int64(len(r.state.Subscriptions)), nil
 }
@@ -221,7 +221,7 @@ func TestListExpiredSubscriptions(t *testing.T) {
 	for _, testCase := range testCases {
 		t.Run(testCase.name, func(t *testing.T) {
 			threshold := testCase.timeRef.Add(-testCase.ttl)
-			expired, err := r.ListExpiredSubscriptions(ctx, threshold)
+			expired, err := r.ListExpiredSubscriptions(ctx, threshold, dssmodels.MaxResultLimit)
 			require.NoError(t, err)
 
 			expiredIDs := make([]dssmodels.ID, 0, len(expired))
@@ -229,6 +229,35 @@ func TestListExpiredSubscriptions(t *testing.T) {
 				expiredIDs = append(expiredIDs, expiredSub.ID)
 			}
 			require.ElementsMatch(t, expiredIDs, testCase.expired)
+
+			count, err := r.CountExpiredSubscriptions(ctx, threshold)
+			require.NoError(t, err)
+			require.Equal(t, int64(len(testCase.expired)), count)
 		})
 	}
 }
+
+func TestDeleteSubscriptions(t *testing.T) {
+	ctx := writeCtx()
+	r := setUpStore(t)
+	for _, sub := range []*scdmodels.Subscription{sub1, sub2, sub3} {
+		_, err := r.UpsertSubscription(ctx, sub)
+		require.NoError(t, err)
+	}
+
+	deleted, err := r.DeleteSubscriptions(ctx, []dssmodels.ID{sub1ID, sub3ID, "00000185-e36d-40be-8d38-beca6ca39999"})
+	require.NoError(t, err)
+	require.Equal(t, int64(2), deleted)
+
+	count, err := r.CountSubscriptions(ctx)
+	require.NoError(t, err)
+	require.Equal(t, int64(1), count)
+	remaining, err := r.GetSubscription(ctx, sub2ID)
+	require.NoError(t, err)
+	require.NotNil(t, remaining)
+	requireIndexesConsistent(t, r)
+
+	deleted, err = r.DeleteSubscriptions(ctx, nil)
+	require.NoError(t, err)
+	require.Equal(t, int64(0), deleted)
+}
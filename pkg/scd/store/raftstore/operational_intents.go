@@ -18,6 +18,10 @@ func (r *repo) DeleteOperationalIntent(_ context.Context, id dssmodels.ID) error
 	return stacktrace.NewErrorWithCode(dsserr.NotImplemented, "DeleteOperationalIntent not implemented for raftstore")
 }
 
+func (r *repo) DeleteOperationalIntents(_ context.Context, ids []dssmodels.ID) (int64, error) {
+	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "DeleteOperationalIntents not implemented for raftstore")
+}
+
 func (r *repo) UpsertOperationalIntent(_ context.Context, operation *scdmodels.OperationalIntent) (*scdmodels.OperationalIntent, error) {
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "UpsertOperationalIntent not implemented for raftstore")
 }
@@ -30,10 +34,14 @@ func (r *repo) GetDependentOperationalIntents(_ context.Context, subscriptionID
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "GetDependentOperationalIntents not implemented for raftstore")
 }
 
-func (r *repo) ListExpiredOperationalIntents(_ context.Context, threshold time.Time) ([]*scdmodels.OperationalIntent, error) {
+func (r *repo) ListExpiredOperationalIntents(_ context.Context, threshold time.Time, limit int) ([]*scdmodels.OperationalIntent, error) {
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "ListExpiredOperationalIntents not implemented for raftstore")
 }
 
+func (r *repo) CountExpiredOperationalIntents(_ context.Context, threshold time.Time) (int64, error) {
+	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "CountExpiredOperationalIntents not implemented for raftstore")
+}
+
 func (r *repo) CountOperationalIntents(_ context.Context) (int64, error) {
 	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "CountOperationalIntents not implemented for raftstore")
 }
@@ -27,6 +27,10 @@ func (r *repo) DeleteSubscription(_ context.Context, id dssmodels.ID) error {
 	return stacktrace.NewErrorWithCode(dsserr.NotImplemented, "DeleteSubscription not implemented for raftstore")
 }
 
+func (r *repo) DeleteSubscriptions(_ context.Context, ids []dssmodels.ID) (int64, error) {
+	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "DeleteSubscriptions not implemented for raftstore")
+}
+
 func (r *repo) IncrementNotificationIndicesForOperationalIntents(_ context.Context, v4d *dssmodels.Volume4D) ([]*scdmodels.Subscription, error) {
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "IncrementNotificationIndicesForOperationalIntents not implemented for raftstore")
 }
@@ -39,10 +43,14 @@ func (r *repo) LockSubscriptionsOnCells(_ context.Context, cells s2.CellUnion, s
 	return stacktrace.NewErrorWithCode(dsserr.NotImplemented, "LockSubscriptionsOnCells not implemented for raftstore")
 }
 
-func (r *repo) ListExpiredSubscriptions(_ context.Context, threshold time.Time) ([]*scdmodels.Subscription, error) {
+func (r *repo) ListExpiredSubscriptions(_ context.Context, threshold time.Time, limit int) ([]*scdmodels.Subscription, error) {
 	return nil, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "ListExpiredSubscriptions not implemented for raftstore")
 }
 
+func (r *repo) CountExpiredSubscriptions(_ context.Context, threshold time.Time) (int64, error) {
+	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "CountExpiredSubscriptions not implemented for raftstore")
+}
+
 func (r *repo) CountSubscriptions(_ context.Context) (int64, error) {
 	return 0, stacktrace.NewErrorWithCode(dsserr.NotImplemented, "CountSubscriptions not implemented for raftstore")
 }
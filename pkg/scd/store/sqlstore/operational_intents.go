@@ -180,6 +180,30 @@ func (s *repo) DeleteOperationalIntent(ctx context.Context, id dssmodels.ID) err
 	return nil
 }
 
+// DeleteOperationalIntents implements repos.Operation.DeleteOperationalIntents.
+func (s *repo) DeleteOperationalIntents(ctx context.Context, ids []dssmodels.ID) (int64, error) {
+	const deleteOperationsQuery = `
+		DELETE FROM
+			scd_operations
+		WHERE
+			id = ANY($1)
+	`
+
+	if len(ids) == 0 {
+		return 0, nil
+	}
+	uids := make([]string, len(ids))
+	for i, id := range ids {
+		uids[i] = id.String()
+	}
+	res, err := s.q.Exec(ctx, deleteOperationsQuery, uids)
+	if err != nil {
+		return 0, stacktrace.Propagate(err, "Error in query: %s", deleteOperationsQuery)
+	}
+
+	return res.RowsAffected(), nil
+}
+
 // UpsertOperation implements repos.Operation.UpsertOperation.
 func (s *repo) UpsertOperationalIntent(ctx context.Context, operation *scdmodels.OperationalIntent) (*scdmodels.OperationalIntent, error) {
 	var (
@@ -355,9 +379,9 @@ func (s *repo) GetDependentOperationalIntents(ctx context.Context, subscriptionI
 	return dependentOps, nil
 }
 
-// ListExpiredOperationalIntents lists all operational intents older than the threshold.
+// ListExpiredOperationalIntents lists at most limit operational intents older than the threshold.
 // Their age is determined by their end time, or by their last update time if they do not have an end time.
-func (s *repo) ListExpiredOperationalIntents(ctx context.Context, threshold time.Time) ([]*scdmodels.OperationalIntent, error) {
+func (s *repo) ListExpiredOperationalIntents(ctx context.Context, threshold time.Time, limit int) ([]*scdmodels.OperationalIntent, error) {
 	expiredOpIntentsQuery := fmt.Sprintf(`
         SELECT
             %s, scd_uss_availability.availability
@@ -374,7 +398,7 @@ func (s *repo) ListExpiredOperationalIntents(ctx context.Context, threshold time
 	result, err := s.fetchOperationalIntents(
 		ctx, s.q, expiredOpIntentsQuery,
 		threshold,
-		dssmodels.MaxResultLimit,
+		limit,
 	)
 	if err != nil {
 		return nil, stacktrace.Propagate(err, "Error fetching Operations")
@@ -383,6 +407,27 @@ func (s *repo) ListExpiredOperationalIntents(ctx context.Context, threshold time
 	return result, nil
 }
 
+// CountExpiredOperationalIntents counts the operational intents older than the threshold, as listed by
+// ListExpiredOperationalIntents.
+func (s *repo) CountExpiredOperationalIntents(ctx context.Context, threshold time.Time) (int64, error) {
+	var count int64
+	err := s.q.QueryRow(ctx, `
+        SELECT
+            COUNT(*)
+        FROM
+            scd_operations
+        WHERE
+            ends_at IS NOT NULL AND ends_at <= $1
+            OR
+            ends_at IS NULL AND updated_at <= $1`,
+		threshold,
+	).Scan(&count)
+	if err != nil {
+		return 0, stacktrace.Propagate(err, "Error counting expired Operations")
+	}
+	return count, nil
+}
+
 func (s *repo) CountOperationalIntents(ctx context.Context) (int64, error) {
 	var count int64
 	err := s.q.QueryRow(ctx, "SELECT COUNT(*) FROM scd_operations").Scan(&count)
@@ -128,7 +128,7 @@ func TestListExpiredOperationalIntents(t *testing.T) {
 	for _, testCase := range testCases {
 		t.Run(testCase.name, func(t *testing.T) {
 			threshold := testCase.timeRef.Add(-testCase.ttl)
-			expired, err := r.ListExpiredOperationalIntents(ctx, threshold)
+			expired, err := r.ListExpiredOperationalIntents(ctx, threshold, models.MaxResultLimit)
 			require.NoError(t, err)
 
 			expiredIDs := make([]models.ID, 0, len(expired))
@@ -136,6 +136,10 @@ func TestListExpiredOperationalIntents(t *testing.T) {
 				expiredIDs = append(expiredIDs, expiredOi.ID)
 			}
 			require.ElementsMatch(t, expiredIDs, testCase.expired)
+
+			count, err := r.CountExpiredOperationalIntents(ctx, threshold)
+			require.NoError(t, err)
+			require.Equal(t, int64(len(testCase.expired)), count)
 		})
 	}
 }
@@ -268,6 +268,32 @@ func (c *repo) DeleteSubscription(ctx context.Context, id dssmodels.ID) error {
 	return nil
 }
 
+// DeleteSubscriptions deletes the subscriptions identified by "ids" and
+// returns the number of subscriptions deleted.
+func (c *repo) DeleteSubscriptions(ctx context.Context, ids []dssmodels.ID) (int64, error) {
+	const (
+		query = `
+		DELETE FROM
+			scd_subscriptions
+		WHERE
+			id = ANY($1)`
+	)
+
+	if len(ids) == 0 {
+		return 0, nil
+	}
+	uids := make([]string, len(ids))
+	for i, id := range ids {
+		uids[i] = id.String()
+	}
+	res, err := c.q.Exec(ctx, query, uids)
+	if err != nil {
+		return 0, stacktrace.Propagate(err, "Error in query: %s", query)
+	}
+
+	return res.RowsAffected(), nil
+}
+
 // Implements SubscriptionStore.SearchSubscriptions
 func (c *repo) SearchSubscriptions(ctx context.Context, v4d *dssmodels.Volume4D) ([]*scdmodels.Subscription, error) {
 	var (
@@ -581,9 +607,9 @@ func (c *repo) LockSubscriptionsOnCells(ctx context.Context, cells s2.CellUnion,
 	return nil
 }
 
-// ListExpiredSubscriptions lists all subscriptions older than the threshold.
+// ListExpiredSubscriptions lists at most limit subscriptions older than the threshold.
 // Their age is determined by their end time, or by their update time if they do not have an end time.
-func (c *repo) ListExpiredSubscriptions(ctx context.Context, threshold time.Time) ([]*scdmodels.Subscription, error) {
+func (c *repo) ListExpiredSubscriptions(ctx context.Context, threshold time.Time, limit int) ([]*scdmodels.Subscription, error) {
 	expiredSubsQuery := fmt.Sprintf(`
         SELECT
             %s
@@ -598,7 +624,7 @@ func (c *repo) ListExpiredSubscriptions(ctx context.Context, threshold time.Time
 	subscriptions, err := c.fetchSubscriptions(
 		ctx, c.q, expiredSubsQuery,
 		threshold,
-		dssmodels.MaxResultLimit,
+		limit,
 	)
 	if err != nil {
 		return nil, stacktrace.Propagate(err, "Unable to fetch Subscriptions")
@@ -608,6 +634,26 @@ func (c *repo) ListExpiredSubscriptions(ctx context.Context, threshold time.Time
 
 }
 
+// CountExpiredSubscriptions counts the subscriptions older than the threshold, as listed by ListExpiredSubscriptions.
+func (c *repo) CountExpiredSubscriptions(ctx context.Context, threshold time.Time) (int64, error) {
+	var count int64
+	err := c.q.QueryRow(ctx, `
+        SELECT
+            COUNT(*)
+        FROM
+            scd_subscriptions
+        WHERE
+            ends_at IS NOT NULL AND ends_at <= $1
+            OR
+            ends_at IS NULL AND updated_at <= $1`,
+		threshold,
+	).Scan(&count)
+	if err != nil {
+		return 0, stacktrace.Propagate(err, "Error counting expired Subscriptions")
+	}
+	return count, nil
+}
+
 func (c *repo) CountSubscriptions(ctx context.Context) (int64, error) {
 	var count int64
 	err := c.q.QueryRow(ctx, "SELECT COUNT(*) FROM scd_subscriptions").Scan(&count)
@@ -0,0 +1,193 @@
+# Small python script comparing the key types supported by dss-certs.py: time to
+# generate a private key, and cost of a full TLS handshake with a certificate
+# signed with a key of that type, like the ones between the DSS and its nodes.
+# Use only standard libraries and the openssl command to run everywhere.
+
+import argparse
+import os
+import socket
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.realpath(__file__)),
+        "..",
+        "..",
+        "deploy",
+        "operations",
+        "certificates-management",
+    ),
+)
+
+from utils import KEY_TYPES, generate_private_key  # noqa: E402
+
+SUBJECT_CONF = """[ req ]
+prompt=no
+distinguished_name = my_distinguished_name
+
+[ my_distinguished_name ]
+commonName = {cn}
+
+[ req_ext ]
+subjectAltName = DNS:localhost
+{extensions}
+"""
+
+
+def openssl(*args):
+    subprocess.check_call(
+        ["openssl"] + list(args), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+def make_certificates(directory, key_type):
+    """Generates a CA and a server certificate signed by it, both with keys of the provided type."""
+    for name, extensions in [
+        (
+            "ca",
+            "keyUsage = critical,digitalSignature,keyCertSign\nbasicConstraints = critical,CA:true",
+        ),
+        ("node", "basicConstraints = CA:false"),
+    ]:
+        with open(os.path.join(directory, f"{name}.conf"), "w") as f:
+            f.write(SUBJECT_CONF.format(cn=name, extensions=extensions))
+        generate_private_key(os.path.join(directory, f"{name}.key"), key_type)
+
+    def path(f):
+        return os.path.join(directory, f)
+
+    openssl(
+        "req",
+        "-new",
+        "-x509",
+        "-days",
+        "1",
+        "-config",
+        path("ca.conf"),
+        "-extensions",
+        "req_ext",
+        "-key",
+        path("ca.key"),
+        "-out",
+        path("ca.crt"),
+    )
+    openssl(
+        "req",
+        "-new",
+        "-config",
+        path("node.conf"),
+        "-key",
+        path("node.key"),
+        "-out",
+        path("node.csr"),
+    )
+    openssl(
+        "x509",
+        "-req",
+        "-days",
+        "1",
+        "-in",
+        path("node.csr"),
+        "-CA",
+        path("ca.crt"),
+        "-CAkey",
+        path("ca.key"),
+        "-CAcreateserial",
+        "-extfile",
+        path("node.conf"),
+        "-extensions",
+        "req_ext",
+        "-out",
+        path("node.crt"),
+    )
+
+
+def benchmark_generation(key_type, runs):
+    durations = []
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(runs):
+            start = time.perf_counter()
+            generate_private_key(os.path.join(directory, f"{i}.key"), key_type)
+            durations.append(time.perf_counter() - start)
+    return durations
+
+
+def benchmark_handshake(key_type, runs):
+    with tempfile.TemporaryDirectory() as directory:
+        make_certificates(directory, key_type)
+
+        server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_context.load_cert_chain(
+            os.path.join(directory, "node.crt"), os.path.join(directory, "node.key")
+        )
+        client_context = ssl.create_default_context(
+            cafile=os.path.join(directory, "ca.crt")
+        )
+
+    listener = socket.create_server(("localhost", 0))
+    port = listener.getsockname()[1]
+
+    def serve():
+        for _ in range(runs):
+            conn, _ = listener.accept()
+            try:
+                with server_context.wrap_socket(conn, server_side=True) as tls:
+                    tls.recv(1)
+            except (ssl.SSLError, OSError):
+                pass
+
+    server = threading.Thread(target=serve, daemon=True)
+    server.start()
+
+    durations = []
+    for _ in range(runs):
+        # TLS sessions are not reused, so each connection goes through a full handshake
+        with socket.create_connection(("localhost", port)) as sock:
+            start = time.perf_counter()
+            with client_context.wrap_socket(sock, server_hostname="localhost") as tls:
+                durations.append(time.perf_counter() - start)
+                tls.sendall(b"x")
+
+    server.join()
+    listener.close()
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the private key types supported by dss-certs.py"
+    )
+    parser.add_argument(
+        "--key-types",
+        default=",".join(KEY_TYPES),
+        help=f"comma-separated key types among {', '.join(KEY_TYPES)}",
+    )
+    parser.add_argument(
+        "--generations", type=int, default=5, help="number of keys generated"
+    )
+    parser.add_argument(
+        "--handshakes", type=int, default=200, help="number of TLS handshakes"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'key type':<12} {'keygen median ms':>17} {'keygen max ms':>14} {'handshake median ms':>20} {'handshake p95 ms':>17}"
+    )
+    for key_type in args.key_types.split(","):
+        generation = benchmark_generation(key_type, args.generations)
+        handshake = sorted(benchmark_handshake(key_type, args.handshakes))
+        print(
+            f"{key_type:<12} {statistics.median(generation) * 1000:>17.1f} {max(generation) * 1000:>14.1f} "
+            f"{statistics.median(handshake) * 1000:>20.2f} {handshake[int(len(handshake) * 0.95) - 1] * 1000:>17.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
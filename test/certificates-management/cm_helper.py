@@ -31,7 +31,11 @@ class CMHelper:
         ]
 
     def run_command(
-        self, workspace: Workspace, args: list[str], stdin: Optional[str] = None
+        self,
+        workspace: Workspace,
+        args: list[str],
+        stdin: Optional[str] = None,
+        env: Optional[dict[str, str]] = None,
     ) -> tuple[bool, subprocess.CompletedProcess]:
         command = (
             [
@@ -47,6 +51,7 @@ class CMHelper:
             shell=True,
             capture_output=True,
             input=stdin.encode("utf-8") if stdin else None,
+            env=env,
         )
 
         return process.returncode == 0, process
@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+
+from cm_helper import CMHelper, Workspace
+from tests.test_pool_ca import TEST_CA
+
+KUBECTL_STUB = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "kubectl-stub"
+)
+
+SECRETS = {
+    "yb-master-yugabyte-tls-cert",
+    "yb-tserver-yugabyte-tls-cert",
+    "yugabyte-tls-client-cert",
+    "dss.public.certs",
+    "monitoring.grafana.certs",
+    "monitoring.prometheus.certs",
+}
+
+
+def applied_secrets(state_dir: str) -> list[set[str]]:
+    """Returns the names of the secrets in each apply call received by the kubectl stub, and clears the calls"""
+    calls_file = os.path.join(state_dir, "calls.jsonl")
+    applies = []
+    with open(calls_file) as f:
+        for line in f:
+            call = json.loads(line)
+            if call["args"][0] == "apply":
+                items = json.loads(call["stdin"])["items"]
+                applies.append(
+                    {i["metadata"]["name"] for i in items if i["kind"] == "Secret"}
+                )
+    os.unlink(calls_file)
+    return applies
+
+
+def test_apply(cm: CMHelper):
+
+    assert cm.run_command(Workspace.WORKSPACE_1, ["init"])[0]
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        env = dict(
+            os.environ,
+            PATH=KUBECTL_STUB + os.pathsep + os.environ["PATH"],
+            KUBECTL_STUB_DIR=state_dir,
+        )
+
+        # All secrets are applied at once
+        assert cm.run_command(Workspace.WORKSPACE_1, ["apply"], env=env)[0]
+        assert applied_secrets(state_dir) == [SECRETS]
+
+        # Nothing changed, nothing is applied
+        assert cm.run_command(Workspace.WORKSPACE_1, ["apply"], env=env)[0]
+        assert applied_secrets(state_dir) == []
+
+        # Only secrets holding the CA bundle are applied again
+        assert cm.run_command(Workspace.WORKSPACE_1, ["add-pool-ca"], TEST_CA)[0]
+        assert cm.run_command(Workspace.WORKSPACE_1, ["apply"], env=env)[0]
+        assert applied_secrets(state_dir) == [SECRETS - {"dss.public.certs"}]
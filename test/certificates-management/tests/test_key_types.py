@@ -0,0 +1,40 @@
+import subprocess
+
+from cm_helper import CMHelper, Workspace
+
+# Expected description of the public key of the CA, for each key type
+KEY_TYPES = {
+    "rsa2048": "Public-Key: (2048 bit)",
+    "rsa4096": "Public-Key: (4096 bit)",
+    "ecdsa-p256": "NIST CURVE: P-256",
+    "ed25519": "ED25519 Public-Key",
+}
+
+
+def test_key_types(cm: CMHelper):
+
+    for key_type, public_key in KEY_TYPES.items():
+        assert cm.run_command(Workspace.WORKSPACE_1, ["--key-type", key_type, "init"])[
+            0
+        ]
+
+        success, process = cm.run_command(Workspace.WORKSPACE_1, ["get-ca"])
+        assert success
+        ca = subprocess.run(
+            ["openssl", "x509", "-noout", "-text"],
+            input=process.stdout,
+            capture_output=True,
+            check=True,
+        )
+        assert public_key in ca.stdout.decode("utf-8")
+
+        # Nodes and clients certificates are signed with the CA key
+        assert cm.run_command(
+            Workspace.WORKSPACE_1,
+            ["--key-type", key_type, "--nodes-count", "4", "regenerate-nodes"],
+        )[0]
+        assert cm.run_command(
+            Workspace.WORKSPACE_1, ["--key-type", key_type, "generate-clients"]
+        )[0]
+
+        assert cm.run_command(Workspace.WORKSPACE_1, ["destroy"], "y")[0]
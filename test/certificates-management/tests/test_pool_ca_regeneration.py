@@ -0,0 +1,34 @@
+from cm_helper import CMHelper, Workspace
+from tests.test_pool_ca import TEST_CA
+
+
+def test_pool_ca_regeneration(cm: CMHelper):
+
+    assert cm.run_command(Workspace.WORKSPACE_1, ["init"])[0]
+
+    # Adding a new CA updates every bundle
+    success, process = cm.run_command(Workspace.WORKSPACE_1, ["add-pool-ca"], TEST_CA)
+    assert success
+    logs = process.stderr.decode("utf-8")
+    for bundle in [
+        "ca_pool/ca.crt",
+        "clients/ca.crt",
+        "masters/ca.crt",
+        "tservers/ca.crt",
+        "prometheus/ca.crt",
+    ]:
+        assert f"Updated {bundle}" in logs
+    assert "Updated clients/ca-instance.crt" not in logs
+
+    # Adding it again leaves the bundles untouched
+    success, process = cm.run_command(Workspace.WORKSPACE_1, ["add-pool-ca"], TEST_CA)
+    assert success
+    logs = process.stderr.decode("utf-8")
+    assert "CA files are up to date" in logs
+    assert "Updated" not in logs
+
+    success, process = cm.run_command(
+        Workspace.WORKSPACE_1, ["remove-pool-ca"], TEST_CA
+    )
+    assert success
+    assert "Updated ca_pool/ca.crt" in process.stderr.decode("utf-8")
@@ -0,0 +1,192 @@
+# Small HTTP client shared by the python test harnesses. Use only standard
+# libraries to run everywhere.
+
+import base64
+import http.client
+import json
+import threading
+import time
+from typing import Any
+from urllib.parse import quote, urlsplit
+
+# Exceptions raised when the server closed an idle keep-alive connection.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class Response:
+    """Fully read response, so that its connection can be reused right away."""
+
+    def __init__(self, status: int, headers: http.client.HTTPMessage, body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        # Seconds between sending the request and reading the end of the response
+        self.elapsed = 0.0
+
+    def read(self) -> bytes:
+        return self.body
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class Timings:
+    """Number and cumulated duration of the requests sent by a client."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, elapsed: float):
+        with self.lock:
+            self.count += 1
+            self.total += elapsed
+
+    def __str__(self) -> str:
+        mean = self.total / self.count if self.count else 0.0
+        return f"{self.count} requests in {self.total:.2f}s ({mean * 1000:.1f}ms on average)"
+
+
+class HTTPClient:
+    """Sends requests over persistent keep-alive connections, one per host and
+    thread. Unlike urllib, error statuses are returned instead of raised."""
+
+    def __init__(self, timeout: float = 30):
+        self.timeout = timeout
+        self.local = threading.local()
+        self.timings = Timings()
+
+    def connection(self, netloc: str) -> tuple[http.client.HTTPConnection, bool]:
+        """Returns the connection to netloc of the current thread, and whether
+        it was already used."""
+        conns = self.local.__dict__.setdefault("conns", {})
+        if netloc in conns:
+            return conns[netloc], True
+        conn = http.client.HTTPConnection(netloc, timeout=self.timeout)
+        conns[netloc] = conn
+        return conn, False
+
+    def close_connection(self, netloc: str):
+        conn = self.local.__dict__.get("conns", {}).pop(netloc, None)
+        if conn:
+            conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        parts = urlsplit(url)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+        while True:
+            conn, reused = self.connection(parts.netloc)
+            start = time.perf_counter()
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                r = conn.getresponse()
+                response = Response(r.status, r.headers, r.read())
+            except STALE_CONNECTION_ERRORS:
+                self.close_connection(parts.netloc)
+                if reused:
+                    # The server closed the idle connection: retry on a new one
+                    continue
+                raise
+            except (http.client.HTTPException, OSError):
+                self.close_connection(parts.netloc)
+                raise
+
+            response.elapsed = time.perf_counter() - start
+            self.timings.add(response.elapsed)
+            if r.will_close:
+                self.close_connection(parts.netloc)
+            return response
+
+    def request_json(
+        self,
+        method: str,
+        url: str,
+        data: dict[str, Any] | None = None,
+        token: str | None = None,
+    ) -> Response:
+        headers = {}
+        body = None
+        if data is not None:
+            body = json.dumps(data).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        if token is not None:
+            headers["Authorization"] = f"Bearer {token}"
+        return self.request(method, url, body=body, headers=headers)
+
+
+def token_expiration(token: str) -> float | None:
+    """Returns the exp claim of a JWT, without verifying it."""
+    try:
+        payload_b64 = token.split(".")[1]
+        pad = "=" * (-len(payload_b64) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload_b64 + pad))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenCache:
+    """Access tokens of the dummy OAuth server, cached by (scopes, audience,
+    expire) until shortly before they expire. Tokens requested with an
+    explicit expire are the same on each request and are cached indefinitely."""
+
+    def __init__(
+        self,
+        client: HTTPClient,
+        sub: str,
+        url: str = "http://localhost:8085/token",
+        issuer: str = "localhost",
+        margin: float = 30,
+    ):
+        self.client = client
+        self.sub = sub
+        self.url = url
+        self.issuer = issuer
+        self.margin = margin
+        self.lock = threading.Lock()
+        self.tokens: dict[
+            tuple[tuple[str, ...], str, str | None], tuple[str, float]
+        ] = {}
+
+    def get(
+        self,
+        scopes: list[str],
+        audience: str = "localhost",
+        expire: str | None = None,
+    ) -> str | None:
+        """Returns an access token, or None if the OAuth server did not provide
+        one."""
+        key = (tuple(scopes), audience, expire)
+        with self.lock:
+            cached = self.tokens.get(key)
+        if cached and time.time() < cached[1]:
+            return cached[0]
+
+        r = self.client.request(
+            "GET",
+            f"{self.url}?grant_type=client_credentials&scope={quote(' '.join(scopes))}&intended_audience={audience}&issuer={self.issuer}&sub={self.sub}{'&expire=' + expire if expire else ''}",
+        )
+        if r.status != 200:
+            return None
+        token = r.json().get("access_token")
+        if not token:
+            return None
+
+        valid_until = float("inf")
+        if expire is None:
+            exp = token_expiration(token)
+            valid_until = exp - self.margin if exp is not None else time.time()
+        with self.lock:
+            self.tokens[key] = (token, valid_until)
+        return token
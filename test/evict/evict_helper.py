@@ -18,6 +18,9 @@ class EvictHelper:
         rid_ttl: str | None = None,
         locality: str = "local_dev",
         delete: bool = False,
+        batch_size: int | None = None,
+        rate: float | None = None,
+        timeout: float = 5,
     ):
         db_hostname = os.environ.get("DB_HOSTNAME", "local-dss-crdb")
         db_port = os.environ.get("DB_PORT", "26257")
@@ -46,6 +49,18 @@ class EvictHelper:
         if delete:
             command.append("--delete")
 
+        if batch_size:
+            command += [
+                "--batch_size",
+                str(batch_size),
+            ]
+
+        if rate:
+            command += [
+                "--rate",
+                str(rate),
+            ]
+
         if scd_ttl:
             command += [
                 "--scd_ttl",
@@ -59,7 +74,7 @@ class EvictHelper:
             ]
 
         process = subprocess.run(
-            " ".join(command), shell=True, capture_output=True, timeout=5
+            " ".join(command), shell=True, capture_output=True, timeout=timeout
         )
 
         if process.returncode != 0:
@@ -74,8 +89,24 @@ class EvictHelper:
     def evict_scd_subscriptions(self, ttl: str, delete: bool):
         self.run_evict(scd_sub=True, delete=delete, scd_ttl=ttl)
 
-    def evict_rid_ISAs(self, ttl: str, delete: bool, locality: str = "local_dev"):
-        self.run_evict(rid_isa=True, delete=delete, rid_ttl=ttl, locality=locality)
+    def evict_rid_ISAs(
+        self,
+        ttl: str,
+        delete: bool,
+        locality: str = "local_dev",
+        batch_size: int | None = None,
+        rate: float | None = None,
+        timeout: float = 5,
+    ):
+        self.run_evict(
+            rid_isa=True,
+            delete=delete,
+            rid_ttl=ttl,
+            locality=locality,
+            batch_size=batch_size,
+            rate=rate,
+            timeout=timeout,
+        )
 
     def evict_rid_subscriptions(
         self, ttl: str, delete: bool, locality: str = "local_dev"
@@ -1,17 +1,62 @@
 import json
+import os
 import sys
-from urllib import request, error
 from datetime import datetime, UTC
 import uuid
 import logging
 import random
 from typing import Any
 
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "common")
+)
+
+from dss_client import HTTPClient, Response, TokenCache  # noqa: E402
+
+SCD_DEFAULT_CENTER = (22.910168434185902, 56)
+
+
+def random_center() -> tuple[float, float]:
+    # We use a random location to avoid too many entities in the same location
+    return random.uniform(-90, 90), random.uniform(-180, 180)
+
+
+def circle_volume(center: tuple[float, float]) -> dict[str, Any]:
+    return {
+        "altitude_upper": {
+            "units": "M",
+            "reference": "W84",
+            "value": 300,
+        },
+        "altitude_lower": {
+            "units": "M",
+            "reference": "W84",
+            "value": 0,
+        },
+        "outline_circle": {
+            "radius": {"units": "M", "value": 100},
+            "center": {"lat": center[0], "lng": center[1]},
+        },
+    }
+
+
+def square_area(center: tuple[float, float], half_side: float = 0.001) -> str:
+    lat, lng = center
+    corners = [
+        (lat - half_side, lng - half_side),
+        (lat - half_side, lng + half_side),
+        (lat + half_side, lng + half_side),
+        (lat + half_side, lng - half_side),
+    ]
+    return ",".join(f"{c[0]},{c[1]}" for c in corners)
+
 
 class QueryHelper:
     def __init__(self):
-        self.token: str = self.get_token()
         self.logger: logging.Logger = logging.getLogger(__name__)
+        self.client = HTTPClient()
+        self.tokens = TokenCache(self.client, sub="test_evict")
+        self.get_token()
 
     def get_token(self) -> str:
         scopes = [
@@ -20,42 +65,37 @@ class QueryHelper:
             "rid.service_provider",
         ]
 
-        r = request.urlopen(
-            f"http://localhost:8085/token?grant_type=client_credentials&scope={'%20'.join(scopes)}&intended_audience=localhost&issuer=localhost&sub=test_evict"
-        ).read()
-        data = json.loads(r)
+        token = self.tokens.get(scopes)
 
-        if "access_token" not in data:
+        if not token:
             self.logger.error(
                 "❌ Unable to retrieve access token. Is the dummy auth server running?"
             )
             sys.exit(1)
 
-        return data["access_token"]
+        return token
 
-    def do_dss_put_query(self, url: str, data: dict[str, Any]):
-        req = request.Request(
-            url,
-            data=json.dumps(data).encode("utf-8"),
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.token}",
-            },
-            method="PUT",
-        )
+    def do_dss_query(
+        self, method: str, url: str, data: dict[str, Any] | None = None
+    ) -> Response:
+        return self.client.request_json(method, url, data, token=self.get_token())
 
-        return request.urlopen(req)
+    def do_dss_put_query(self, url: str, data: dict[str, Any]) -> Response:
+        return self.do_dss_query("PUT", url, data)
 
-    def do_dss_get_query(self, url: str):
-        req = request.Request(
-            url,
-            headers={"Authorization": f"Bearer {self.token}"},
-            method="GET",
-        )
+    def do_dss_post_query(self, url: str, data: dict[str, Any]) -> Response:
+        return self.do_dss_query("POST", url, data)
 
-        return request.urlopen(req)
+    def do_dss_delete_query(self, url: str) -> Response:
+        return self.do_dss_query("DELETE", url)
 
-    def create_scd_subscription(self, until: datetime) -> dict[str, Any] | None:
+    def do_dss_get_query(self, url: str) -> Response:
+        return self.do_dss_query("GET", url)
+
+    def create_scd_subscription(
+        self, until: datetime, center: tuple[float, float] | None = None
+    ) -> dict[str, Any] | None:
+        center = center or SCD_DEFAULT_CENTER
         r = self.do_dss_put_query(
             f"http://localhost:8082/dss/v1/subscriptions/{uuid.uuid4()}",
             {
@@ -63,22 +103,7 @@ class QueryHelper:
                 "notify_for_constraints": False,
                 "uss_base_url": "https://testdummy.interuss.org/interuss/dss/test/evict/query_helper/scd_sub",
                 "extents": {
-                    "volume": {
-                        "altitude_upper": {
-                            "units": "M",
-                            "reference": "W84",
-                            "value": 300,
-                        },
-                        "altitude_lower": {
-                            "units": "M",
-                            "reference": "W84",
-                            "value": 0,
-                        },
-                        "outline_circle": {
-                            "radius": {"units": "M", "value": 100},
-                            "center": {"lat": 22.910168434185902, "lng": 56},
-                        },
-                    },
+                    "volume": circle_volume(center),
                     "time_end": {"value": until.isoformat(), "format": "RFC3339"},
                 },
             },
@@ -90,21 +115,17 @@ class QueryHelper:
         return json.loads(r.read())
 
     def get_scd_subscription(self, id: str) -> dict[str, Any] | None:
-        try:
-            r = self.do_dss_get_query(
-                f"http://localhost:8082/dss/v1/subscriptions/{id}"
-            )
-        except error.HTTPError as e:
-            if e.code == 404:
-                return None
-            raise
+        r = self.do_dss_get_query(f"http://localhost:8082/dss/v1/subscriptions/{id}")
 
         if r.status != 200:
             return None
 
         return json.loads(r.read())
 
-    def create_scd_op_intent(self, until: datetime) -> dict[str, Any] | None:
+    def create_scd_op_intent(
+        self, until: datetime, center: tuple[float, float] | None = None
+    ) -> dict[str, Any] | None:
+        center = center or SCD_DEFAULT_CENTER
         r = self.do_dss_put_query(
             f"http://localhost:8082/dss/v1/operational_intent_references/{uuid.uuid4()}",
             {
@@ -112,22 +133,7 @@ class QueryHelper:
                 "uss_base_url": "https://testdummy.interuss.org/interuss/dss/test/evict/query_helper/op_intent",
                 "extents": [
                     {
-                        "volume": {
-                            "altitude_upper": {
-                                "units": "M",
-                                "reference": "W84",
-                                "value": 300,
-                            },
-                            "altitude_lower": {
-                                "units": "M",
-                                "reference": "W84",
-                                "value": 0,
-                            },
-                            "outline_circle": {
-                                "radius": {"units": "M", "value": 100},
-                                "center": {"lat": 22.910168434185902, "lng": 56},
-                            },
-                        },
+                        "volume": circle_volume(center),
                         "time_start": {
                             "value": datetime.now(UTC).isoformat(),
                             "format": "RFC3339",
@@ -145,45 +151,25 @@ class QueryHelper:
         return json.loads(r.read())
 
     def get_scd_op_intent(self, id: str) -> dict[str, Any] | None:
-        try:
-            r = self.do_dss_get_query(
-                f"http://localhost:8082/dss/v1/operational_intent_references/{id}"
-            )
-        except error.HTTPError as e:
-            if e.code == 404:
-                return None
-            raise
+        r = self.do_dss_get_query(
+            f"http://localhost:8082/dss/v1/operational_intent_references/{id}"
+        )
 
         if r.status != 200:
             return None
 
         return json.loads(r.read())
 
-    def create_rid_subscription(self, until: datetime) -> dict[str, Any] | None:
+    def create_rid_subscription(
+        self, until: datetime, center: tuple[float, float] | None = None
+    ) -> dict[str, Any] | None:
+        center = center or random_center()
         r = self.do_dss_put_query(
             f"http://localhost:8082/rid/v2/dss/subscriptions/{uuid.uuid4()}",
             {
                 "uss_base_url": "https://testdummy.interuss.org/interuss/dss/test/evict/query_helper/rid_sub",
                 "extents": {
-                    "volume": {
-                        "altitude_upper": {
-                            "units": "M",
-                            "reference": "W84",
-                            "value": 300,
-                        },
-                        "altitude_lower": {
-                            "units": "M",
-                            "reference": "W84",
-                            "value": 0,
-                        },
-                        "outline_circle": {
-                            "radius": {"units": "M", "value": 100},
-                            "center": {
-                                "lat": random.uniform(-90, 90),
-                                "lng": random.uniform(-180, 180),
-                            },  # We use a random location to avoid too many subscription in the same location
-                        },
-                    },
+                    "volume": circle_volume(center),
                     "time_end": {"value": until.isoformat(), "format": "RFC3339"},
                 },
             },
@@ -195,45 +181,25 @@ class QueryHelper:
         return json.loads(r.read())
 
     def get_rid_subscription(self, id: str) -> dict[str, Any] | None:
-        try:
-            r = self.do_dss_get_query(
-                f"http://localhost:8082/rid/v2/dss/subscriptions/{id}"
-            )
-        except error.HTTPError as e:
-            if e.code == 404:
-                return None
-            raise
+        r = self.do_dss_get_query(
+            f"http://localhost:8082/rid/v2/dss/subscriptions/{id}"
+        )
 
         if r.status != 200:
             return None
 
         return json.loads(r.read())
 
-    def create_rid_ISA(self, until: datetime) -> dict[str, Any] | None:
+    def create_rid_ISA(
+        self, until: datetime, center: tuple[float, float] | None = None
+    ) -> dict[str, Any] | None:
+        center = center or random_center()
         r = self.do_dss_put_query(
             f"http://localhost:8082/rid/v2/dss/identification_service_areas/{uuid.uuid4()}",
             {
                 "uss_base_url": "https://testdummy.interuss.org/interuss/dss/test/evict/query_helper/isa",
                 "extents": {
-                    "volume": {
-                        "altitude_upper": {
-                            "units": "M",
-                            "reference": "W84",
-                            "value": 300,
-                        },
-                        "altitude_lower": {
-                            "units": "M",
-                            "reference": "W84",
-                            "value": 0,
-                        },
-                        "outline_circle": {
-                            "radius": {"units": "M", "value": 100},
-                            "center": {
-                                "lat": random.uniform(-90, 90),
-                                "lng": random.uniform(-180, 180),
-                            },  # We use a random location to avoid too many subscription in the same location
-                        },
-                    },
+                    "volume": circle_volume(center),
                     "time_end": {"value": until.isoformat(), "format": "RFC3339"},
                 },
             },
@@ -245,16 +211,85 @@ class QueryHelper:
         return json.loads(r.read())
 
     def get_rid_ISA(self, id: str) -> dict[str, Any] | None:
-        try:
-            r = self.do_dss_get_query(
-                f"http://localhost:8082/rid/v2/dss/identification_service_areas/{id}"
-            )
-        except error.HTTPError as e:
-            if e.code == 404:
-                return None
-            raise
+        r = self.do_dss_get_query(
+            f"http://localhost:8082/rid/v2/dss/identification_service_areas/{id}"
+        )
 
         if r.status != 200:
             return None
 
         return json.loads(r.read())
+
+    def search_scd_subscriptions(
+        self, center: tuple[float, float]
+    ) -> list[dict[str, Any]] | None:
+        r = self.do_dss_post_query(
+            "http://localhost:8082/dss/v1/subscriptions/query",
+            {"area_of_interest": {"volume": circle_volume(center)}},
+        )
+
+        if r.status != 200:
+            return None
+
+        return json.loads(r.read())["subscriptions"]
+
+    def search_scd_op_intents(
+        self, center: tuple[float, float]
+    ) -> list[dict[str, Any]] | None:
+        r = self.do_dss_post_query(
+            "http://localhost:8082/dss/v1/operational_intent_references/query",
+            {"area_of_interest": {"volume": circle_volume(center)}},
+        )
+
+        if r.status != 200:
+            return None
+
+        return json.loads(r.read())["operational_intent_references"]
+
+    def search_rid_subscriptions(
+        self, center: tuple[float, float]
+    ) -> list[dict[str, Any]] | None:
+        r = self.do_dss_get_query(
+            f"http://localhost:8082/rid/v2/dss/subscriptions?area={square_area(center)}"
+        )
+
+        if r.status != 200:
+            return None
+
+        return json.loads(r.read())["subscriptions"]
+
+    def search_rid_ISAs(
+        self, center: tuple[float, float]
+    ) -> list[dict[str, Any]] | None:
+        r = self.do_dss_get_query(
+            f"http://localhost:8082/rid/v2/dss/identification_service_areas?area={square_area(center)}"
+        )
+
+        if r.status != 200:
+            return None
+
+        return json.loads(r.read())["service_areas"]
+
+    def delete_scd_subscription(self, id: str, version: str) -> bool:
+        r = self.do_dss_delete_query(
+            f"http://localhost:8082/dss/v1/subscriptions/{id}/{version}"
+        )
+        return r.status == 200
+
+    def delete_scd_op_intent(self, id: str, ovn: str) -> bool:
+        r = self.do_dss_delete_query(
+            f"http://localhost:8082/dss/v1/operational_intent_references/{id}/{ovn}"
+        )
+        return r.status == 200
+
+    def delete_rid_subscription(self, id: str, version: str) -> bool:
+        r = self.do_dss_delete_query(
+            f"http://localhost:8082/rid/v2/dss/subscriptions/{id}/{version}"
+        )
+        return r.status == 200
+
+    def delete_rid_ISA(self, id: str, version: str) -> bool:
+        r = self.do_dss_delete_query(
+            f"http://localhost:8082/rid/v2/dss/identification_service_areas/{id}/{version}"
+        )
+        return r.status == 200
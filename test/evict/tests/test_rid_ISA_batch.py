@@ -0,0 +1,72 @@
+import sys
+from datetime import datetime, timedelta, UTC
+import time
+import logging
+
+from evict_helper import EvictHelper
+from query_helper import QueryHelper
+
+ISA_COUNT = 5
+BATCH_SIZE = 2
+RATE = 2
+
+
+def create_expired_ISAs(qh: QueryHelper, logger: logging.Logger) -> list[str]:
+    t = datetime.now(UTC) + timedelta(seconds=1)
+
+    logger.debug(f"Creating {ISA_COUNT} test ISAs")
+    ISA_ids: list[str] = []
+    for _ in range(ISA_COUNT):
+        isa = qh.create_rid_ISA(t)
+
+        if not isa:
+            logger.error("❌ Unable to create ISA")
+            sys.exit(1)
+
+        ISA_ids.append(str(isa["service_area"]["id"]))
+
+    logger.debug("Waiting 3s so the ISAs expire")
+    _ = sys.stdout.flush()
+    time.sleep(3)
+
+    return ISA_ids
+
+
+def check_deleted(qh: QueryHelper, logger: logging.Logger, ISA_ids: list[str]):
+    logger.debug("Check that all ISAs have been deleted")
+    for ISA_id in ISA_ids:
+        if qh.get_rid_ISA(ISA_id):
+            logger.error(f"❌ Test ISA {ISA_id} shall has been deleted by evict")
+            sys.exit(1)
+
+
+def test_rid_ISA_batch(qh: QueryHelper, eh: EvictHelper):
+    logger = logging.getLogger("test_rid_ISA_batch")
+
+    logger.info("📋 RID ISA batch eviction test")
+
+    ISA_ids = create_expired_ISAs(qh, logger)
+
+    logger.debug(f"Evicting ISAs older than 1s by batches of {BATCH_SIZE}")
+    eh.evict_rid_ISAs("1s", delete=True, batch_size=BATCH_SIZE)
+
+    check_deleted(qh, logger, ISA_ids)
+
+    ISA_ids = create_expired_ISAs(qh, logger)
+
+    logger.debug(f"Evicting ISAs older than 1s at {RATE} ISAs per second")
+    start = time.monotonic()
+    eh.evict_rid_ISAs("1s", delete=True, rate=RATE, timeout=60)
+    elapsed = time.monotonic() - start
+
+    # Lower bound, as the last batch of ISAs may not be followed by any wait.
+    min_elapsed = (ISA_COUNT - RATE) / RATE
+    if elapsed < min_elapsed:
+        logger.error(
+            f"❌ Evicting {ISA_COUNT} ISAs at {RATE} per second took {elapsed:.1f}s, less than {min_elapsed:.1f}s"
+        )
+        sys.exit(1)
+
+    check_deleted(qh, logger, ISA_ids)
+
+    logger.info("✅ RID ISA batch eviction test successful :)")
@@ -0,0 +1,338 @@
+# Small python script generating concurrent load against a local DSS, built on
+# the QueryHelper of the evict tests, whose client keeps one keep-alive
+# connection per thread. Use only standard libraries to run everywhere.
+# Expect that `start-locally` have been ran
+
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from typing import Any, Callable
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "evict")
+)
+
+from query_helper import QueryHelper, random_center  # noqa: E402
+
+OPERATIONS = ["create", "search", "delete"]
+
+logger = logging.getLogger("loadtest")
+
+
+@dataclass
+class EntityKind:
+    create: Callable[..., dict[str, Any] | None]
+    search: Callable[..., list[dict[str, Any]] | None]
+    delete: Callable[..., bool]
+    # Key of the entity in the creation response, and of its version in the entity.
+    key: str
+    version: str
+
+
+ENTITY_KINDS = {
+    "scd_sub": EntityKind(
+        QueryHelper.create_scd_subscription,
+        QueryHelper.search_scd_subscriptions,
+        QueryHelper.delete_scd_subscription,
+        "subscription",
+        "version",
+    ),
+    "scd_oir": EntityKind(
+        QueryHelper.create_scd_op_intent,
+        QueryHelper.search_scd_op_intents,
+        QueryHelper.delete_scd_op_intent,
+        "operational_intent_reference",
+        "ovn",
+    ),
+    "rid_sub": EntityKind(
+        QueryHelper.create_rid_subscription,
+        QueryHelper.search_rid_subscriptions,
+        QueryHelper.delete_rid_subscription,
+        "subscription",
+        "version",
+    ),
+    "rid_isa": EntityKind(
+        QueryHelper.create_rid_ISA,
+        QueryHelper.search_rid_ISAs,
+        QueryHelper.delete_rid_ISA,
+        "service_area",
+        "version",
+    ),
+}
+
+
+@dataclass
+class Entity:
+    id: str
+    version: str
+    center: tuple[float, float]
+
+
+class EntityPool:
+    """Entities created during the run, available to searches and deletes."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entities: list[Entity] = []
+
+    def add(self, entity: Entity):
+        with self.lock:
+            self.entities.append(entity)
+
+    def pick(self) -> Entity | None:
+        with self.lock:
+            return random.choice(self.entities) if self.entities else None
+
+    def pop(self) -> Entity | None:
+        with self.lock:
+            if not self.entities:
+                return None
+            i = random.randrange(len(self.entities))
+            self.entities[i], self.entities[-1] = self.entities[-1], self.entities[i]
+            return self.entities.pop()
+
+    def drain(self) -> list[Entity]:
+        with self.lock:
+            entities, self.entities = self.entities, []
+            return entities
+
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+
+    def record(self, endpoint: str, latency: float, ok: bool):
+        with self.lock:
+            self.latencies.setdefault(endpoint, []).append(latency)
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + (not ok)
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+def report(stats: Stats, elapsed: float) -> dict[str, dict[str, float]]:
+    results = {}
+    all_latencies: list[float] = []
+    for endpoint in sorted(stats.latencies):
+        latencies = sorted(stats.latencies[endpoint])
+        all_latencies += latencies
+        results[endpoint] = summarize(latencies, stats.errors[endpoint], elapsed)
+    results["total"] = summarize(
+        sorted(all_latencies), sum(stats.errors.values()), elapsed
+    )
+    return results
+
+
+def summarize(
+    sorted_latencies: list[float], errors: int, elapsed: float
+) -> dict[str, float]:
+    return {
+        "requests": len(sorted_latencies),
+        "errors": errors,
+        "throughput": len(sorted_latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(sorted_latencies, 50) * 1000,
+        "p95_ms": percentile(sorted_latencies, 95) * 1000,
+        "p99_ms": percentile(sorted_latencies, 99) * 1000,
+    }
+
+
+def print_report(results: dict[str, dict[str, float]]):
+    print(
+        f"{'endpoint':<16} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    )
+    for endpoint, r in results.items():
+        print(
+            f"{endpoint:<16} {r['requests']:>9} {r['errors']:>7} {r['throughput']:>9.1f} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f}"
+        )
+
+
+class LoadGenerator:
+    def __init__(self, qh: QueryHelper, args: argparse.Namespace):
+        self.qh = qh
+        self.kinds: list[str] = args.entities
+        self.weights: list[float] = [args.mix[op] for op in OPERATIONS]
+        self.ttl = timedelta(seconds=args.ttl)
+        self.pools = {kind: EntityPool() for kind in self.kinds}
+        self.stats = Stats()
+
+        self.lock = threading.Lock()
+        self.remaining_requests: int | None = args.requests or None
+
+    def take_request(self) -> bool:
+        if self.remaining_requests is None:
+            return True
+        with self.lock:
+            if self.remaining_requests <= 0:
+                return False
+            self.remaining_requests -= 1
+            return True
+
+    def run_operation(self, op: str, kind: str):
+        entity_kind = ENTITY_KINDS[kind]
+        pool = self.pools[kind]
+
+        entity = None
+        if op == "search":
+            entity = pool.pick()
+        elif op == "delete":
+            entity = pool.pop()
+        if op != "create" and entity is None:
+            # Nothing to search or delete yet
+            op = "create"
+
+        start = time.perf_counter()
+        ok = False
+        try:
+            if op == "create":
+                center = random_center()
+                created = entity_kind.create(
+                    self.qh, datetime.now(UTC) + self.ttl, center
+                )
+                if created:
+                    e = created[entity_kind.key]
+                    pool.add(Entity(e["id"], e[entity_kind.version], center))
+                    ok = True
+            elif op == "search":
+                ok = entity_kind.search(self.qh, entity.center) is not None
+            else:
+                ok = entity_kind.delete(self.qh, entity.id, entity.version)
+        except Exception as e:
+            logger.debug(f"{op} {kind} failed: {e}")
+        self.stats.record(f"{op} {kind}", time.perf_counter() - start, ok)
+
+    def worker(self, deadline: float):
+        while time.monotonic() < deadline and self.take_request():
+            op = random.choices(OPERATIONS, self.weights)[0]
+            self.run_operation(op, random.choice(self.kinds))
+
+    def run(self, concurrency: int, duration: float) -> float:
+        deadline = time.monotonic() + duration if duration else math.inf
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in [
+                executor.submit(self.worker, deadline) for _ in range(concurrency)
+            ]:
+                future.result()
+        return time.monotonic() - start
+
+    def cleanup(self, concurrency: int):
+        def delete(kind: str, entity: Entity):
+            try:
+                ENTITY_KINDS[kind].delete(self.qh, entity.id, entity.version)
+            except Exception as e:
+                logger.debug(f"cleanup of {kind} {entity.id} failed: {e}")
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for kind, pool in self.pools.items():
+                for entity in pool.drain():
+                    executor.submit(delete, kind, entity)
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    mix = {op: 0.0 for op in OPERATIONS}
+    for part in value.split(","):
+        op, _, weight = part.partition("=")
+        if op not in mix:
+            raise argparse.ArgumentTypeError(f"unknown operation {op}")
+        mix[op] = float(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("at least one weight must be positive")
+    return mix
+
+
+def parse_entities(value: str) -> list[str]:
+    kinds = value.split(",")
+    for kind in kinds:
+        if kind not in ENTITY_KINDS:
+            raise argparse.ArgumentTypeError(f"unknown entity type {kind}")
+    return kinds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate load against a local DSS")
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="number of concurrent clients"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=30,
+        help="duration of the run in seconds, 0 to only stop after --requests",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=0,
+        help="total number of requests to send, 0 for no limit",
+    )
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default="create=0.4,search=0.4,delete=0.2",
+        help="relative weights of the operations",
+    )
+    parser.add_argument(
+        "--entities",
+        type=parse_entities,
+        default=",".join(ENTITY_KINDS),
+        help=f"comma-separated entity types among {', '.join(ENTITY_KINDS)}",
+    )
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=3600,
+        help="lifetime in seconds of the created entities",
+    )
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help="keep the entities created during the run instead of deleting them",
+    )
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    if not args.duration and not args.requests:
+        parser.error("one of --duration and --requests must be set")
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)-8s %(name)-10s %(message)-50s",
+        handlers=[logging.StreamHandler(sys.stderr)],
+    )
+
+    qh = QueryHelper()
+    generator = LoadGenerator(qh, args)
+    logger.info(
+        f"Running {args.concurrency} clients on {', '.join(args.entities)} with mix {args.mix}"
+    )
+    elapsed = generator.run(args.concurrency, args.duration)
+
+    results = report(generator.stats, elapsed)
+    print_report(results)
+    logger.info(f"Sent {qh.client.timings}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if not args.keep:
+        logger.info("Deleting the remaining entities created during the run")
+        generator.cleanup(args.concurrency)
+
+
+if __name__ == "__main__":
+    main()